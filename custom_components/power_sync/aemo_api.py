@@ -26,6 +26,9 @@ _SPIKE_HYSTERESIS_DEADBAND = 20.0
 # NEM time is always AEST (no daylight saving)
 NEM_TIMEZONE = ZoneInfo("Australia/Brisbane")
 
+# Raw line prefix of the DispatchIS PRICE table rows
+_DISPATCH_PRICE_PREFIX = "D,DISPATCH,PRICE,"
+
 
 class AEMOAPIClient:
     """Client for AEMO NEM Data API.
@@ -64,6 +67,22 @@ class AEMOAPIClient:
         "timestamp": None,  # When the cache was populated
     }
 
+    # Class-level cache for the latest dispatch file (shared across instances).
+    # Several coordinators poll NEMWEB for the same 5-minute file; the first to
+    # see it downloads and parses it, concurrent callers await that download.
+    _dispatch_shared: dict[str, Any] = {
+        "filename": None,  # Last parsed dispatch filename
+        "prices": None,  # Parsed prices by region
+    }
+    _dispatch_inflight: dict[str, asyncio.Future] = {}
+    _dispatch_stats: dict[str, Any] = {
+        "downloads": 0,
+        "shared_hits": 0,
+        "bytes_downloaded": 0,
+        "last_bytes": None,
+        "last_parse_ms": None,
+    }
+
     def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
         """Initialize AEMO API client.
 
@@ -99,7 +118,9 @@ class AEMOAPIClient:
 
         Uses NEMWEB dispatch ZIP files for faster updates.  The parsed result
         is cached by filename so repeated calls within the same 5-minute
-        dispatch period never re-download or re-parse the ZIP.
+        dispatch period never re-download or re-parse the ZIP, and the latest
+        file is shared across instances so each one is downloaded once per
+        process.  Parsing runs in the default executor.
 
         Returns:
             (prices, is_new_file, filename)
@@ -138,16 +159,9 @@ class AEMOAPIClient:
                 _LOGGER.debug("Dispatch file unchanged: %s", latest_file)
                 return self._dispatch_cache[latest_file], False, latest_file
 
-            # Step 3: Download the ZIP (new file)
-            file_url = f"{self.DISPATCH_URL}{latest_file}"
-            async with session.get(
-                file_url, headers=self.HEADERS, timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                response.raise_for_status()
-                zip_content = await response.read()
-
-            # Step 4: Parse dispatch prices from ZIP
-            prices = self._parse_dispatch_zip(zip_content)
+            # Step 3: Download and parse the ZIP, unless another instance
+            # already has (or is doing so right now)
+            prices = await self._get_shared_dispatch(session, latest_file)
             if not prices:
                 _LOGGER.warning("No prices parsed from NEMWEB dispatch ZIP, using JSON fallback")
                 return await self._get_current_prices_json_fallback(), False, ""
@@ -164,6 +178,73 @@ class AEMOAPIClient:
             self._record_nemweb_failure(err)
             return await self._get_current_prices_json_fallback(), False, ""
 
+    async def _get_shared_dispatch(
+        self, session: aiohttp.ClientSession, filename: str
+    ) -> dict[str, dict[str, Any]] | None:
+        """Return parsed prices for a dispatch file, downloading it at most once."""
+        shared = AEMOAPIClient._dispatch_shared
+        if shared["filename"] == filename:
+            AEMOAPIClient._dispatch_stats["shared_hits"] += 1
+            return shared["prices"]
+
+        inflight = AEMOAPIClient._dispatch_inflight
+        pending = inflight.get(filename)
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            AEMOAPIClient._dispatch_stats["shared_hits"] += 1
+        else:
+            pending = asyncio.ensure_future(self._download_dispatch(session, filename))
+            inflight[filename] = pending
+
+            def _forget(task: asyncio.Future) -> None:
+                if inflight.get(filename) is task:
+                    del inflight[filename]
+
+            pending.add_done_callback(_forget)
+
+        # Shield so a cancelled caller does not abort the download for the others
+        return await asyncio.shield(pending)
+
+    async def _download_dispatch(
+        self, session: aiohttp.ClientSession, filename: str
+    ) -> dict[str, dict[str, Any]] | None:
+        """Download a dispatch ZIP and parse it off the event loop."""
+        file_url = f"{self.DISPATCH_URL}{filename}"
+        async with session.get(
+            file_url, headers=self.HEADERS, timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            response.raise_for_status()
+            zip_content = await response.read()
+
+        stats = AEMOAPIClient._dispatch_stats
+        stats["downloads"] += 1
+        stats["bytes_downloaded"] += len(zip_content)
+        stats["last_bytes"] = len(zip_content)
+
+        prices, parse_seconds = await asyncio.get_running_loop().run_in_executor(
+            None, self._timed_parse_dispatch_zip, zip_content
+        )
+        stats["last_parse_ms"] = round(parse_seconds * 1000, 2)
+
+        if prices:
+            AEMOAPIClient._dispatch_shared = {"filename": filename, "prices": prices}
+        return prices
+
+    def _timed_parse_dispatch_zip(
+        self, content: bytes
+    ) -> tuple[dict[str, dict[str, Any]] | None, float]:
+        """Parse a dispatch ZIP, also returning the parse wall time in seconds."""
+        start = time.perf_counter()
+        prices = self._parse_dispatch_zip(content)
+        return prices, time.perf_counter() - start
+
+    @classmethod
+    def dispatch_diagnostics(cls) -> dict[str, Any]:
+        """Return process-wide NEMWEB dispatch download/parse counters."""
+        return {
+            **cls._dispatch_stats,
+            "cached_file": cls._dispatch_shared["filename"],
+        }
+
     def _is_nemweb_backing_off(self) -> bool:
         """Return True while NEMWEB fetches are paused after a transient failure."""
         return time.monotonic() < self._nemweb_backoff_until
@@ -205,6 +286,11 @@ class AEMOAPIClient:
     def _parse_dispatch_zip(self, content: bytes) -> dict[str, dict[str, Any]] | None:
         """Parse a NEMWEB DispatchIS ZIP file to extract current prices.
 
+        Blocking (inflate + CSV), so callers on the event loop run it in an
+        executor.  Only ``D,DISPATCH,PRICE`` lines are handed to the CSV
+        parser, and reading stops once every region has a price, so the
+        larger tables later in the file are never decompressed.
+
         Args:
             content: Raw bytes of the ZIP file.
 
@@ -221,9 +307,7 @@ class AEMOAPIClient:
                     return None
 
                 with zf.open(csv_files[0]) as f:
-                    reader = csv.reader(io.TextIOWrapper(f, encoding="utf-8"))
-
-                    for row in reader:
+                    for line in io.TextIOWrapper(f, encoding="utf-8"):
                         # Dispatch CSV PRICE table format:
                         # row[0]: Record type ("D" = data)
                         # row[1]: "DISPATCH"
@@ -232,10 +316,11 @@ class AEMOAPIClient:
                         # row[6]: Region ID
                         # row[8]: Intervention flag (0 = normal)
                         # row[9]: RRP in $/MWh
-                        if len(row) < 10 or row[0] != "D":
+                        if not line.startswith(_DISPATCH_PRICE_PREFIX):
                             continue
 
-                        if row[1] != "DISPATCH" or row[2] != "PRICE":
+                        row = next(csv.reader((line,)), [])
+                        if len(row) < 10:
                             continue
 
                         # Skip intervention pricing
@@ -263,6 +348,9 @@ class AEMOAPIClient:
                             _LOGGER.debug("Skipping dispatch row: %s", err)
                             continue
 
+                        if len(prices) == len(self.REGIONS):
+                            break
+
         except zipfile.BadZipFile as err:
             _LOGGER.warning("Invalid dispatch ZIP: %s", err)
             return None
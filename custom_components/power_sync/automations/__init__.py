@@ -6,6 +6,7 @@ Automations are stored using HA's Store helper for persistence.
 """
 
 import logging
+import time
 from datetime import datetime, time as dt_time, timezone
 from typing import Optional, List, Dict, Any
 import json
@@ -21,7 +22,12 @@ from ..const import (
     SOLAR_FORECAST_PROVIDERS,
 )
 from ..optimization.load_estimator import SolcastForecaster
-from .triggers import evaluate_trigger, evaluate_conditions, TriggerResult
+from .triggers import (
+    evaluate_trigger,
+    evaluate_conditions,
+    required_state_facets,
+    TriggerResult,
+)
 from .actions import execute_actions
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,6 +35,33 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_KEY = "power_sync.automations"
 STORAGE_VERSION = 1
 
+# Fast-changing evaluation state lives in its own file so trigger bursts do
+# not rewrite automation definitions, push tokens and the custom tariff.
+RUNTIME_STORAGE_KEY = "power_sync.automations_runtime"
+RUNTIME_STORAGE_VERSION = 1
+RUNTIME_SAVE_DELAY = 60  # seconds; upper bound on unflushed runtime state
+
+# Per-automation keys that belong to the runtime file
+AUTOMATION_RUNTIME_FIELDS = (
+    "last_evaluated_value",
+    "last_evaluated_at",
+    "last_triggered_at",
+    "trigger_runtime",
+)
+# Top-level store keys that belong to the runtime file
+RUNTIME_DATA_KEYS = ("ev_runtime_state",)
+
+# How long a fetched state facet may be reused across evaluation ticks.
+# EV and OCPP drive edge-detected triggers and are read every tick; forecasts
+# and weather change slowly and are comparatively expensive. Prices are read
+# straight from the price coordinators (the tariff fallback has its own cache).
+STATE_FACET_TTL_SECONDS = {
+    "ev": 0,
+    "ocpp": 0,
+    "solar_forecast": 300,
+    "weather": 900,
+}
+
 
 class AutomationStore:
     """Manages automation storage using HA's Store helper."""
@@ -36,8 +69,18 @@ class AutomationStore:
     def __init__(self, hass: HomeAssistant):
         self._hass = hass
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._runtime_store = Store(hass, RUNTIME_STORAGE_VERSION, RUNTIME_STORAGE_KEY)
         self._data: Dict[str, Any] = {"automations": [], "next_id": 1, "push_tokens": {}}
         self._runtime_dirty = False
+        # Monotonic time each file first became dirty since its last write
+        self._dirty_since: Dict[str, Optional[float]] = {"definitions": None, "runtime": None}
+        self._persist_stats: Dict[str, Any] = {
+            "save_requests": 0,
+            "definitions_writes": 0,
+            "runtime_writes": 0,
+            "last_flush_latency_ms": None,
+            "max_flush_latency_ms": 0.0,
+        }
 
     async def async_load(self) -> None:
         """Load automations from storage."""
@@ -47,13 +90,123 @@ class AutomationStore:
             # Ensure push_tokens exists (for upgrades from older versions)
             if "push_tokens" not in self._data:
                 self._data["push_tokens"] = {}
+
+        runtime = await self._runtime_store.async_load()
+        if runtime:
+            for key in RUNTIME_DATA_KEYS:
+                if key in runtime:
+                    self._data[key] = runtime[key]
+            runtime_by_id = runtime.get("automations", {})
+            for auto in self._data.get("automations", []):
+                auto.update(runtime_by_id.get(str(auto.get("id")), {}))
+        elif any(
+            field in auto
+            for auto in self._data.get("automations", [])
+            for field in AUTOMATION_RUNTIME_FIELDS
+        ):
+            # Upgrade: runtime fields still live in the definitions file. Write
+            # them out once so the next definitions save can drop them.
+            self.schedule_runtime_save()
         _LOGGER.debug(f"Loaded {len(self._data.get('automations', []))} automations from storage")
         _LOGGER.debug(f"Loaded {len(self._data.get('push_tokens', {}))} push tokens from storage")
 
     async def async_save(self) -> None:
-        """Save automations to storage."""
-        await self._store.async_save(self._data)
+        """Save automations to storage now.
+
+        Definitions are always written; runtime state only if it changed.
+        Any pending delayed write is superseded by this one.
+        """
+        self._persist_stats["save_requests"] += 1
+        self._mark_dirty("definitions")
+        await self._store.async_save(self._definitions_payload())
+        if self._runtime_dirty:
+            await self._runtime_store.async_save(self._runtime_payload())
+
+    async def async_save_runtime(self) -> None:
+        """Write runtime state now, leaving definitions untouched."""
+        self._persist_stats["save_requests"] += 1
+        self._mark_dirty("runtime")
+        await self._runtime_store.async_save(self._runtime_payload())
+
+    def schedule_runtime_save(self) -> None:
+        """Persist runtime state within RUNTIME_SAVE_DELAY seconds.
+
+        The delay is not extended by later changes, so state is never more
+        than RUNTIME_SAVE_DELAY seconds behind disk. HA's Store flushes any
+        pending write on shutdown.
+        """
+        self._persist_stats["save_requests"] += 1
+        if self._runtime_dirty:
+            return  # Coalesced into the pending write
+        self._mark_dirty("runtime")
+        self._runtime_store.async_delay_save(self._runtime_payload, RUNTIME_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write any pending changes immediately (used on unload).
+
+        Definitions are always written by ``async_save``, so only runtime
+        state can be pending.
+        """
+        if self._runtime_dirty:
+            await self._runtime_store.async_save(self._runtime_payload())
+
+    def _mark_dirty(self, kind: str) -> None:
+        if kind == "runtime":
+            self._runtime_dirty = True
+        if self._dirty_since[kind] is None:
+            self._dirty_since[kind] = time.monotonic()
+
+    def _record_flush(self, kind: str) -> None:
+        since = self._dirty_since[kind]
+        self._dirty_since[kind] = None
+        self._persist_stats[f"{kind}_writes"] += 1
+        if since is not None:
+            latency_ms = round((time.monotonic() - since) * 1000, 1)
+            self._persist_stats["last_flush_latency_ms"] = latency_ms
+            self._persist_stats["max_flush_latency_ms"] = max(
+                self._persist_stats["max_flush_latency_ms"], latency_ms
+            )
+
+    def _definitions_payload(self) -> Dict[str, Any]:
+        """Build the definitions file contents (called at write time)."""
+        self._record_flush("definitions")
+        payload = {
+            key: value for key, value in self._data.items() if key not in RUNTIME_DATA_KEYS
+        }
+        payload["automations"] = [
+            {
+                key: value
+                for key, value in auto.items()
+                if key not in AUTOMATION_RUNTIME_FIELDS
+            }
+            for auto in self._data.get("automations", [])
+        ]
+        return payload
+
+    def _runtime_payload(self) -> Dict[str, Any]:
+        """Build the runtime file contents (called at write time)."""
         self._runtime_dirty = False
+        self._record_flush("runtime")
+        payload: Dict[str, Any] = {
+            key: self._data[key] for key in RUNTIME_DATA_KEYS if key in self._data
+        }
+        payload["automations"] = {
+            str(auto.get("id")): {
+                field: auto[field] for field in AUTOMATION_RUNTIME_FIELDS if field in auto
+            }
+            for auto in self._data.get("automations", [])
+        }
+        return payload
+
+    def persistence_stats(self) -> Dict[str, Any]:
+        """Return save requests, actual writes and flush latency."""
+        stats = dict(self._persist_stats)
+        writes = stats["definitions_writes"] + stats["runtime_writes"]
+        stats["writes_avoided"] = max(0, stats["save_requests"] - writes)
+        stats["pending"] = [
+            kind for kind, since in self._dirty_since.items() if since is not None
+        ]
+        return stats
 
     def get_all(self) -> List[Dict[str, Any]]:
         """Get all automations."""
@@ -221,21 +374,28 @@ class AutomationStore:
         if automation.get("trigger_runtime") == new_runtime:
             return
         automation["trigger_runtime"] = new_runtime
-        self._runtime_dirty = True
+        self.schedule_runtime_save()
 
     @property
     def runtime_dirty(self) -> bool:
         """Return whether stateful trigger runtime needs persistence."""
         return self._runtime_dirty
 
-    def mark_triggered(self, automation_id: int) -> None:
-        """Mark automation as triggered."""
+    def mark_triggered(self, automation_id: int) -> bool:
+        """Mark automation as triggered.
+
+        Returns True if a run-once automation was paused, which is a
+        definition change the caller should save straight away.
+        """
         for auto in self._data.get("automations", []):
             if auto.get("id") == automation_id:
                 auto["last_triggered_at"] = datetime.utcnow().isoformat() + "Z"
+                self.schedule_runtime_save()
                 if auto.get("run_once"):
                     auto["paused"] = True
+                    return True
                 break
+        return False
 
     def get_groups(self) -> List[str]:
         """Get unique group names."""
@@ -418,11 +578,11 @@ class AutomationEngine:
         self._hass = hass
         self._store = store
         self._config_entry = config_entry
-        self._weather_cache: Optional[Dict[str, Any]] = None
-        self._weather_cache_time: Optional[datetime] = None
+        self._facet_cache: Dict[str, tuple] = {}
+        self._facet_stats: Dict[str, Dict[str, Any]] = {}
+        self._last_facets: List[str] = []
         self._tariff_cache: Optional[Dict[str, Any]] = None
         self._tariff_cache_time: Optional[datetime] = None
-        self._last_runtime_save: Optional[datetime] = None
 
     async def async_evaluate_all(self) -> int:
         """
@@ -443,9 +603,15 @@ class AutomationEngine:
         if not automations:
             return 0
 
+        # Only gather the state facets the enabled automations actually read
+        facets = set()
+        for automation in automations:
+            facets.update(required_state_facets(automation))
+        self._last_facets = sorted(facets)
+
         # Get current state
         try:
-            current_state = await self._async_get_current_state()
+            current_state = await self._async_get_current_state(facets)
         except Exception as e:
             _LOGGER.error(f"Failed to get current state: {e}")
             return 0
@@ -502,8 +668,10 @@ class AutomationEngine:
 
                     if actions_executed:
                         triggered_count += 1
-                        self._store.mark_triggered(automation.get("id"))
-                        await self._store.async_save()
+                        # Trigger times are batched into the runtime file;
+                        # only a run-once pause is written immediately.
+                        if self._store.mark_triggered(automation.get("id")):
+                            await self._store.async_save()
 
             except Exception as e:
                 _LOGGER.error(
@@ -518,19 +686,17 @@ class AutomationEngine:
                 except Exception:
                     pass
 
-        if self._store.runtime_dirty:
-            now_utc = datetime.now(timezone.utc)
-            if (
-                self._last_runtime_save is None
-                or (now_utc - self._last_runtime_save).total_seconds() >= 60
-            ):
-                await self._store.async_save()
-                self._last_runtime_save = now_utc
-
         return triggered_count
 
-    async def _async_get_current_state(self) -> Dict[str, Any]:
-        """Get current state for automation evaluation."""
+    async def _async_get_current_state(
+        self, facets: Optional[set] = None
+    ) -> Dict[str, Any]:
+        """Get current state for automation evaluation.
+
+        ``facets`` limits the optional state (prices, EV, OCPP, solar
+        forecast, weather) to what the enabled automations read; None
+        gathers everything.
+        """
         import math
         from ..const import DOMAIN, CONF_AEMO_REGION
         from zoneinfo import ZoneInfo
@@ -762,6 +928,9 @@ class AutomationEngine:
                 }:
                     state["grid_status"] = "off_grid"
 
+            if coordinator and coordinator.data and (
+                facets is None or "prices" in facets
+            ):
                 # Get prices for price-based triggers (settled prices from WebSocket or REST API)
                 # - Amber users: Amber API prices
                 # - Flow Power users: Either Amber or AEMO prices (based on flow_power_price_source)
@@ -819,38 +988,101 @@ class AutomationEngine:
                 state["battery_mode"] = "normal"
 
         # Get EV state from Tesla Fleet entities
-        try:
-            state["ev_state"] = await self._async_get_ev_state()
-        except Exception as e:
-            _LOGGER.warning(f"Failed to get EV state: {e}")
+        if facets is None or "ev" in facets:
+            try:
+                state["ev_state"] = await self._async_get_facet(
+                    "ev", self._async_get_ev_state
+                )
+            except Exception as e:
+                _LOGGER.warning(f"Failed to get EV state: {e}")
 
         # Get OCPP state
-        try:
-            state["ocpp_state"] = await self._async_get_ocpp_state()
-        except Exception as e:
-            _LOGGER.warning(f"Failed to get OCPP state: {e}")
+        if facets is None or "ocpp" in facets:
+            try:
+                state["ocpp_state"] = await self._async_get_facet(
+                    "ocpp", self._async_get_ocpp_state
+                )
+            except Exception as e:
+                _LOGGER.warning(f"Failed to get OCPP state: {e}")
 
         # Get solar forecast. Keep solcast_forecast as a compatibility alias for
         # existing automation triggers and conditions.
-        try:
-            solar_forecast = await self._async_get_solar_forecast()
-            state["solar_forecast"] = solar_forecast
-            state["solcast_forecast"] = solar_forecast
-            state["solar_forecast_source"] = solar_forecast.get("source")
-        except Exception as e:
-            _LOGGER.warning(f"Failed to get solar forecast: {e}")
+        if facets is None or "solar_forecast" in facets:
+            try:
+                solar_forecast = await self._async_get_facet(
+                    "solar_forecast", self._async_get_solar_forecast
+                )
+                state["solar_forecast"] = solar_forecast
+                state["solcast_forecast"] = solar_forecast
+                state["solar_forecast_source"] = solar_forecast.get("source")
+            except Exception as e:
+                _LOGGER.warning(f"Failed to get solar forecast: {e}")
 
         # Get weather
-        try:
-            state["weather"] = await self._async_get_weather()
-        except Exception as e:
-            _LOGGER.warning(f"Failed to get weather: {e}")
+        if facets is None or "weather" in facets:
+            try:
+                state["weather"] = await self._async_get_facet(
+                    "weather", self._async_get_weather
+                )
+            except Exception as e:
+                _LOGGER.warning(f"Failed to get weather: {e}")
 
         return state
 
+    async def _async_get_facet(self, facet: str, fetch) -> Any:
+        """Fetch one optional state facet, reusing it within its TTL.
+
+        Empty results are never cached so a failed lookup is retried on the
+        next tick. Fetch counts and timings are kept for diagnostics.
+        """
+        stats = self._facet_stats.setdefault(
+            facet,
+            {"fetches": 0, "cache_hits": 0, "errors": 0, "last_ms": None, "total_ms": 0.0},
+        )
+        ttl = STATE_FACET_TTL_SECONDS.get(facet, 0)
+        now = time.monotonic()
+        cached = self._facet_cache.get(facet)
+        if cached is not None and ttl > 0 and now - cached[0] < ttl:
+            stats["cache_hits"] += 1
+            return cached[1]
+
+        start = time.perf_counter()
+        try:
+            value = await fetch()
+        except Exception:
+            stats["errors"] += 1
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            stats["fetches"] += 1
+            stats["last_ms"] = round(elapsed_ms, 2)
+            stats["total_ms"] += elapsed_ms
+
+        if value:
+            self._facet_cache[facet] = (now, value)
+        else:
+            self._facet_cache.pop(facet, None)
+        return value
+
+    def get_state_diagnostics(self) -> Dict[str, Any]:
+        """Return which state facets the last tick gathered and their timings."""
+        facets = {}
+        for facet, stats in self._facet_stats.items():
+            fetches = stats["fetches"]
+            facets[facet] = {
+                "ttl_s": STATE_FACET_TTL_SECONDS.get(facet, 0),
+                "fetches": fetches,
+                "cache_hits": stats["cache_hits"],
+                "errors": stats["errors"],
+                "last_ms": stats["last_ms"],
+                "avg_ms": round(stats["total_ms"] / fetches, 2) if fetches else None,
+            }
+        return {"active_facets": list(self._last_facets), "facets": facets}
+
     async def _async_get_weather(self) -> Optional[str]:
-        """Get current weather condition with caching.
+        """Get current weather condition.
 
+        Cached by the state facet memo (see STATE_FACET_TTL_SECONDS).
         Goes through the shared resolver so Solcast-only installs still
         get weather (via HA's inbuilt weather entity) instead of silently
         returning None and making weather-based automation conditions
@@ -859,14 +1091,6 @@ class AutomationEngine:
         from .weather import async_resolve_weather
         from ..const import CONF_OPENWEATHERMAP_API_KEY, CONF_WEATHER_LOCATION
 
-        cache_duration_seconds = 900  # 15 minutes
-
-        # Check cache
-        if self._weather_cache_time:
-            cache_age = (datetime.utcnow() - self._weather_cache_time).total_seconds()
-            if cache_age < cache_duration_seconds and self._weather_cache:
-                return self._weather_cache.get("condition")
-
         # Resolver handles OWM → HA entity → sun.sun-only fallback chain.
         # api_key may be None (Solcast-only installs) — resolver skips OWM
         # and goes straight to the HA entity.
@@ -887,8 +1111,6 @@ class AutomationEngine:
             self._hass, api_key, timezone, weather_location
         )
         if weather_data:
-            self._weather_cache = weather_data
-            self._weather_cache_time = datetime.utcnow()
             return weather_data.get("condition")
 
         return None
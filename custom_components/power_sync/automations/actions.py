@@ -81,6 +81,7 @@ _LOGGER = logging.getLogger(__name__)
 
 # Tesla integrations supported for EV control via Fleet API
 from ..const import TESLA_INTEGRATIONS
+from ..tesla_vehicle_index import tesla_vehicle_index
 TESLA_EV_INTEGRATIONS = TESLA_INTEGRATIONS
 
 # Global lock to prevent concurrent wake/charging attempts
@@ -666,8 +667,7 @@ async def _get_tesla_ev_entity(
     """
     import re
 
-    entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
+    vehicle_index = tesla_vehicle_index(hass)
 
     def _device_name(device: Any) -> str:
         """Return a registry device label without requiring optional metadata."""
@@ -678,76 +678,79 @@ async def _get_tesla_ev_entity(
         value = getattr(device, "id", None)
         return str(value) if value else None
 
-    # EV-specific entity patterns that only vehicles have (not energy products)
-    ev_entity_markers = [
-        r"button\..*_charge",  # charge_start, force_data_update
-        r"switch\..*(?<!dis)charge(?:_\d+)?$",  # charger switch
-        r"number\..*_charge_limit",  # charge limit
-        r"number\..*_charging_amps",  # charging amps
-        r"sensor\..*_battery_level$",  # vehicle battery (not Powerwall)
-        r"device_tracker\.",  # vehicle location
-    ]
-    ev_marker_patterns = [re.compile(p, re.IGNORECASE) for p in ev_entity_markers]
-
-    def _device_has_ev_entities(device_id: str) -> bool:
-        """Check if device has EV-specific entities."""
-        for entity in entity_registry.entities.values():
-            if entity.device_id == device_id:
-                for marker in ev_marker_patterns:
-                    if marker.search(entity.entity_id):
-                        return True
-        return False
-
-    # Find devices from Tesla integrations
+    # Find vehicle devices (17-character VIN identifiers) from Tesla integrations
     tesla_devices = []
-    all_domains_found = set()
-    all_tesla_domain_devices = []  # Track all devices from Tesla domains
-
-    for device in device_registry.devices.values():
-        for identifier in device.identifiers:
-            # Use index access instead of tuple unpacking (identifiers can have >2 values)
-            if len(identifier) < 2:
-                continue
-            domain = identifier[0]
-            identifier_value = identifier[1]
-            all_domains_found.add(domain)
-            if domain in TESLA_EV_INTEGRATIONS:
-                id_str = str(identifier_value)
-                id_len = len(id_str)
-                is_all_digit = id_str.isdigit()
-                _LOGGER.debug(f"Tesla domain device: {_device_name(device)}, domain={domain}, id={id_str}, len={id_len}, all_digit={is_all_digit}")
-
-                all_tesla_domain_devices.append((device, domain, id_str))
-
-                # Check if it's a vehicle (VIN is 17 chars, not all numeric)
-                if id_len == 17 and not is_all_digit:
-                    if vehicle_vin is None or id_str == vehicle_vin:
-                        tesla_devices.append(device)
-                        _LOGGER.info(f"Found Tesla EV vehicle by VIN: {_device_name(device)}, VIN: {id_str}")
-                        break
-                    else:
-                        _LOGGER.debug(f"Tesla device VIN format OK but doesn't match filter: {_device_name(device)}, VIN={id_str}, filter={vehicle_vin}")
-                else:
-                    _LOGGER.debug(f"Tesla device skipped VIN check (not VIN format): {_device_name(device)}, id={id_str} (len={id_len}, all_digit={is_all_digit})")
+    entities_by_device: dict[str, list[str]] = {}
+    for device, device_vin in vehicle_index.vehicle_devices(vehicle_vin):
+        tesla_devices.append(device)
+        _LOGGER.info(f"Found Tesla EV vehicle by VIN: {_device_name(device)}, VIN: {device_vin}")
+        device_id = _device_id(device)
+        if device_id:
+            entities_by_device[device_id] = [
+                entity.entity_id for entity in vehicle_index.device_entities(device_id)
+            ]
 
     # Fallback only when no explicit vehicle was requested. An explicit VIN or
     # BLE pseudo-id must never degrade to an arbitrary Tesla-domain device.
-    if not tesla_devices and all_tesla_domain_devices and vehicle_vin is None:
+    # Devices without a VIN identifier are not indexed, so only this path
+    # walks the registries.
+    if not tesla_devices and vehicle_vin is None:
+        entity_registry = er.async_get(hass)
+        device_registry = dr.async_get(hass)
+
+        # EV-specific entity patterns that only vehicles have (not energy products)
+        ev_entity_markers = [
+            r"button\..*_charge",  # charge_start, force_data_update
+            r"switch\..*(?<!dis)charge(?:_\d+)?$",  # charger switch
+            r"number\..*_charge_limit",  # charge limit
+            r"number\..*_charging_amps",  # charging amps
+            r"sensor\..*_battery_level$",  # vehicle battery (not Powerwall)
+            r"device_tracker\.",  # vehicle location
+        ]
+        ev_marker_patterns = [re.compile(p, re.IGNORECASE) for p in ev_entity_markers]
+
+        all_domains_found = set()
+        all_tesla_domain_devices = []  # Track all devices from Tesla domains
+        for device in device_registry.devices.values():
+            for identifier in device.identifiers:
+                # Use index access instead of tuple unpacking (identifiers can have >2 values)
+                if len(identifier) < 2:
+                    continue
+                domain = identifier[0]
+                all_domains_found.add(domain)
+                if domain in TESLA_EV_INTEGRATIONS:
+                    id_str = str(identifier[1])
+                    _LOGGER.debug(f"Tesla domain device: {_device_name(device)}, domain={domain}, id={id_str}")
+                    all_tesla_domain_devices.append((device, domain, id_str))
+
+        registry_entities: dict[str, list[str]] = {}
+        for entity in entity_registry.entities.values():
+            registry_entities.setdefault(entity.device_id, []).append(entity.entity_id)
+
         _LOGGER.debug(f"No VIN-based devices found, checking {len(all_tesla_domain_devices)} Tesla domain devices for EV entities")
         for device, domain, id_str in all_tesla_domain_devices:
             device_id = _device_id(device)
-            if device_id and _device_has_ev_entities(device_id):
+            if device_id and any(
+                marker.search(entity_id)
+                for entity_id in registry_entities.get(device_id, ())
+                for marker in ev_marker_patterns
+            ):
                 tesla_devices.append(device)
+                entities_by_device[device_id] = registry_entities[device_id]
                 _LOGGER.info(f"Found Tesla EV device by entity detection: {_device_name(device)}, domain={domain}, id={id_str}")
                 break
 
+        if not tesla_devices:
+            log_missing = _LOGGER.warning if warn_on_missing else _LOGGER.debug
+            log_missing(f"No Tesla EV devices found. Looking for domains {TESLA_EV_INTEGRATIONS}, found domains: {sorted(all_domains_found)}")
+            if all_tesla_domain_devices:
+                log_missing(f"Found {len(all_tesla_domain_devices)} Tesla domain devices but none matched VIN format or had EV entities:")
+                for device, domain, id_str in all_tesla_domain_devices[:5]:
+                    log_missing(f"  - {_device_name(device)}: domain={domain}, id={id_str}")
+            return None
     if not tesla_devices:
         log_missing = _LOGGER.warning if warn_on_missing else _LOGGER.debug
-        log_missing(f"No Tesla EV devices found. Looking for domains {TESLA_EV_INTEGRATIONS}, found domains: {sorted(all_domains_found)}")
-        if all_tesla_domain_devices:
-            log_missing(f"Found {len(all_tesla_domain_devices)} Tesla domain devices but none matched VIN format or had EV entities:")
-            for device, domain, id_str in all_tesla_domain_devices[:5]:
-                log_missing(f"  - {_device_name(device)}: domain={domain}, id={id_str}")
+        log_missing(f"No Tesla EV device found for VIN {vehicle_vin}")
         return None
 
     # A vehicle can be exposed by more than one Tesla integration at once. Do
@@ -794,15 +797,6 @@ async def _get_tesla_ev_entity(
             "unavailable",
         }
 
-    entities_by_device: dict[str, list[str]] = {}
-    for device in tesla_devices:
-        device_id = _device_id(device)
-        if device_id:
-            entities_by_device[device_id] = []
-    for entity in entity_registry.entities.values():
-        if entity.device_id in entities_by_device:
-            entities_by_device[entity.device_id].append(entity.entity_id)
-
     candidates: list[tuple[int, int, int, int, Any, str]] = []
     for registry_index, device in enumerate(tesla_devices):
         device_id = _device_id(device)
@@ -914,20 +908,10 @@ def _get_vehicle_name_from_vin(hass: HomeAssistant, vehicle_vin: str) -> str:
     Returns:
         The vehicle's friendly name (e.g., "PRIMARY EV") or a truncated VIN if not found
     """
-    device_registry = dr.async_get(hass)
-
-    for device in device_registry.devices.values():
-        for identifier in device.identifiers:
-            if len(identifier) < 2:
-                continue
-            domain = identifier[0]
-            identifier_value = identifier[1]
-            if domain in TESLA_EV_INTEGRATIONS:
-                id_str = str(identifier_value)
-                # VIN is 17 chars, not all numeric
-                if len(id_str) == 17 and not id_str.isdigit():
-                    if id_str == vehicle_vin or vehicle_vin == DEFAULT_VEHICLE_ID:
-                        return device.name or id_str[:8]
+    for device, device_vin in tesla_vehicle_index(hass).vehicle_devices(
+        None if vehicle_vin == DEFAULT_VEHICLE_ID else vehicle_vin
+    ):
+        return device.name or device_vin[:8]
 
     return ""
 
@@ -1051,21 +1035,11 @@ def _tesla_start_confirmation_entity_ids(
 
     normalized_vin = str(vehicle_vin or "").upper()
     if len(normalized_vin) == 17 and normalized_vin.isalnum():
-        entity_registry = er.async_get(hass)
-        device_registry = dr.async_get(hass)
-        for device in device_registry.devices.values():
-            if not any(
-                len(identifier) >= 2
-                and identifier[0] in TESLA_EV_INTEGRATIONS
-                and str(identifier[1]).upper() == normalized_vin
-                for identifier in getattr(device, "identifiers", set())
-            ):
-                continue
-            entity_ids.update(
-                entity.entity_id
-                for entity in entity_registry.entities.values()
-                if entity.device_id == device.id
-            )
+        entity_ids.update(
+            entity.entity_id
+            for entity, device_vin in tesla_vehicle_index(hass).vehicle_entities()
+            if device_vin.upper() == normalized_vin
+        )
 
     paired_prefix = _resolve_ble_prefix_for_vehicle(
         hass,
@@ -1737,23 +1711,7 @@ def _resolve_ble_prefix_for_vehicle(
         and config.get(CONF_EV_PROVIDER, EV_PROVIDER_FLEET_API) == EV_PROVIDER_BOTH
     ):
         try:
-            device_registry = dr.async_get(hass)
-            fleet_vins: list[str] = []
-            seen_vins: set[str] = set()
-            for device in device_registry.devices.values():
-                for identifier in device.identifiers:
-                    if len(identifier) < 2 or identifier[0] not in TESLA_EV_INTEGRATIONS:
-                        continue
-                    candidate = str(identifier[1])
-                    candidate_key = candidate.strip().lower()
-                    if (
-                        len(candidate) == 17
-                        and not candidate.isdigit()
-                        and candidate_key not in seen_vins
-                    ):
-                        seen_vins.add(candidate_key)
-                        fleet_vins.append(candidate)
-                    break
+            fleet_vins = list(tesla_vehicle_index(hass).vins())
             return vehicle_ble_prefix(
                 config,
                 vehicle_vin,
@@ -1794,23 +1752,7 @@ def _canonical_dynamic_tesla_vehicle_id(
     if explicitly_canonical_id != normalized_id:
         return explicitly_canonical_id
     try:
-        device_registry = dr.async_get(hass)
-        fleet_vins: list[str] = []
-        seen_vins: set[str] = set()
-        for device in device_registry.devices.values():
-            for identifier in device.identifiers:
-                if len(identifier) < 2 or identifier[0] not in TESLA_EV_INTEGRATIONS:
-                    continue
-                candidate = str(identifier[1])
-                candidate_key = candidate.strip().lower()
-                if (
-                    len(candidate) == 17
-                    and not candidate.isdigit()
-                    and candidate_key not in seen_vins
-                ):
-                    seen_vins.add(candidate_key)
-                    fleet_vins.append(candidate)
-                break
+        fleet_vins = list(tesla_vehicle_index(hass).vins())
         return canonical_tesla_vehicle_id(
             config,
             normalized_id,
@@ -9895,23 +9837,15 @@ async def _resolve_tesla_active_charger_capability(
     ):
         return result
 
-    entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
+    vehicle_index = tesla_vehicle_index(hass)
     source_entity_ids: list[tuple[list[str], str]] = []
     normalized_vin = vehicle_vin.upper()
-    for device in device_registry.devices.values():
-        matches_vin = any(
-            len(identifier) >= 2
-            and identifier[0] in TESLA_EV_INTEGRATIONS
-            and str(identifier[1]).upper() == normalized_vin
-            for identifier in device.identifiers
-        )
-        if not matches_vin:
+    for device, device_vin in vehicle_index.vehicle_devices():
+        if device_vin.upper() != normalized_vin:
             continue
         source_entity_ids.append(([
             entity.entity_id
-            for entity in entity_registry.entities.values()
-            if entity.device_id == device.id
+            for entity in vehicle_index.device_entities(device.id)
         ], "vin"))
 
     paired_prefix = _resolve_ble_prefix_for_vehicle(
@@ -9933,11 +9867,12 @@ async def _resolve_tesla_active_charger_capability(
             f"sensor.{paired_prefix}_charger_power",
         ], "paired_ble"))
 
+    # Wall Connectors are not vehicles, so they are not in the vehicle index.
     exact_wall_connector_vehicle = normalized_vin in (
         _exact_tesla_wall_connector_vehicle_vins(
             hass,
-            entity_registry,
-            device_registry,
+            er.async_get(hass),
+            dr.async_get(hass),
         )
     )
 
@@ -11,8 +11,8 @@ Plans optimal charging windows based on:
 
 import logging
 import math
-import statistics
 import time
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, time as dt_time, timezone
 from typing import Optional, List, Dict, Any, Tuple, Iterator, Mapping, Sequence
@@ -32,9 +32,9 @@ from ..const import (
     DOMAIN,
     SOLAR_FORECAST_PROVIDER_OPEN_METEO,
     SOLAR_FORECAST_PROVIDERS,
-    TESLA_INTEGRATIONS,
 )
 from ..optimization.load_estimator import SolcastForecaster as SharedSolarForecaster
+from ..optimization.load_history import hourly_load_profiles
 from ..optimization.price_level_projection import (
     PriceLevelVehicleSnapshot,
     classify_price_level_policy,
@@ -44,6 +44,8 @@ from ..solar_surplus_config import (
     get_solar_surplus_min_battery_soc,
     normalize_solar_surplus_config,
 )
+from ..tariff_time import compile_tariff_timeline
+from ..tesla_vehicle_index import tesla_vehicle_index
 from ..tesla_ble_mapping import (
     canonical_tesla_vehicle_id,
     coalesce_paired_vehicle_configs,
@@ -113,6 +115,9 @@ AUTO_SCHEDULE_START_RETRY_MAX_SECONDS = 15 * 60
 PRICE_LEVEL_START_RETRY_BASE_SECONDS = 30
 PRICE_LEVEL_START_RETRY_MAX_SECONDS = 15 * 60
 FREE_GRID_PRICE_EPSILON_CENTS = 0.001
+# Horizon fetched for the forecast frame shared across one evaluation tick.
+# Shorter per-vehicle horizons are served from its leading slots.
+FORECAST_FRAME_MIN_HOURS = 24
 
 # Executor decisions that mean no vehicle is physically on this loadpoint.
 # Their plans are retained to protect future demand, so any consumer that
@@ -326,27 +331,6 @@ def _forecast_window_display_bounds(
     return local_start.isoformat(), local_end.isoformat()
 
 
-def _repeated_forecast_local_hours(values: List[str]) -> set[str]:
-    """Return local hours represented by multiple absolute intervals."""
-    identities_by_local: dict[str, set[str]] = {}
-    for value in values:
-        local_dt = _parse_forecast_hour_local_naive(value)
-        identity = _forecast_hour_key(value)
-        if local_dt is None or identity is None:
-            continue
-        local_key = local_dt.replace(
-            minute=0,
-            second=0,
-            microsecond=0,
-        ).isoformat()
-        identities_by_local.setdefault(local_key, set()).add(identity)
-    return {
-        local_key
-        for local_key, identities in identities_by_local.items()
-        if len(identities) > 1
-    }
-
-
 def _usable_forecast_window(
     hour_dt: datetime,
     now: datetime,
@@ -398,29 +382,10 @@ def _configured_ble_prefixes(
         and vehicle_vin.isalnum()
         and opts.get(CONF_EV_PROVIDER) == EV_PROVIDER_BOTH
     ):
-        from homeassistant.helpers import device_registry as dr
-
-        device_registry = dr.async_get(hass)
-        fleet_vins: list[str] = []
-        seen_vins: set[str] = set()
-        for device in device_registry.devices.values():
-            for identifier in device.identifiers:
-                if len(identifier) < 2 or identifier[0] not in TESLA_INTEGRATIONS:
-                    continue
-                candidate = str(identifier[1])
-                candidate_key = candidate.strip().lower()
-                if (
-                    len(candidate) == 17
-                    and not candidate.isdigit()
-                    and candidate_key not in seen_vins
-                ):
-                    seen_vins.add(candidate_key)
-                    fleet_vins.append(candidate)
-                break
         prefix = vehicle_ble_prefix(
             opts,
             vehicle_vin,
-            fleet_vins,
+            list(tesla_vehicle_index(hass).vins()),
             prefixes,
         )
         return [prefix] if prefix else []
@@ -584,27 +549,6 @@ def _tesla_ble_presence_says_home(hass: "HomeAssistant", prefix: str) -> bool:
     return _tesla_ble_plugged_in_status(hass, prefix) is True
 
 
-def _iter_tesla_vehicle_devices(device_registry) -> Iterator[Tuple[Any, str]]:
-    """Yield ``(device, vin)`` tuples for every Tesla vehicle in the HA device registry.
-
-    Scans every device, looking for identifiers from one of the
-    ``TESLA_INTEGRATIONS`` domains whose ID value is a 17-character non-digit
-    VIN. Yields at most once per device — subsequent identifiers are ignored.
-
-    Replaces seven near-identical open-coded scan loops that repeated the
-    same ``for device → for identifier → is_tesla_vehicle`` boilerplate.
-    Future BLE-style extensions or new Tesla integrations only need to
-    change this helper rather than edit every call site.
-    """
-    for device in device_registry.devices.values():
-        for identifier in device.identifiers:
-            if len(identifier) >= 2 and identifier[0] in TESLA_INTEGRATIONS:
-                id_str = str(identifier[1])
-                if len(id_str) == 17 and not id_str.isdigit():
-                    yield device, id_str
-                    break
-
-
 def _state_power_w(state: Any) -> Optional[float]:
     """Return a Home Assistant power sensor state as watts."""
     if not state or state.state in ("unavailable", "unknown", "None", None):
@@ -622,6 +566,19 @@ def _state_power_w(state: Any) -> Optional[float]:
     return value
 
 
+def _state_hourly_load_profiles(
+    states: Sequence[Any],
+    to_local: Any,
+) -> Dict[str, List[Optional[float]]]:
+    """Bucket raw Recorder load states into hourly kW profiles."""
+    samples = []
+    for state in states:
+        power_w = _state_power_w(state)
+        if power_w is not None:
+            samples.append((state.last_updated, power_w))
+    return hourly_load_profiles(samples, to_local)
+
+
 class ChargingPriority(Enum):
     """Priority for charging source selection."""
     SOLAR_ONLY = "solar_only"  # Only charge from solar surplus
@@ -649,6 +606,156 @@ class PriceForecast:
     period: str  # 'offpeak', 'shoulder', 'peak'
 
 
+def _forecast_row_times(
+    value: Any,
+) -> tuple[Optional[datetime], Optional[str], Optional[str]]:
+    """Return (local naive hour, local hour key, absolute identity) for a row."""
+    try:
+        local_dt = _parse_forecast_hour_local_naive(value)
+        identity = _forecast_hour_key(value)
+    except (AttributeError, TypeError, ValueError):
+        return None, None, None
+    if local_dt is None:
+        return None, None, identity
+    local_key = local_dt.replace(minute=0, second=0, microsecond=0).isoformat()
+    return local_dt, local_key, identity
+
+
+@dataclass(frozen=True)
+class ForecastFrame:
+    """Surplus, price and battery forecasts aligned once onto integer slots.
+
+    Forecast rows carry ISO hour strings. Every planner strategy used to
+    re-parse them and rebuild hour-keyed dicts per vehicle; the frame parses
+    each row once and precomputes the surplus row matching each price row,
+    so strategies index parallel tuples instead.
+    """
+
+    hours: int
+    surplus_forecast: tuple[SurplusForecast, ...]
+    price_forecast: tuple[PriceForecast, ...]
+    battery_power_schedule: Mapping[str, float]
+    surplus_local: tuple[Optional[datetime], ...]
+    surplus_keys: tuple[Optional[str], ...]
+    surplus_identity: tuple[Optional[str], ...]
+    price_local: tuple[Optional[datetime], ...]
+    price_keys: tuple[Optional[str], ...]
+    price_identity: tuple[Optional[str], ...]
+    # Index of the surplus row for the same absolute hour, or -1.
+    price_surplus_index: tuple[int, ...]
+    repeated_price_hours: frozenset[str]
+
+    @classmethod
+    def build(
+        cls,
+        surplus_forecast: Sequence[SurplusForecast],
+        price_forecast: Sequence[PriceForecast],
+        battery_power_schedule: Optional[Mapping[str, float]] = None,
+        hours: Optional[int] = None,
+    ) -> "ForecastFrame":
+        """Parse forecast rows once and align them by absolute hour."""
+        surplus_rows = [_forecast_row_times(f.hour) for f in surplus_forecast]
+        price_rows = [_forecast_row_times(p.hour) for p in price_forecast]
+        return cls._aligned(
+            hours if hours is not None else max(
+                len(surplus_forecast),
+                len(price_forecast),
+            ),
+            tuple(surplus_forecast),
+            tuple(price_forecast),
+            battery_power_schedule or {},
+            surplus_rows,
+            price_rows,
+        )
+
+    @classmethod
+    def _aligned(
+        cls,
+        hours: int,
+        surplus_forecast: tuple[SurplusForecast, ...],
+        price_forecast: tuple[PriceForecast, ...],
+        battery_power_schedule: Mapping[str, float],
+        surplus_rows: Sequence[tuple],
+        price_rows: Sequence[tuple],
+    ) -> "ForecastFrame":
+        surplus_local, surplus_keys, surplus_identity = (
+            tuple(column) for column in zip(*surplus_rows)
+        ) if surplus_rows else ((), (), ())
+        price_local, price_keys, price_identity = (
+            tuple(column) for column in zip(*price_rows)
+        ) if price_rows else ((), (), ())
+
+        # Last row wins for a duplicated hour, as the hour-keyed dicts did.
+        surplus_index_by_identity = {
+            identity: index
+            for index, identity in enumerate(surplus_identity)
+            if identity is not None
+        }
+        price_surplus_index = tuple(
+            surplus_index_by_identity.get(identity, -1)
+            if identity is not None
+            else -1
+            for identity in price_identity
+        )
+
+        identities_by_local: dict[str, set[str]] = {}
+        for local_key, identity in zip(price_keys, price_identity):
+            if local_key is not None and identity is not None:
+                identities_by_local.setdefault(local_key, set()).add(identity)
+        repeated_price_hours = frozenset(
+            local_key
+            for local_key, identities in identities_by_local.items()
+            if len(identities) > 1
+        )
+
+        return cls(
+            hours=hours,
+            surplus_forecast=surplus_forecast,
+            price_forecast=price_forecast,
+            battery_power_schedule=battery_power_schedule,
+            surplus_local=surplus_local,
+            surplus_keys=surplus_keys,
+            surplus_identity=surplus_identity,
+            price_local=price_local,
+            price_keys=price_keys,
+            price_identity=price_identity,
+            price_surplus_index=price_surplus_index,
+            repeated_price_hours=repeated_price_hours,
+        )
+
+    def head(self, hours: int) -> "ForecastFrame":
+        """Return the first ``hours`` slots without re-parsing any row.
+
+        Forecasters return the same leading rows for any horizon, so a frame
+        fetched for the longest horizon serves every shorter one.
+        """
+        if hours >= self.hours:
+            return self
+        return self._aligned(
+            hours,
+            self.surplus_forecast[:hours],
+            self.price_forecast[:hours],
+            self.battery_power_schedule,
+            list(zip(
+                self.surplus_local[:hours],
+                self.surplus_keys[:hours],
+                self.surplus_identity[:hours],
+            )),
+            list(zip(
+                self.price_local[:hours],
+                self.price_keys[:hours],
+                self.price_identity[:hours],
+            )),
+        )
+
+    def surplus_for_price(self, index: int) -> Optional[SurplusForecast]:
+        """Return the surplus row for the same absolute hour as price row ``index``."""
+        surplus_index = self.price_surplus_index[index]
+        if surplus_index < 0:
+            return None
+        return self.surplus_forecast[surplus_index]
+
+
 @dataclass
 class PlannedChargingWindow:
     """A planned charging window."""
@@ -754,7 +861,6 @@ async def get_ev_location(
         CONF_ZAPTEC_USERNAME,
         CONF_OCPP_ENABLED,
     )
-    from homeassistant.helpers import entity_registry as er, device_registry as dr
 
     location = "unknown"
 
@@ -794,21 +900,13 @@ async def get_ev_location(
                             location = candidate_location
 
     # Method 1: Check Tesla Fleet/Teslemetry device_tracker entities
-    entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
+    vehicle_index = tesla_vehicle_index(hass)
 
-    for device, device_vin in _iter_tesla_vehicle_devices(device_registry):
+    for device, device_vin in vehicle_index.vehicle_devices(vehicle_vin):
         if vehicle_vin is not None and location != "unknown":
             break
 
-        # If specific VIN requested, skip other vehicles
-        if vehicle_vin is not None and device_vin != vehicle_vin:
-            continue
-
-        for entity in entity_registry.entities.values():
-            if entity.device_id != device.id:
-                continue
-
+        for entity in vehicle_index.device_entities(device.id):
             entity_id = entity.entity_id
             entity_id_lower = entity_id.lower()
 
@@ -905,7 +1003,6 @@ async def discover_all_tesla_vehicles(
             - ``ble_prefix`` (str | None): BLE entity prefix for BLE vehicles,
               ``None`` for Fleet API vehicles
     """
-    from homeassistant.helpers import device_registry as dr
     from ..const import (
         CONF_EV_PROVIDER,
         CONF_TESLA_BLE_ENTITY_PREFIX,
@@ -916,7 +1013,6 @@ async def discover_all_tesla_vehicles(
     )
     from ..tesla_ble import get_tesla_ble_status_state, tesla_ble_status_entity_ids
 
-    device_registry = dr.async_get(hass)
     vehicles: List[Dict[str, Any]] = []
     opts = {**config_entry.data, **config_entry.options} if config_entry else {}
     ev_provider = opts.get(CONF_EV_PROVIDER, EV_PROVIDER_FLEET_API)
@@ -936,7 +1032,7 @@ async def discover_all_tesla_vehicles(
         # device id is kept in ``device_ids`` so entity scans still see what
         # each integration contributes.
         by_vin: Dict[str, Dict[str, Any]] = {}
-        for device, device_vin in _iter_tesla_vehicle_devices(device_registry):
+        for device, device_vin in tesla_vehicle_index(hass).vehicle_devices():
             merged = by_vin.get(device_vin)
             if merged is not None:
                 merged["device_ids"].append(device.id)
@@ -1043,7 +1139,6 @@ async def is_ev_plugged_in(
         CONF_GENERIC_CHARGER_STATUS_ENTITY,
         CONF_SIGENERGY_CHARGER_ENABLED,
     )
-    from homeassistant.helpers import entity_registry as er, device_registry as dr
 
     # Sigenergy EVAC/EVDC exposes its own Modbus connection state. Check it
     # before OCPP/generic paths, because those can return False early when both
@@ -1207,18 +1302,10 @@ async def is_ev_plugged_in(
                         return True
 
     # Method 1: Check Tesla Fleet/Teslemetry entities
-    entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
-
-    for device, device_vin in _iter_tesla_vehicle_devices(device_registry):
-        # If specific VIN requested, skip other vehicles
-        if vehicle_vin is not None and device_vin != vehicle_vin:
-            continue
-
-        for entity in entity_registry.entities.values():
-            if entity.device_id != device.id:
-                continue
+    vehicle_index = tesla_vehicle_index(hass)
 
+    for device, device_vin in vehicle_index.vehicle_devices(vehicle_vin):
+        for entity in vehicle_index.device_entities(device.id):
             entity_id = entity.entity_id
             entity_id_lower = entity_id.lower()
 
@@ -1303,7 +1390,6 @@ async def is_ev_actively_charging(
         CONF_EV_PROVIDER,
         EV_PROVIDER_BOTH,
     )
-    from homeassistant.helpers import entity_registry as er, device_registry as dr
     from .loadpoint_status import charging_state_plugged_status
     import re as _re
 
@@ -1338,17 +1424,12 @@ async def is_ev_actively_charging(
 
     # Method 1: Tesla Fleet/Teslemetry — sensor.{vehicle}_charging == "Charging"
     # (binary_sensor.*_charger is plug-state, not charge-state, so we ignore it)
-    entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
-    for device, device_vin in _iter_tesla_vehicle_devices(device_registry):
-        if vehicle_vin is not None and device_vin != vehicle_vin:
-            continue
+    vehicle_index = tesla_vehicle_index(hass)
+    for device, device_vin in vehicle_index.vehicle_devices(vehicle_vin):
         charge_state_known = False
         charging_state_active = False
         maximum_power_w = 0.0
-        for entity in entity_registry.entities.values():
-            if entity.device_id != device.id:
-                continue
+        for entity in vehicle_index.device_entities(device.id):
             eid = entity.entity_id
             eid_lower = eid.lower()
             if (
@@ -1452,7 +1533,6 @@ async def get_ev_battery_level(
         CONF_GENERIC_CHARGER_ENABLED,
     )
     from .generic_charger_soc import resolve_generic_charger_soc
-    from homeassistant.helpers import entity_registry as er, device_registry as dr
 
     # Generic charger — check configured SoC sensor
     if config_entry:
@@ -1493,18 +1573,10 @@ async def get_ev_battery_level(
                     continue
 
     # Method 2: Check Tesla Fleet/Teslemetry entities
-    entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
-
-    for device, device_vin in _iter_tesla_vehicle_devices(device_registry):
-        # If specific VIN requested, skip other vehicles
-        if vehicle_vin is not None and device_vin != vehicle_vin:
-            continue
-
-        for entity in entity_registry.entities.values():
-            if entity.device_id != device.id:
-                continue
+    vehicle_index = tesla_vehicle_index(hass)
 
+    for device, device_vin in vehicle_index.vehicle_devices(vehicle_vin):
+        for entity in vehicle_index.device_entities(device.id):
             entity_id = entity.entity_id
             entity_id_lower = entity_id.lower()
 
@@ -1546,15 +1618,19 @@ class LoadProfileEstimator:
         1.5, 1.4, 1.0, 0.8, 0.6, 0.5,  # 18:00-23:59 (earlier evening decline)
     ]
 
-    def __init__(self, hass):
+    def __init__(self, hass, config_entry=None):
         """Initialize the estimator.
 
         Args:
             hass: Home Assistant instance
+            config_entry: Optional config entry used to find the optimizer's
+                load estimator, whose cached history is preferred
         """
         self.hass = hass
+        self.config_entry = config_entry
         self._load_history: Dict[str, List[float]] = {}
         self._last_history_update: Optional[datetime] = None
+        self.profile_source = "default"
 
     async def get_typical_load_profile(self, day_type: str = "weekday") -> List[float]:
         """
@@ -1575,10 +1651,49 @@ class LoadProfileEstimator:
             return self.DEFAULT_WEEKEND_PROFILE.copy()
         return self.DEFAULT_WEEKDAY_PROFILE.copy()
 
+    def _shared_load_estimator(self) -> Any:
+        """Return the optimizer's load estimator when it has a load entity."""
+        if self.config_entry is None:
+            return None
+        entry_data = self.hass.data.get(DOMAIN, {}).get(
+            self.config_entry.entry_id,
+            {},
+        )
+        estimator = getattr(
+            entry_data.get("optimization_coordinator"),
+            "_load_estimator",
+            None,
+        )
+        if estimator is None or not getattr(estimator, "load_entity_id", None):
+            return None
+        return estimator
+
+    def _apply_profiles(
+        self,
+        profiles: Mapping[str, List[Optional[float]]],
+        source: str,
+    ) -> None:
+        """Store learned hourly profiles, filling empty hours from defaults."""
+        defaults = {
+            "weekday": self.DEFAULT_WEEKDAY_PROFILE,
+            "weekend": self.DEFAULT_WEEKEND_PROFILE,
+        }
+        for day_type, default_profile in defaults.items():
+            learned = profiles.get(day_type) or [None] * 24
+            self._load_history[day_type] = [
+                value if value is not None else default_profile[hour]
+                for hour, value in enumerate(learned)
+            ]
+        self.profile_source = source
+
     async def update_from_history(self, days: int = 14) -> None:
         """
         Update load profiles from Home Assistant history.
 
+        Prefers the optimizer's cached half-hour load history, so one Recorder
+        scan serves both the LP and the EV planner. Only installs without an
+        optimizer load entity scan the Recorder here.
+
         Args:
             days: Number of days of history to analyze
         """
@@ -1588,6 +1703,19 @@ class LoadProfileEstimator:
                 if (datetime.now() - self._last_history_update).total_seconds() < 3600:
                     return  # Updated within last hour
 
+            shared = self._shared_load_estimator()
+            if shared is not None:
+                profiles = await shared.get_hourly_load_profiles(days)
+                if profiles:
+                    self._apply_profiles(profiles, "optimizer_history")
+                    _LOGGER.info(
+                        f"Updated load profiles from {days} days of optimizer load history"
+                    )
+                # The optimizer owns this Recorder scan; retry with it, not
+                # with a second scan of our own, after the hourly throttle.
+                self._last_history_update = datetime.now()
+                return
+
             # Find load power sensor
             load_entity = None
             for entity_id in self.hass.states.async_entity_ids("sensor"):
@@ -1622,46 +1750,14 @@ class LoadProfileEstimator:
             if not history or load_entity not in history:
                 return
 
-            # Group by hour and day type
-            weekday_hours: Dict[int, List[float]] = {h: [] for h in range(24)}
-            weekend_hours: Dict[int, List[float]] = {h: [] for h in range(24)}
-
-            for state in history[load_entity]:
-                if state.state in ("unknown", "unavailable"):
-                    continue
-                try:
-                    power_w = _state_power_w(state)
-                    if power_w is None:
-                        continue
-                    power_kw = power_w / 1000
-                    local_last_updated = dt_util.as_local(state.last_updated)
-                    hour = local_last_updated.hour
-                    is_weekend = local_last_updated.weekday() >= 5
-
-                    if is_weekend:
-                        weekend_hours[hour].append(power_kw)
-                    else:
-                        weekday_hours[hour].append(power_kw)
-                except (ValueError, TypeError):
-                    continue
-
-            # Calculate median for each hour
-            weekday_profile = []
-            weekend_profile = []
-
-            for hour in range(24):
-                if weekday_hours[hour]:
-                    weekday_profile.append(statistics.median(weekday_hours[hour]))
-                else:
-                    weekday_profile.append(self.DEFAULT_WEEKDAY_PROFILE[hour])
-
-                if weekend_hours[hour]:
-                    weekend_profile.append(statistics.median(weekend_hours[hour]))
-                else:
-                    weekend_profile.append(self.DEFAULT_WEEKEND_PROFILE[hour])
-
-            self._load_history["weekday"] = weekday_profile
-            self._load_history["weekend"] = weekend_profile
+            # Bucketing two weeks of raw states is pure CPU; keep it off the
+            # event loop.
+            profiles = await self.hass.async_add_executor_job(
+                _state_hourly_load_profiles,
+                history[load_entity],
+                dt_util.as_local,
+            )
+            self._apply_profiles(profiles, "recorder")
             self._last_history_update = datetime.now()
 
             _LOGGER.info(f"Updated load profiles from {days} days of history")
@@ -1932,7 +2028,7 @@ class SurplusForecaster:
         self.hass = hass
         self.config_entry = config_entry
         self.solar_forecaster = SolarForecaster(hass, config_entry)
-        self.load_estimator = LoadProfileEstimator(hass)
+        self.load_estimator = LoadProfileEstimator(hass, config_entry)
 
     async def forecast_surplus(
         self,
@@ -2244,15 +2340,16 @@ class PriceForecaster:
 
             # Get rates and TOU schedule
             buy_rates = tariff_schedule.get("buy_rates", {})
-            sell_rates = tariff_schedule.get("sell_rates", {})
             tou_periods = tariff_schedule.get("tou_periods", {})
-            current_season = tariff_schedule.get("current_season", "Summer")
 
             if not buy_rates:
                 _LOGGER.debug("No buy_rates in tariff schedule")
                 return None
 
             _LOGGER.debug(f"Tariff forecast using rates: {buy_rates}, TOU periods: {list(tou_periods.keys())}")
+            # Same season-aware period matching as the optimizer and the
+            # current-price sensors, compiled once per tariff version.
+            timeline = compile_tariff_timeline(tariff_schedule)
 
             forecasts = []
             # TOU rates change on wall-clock boundaries. Anchoring every row
@@ -2266,12 +2363,10 @@ class PriceForecaster:
 
             for h in range(hours):
                 hour_dt = now + timedelta(hours=h)
-                hour = hour_dt.hour
-                dow = hour_dt.weekday()
-                tesla_dow = (dow + 1) % 7  # Convert Python dow to Tesla dow (0=Sunday)
 
                 # Find the TOU period for this hour using the actual schedule
-                period_type = self._find_tou_period(tou_periods, hour, tesla_dow)
+                period_type = timeline.period_at(hour_dt, default="ALL")
+                _, buy_rates, sell_rates, _ = timeline.components(hour_dt)
 
                 # Get rate for this period - try exact match, then common variations
                 import_rate = None
@@ -2424,61 +2519,6 @@ class PriceForecaster:
             _LOGGER.warning(f"Could not get Sigenergy tariff forecast: {e}")
             return None
 
-    def _find_tou_period(self, tou_periods: dict, hour: int, tesla_dow: int) -> str:
-        """
-        Find the TOU period for a given hour and day of week.
-
-        Args:
-            tou_periods: Dict of period_name -> list of time ranges
-            hour: Hour of day (0-23)
-            tesla_dow: Day of week in Tesla format (0=Sunday)
-
-        Returns:
-            Period name (e.g., 'ON_PEAK', 'OFF_PEAK', 'SUPER_OFF_PEAK')
-        """
-        # Check all defined periods — supports custom names like PEAK_1, PEAK_2.
-        # SUPER_OFF_PEAK checked first, OFF_PEAK last as catch-all.
-        sorted_priority = sorted(
-            tou_periods.keys(),
-            key=lambda n: (
-                2 if n.startswith("OFF_PEAK") else
-                0 if n.startswith("SUPER_OFF_PEAK") else 1
-            ),
-        )
-        for period_name in sorted_priority:
-            period_data = tou_periods[period_name]
-            if isinstance(period_data, list):
-                periods_list = period_data
-            elif isinstance(period_data, dict):
-                periods_list = period_data.get("periods", [])
-            else:
-                periods_list = []
-            for period in periods_list:
-                from_dow = period.get("fromDayOfWeek", 0)
-                to_dow = period.get("toDayOfWeek", 6)
-                from_hour = period.get("fromHour", 0)
-                to_hour = period.get("toHour", 24)
-
-                # Check day of week
-                if from_dow <= tesla_dow <= to_dow:
-                    # Check time - handle overnight periods (e.g., 21:00 to 10:00)
-                    if from_hour <= to_hour:
-                        # Normal period (e.g., 10:00 to 14:00)
-                        if from_hour <= hour < to_hour:
-                            _LOGGER.debug(
-                                f"TOU match: hour={hour}, dow={tesla_dow} -> {period_name} "
-                                f"(from_hour={from_hour}, to_hour={to_hour})"
-                            )
-                            return period_name
-                    else:
-                        # Overnight period (e.g., 21:00 to 10:00)
-                        if hour >= from_hour or hour < to_hour:
-                            return period_name
-
-        # Default fallback - log when we fall back to ALL
-        _LOGGER.debug(f"TOU fallback: hour={hour}, dow={tesla_dow} -> ALL (no match found)")
-        return "ALL"
-
     async def _estimate_tou_prices(self, hours: int) -> List[PriceForecast]:
         """
         Estimate prices based on typical TOU tariff structure.
@@ -2541,6 +2581,12 @@ class ChargingPlanner:
     # Charging efficiency (AC to DC)
     CHARGING_EFFICIENCY = 0.9
 
+    # Forecast frame shared by every plan made inside forecast_tick().
+    _forecast_frame: Optional[ForecastFrame] = None
+    _forecast_tick_depth = 0
+    _forecast_frame_builds = 0
+    _forecast_frame_hits = 0
+
     def __init__(self, hass, config_entry, battery_schedule_getter=None, grid_capacity_kw: float = 7.4):
         """Initialize the planner.
 
@@ -2654,6 +2700,52 @@ class ChargingPlanner:
             _LOGGER.debug(f"Error getting battery schedule: {e}")
             return {}
 
+    @contextmanager
+    def forecast_tick(self) -> Iterator["ChargingPlanner"]:
+        """Share one forecast frame across every plan made inside the block.
+
+        Outside a tick each plan fetches its own forecasts, as direct API
+        callers expect fresh data.
+        """
+        self._forecast_tick_depth += 1
+        try:
+            yield self
+        finally:
+            self._forecast_tick_depth -= 1
+            if not self._forecast_tick_depth:
+                self._forecast_frame = None
+
+    async def get_forecast_frame(self, hours: int = 24) -> ForecastFrame:
+        """Return the aligned forecast frame covering the next ``hours`` hours."""
+        frame = self._forecast_frame
+        in_tick = self._forecast_tick_depth > 0
+        if in_tick and frame is not None and frame.hours >= hours:
+            self._forecast_frame_hits += 1
+            return frame.head(hours)
+
+        horizon = max(hours, FORECAST_FRAME_MIN_HOURS) if in_tick else hours
+        surplus_forecast = await self.surplus_forecaster.forecast_surplus(horizon)
+        price_forecast = await self.price_forecaster.get_price_forecast(horizon)
+        # EV uses remaining grid capacity when the battery is also charging.
+        battery_power_schedule = await self._get_battery_power_schedule(horizon)
+        frame = ForecastFrame.build(
+            surplus_forecast,
+            price_forecast,
+            battery_power_schedule,
+            hours=horizon,
+        )
+        self._forecast_frame_builds += 1
+        if in_tick:
+            self._forecast_frame = frame
+        return frame.head(hours)
+
+    def forecast_frame_stats(self) -> dict[str, int]:
+        """Return how often plans built or reused a forecast frame."""
+        return {
+            "builds": self._forecast_frame_builds,
+            "hits": self._forecast_frame_hits,
+        }
+
     def _get_grid_capacity_kw(self) -> float:
         """Return the configured site import limit used by EV power sharing."""
         entry_data: dict[str, Any] = {}
@@ -2705,6 +2797,7 @@ class ChargingPlanner:
         reserved_ev_power_schedule: Optional[Dict[str, float]] = None,
         minimum_charging_power_kw: float = MIN_CHARGING_POWER_KW,
         charging_power_step_kw: Optional[float] = None,
+        grid_capacity_kw: Optional[float] = None,
     ) -> float:
         """Calculate available power for EV charging at a given hour.
 
@@ -2716,13 +2809,16 @@ class ChargingPlanner:
             charger_max_kw: Maximum EV charger power
             battery_power_schedule: Dict of hour -> battery charging power
             solar_surplus_kw: Available solar surplus (can exceed grid capacity)
+            grid_capacity_kw: Site import limit, when the caller already
+                resolved it for a whole plan
 
         Returns:
             Available power for EV in kW
         """
         battery_power = battery_power_schedule.get(hour, 0)
         reserved_ev_power = (reserved_ev_power_schedule or {}).get(hour, 0)
-        grid_capacity_kw = self._get_grid_capacity_kw()
+        if grid_capacity_kw is None:
+            grid_capacity_kw = self._get_grid_capacity_kw()
 
         if solar_surplus_kw > 0:
             # Solar surplus available - EV can use surplus + remaining grid
@@ -2824,14 +2920,13 @@ class ChargingPlanner:
         else:
             hours_available = 24
 
-        # Get forecasts
-        surplus_forecast = await self.surplus_forecaster.forecast_surplus(hours_available)
-        price_forecast = await self.price_forecaster.get_price_forecast(hours_available)
-
-        # Get battery power schedule for dynamic power sharing
-        # EV uses remaining grid capacity when battery is also charging
-        # Both charge during cheap/solar periods - we just share the available power
-        battery_power_schedule = await self._get_battery_power_schedule(hours_available)
+        # Get forecasts and the battery power schedule for dynamic power
+        # sharing, aligned once per evaluation tick and shared by every
+        # vehicle planned inside it.
+        frame = await self.get_forecast_frame(hours_available)
+        surplus_forecast = frame.surplus_forecast
+        price_forecast = frame.price_forecast
+        battery_power_schedule = frame.battery_power_schedule
         if battery_power_schedule:
             _LOGGER.debug(
                 f"Battery charging in {len(battery_power_schedule)} hours - "
@@ -2849,6 +2944,7 @@ class ChargingPlanner:
                 reserved_ev_power_schedule=reserved_ev_power_schedule,
                 minimum_charging_power_kw=minimum_charging_power_kw,
                 charging_power_step_kw=charging_power_step_kw,
+                forecast_frame=frame,
             )
         elif (
             priority == ChargingPriority.SOLAR_PREFERRED
@@ -2863,6 +2959,7 @@ class ChargingPlanner:
                 reserved_ev_power_schedule=reserved_ev_power_schedule,
                 minimum_charging_power_kw=minimum_charging_power_kw,
                 charging_power_step_kw=charging_power_step_kw,
+                forecast_frame=frame,
             )
         elif priority in (
             ChargingPriority.COST_OPTIMIZED,
@@ -2877,6 +2974,7 @@ class ChargingPlanner:
                 reserved_ev_power_schedule=reserved_ev_power_schedule,
                 minimum_charging_power_kw=minimum_charging_power_kw,
                 charging_power_step_kw=charging_power_step_kw,
+                forecast_frame=frame,
             )
         else:  # TIME_CRITICAL
             plan = await self._plan_time_critical(
@@ -2887,6 +2985,7 @@ class ChargingPlanner:
                 reserved_ev_power_schedule=reserved_ev_power_schedule,
                 minimum_charging_power_kw=minimum_charging_power_kw,
                 charging_power_step_kw=charging_power_step_kw,
+                forecast_frame=frame,
             )
 
         plan.battery_capacity_kwh = resolved_capacity.battery_capacity_kwh
@@ -2911,24 +3010,31 @@ class ChargingPlanner:
         reserved_ev_power_schedule: Optional[Dict[str, float]] = None,
         minimum_charging_power_kw: float = MIN_CHARGING_POWER_KW,
         charging_power_step_kw: Optional[float] = None,
+        forecast_frame: Optional[ForecastFrame] = None,
     ) -> ChargingPlan:
         """Plan charging using only solar surplus with dynamic power sharing."""
         windows = []
         energy_allocated = 0
         total_confidence = 0
-        battery_power_schedule = battery_power_schedule or {}
+        frame = forecast_frame or ForecastFrame.build(
+            surplus_forecast,
+            (),
+            battery_power_schedule,
+        )
+        battery_power_schedule = frame.battery_power_schedule
+        grid_capacity_kw = self._get_grid_capacity_kw()
         now = _ha_local_now_naive()
         target_time_local = (
             _as_ha_local_naive(target_time)
             if target_time is not None and target_time.tzinfo is not None
             else target_time
         )
-        for forecast in surplus_forecast:
+        for index, forecast in enumerate(frame.surplus_forecast):
             if energy_allocated >= energy_needed_kwh:
                 break
 
             if forecast.surplus_kw >= 1.0:  # Minimum 1kW to charge
-                hour_dt = _parse_forecast_hour_local_naive(forecast.hour)
+                hour_dt = frame.surplus_local[index]
                 if hour_dt is None:
                     continue
                 usable_window = _usable_forecast_window(
@@ -2939,18 +3045,18 @@ class ChargingPlanner:
                 if usable_window is None:
                     continue
                 end_dt, usable_fraction = usable_window
-                hour_key = hour_dt.replace(minute=0, second=0, microsecond=0).isoformat()
 
                 # Dynamic power sharing: calculate available power for EV
                 # Solar surplus can power both battery and EV simultaneously
                 available_power = self._get_available_ev_power(
-                    hour_key,
+                    frame.surplus_keys[index],
                     charger_power_kw,
                     battery_power_schedule,
                     solar_surplus_kw=forecast.surplus_kw,
                     reserved_ev_power_schedule=reserved_ev_power_schedule,
                     minimum_charging_power_kw=minimum_charging_power_kw,
                     charging_power_step_kw=charging_power_step_kw,
+                    grid_capacity_kw=grid_capacity_kw,
                 )
 
                 if available_power < minimum_charging_power_kw:
@@ -3021,6 +3127,7 @@ class ChargingPlanner:
         reserved_ev_power_schedule: Optional[Dict[str, float]] = None,
         minimum_charging_power_kw: float = MIN_CHARGING_POWER_KW,
         charging_power_step_kw: Optional[float] = None,
+        forecast_frame: Optional[ForecastFrame] = None,
     ) -> ChargingPlan:
         """Plan charging preferring solar, falling back to offpeak grid with dynamic power sharing."""
         windows = []
@@ -3028,24 +3135,30 @@ class ChargingPlanner:
         grid_energy = 0
         total_cost = 0
         total_confidence = 0
-        battery_power_schedule = battery_power_schedule or {}
+        frame = forecast_frame or ForecastFrame.build(
+            surplus_forecast,
+            price_forecast,
+            battery_power_schedule,
+        )
+        battery_power_schedule = frame.battery_power_schedule
+        grid_capacity_kw = self._get_grid_capacity_kw()
         now = _ha_local_now_naive()
         target_time_local = (
             _as_ha_local_naive(target_time)
             if target_time is not None and target_time.tzinfo is not None
             else target_time
         )
-        repeated_price_hours = _repeated_forecast_local_hours(
-            [price.hour for price in price_forecast]
-        )
+        # Absolute hours already holding a window, keyed like
+        # _forecast_hour_key(window.start_time).
+        covered_hours: set[Optional[str]] = set()
 
         # First pass: allocate solar
-        for forecast in surplus_forecast:
+        for index, forecast in enumerate(frame.surplus_forecast):
             if solar_energy + grid_energy >= energy_needed_kwh:
                 break
 
             if forecast.surplus_kw >= 1.0:
-                hour_dt = _parse_forecast_hour_local_naive(forecast.hour)
+                hour_dt = frame.surplus_local[index]
                 if hour_dt is None:
                     continue
                 usable_window = _usable_forecast_window(
@@ -3056,17 +3169,17 @@ class ChargingPlanner:
                 if usable_window is None:
                     continue
                 end_dt, usable_fraction = usable_window
-                hour_key = hour_dt.replace(minute=0, second=0, microsecond=0).isoformat()
 
                 # Dynamic power sharing with battery
                 available_power = self._get_available_ev_power(
-                    hour_key,
+                    frame.surplus_keys[index],
                     charger_power_kw,
                     battery_power_schedule,
                     solar_surplus_kw=forecast.surplus_kw,
                     reserved_ev_power_schedule=reserved_ev_power_schedule,
                     minimum_charging_power_kw=minimum_charging_power_kw,
                     charging_power_step_kw=charging_power_step_kw,
+                    grid_capacity_kw=grid_capacity_kw,
                 )
 
                 if available_power < minimum_charging_power_kw:
@@ -3097,6 +3210,7 @@ class ChargingPlanner:
                     price_cents_kwh=0,
                     reason="solar_forecast",
                 ))
+                covered_hours.add(_forecast_hour_key(display_start))
 
                 solar_energy += energy_this_hour
                 total_confidence += forecast.confidence
@@ -3105,24 +3219,23 @@ class ChargingPlanner:
         # Sort by price (cheapest first) to prefer offpeak/cheap hours
         # Cheap hours are when battery also charges - use dynamic power sharing
         remaining_energy = energy_needed_kwh - solar_energy
-        if remaining_energy > 0 and price_forecast:
+        if remaining_energy > 0 and frame.price_forecast:
             # Sort all hours by price (cheapest first)
-            sorted_by_price = sorted(price_forecast, key=lambda p: p.import_cents)
+            sorted_by_price = sorted(
+                range(len(frame.price_forecast)),
+                key=lambda index: frame.price_forecast[index].import_cents,
+            )
 
-            for price_data in sorted_by_price:
+            for index in sorted_by_price:
                 if grid_energy >= remaining_energy:
                     break
+                price_data = frame.price_forecast[index]
 
                 # Check if this hour is already covered by solar
-                already_covered = any(
-                    _forecast_hour_key(w.start_time)
-                    == _forecast_hour_key(price_data.hour)
-                    for w in windows
-                )
-                if already_covered:
+                if frame.price_identity[index] in covered_hours:
                     continue
 
-                hour_dt = _parse_forecast_hour_local_naive(price_data.hour)
+                hour_dt = frame.price_local[index]
                 if hour_dt is None:
                     continue
                 usable_window = _usable_forecast_window(
@@ -3133,7 +3246,7 @@ class ChargingPlanner:
                 if usable_window is None:
                     continue
                 end_dt, usable_fraction = usable_window
-                hour_key = hour_dt.replace(minute=0, second=0, microsecond=0).isoformat()
+                hour_key = frame.price_keys[index]
 
                 # Skip hours that fall inside a demand window (unless override set)
                 if self._is_grid_charging_blocked_at(hour_dt):
@@ -3161,6 +3274,7 @@ class ChargingPlanner:
                     reserved_ev_power_schedule=reserved_ev_power_schedule,
                     minimum_charging_power_kw=minimum_charging_power_kw,
                     charging_power_step_kw=charging_power_step_kw,
+                    grid_capacity_kw=grid_capacity_kw,
                 )
 
                 if available_power < minimum_charging_power_kw:
@@ -3180,14 +3294,7 @@ class ChargingPlanner:
                     price_data.hour,
                     planned_end,
                     start_dt=planned_start,
-                    preserve_offset=(
-                        hour_dt.replace(
-                            minute=0,
-                            second=0,
-                            microsecond=0,
-                        ).isoformat()
-                        in repeated_price_hours
-                    ),
+                    preserve_offset=hour_key in frame.repeated_price_hours,
                 )
 
                 # Label source based on period type
@@ -3202,6 +3309,7 @@ class ChargingPlanner:
                     price_cents_kwh=price_data.import_cents,
                     reason=reason,
                 ))
+                covered_hours.add(_forecast_hour_key(display_start))
 
                 grid_energy += energy_this_hour
                 total_cost += energy_this_hour * price_data.import_cents
@@ -3256,6 +3364,7 @@ class ChargingPlanner:
         reserved_ev_power_schedule: Optional[Dict[str, float]] = None,
         minimum_charging_power_kw: float = MIN_CHARGING_POWER_KW,
         charging_power_step_kw: Optional[float] = None,
+        forecast_frame: Optional[ForecastFrame] = None,
     ) -> ChargingPlan:
         """
         Plan charging to minimize cost while meeting departure deadline.
@@ -3273,7 +3382,13 @@ class ChargingPlanner:
         - Battery charging at 5kW during cheap period -> EV charges at reduced rate
         """
         now = _ha_local_now_naive()
-        battery_power_schedule = battery_power_schedule or {}
+        frame = forecast_frame or ForecastFrame.build(
+            surplus_forecast,
+            price_forecast,
+            battery_power_schedule,
+        )
+        battery_power_schedule = frame.battery_power_schedule
+        grid_capacity_kw = self._get_grid_capacity_kw()
 
         # Convert target_time to naive local time for comparison
         # Price forecast hours are stored as naive local time strings
@@ -3291,21 +3406,10 @@ class ChargingPlanner:
 
         # Build charging options from price forecast (within deadline)
         charging_options = []
-        repeated_price_hours = _repeated_forecast_local_hours(
-            [price.hour for price in price_forecast]
-        )
-        surplus_by_hour = {
-            key: forecast
-            for forecast in surplus_forecast
-            if (key := _forecast_hour_key(forecast.hour)) is not None
-        }
 
-        for i, price in enumerate(price_forecast):
-            try:
-                hour_dt = _parse_forecast_hour_local_naive(price.hour)
-                if hour_dt is None:
-                    continue
-            except Exception:
+        for i, price in enumerate(frame.price_forecast):
+            hour_dt = frame.price_local[i]
+            if hour_dt is None:
                 continue
 
             # Skip if past departure time (compare naive local times)
@@ -3326,22 +3430,17 @@ class ChargingPlanner:
                 continue  # Less than 6 minutes usable — skip
 
             # Check for solar surplus at this hour
-            surplus = surplus_by_hour.get(_forecast_hour_key(price.hour))
+            surplus = frame.surplus_for_price(i)
             solar_available = surplus.surplus_kw if surplus is not None else 0
+            hour_key = frame.price_keys[i]
+            preserve_offset = hour_key in frame.repeated_price_hours
             display_start, display_end = _forecast_window_display_bounds(
                 price.hour,
                 hour_end,
                 start_dt=max(hour_dt, now),
-                preserve_offset=(
-                    hour_dt.replace(
-                        minute=0,
-                        second=0,
-                        microsecond=0,
-                    ).isoformat()
-                    in repeated_price_hours
-                ),
+                preserve_offset=preserve_offset,
             )
-            option_identity = _forecast_hour_key(price.hour) or display_start
+            option_identity = frame.price_identity[i] or display_start
 
             # Solar surplus is free
             if solar_available >= 1.0:
@@ -3361,11 +3460,6 @@ class ChargingPlanner:
             # Grid option. Respect the home battery's optimizer allocation and
             # use only remaining site capacity. Free/negative grid can use all
             # remaining headroom; paid grid still yields forecast solar first.
-            hour_key = hour_dt.replace(
-                minute=0,
-                second=0,
-                microsecond=0,
-            ).isoformat()
             available_power = self._get_available_ev_power(
                 hour_key,
                 charger_power_kw,
@@ -3374,6 +3468,7 @@ class ChargingPlanner:
                 reserved_ev_power_schedule=reserved_ev_power_schedule,
                 minimum_charging_power_kw=minimum_charging_power_kw,
                 charging_power_step_kw=charging_power_step_kw,
+                grid_capacity_kw=grid_capacity_kw,
             )
 
             # When grid is free (0c) or negative, use full charger power - don't reduce for solar
@@ -3408,14 +3503,7 @@ class ChargingPlanner:
                     "bounded_start": max(hour_dt, now),
                     "bounded_end": hour_end,
                     "forecast_hour": price.hour,
-                    "preserve_offset": (
-                        hour_dt.replace(
-                            minute=0,
-                            second=0,
-                            microsecond=0,
-                        ).isoformat()
-                        in repeated_price_hours
-                    ),
+                    "preserve_offset": preserve_offset,
                     "end_time": display_end,
                     "identity": option_identity,
                     "source": grid_source,
@@ -3606,9 +3694,15 @@ class ChargingPlanner:
         reserved_ev_power_schedule: Optional[Dict[str, float]] = None,
         minimum_charging_power_kw: float = MIN_CHARGING_POWER_KW,
         charging_power_step_kw: Optional[float] = None,
+        forecast_frame: Optional[ForecastFrame] = None,
     ) -> ChargingPlan:
         """Plan charging to meet deadline, minimizing cost as secondary goal."""
-        battery_power_schedule = battery_power_schedule or {}
+        frame = forecast_frame or ForecastFrame.build(
+            surplus_forecast,
+            price_forecast,
+            battery_power_schedule,
+        )
+        battery_power_schedule = frame.battery_power_schedule
 
         if not target_time:
             # No deadline, use cost-optimized
@@ -3620,6 +3714,7 @@ class ChargingPlanner:
                 reserved_ev_power_schedule=reserved_ev_power_schedule,
                 minimum_charging_power_kw=minimum_charging_power_kw,
                 charging_power_step_kw=charging_power_step_kw,
+                forecast_frame=frame,
             )
 
         # If the target can be met entirely inside guaranteed free-grid
@@ -3640,6 +3735,7 @@ class ChargingPlanner:
             reserved_ev_power_schedule=reserved_ev_power_schedule,
             minimum_charging_power_kw=minimum_charging_power_kw,
             charging_power_step_kw=charging_power_step_kw,
+            forecast_frame=frame,
         )
         if (
             cost_plan.can_meet_target
@@ -3677,28 +3773,16 @@ class ChargingPlanner:
         grid_energy = 0
         total_cost = 0
 
-        # Reverse matched forecast hours to work backwards. Amber price data can
-        # contain historical rows, so positional zipping can attach the wrong
-        # price to a future solar interval.
-        surplus_by_hour = {
-            key: surplus
-            for surplus in surplus_forecast
-            if (key := _forecast_hour_key(surplus.hour)) is not None
-        }
-        repeated_price_hours = _repeated_forecast_local_hours(
-            [price.hour for price in price_forecast]
-        )
-        combined = [
-            (surplus_by_hour.get(_forecast_hour_key(price.hour)), price)
-            for price in price_forecast
-        ]
-        combined.reverse()
-
-        for surplus, price in combined:
+        # Walk price slots backwards with their matched surplus slot. Amber
+        # price data can contain historical rows, so positional zipping can
+        # attach the wrong price to a future solar interval.
+        for index in reversed(range(len(frame.price_forecast))):
             if energy_allocated >= energy_needed_kwh:
                 break
 
-            hour_dt = _parse_forecast_hour_local_naive(price.hour)
+            price = frame.price_forecast[index]
+            surplus = frame.surplus_for_price(index)
+            hour_dt = frame.price_local[index]
             if hour_dt is None:
                 continue
 
@@ -3754,12 +3838,7 @@ class ChargingPlanner:
                 bounded_end,
                 start_dt=planned_start,
                 preserve_offset=(
-                    hour_dt.replace(
-                        minute=0,
-                        second=0,
-                        microsecond=0,
-                    ).isoformat()
-                    in repeated_price_hours
+                    frame.price_keys[index] in frame.repeated_price_hours
                 ),
             )
 
@@ -4438,6 +4517,12 @@ def _vehicle_config_value(
     return default
 
 
+def _forecast_tick(planner: Any):
+    """Return the planner's shared forecast tick, or a no-op context."""
+    tick = getattr(planner, "forecast_tick", None)
+    return tick() if tick is not None else nullcontext()
+
+
 class AutoScheduleExecutor:
     """
     Automatically executes charging plans based on optimal windows.
@@ -4524,28 +4609,11 @@ class AutoScheduleExecutor:
 
         # Fleet API vehicles numbered first (same order as EVVehiclesView)
         if ev_provider in (EV_PROVIDER_FLEET_API, EV_PROVIDER_BOTH):
-            from homeassistant.helpers import device_registry as dr
-            device_registry = dr.async_get(self.hass)
-            seen_vins: set[str] = set()
-            for device in device_registry.devices.values():
-                for identifier in device.identifiers:
-                    if len(identifier) < 2:
-                        continue
-                    domain = identifier[0]
-                    id_str = str(identifier[1])
-                    vin_key = id_str.strip().lower()
-                    if (
-                        domain in TESLA_INTEGRATIONS
-                        and len(id_str) == 17
-                        and not id_str.isdigit()
-                        and vin_key not in seen_vins
-                    ):
-                        seen_vins.add(vin_key)
-                        fleet_vins.append(id_str)
-                        vehicle_num += 1
-                        if str(vehicle_num) == str(vehicle_id):
-                            return id_str
-                        break
+            for fleet_vin in tesla_vehicle_index(self.hass).vins():
+                fleet_vins.append(fleet_vin)
+                vehicle_num += 1
+                if str(vehicle_num) == str(vehicle_id):
+                    return fleet_vin
 
         # BLE vehicles follow fleet vehicles
         if ev_provider in (EV_PROVIDER_TESLA_BLE, EV_PROVIDER_BOTH):
@@ -5120,7 +5188,6 @@ class AutoScheduleExecutor:
             TESLA_BLE_SENSOR_CHARGE_LEVEL,
         )
         from .generic_charger_soc import resolve_generic_charger_soc
-        from homeassistant.helpers import entity_registry as er, device_registry as dr
 
         live_soc = None
         entries = self.hass.config_entries.async_entries(DOMAIN)
@@ -5177,23 +5244,20 @@ class AutoScheduleExecutor:
 
         # Method 2: Check Tesla Fleet/Teslemetry entities via device registry
         if live_soc is None:
-            entity_registry = er.async_get(self.hass)
-            device_registry = dr.async_get(self.hass)
+            vehicle_index = tesla_vehicle_index(self.hass)
+            # If we have a resolved VIN, only match the correct vehicle
+            device_filter = (
+                vehicle_vin
+                if vehicle_vin and len(vehicle_vin) == 17 and vehicle_vin.isalnum()
+                else None
+            )
 
-            for device, device_vin in _iter_tesla_vehicle_devices(device_registry):
+            for device, device_vin in vehicle_index.vehicle_devices(device_filter):
                 if live_soc is not None:
                     break
 
-                # If we have a resolved VIN, only match the correct vehicle
-                if vehicle_vin and len(vehicle_vin) == 17 and vehicle_vin.isalnum():
-                    if device_vin != vehicle_vin:
-                        continue
-
                 # Find battery/charge_level sensor for this Tesla device
-                for entity in entity_registry.entities.values():
-                    if entity.device_id != device.id:
-                        continue
-
+                for entity in vehicle_index.device_entities(device.id):
                     entity_id = entity.entity_id
                     entity_id_lower = entity_id.lower()
 
@@ -5266,7 +5330,6 @@ class AutoScheduleExecutor:
             CONF_TESLA_BLE_ENTITY_PREFIX,
             DEFAULT_TESLA_BLE_ENTITY_PREFIX,
         )
-        from homeassistant.helpers import entity_registry as er, device_registry as dr
 
         # Initialize location cache if needed
         if not hasattr(self, '_location_cache'):
@@ -5278,23 +5341,20 @@ class AutoScheduleExecutor:
         vehicle_vin = self._resolve_vehicle_vin(vehicle_id)
 
         # Method 1: Check Tesla Fleet/Teslemetry device_tracker entities
-        entity_registry = er.async_get(self.hass)
-        device_registry = dr.async_get(self.hass)
+        vehicle_index = tesla_vehicle_index(self.hass)
+        # If we have a resolved VIN, only match the correct vehicle
+        device_filter = (
+            vehicle_vin
+            if vehicle_vin and len(vehicle_vin) == 17 and vehicle_vin.isalnum()
+            else None
+        )
 
-        for device, device_vin in _iter_tesla_vehicle_devices(device_registry):
+        for device, device_vin in vehicle_index.vehicle_devices(device_filter):
             if location != "unknown":
                 break
 
-            # If we have a resolved VIN, only match the correct vehicle
-            if vehicle_vin and len(vehicle_vin) == 17 and vehicle_vin.isalnum():
-                if device_vin != vehicle_vin:
-                    continue
-
             # Find location entities for this Tesla vehicle
-            for entity in entity_registry.entities.values():
-                if entity.device_id != device.id:
-                    continue
-
+            for entity in vehicle_index.device_entities(device.id):
                 entity_id = entity.entity_id
                 entity_id_lower = entity_id.lower()
 
@@ -5372,18 +5432,13 @@ class AutoScheduleExecutor:
             CONF_TESLA_BLE_ENTITY_PREFIX,
             DEFAULT_TESLA_BLE_ENTITY_PREFIX,
         )
-        from homeassistant.helpers import entity_registry as er, device_registry as dr
 
         # Method 1: Check Tesla Fleet/Teslemetry entities
-        entity_registry = er.async_get(self.hass)
-        device_registry = dr.async_get(self.hass)
+        vehicle_index = tesla_vehicle_index(self.hass)
 
-        for device, _device_vin in _iter_tesla_vehicle_devices(device_registry):
+        for device, _device_vin in vehicle_index.vehicle_devices():
             # Find plugged in sensor for this Tesla vehicle
-            for entity in entity_registry.entities.values():
-                if entity.device_id != device.id:
-                    continue
-
+            for entity in vehicle_index.device_entities(device.id):
                 entity_id = entity.entity_id
                 entity_id_lower = entity_id.lower()
 
@@ -5456,35 +5511,37 @@ class AutoScheduleExecutor:
             live_status: Current Powerwall/system status with battery_soc, solar_power, etc.
             current_price_cents: Current import price (from Amber/tariff)
         """
-        for vehicle_id, settings in self._settings.items():
-            if not settings.enabled:
-                self._clear_start_failure(vehicle_id)
-                self._clear_active_charging_preserve_intent(
-                    vehicle_id,
-                    "Smart Schedule disabled",
-                )
-                # Restore curtailment if modified and auto-schedule is now disabled
-                state = self._state.get(vehicle_id)
-                if state:
-                    if state.curtailment_override_active:
-                        _LOGGER.info(
-                            f"Auto-schedule disabled for {vehicle_id}, restoring curtailment"
-                        )
-                        await self._restore_curtailment(state)
-                    # Also stop charging if still active
-                    if state.is_charging:
-                        await self._stop_charging(
-                            vehicle_id,
-                            settings,
-                            state,
-                            reason="Smart Schedule disabled",
-                        )
-                continue
+        # Plan every vehicle against one forecast frame per tick.
+        with _forecast_tick(self.planner):
+            for vehicle_id, settings in self._settings.items():
+                if not settings.enabled:
+                    self._clear_start_failure(vehicle_id)
+                    self._clear_active_charging_preserve_intent(
+                        vehicle_id,
+                        "Smart Schedule disabled",
+                    )
+                    # Restore curtailment if modified and auto-schedule is now disabled
+                    state = self._state.get(vehicle_id)
+                    if state:
+                        if state.curtailment_override_active:
+                            _LOGGER.info(
+                                f"Auto-schedule disabled for {vehicle_id}, restoring curtailment"
+                            )
+                            await self._restore_curtailment(state)
+                        # Also stop charging if still active
+                        if state.is_charging:
+                            await self._stop_charging(
+                                vehicle_id,
+                                settings,
+                                state,
+                                reason="Smart Schedule disabled",
+                            )
+                    continue
 
-            try:
-                await self._evaluate_vehicle(vehicle_id, settings, live_status, current_price_cents)
-            except Exception as e:
-                _LOGGER.error(f"Auto-schedule evaluation failed for {vehicle_id}: {e}")
+                try:
+                    await self._evaluate_vehicle(vehicle_id, settings, live_status, current_price_cents)
+                except Exception as e:
+                    _LOGGER.error(f"Auto-schedule evaluation failed for {vehicle_id}: {e}")
 
         self._sync_inactive_smart_schedule_preserve_intent()
 
@@ -6500,6 +6557,13 @@ class AutoScheduleExecutor:
         current_price_cents: Optional[float] = None,
     ) -> None:
         """Refresh EV forecast plans for the optimiser without charger commands."""
+        with _forecast_tick(self.planner):
+            await self._refresh_optimizer_forecast_plans(current_price_cents)
+
+    async def _refresh_optimizer_forecast_plans(
+        self,
+        current_price_cents: Optional[float],
+    ) -> None:
         for vehicle_id, settings in self._settings.items():
             if not settings.enabled:
                 continue
@@ -9199,7 +9263,7 @@ class PriceLevelChargingExecutor:
             TESLA_BLE_SENSOR_CHARGE_LEVEL,
         )
         from .generic_charger_soc import resolve_generic_charger_soc
-        from homeassistant.helpers import entity_registry as er, device_registry as dr
+        from homeassistant.helpers import entity_registry as er
 
         config_entries = getattr(self.hass, "config_entries", None)
         if vehicle_vin in (None, "_default", "generic_ev", "ev") and config_entries:
@@ -9256,42 +9320,12 @@ class PriceLevelChargingExecutor:
         # Method 2: Search HA entity registry for EV battery sensors
         try:
             entity_reg = er.async_get(self.hass)
-            device_reg = dr.async_get(self.hass)
-
-            # Find Tesla devices (with VIN mapping)
-            tesla_device_map: Dict[str, str] = {}  # device_id -> VIN
-            for device in device_reg.devices.values():
-                # Check various Tesla integration identifiers.
-                # Historical note: an earlier version also tested
-                # `domain in ("tesla_ble", "tesla_bluetooth")` here, but
-                # neither is a real HA integration domain — ESPHome Tesla
-                # BLE bridges register under `esphome` with empty
-                # identifiers[], so that extra check never matched. Removed
-                # to avoid misleading future readers. BLE discovery is
-                # handled separately via binary_sensor.{prefix}_status.
-                for identifier in device.identifiers:
-                    if len(identifier) >= 2:
-                        domain = identifier[0]
-                        id_str = str(identifier[1])
-                        if domain in TESLA_INTEGRATIONS:
-                            # Only a 17-char VIN identifies a vehicle. The
-                            # Powerwall and the Wall Connectors register under
-                            # these same integrations with non-VIN identifiers;
-                            # they used to be mapped in with an empty VIN,
-                            # which then read as "matches every vehicle" below
-                            # and let the home battery's state of charge be
-                            # returned as a car's SoC.
-                            if len(id_str) == 17 and not id_str.isdigit():
-                                tesla_device_map[device.id] = id_str
-                            break
-
-            # Search for battery level sensors
-            for entity in entity_reg.entities.values():
-                if entity.device_id not in tesla_device_map:
-                    continue
 
+            # Tesla vehicle devices only: the Powerwall and the Wall
+            # Connectors register under the same integrations with non-VIN
+            # identifiers, and must never lend a car the home battery's SoC.
+            for entity, device_vin in tesla_vehicle_index(self.hass).vehicle_entities():
                 # If specific VIN requested, skip other vehicles
-                device_vin = tesla_device_map.get(entity.device_id, "")
                 if vehicle_vin is not None and device_vin != vehicle_vin:
                     continue
 
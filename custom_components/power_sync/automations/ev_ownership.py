@@ -172,7 +172,9 @@ async def persist_ev_runtime_state(
         return
 
     runtime_store._data["ev_runtime_state"] = _runtime_snapshot(hass, config_entry)
-    save = getattr(runtime_store, "async_save", None)
+    save = getattr(runtime_store, "async_save_runtime", None) or getattr(
+        runtime_store, "async_save", None
+    )
     if save is None:
         return
 
@@ -184,7 +186,13 @@ async def persist_ev_runtime_state(
 def _schedule_runtime_save(hass: Any, config_entry: Any) -> None:
     """Schedule a best-effort runtime persistence save."""
     entry = _entry_data(hass, config_entry.entry_id)
-    if not entry.get("automation_store"):
+    store = entry.get("automation_store")
+    if not store:
+        return
+    if hasattr(store, "schedule_runtime_save") and hasattr(store, "_data"):
+        # Coalesced with other runtime changes into one delayed write
+        store._data["ev_runtime_state"] = _runtime_snapshot(hass, config_entry)
+        store.schedule_runtime_save()
         return
     create_task = getattr(hass, "async_create_task", None)
     if create_task is None:
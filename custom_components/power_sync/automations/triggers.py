@@ -37,6 +37,60 @@ class TriggerResult:
     reason: str = ""
 
 
+# Optional state facets read by each trigger/condition type. Core state
+# (telemetry, grid status, battery mode, local time) is always gathered; a
+# facet is only fetched when an enabled automation needs it.
+STATE_FACETS = ("prices", "ev", "ocpp", "solar_forecast", "weather")
+
+TRIGGER_STATE_FACETS: Dict[str, tuple] = {
+    "time": (),
+    "battery": (),
+    "flow": (),
+    "grid_import_energy": (),
+    "grid_export_energy": (),
+    "price": ("prices",),
+    "grid": (),
+    "weather": ("weather",),
+    "solar_forecast": ("solar_forecast",),
+    "ev": ("ev",),
+    "ocpp": ("ocpp",),
+}
+
+CONDITION_STATE_FACETS: Dict[str, tuple] = {
+    "battery": (),
+    "flow": (),
+    "price": ("prices",),
+    "grid": (),
+    "weather": ("weather",),
+    "ev": ("ev",),
+    "solar_forecast": ("solar_forecast",),
+    "time": (),
+}
+
+# Actions that read evaluated state through the execution context.
+ACTION_STATE_FACETS: Dict[str, tuple] = {
+    "stop_ev_charging": ("ev",),
+}
+
+
+def required_state_facets(automation: Dict[str, Any]) -> set:
+    """Return the optional state facets an automation reads."""
+    facets = set(
+        TRIGGER_STATE_FACETS.get(
+            (automation.get("trigger") or {}).get("trigger_type"), ()
+        )
+    )
+    for condition in [
+        *(automation.get("if_conditions") or []),
+        *(automation.get("conditions") or []),
+    ]:
+        facets.update(CONDITION_STATE_FACETS.get(condition.get("condition_type"), ()))
+    if not automation.get("notification_only"):
+        for action in automation.get("actions") or []:
+            facets.update(ACTION_STATE_FACETS.get(action.get("action_type"), ()))
+    return facets
+
+
 def evaluate_trigger(
     trigger: Dict[str, Any],
     current_state: Dict[str, Any],
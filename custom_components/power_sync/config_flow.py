@@ -515,6 +515,8 @@ from .const import (
     CONF_OPTIMIZATION_SPREAD_EXPORT_ENABLED,
     CONF_OPTIMIZATION_DISABLE_IDLE,
     CONF_OPTIMIZATION_BATTERY_EFFICIENCY_LEARNING,
+    CONF_OPTIMIZATION_SOLVER_PROCESS,
+    DEFAULT_OPTIMIZATION_SOLVER_PROCESS,
     CONF_OPTIMIZATION_MAX_CHARGE_W,
     CONF_OPTIMIZATION_MAX_DISCHARGE_W,
     CONF_OPTIMIZATION_MAX_GRID_IMPORT_W,
@@ -11351,6 +11353,12 @@ class PowerSyncOptionsFlow(config_entries.OptionsFlow):
                         True,
                     )
                 )
+                solver_process_enabled = bool(
+                    user_input.get(
+                        CONF_OPTIMIZATION_SOLVER_PROCESS,
+                        DEFAULT_OPTIMIZATION_SOLVER_PROCESS,
+                    )
+                )
                 new_data[CONF_OPTIMIZATION_COST_FUNCTION] = COST_FUNCTION_COST
                 new_options[CONF_OPTIMIZATION_COST_FUNCTION] = COST_FUNCTION_COST
                 new_data[CONF_OPTIMIZATION_BACKUP_RESERVE] = backup_reserve
@@ -11423,6 +11431,8 @@ class PowerSyncOptionsFlow(config_entries.OptionsFlow):
                 new_options[CONF_OPTIMIZATION_BATTERY_EFFICIENCY_LEARNING] = (
                     battery_efficiency_learning_enabled
                 )
+                new_data[CONF_OPTIMIZATION_SOLVER_PROCESS] = solver_process_enabled
+                new_options[CONF_OPTIMIZATION_SOLVER_PROCESS] = solver_process_enabled
                 new_data[CONF_OPTIMIZATION_LOAD_ENTITY] = load_entity
                 new_options[CONF_OPTIMIZATION_LOAD_ENTITY] = load_entity
                 new_data[CONF_OPTIMIZATION_EV_INTEGRATION] = ev_integration_enabled
@@ -11550,6 +11560,11 @@ class PowerSyncOptionsFlow(config_entries.OptionsFlow):
                 or _opt_changed(CONF_OPTIMIZATION_AUTO_APPLY_RESERVE, False)
                 or _opt_changed(CONF_MONITORING_MODE, False)
                 or _opt_changed(CONF_OPTIMIZATION_DISABLE_IDLE, False)
+                # The solver pool is created with the coordinator.
+                or _opt_changed(
+                    CONF_OPTIMIZATION_SOLVER_PROCESS,
+                    DEFAULT_OPTIMIZATION_SOLVER_PROCESS,
+                )
                 # EV integration must reload: set_settings only flips the
                 # load-overlay flag, it does NOT start/stop the EV coordinator
                 # that schedules charging — that happens during setup/enable.
@@ -11825,6 +11840,13 @@ class PowerSyncOptionsFlow(config_entries.OptionsFlow):
                 True,
             ),
         )
+        current_solver_process = self._get_option(
+            CONF_OPTIMIZATION_SOLVER_PROCESS,
+            self.config_entry.data.get(
+                CONF_OPTIMIZATION_SOLVER_PROCESS,
+                DEFAULT_OPTIMIZATION_SOLVER_PROCESS,
+            ),
+        )
         current_ev_integration_enabled = self._get_option(
             CONF_OPTIMIZATION_EV_INTEGRATION,
             self.config_entry.data.get(CONF_OPTIMIZATION_EV_INTEGRATION, False),
@@ -11978,6 +12000,9 @@ class PowerSyncOptionsFlow(config_entries.OptionsFlow):
         current_form_values[CONF_OPTIMIZATION_BATTERY_EFFICIENCY_LEARNING] = bool(
             current_battery_efficiency_learning
         )
+        current_form_values[CONF_OPTIMIZATION_SOLVER_PROCESS] = bool(
+            current_solver_process
+        )
         if battery_system == BATTERY_SYSTEM_NEOVOLT:
             current_form_values[CONF_NEOVOLT_SURPLUS_BALANCER_MODE] = (
                 current_surplus_balancer_mode
@@ -12162,6 +12187,12 @@ class PowerSyncOptionsFlow(config_entries.OptionsFlow):
                 default=bool(current_battery_efficiency_learning),
             )
         ] = BooleanSelector()
+        schema_fields[
+            vol.Required(
+                CONF_OPTIMIZATION_SOLVER_PROCESS,
+                default=bool(current_solver_process),
+            )
+        ] = BooleanSelector()
         schema_fields.update(
             {
                 vol.Required(
@@ -12236,6 +12267,7 @@ class PowerSyncOptionsFlow(config_entries.OptionsFlow):
                 CONF_OPTIMIZATION_SPREAD_EXPORT_ENABLED,
                 CONF_OPTIMIZATION_SPREAD_IMPORT_ENABLED,
                 CONF_OPTIMIZATION_DISABLE_IDLE,
+                CONF_OPTIMIZATION_SOLVER_PROCESS,
                 CONF_MONITORING_MODE,
                 CONF_NEOVOLT_SURPLUS_BALANCER_MODE,
             },
@@ -2033,6 +2033,8 @@ CONF_OPTIMIZATION_BATTERY_EFFICIENCY_LEARNING = (
     "optimization_battery_efficiency_learning"
 )
 CONF_OPTIMIZATION_WEATHER_INTEGRATION = "optimization_weather_integration"
+CONF_OPTIMIZATION_SOLVER_PROCESS = "optimization_solver_process"  # Solve the LP in a worker process
+DEFAULT_OPTIMIZATION_SOLVER_PROCESS = True
 CONF_OPTIMIZATION_AI_SUMMARY_PROVIDER = "optimization_ai_summary_provider"
 CONF_OPTIMIZATION_AI_SUMMARY_API_KEY = "optimization_ai_summary_api_key"
 CONF_OPTIMIZATION_AI_SUMMARY_CLEAR_API_KEY = "optimization_ai_summary_clear_api_key"
@@ -58,6 +58,7 @@ from .const import (
     SIGENERGY_CHARGER_EVAC,
     SIGENERGY_CHARGER_EVDC,
 )
+from .energy_ledger import EnergyLedger
 from .sensitive_logging import obfuscate_log_arg, obfuscate_vin_tokens
 from .tesla_grid_control import async_set_tesla_grid_charging_confirmed
 from .tesla_ble_mapping import (
@@ -466,15 +467,21 @@ class EnergyAccumulator:
         self._load_accounting_partial_mtd = False
         self._last_month: Any = None
         self._store: Store | None = None
+        # Per-interval history behind calendar and cost requests; the daily
+        # and MTD totals above remain the source for the live sensors.
+        self.ledger: EnergyLedger | None = None
         if hass and store_key:
             self._store = Store(
                 hass,
                 ENERGY_ACC_STORE_VERSION,
                 f"power_sync.energy_acc.{store_key}",
             )
+            self.ledger = EnergyLedger(hass, store_key)
 
     async def async_restore(self) -> None:
         """Restore accumulated energy from persistent storage."""
+        if self.ledger is not None:
+            await self.ledger.async_load(dt_util.now().tzinfo)
         if not self._store:
             return
         try:
@@ -713,6 +720,8 @@ class EnergyAccumulator:
         Called during integration unload so the next restore gets the latest
         values, preventing total_increasing sensors from going backwards.
         """
+        if self.ledger is not None:
+            await self.ledger.async_flush(close_open=True)
         if not self._store:
             return
         await self._store.async_save(self._data_to_save())
@@ -923,6 +932,26 @@ class EnergyAccumulator:
                     export_kwh = max(0, -grid_kw) * delta_h
                     self.mtd_export_earnings += export_kwh * sell_price_per_kwh
                     self.mtd_export_earnings_covered_kwh += export_kwh
+                if self.ledger is not None:
+                    import_kwh = max(0, grid_kw) * delta_h
+                    export_kwh = max(0, -grid_kw) * delta_h
+                    import_priced = buy_price_per_kwh is not None
+                    export_priced = sell_price_per_kwh is not None
+                    self.ledger.add(
+                        now,
+                        (
+                            max(0, solar_kw) * delta_h,
+                            import_kwh,
+                            export_kwh,
+                            max(0, -battery_kw) * delta_h,
+                            max(0, battery_kw) * delta_h,
+                            max(0, load_kw) * delta_h if load_kw is not None else 0.0,
+                            import_kwh * buy_price_per_kwh if import_priced else 0.0,
+                            export_kwh * sell_price_per_kwh if export_priced else 0.0,
+                            import_kwh if import_priced else 0.0,
+                            export_kwh if export_priced else 0.0,
+                        ),
+                    )
                 if load_kw is None:
                     # Only an interval that was actually integrated can leave a
                     # hole in Home Load.  The first sample after a restart, and
@@ -4982,6 +5011,7 @@ class AEMOPriceCoordinator(DataUpdateCoordinator):
                 "last_update": dt_util.utcnow(),
                 "source": "aemo_api",
                 "dispatch_file": dispatch_file,
+                "nemweb": self._client.dispatch_diagnostics(),
             }
 
         except Exception as err:
@@ -5625,6 +5655,9 @@ class SigenergyEnergyCoordinator(DataUpdateCoordinator):
                     if self._rated_discharge_power_kw else None
                 ),
                 "energy_summary": self._energy_acc.as_dict(),
+                # Coalesced telemetry read cost for this poll
+                "modbus_round_trips": attrs.get("modbus_round_trips"),
+                "modbus_poll_ms": attrs.get("modbus_poll_ms"),
             }
 
             _LOGGER.debug(
@@ -5899,6 +5932,9 @@ class AlphaESSEnergyCoordinator(DataUpdateCoordinator):
             "supports_dispatch": self.supports_dispatch,
             "last_update": dt_util.utcnow(),
             "energy_summary": self._energy_acc.as_dict(),
+            # Coalesced telemetry read cost for this poll
+            "modbus_round_trips": attrs.get("modbus_round_trips"),
+            "modbus_poll_ms": attrs.get("modbus_poll_ms"),
         }
 
         _LOGGER.debug(
@@ -6833,6 +6869,9 @@ class SungrowEnergyCoordinator(DataUpdateCoordinator):
                     if data.get("discharge_rate_limit_kw") else None
                 ),
                 "energy_summary": self._build_energy_summary(data),
+                # Coalesced telemetry read cost for this poll
+                "modbus_round_trips": data.get("modbus_round_trips"),
+                "modbus_poll_ms": data.get("modbus_poll_ms"),
             }
             await self._async_save_daily_energy_baselines()
 
@@ -8190,6 +8229,9 @@ class FoxESSEnergyCoordinator(DataUpdateCoordinator):
                 "nominal_power_w": attrs.get("nominal_power_w"),
                 "nominal_energy_kwh": attrs.get("nominal_energy_kwh"),
                 "total_charged_energy_kwh": attrs.get("total_charged_energy_kwh"),
+                # Coalesced telemetry read cost for this poll
+                "modbus_round_trips": attrs.get("modbus_round_trips"),
+                "modbus_poll_ms": attrs.get("modbus_poll_ms"),
             }
 
             # Max charge/discharge power is taken directly from nominal_power_w
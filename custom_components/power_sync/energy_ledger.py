@@ -0,0 +1,450 @@
+"""Append-only per-interval energy and cost ledger.
+
+Calendar history for energy-summary systems used to be rebuilt from Recorder
+long-term statistics on every request, with a raw state-history scan as the
+fallback.  A Year request on a Raspberry Pi could take seconds and competed
+with everything else using the shared Recorder database.
+
+``EnergyAccumulator`` now also feeds an ``EnergyLedger``: every 5-minute
+interval is closed into one fixed-width binary record (energy flows, import
+cost, export earnings and the priced energy behind both) appended to a file
+under ``.storage``.  Day, week, month and year rollups are folded in memory
+as samples arrive and rebuilt from the file in one sequential read at
+startup, so calendar and cost requests are answered from memory.  Hourly
+rows for a single day come from a bisected read of that day's records.
+
+Recorder statistics remain the backfill source for the part of a range
+before the ledger's first complete hour or day; the rest still comes from the
+ledger.  Intervals missing because Home Assistant was not running are counted
+as gaps in ``stats()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import struct
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Any, Callable, Iterable, Sequence
+
+_LOGGER = logging.getLogger(__name__)
+
+LEDGER_INTERVAL_SECONDS = 300
+LEDGER_FIELDS = (
+    "solar_kwh",
+    "grid_import_kwh",
+    "grid_export_kwh",
+    "battery_charge_kwh",
+    "battery_discharge_kwh",
+    "load_kwh",
+    "import_cost",
+    "export_earnings",
+    "import_priced_kwh",
+    "export_priced_kwh",
+)
+# uint32 interval start (UTC epoch seconds) followed by one float32 per field.
+_RECORD = struct.Struct(f"<I{len(LEDGER_FIELDS)}f")
+_FIELD_COUNT = len(LEDGER_FIELDS)
+# Most recent gaps listed in stats(); all of them are counted.
+_STATS_RECENT_GAPS = 5
+
+
+def _local_day_bounds(day: date, tz: tzinfo | None) -> tuple[float, float]:
+    """Return the UTC epoch bounds of one local day (23/25 h across DST)."""
+    start = datetime(day.year, day.month, day.day, tzinfo=tz or timezone.utc)
+    return start.timestamp(), (start + timedelta(days=1)).timestamp()
+
+
+def _read_ledger_file(
+    path: str,
+    tz: tzinfo | None,
+) -> tuple[
+    int | None, int | None, int, dict[date, list[float]], list[tuple[int, int]]
+] | None:
+    """Fold every record in ``path`` into per-day totals (executor).
+
+    Also returns the gaps: ``(last slot, next slot)`` pairs more than one
+    interval apart.
+    """
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+    except FileNotFoundError:
+        return None
+
+    usable = len(data) - len(data) % _RECORD.size
+    if usable != len(data):
+        # A crash mid-append leaves a torn trailing record; drop it so every
+        # later append stays aligned to the fixed record width.
+        _LOGGER.warning(
+            "Energy ledger %s ended with a partial record; truncating %d byte(s)",
+            path,
+            len(data) - usable,
+        )
+        with open(path, "r+b") as handle:
+            handle.truncate(usable)
+
+    days: dict[date, list[float]] = {}
+    gaps: list[tuple[int, int]] = []
+    totals: list[float] = []
+    day_start = day_end = 0.0
+    first_slot = last_slot = None
+    count = 0
+    for record in _RECORD.iter_unpack(memoryview(data)[:usable]):
+        slot = record[0]
+        if first_slot is None:
+            first_slot = slot
+        elif slot > last_slot + LEDGER_INTERVAL_SECONDS:
+            gaps.append((last_slot, slot))
+        last_slot = slot
+        count += 1
+        if not day_start <= slot < day_end:
+            key = datetime.fromtimestamp(slot, tz or timezone.utc).date()
+            day_start, day_end = _local_day_bounds(key, tz)
+            totals = days.setdefault(key, [0.0] * _FIELD_COUNT)
+        for index in range(_FIELD_COUNT):
+            totals[index] += record[index + 1]
+    return first_slot, last_slot, count, days, gaps
+
+
+def _read_ledger_range(path: str, start: float, end: float) -> list[tuple]:
+    """Return records with ``start <= slot < end`` by bisecting ``path``."""
+    try:
+        handle = open(path, "rb")
+    except FileNotFoundError:
+        return []
+    with handle:
+        count = os.fstat(handle.fileno()).st_size // _RECORD.size
+
+        def slot_at(index: int) -> int:
+            handle.seek(index * _RECORD.size)
+            return struct.unpack("<I", handle.read(4))[0]
+
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if slot_at(middle) < start:
+                low = middle + 1
+            else:
+                high = middle
+        handle.seek(low * _RECORD.size)
+        records = []
+        while low < count:
+            chunk = handle.read(_RECORD.size * 288)
+            if not chunk:
+                break
+            for record in _RECORD.iter_unpack(chunk[: len(chunk) - len(chunk) % _RECORD.size]):
+                if record[0] >= end:
+                    return records
+                records.append(record)
+            low += len(chunk) // _RECORD.size
+        return records
+
+
+def _append_ledger_records(path: str, records: Sequence[tuple]) -> None:
+    """Append packed records to ``path`` (executor)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "ab") as handle:
+        handle.write(b"".join(_RECORD.pack(*record) for record in records))
+
+
+def _ledger_totals_dict(values: Sequence[float]) -> dict[str, float]:
+    return {
+        field: round(value, 6) for field, value in zip(LEDGER_FIELDS, values)
+    }
+
+
+class EnergyLedger:
+    """Per-interval energy/cost records with incremental calendar rollups.
+
+    ``add`` is called for every integrated accumulator sample and folds the
+    sample into the open 5-minute interval and into the day, week, month and
+    year totals for its local date.  Closed intervals are appended to the
+    ledger file in the executor; an interval that is reopened after a flush
+    (unload, reload) is simply written again and summed with the first copy.
+    """
+
+    def __init__(
+        self,
+        hass: Any,
+        ledger_key: str = "",
+        *,
+        path: str | None = None,
+    ) -> None:
+        self._hass = hass
+        if path is None and ledger_key:
+            config_path = getattr(getattr(hass, "config", None), "path", None)
+            if callable(config_path):
+                path = config_path(".storage", f"power_sync.energy_ledger.{ledger_key}")
+        self._path = path
+        self._tz: tzinfo | None = None
+        self._loaded = False
+        self._open_slot: int | None = None
+        self._open = [0.0] * _FIELD_COUNT
+        self._pending: list[tuple] = []
+        self._first_slot: int | None = None
+        self._last_slot: int | None = None
+        self._days: dict[date, list[float]] = {}
+        self._weeks: dict[date, list[float]] = {}
+        self._months: dict[tuple[int, int], list[float]] = {}
+        self._years: dict[int, list[float]] = {}
+        self._gaps: list[tuple[int, int]] = []
+        self._write_lock = asyncio.Lock()
+        self._flush_task: Any = None
+        self.records = 0
+        self.range_reads = 0
+
+    @property
+    def loaded(self) -> bool:
+        """Return True once the on-disk history has been folded in."""
+        return self._loaded
+
+    async def _async_run(self, target: Callable[..., Any], *args: Any) -> Any:
+        run = getattr(self._hass, "async_add_executor_job", None)
+        if callable(run):
+            return await run(target, *args)
+        return target(*args)
+
+    async def async_load(self, tz: tzinfo | None) -> None:
+        """Rebuild the rollups from the ledger file once per setup."""
+        if self._loaded:
+            return
+        self._tz = self._tz or tz
+        loaded = None
+        if self._path:
+            try:
+                loaded = await self._async_run(_read_ledger_file, self._path, self._tz)
+            except Exception as err:
+                _LOGGER.warning("Failed to load energy ledger %s: %s", self._path, err)
+                return
+        if loaded is not None:
+            first_slot, last_slot, count, days, gaps = loaded
+            # Samples folded before the file was read are not in the file yet.
+            for day, values in self._days.items():
+                totals = days.setdefault(day, [0.0] * _FIELD_COUNT)
+                for index, value in enumerate(values):
+                    totals[index] += value
+            self._days = days
+            self._rebuild_period_rollups()
+            self.records += count
+            self._gaps[:0] = gaps
+            if first_slot is not None:
+                self._first_slot = min(first_slot, self._first_slot or first_slot)
+                self._last_slot = max(last_slot, self._last_slot or last_slot)
+                if self._open_slot is not None and self._open_slot < self._last_slot:
+                    self._open_slot = self._last_slot
+        self._loaded = True
+        _LOGGER.debug(
+            "Energy ledger loaded: %d interval(s) over %d day(s)",
+            self.records,
+            len(self._days),
+        )
+        if self._pending:
+            self._schedule_flush()
+
+    def _rebuild_period_rollups(self) -> None:
+        self._weeks, self._months, self._years = {}, {}, {}
+        for day, values in self._days.items():
+            for bucket, key in self._period_keys(day):
+                totals = bucket.setdefault(key, [0.0] * _FIELD_COUNT)
+                for index, value in enumerate(values):
+                    totals[index] += value
+
+    def _period_keys(self, day: date) -> tuple[tuple[dict, Any], ...]:
+        return (
+            (self._weeks, day - timedelta(days=day.weekday())),
+            (self._months, (day.year, day.month)),
+            (self._years, day.year),
+        )
+
+    def add(self, when: datetime, values: Sequence[float]) -> None:
+        """Fold one integrated sample ending at local time ``when``."""
+        if self._tz is None:
+            self._tz = when.tzinfo
+        slot = int(when.timestamp()) // LEDGER_INTERVAL_SECONDS * LEDGER_INTERVAL_SECONDS
+        if self._open_slot is None:
+            # Never write behind the file's last record; bisected reads rely
+            # on slots being non-decreasing even if the clock steps back.
+            self._open_slot = max(slot, self._last_slot or slot)
+            if self._first_slot is None:
+                self._first_slot = self._open_slot
+            elif self._last_slot is not None:
+                self._note_gap(self._last_slot, slot)
+        elif slot > self._open_slot:
+            self._close_open_interval()
+            self._note_gap(self._last_slot, slot)
+            self._open_slot = slot
+        for index, value in enumerate(values):
+            self._open[index] += value
+
+        day = when.date()
+        for bucket, key in ((self._days, day), *self._period_keys(day)):
+            totals = bucket.get(key)
+            if totals is None:
+                totals = bucket[key] = [0.0] * _FIELD_COUNT
+            for index, value in enumerate(values):
+                totals[index] += value
+
+    def _note_gap(self, last_slot: int, slot: int) -> None:
+        if slot > last_slot + LEDGER_INTERVAL_SECONDS:
+            self._gaps.append((last_slot, slot))
+
+    def _close_open_interval(self) -> None:
+        if self._open_slot is None:
+            return
+        self._pending.append((self._open_slot, *self._open))
+        self._last_slot = self._open_slot
+        self._open_slot = None
+        self._open = [0.0] * _FIELD_COUNT
+        self.records += 1
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if not self._path or not self._loaded:
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        create_task = getattr(self._hass, "async_create_task", None)
+        if callable(create_task):
+            self._flush_task = create_task(self.async_flush())
+
+    async def async_flush(self, close_open: bool = False) -> None:
+        """Append closed intervals to the ledger file.
+
+        ``close_open`` also writes the interval in progress, which unload uses
+        so the next setup starts from a complete file.
+        """
+        if close_open and any(self._open):
+            self._close_open_interval()
+        if not self._path or not self._loaded:
+            return
+        async with self._write_lock:
+            while self._pending:
+                batch = self._pending[:]
+                del self._pending[: len(batch)]
+                try:
+                    await self._async_run(_append_ledger_records, self._path, batch)
+                except Exception as err:
+                    self._pending[:0] = batch
+                    _LOGGER.warning(
+                        "Failed to append %d energy ledger record(s): %s",
+                        len(batch),
+                        err,
+                    )
+                    return
+
+    def history_start(self, tz: tzinfo | None, *, hourly: bool) -> datetime | None:
+        """Return the first local hour (or midnight) the ledger fully holds.
+
+        Buckets before it started part-way through belong to the backfill.
+        Intervals missed while Home Assistant was down are not backfilled;
+        they are counted as gaps in ``stats()``.
+        """
+        if not self._loaded or self._first_slot is None:
+            return None
+        first = datetime.fromtimestamp(self._first_slot, tz or timezone.utc)
+        if hourly:
+            start = first.replace(minute=0, second=0, microsecond=0)
+            if start < first:
+                start = (start + timedelta(hours=1)).astimezone(first.tzinfo)
+            return start
+        start = datetime(first.year, first.month, first.day, tzinfo=first.tzinfo)
+        if start < first:
+            day = first.date() + timedelta(days=1)
+            start = datetime(day.year, day.month, day.day, tzinfo=first.tzinfo)
+        return start
+
+    def day_totals(self, first_day: date, last_day: date) -> list[tuple[date, dict[str, float]]]:
+        """Return ``(day, totals)`` rows for recorded days in the range."""
+        rows = []
+        day = first_day
+        while day <= last_day:
+            values = self._days.get(day)
+            if values is not None:
+                rows.append((day, _ledger_totals_dict(values)))
+            day += timedelta(days=1)
+        return rows
+
+    def totals(self, first_day: date, last_day: date) -> dict[str, float]:
+        """Sum the range from the coarsest rollups that fit inside it."""
+        result = [0.0] * _FIELD_COUNT
+        day = first_day
+        while day <= last_day:
+            values: Iterable[float] | None
+            year_end = date(day.year, 12, 31)
+            next_month = (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+            if day.month == 1 and day.day == 1 and year_end <= last_day:
+                values, day = self._years.get(day.year), year_end + timedelta(days=1)
+            elif day.day == 1 and next_month - timedelta(days=1) <= last_day:
+                values, day = self._months.get((day.year, day.month)), next_month
+            elif day.weekday() == 0 and day + timedelta(days=6) <= last_day:
+                values, day = self._weeks.get(day), day + timedelta(days=7)
+            else:
+                values, day = self._days.get(day), day + timedelta(days=1)
+            for index, value in enumerate(values or ()):
+                result[index] += value
+        return _ledger_totals_dict(result)
+
+    async def async_hourly_totals(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[datetime, dict[str, float]]]:
+        """Return ``(local hour, totals)`` rows for intervals in ``[start, end)``."""
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        tz = start.tzinfo or self._tz
+        async with self._write_lock:
+            records = []
+            if self._path:
+                self.range_reads += 1
+                records = await self._async_run(
+                    _read_ledger_range, self._path, start_ts, end_ts
+                )
+            records.extend(
+                record for record in self._pending if start_ts <= record[0] < end_ts
+            )
+            if self._open_slot is not None and start_ts <= self._open_slot < end_ts:
+                records.append((self._open_slot, *self._open))
+
+        hours: dict[datetime, list[float]] = {}
+        for record in records:
+            hour = datetime.fromtimestamp(record[0], tz or timezone.utc).replace(
+                minute=0, second=0, microsecond=0
+            )
+            totals = hours.setdefault(hour, [0.0] * _FIELD_COUNT)
+            for index in range(_FIELD_COUNT):
+                totals[index] += record[index + 1]
+        return [(hour, _ledger_totals_dict(hours[hour])) for hour in sorted(hours)]
+
+    def stats(self) -> dict[str, Any]:
+        """Return ledger size, gaps and read counters for diagnostics."""
+
+        def iso(slot: int) -> str:
+            return datetime.fromtimestamp(slot, timezone.utc).isoformat()
+
+        return {
+            "loaded": self._loaded,
+            "records": self.records,
+            "pending": len(self._pending),
+            "days": len(self._days),
+            "first_interval": (
+                iso(self._first_slot) if self._first_slot is not None else None
+            ),
+            "gaps": len(self._gaps),
+            "missing_intervals": sum(
+                (slot - last_slot) // LEDGER_INTERVAL_SECONDS - 1
+                for last_slot, slot in self._gaps
+            ),
+            "recent_gaps": [
+                {
+                    "after": iso(last_slot),
+                    "resumed": iso(slot),
+                    "missing_intervals": (slot - last_slot) // LEDGER_INTERVAL_SECONDS - 1,
+                }
+                for last_slot, slot in self._gaps[-_STATS_RECENT_GAPS:]
+            ],
+            "range_reads": self.range_reads,
+        }
@@ -29,7 +29,14 @@ from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 import pymodbus
 
-from .base import InverterController, InverterState, InverterStatus
+from .base import (
+    FC_READ_HOLDING_REGISTERS,
+    InverterController,
+    InverterState,
+    InverterStatus,
+    RegisterField,
+    RegisterReadPlan,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -135,6 +142,22 @@ class AlphaESSController(InverterController):
     #       → charge from grid at the configured rate until cutoff SOC reached
     DISPATCH_MODE_SOC_CONTROL = 2
 
+    # Status poll register map, read in coalesced blocks (see RegisterReadPlan).
+    # The 0100H battery section is contiguous, so its fields share one read.
+    READ_PLAN_MAX_GAP = 32
+    _STATUS_FIELDS = (
+        RegisterField("soc", REG_BAT_SOC, 1, FC_READ_HOLDING_REGISTERS),
+        RegisterField("soh", REG_BAT_SOH, 1, FC_READ_HOLDING_REGISTERS),
+        RegisterField("capacity", REG_BAT_CAPACITY, 1, FC_READ_HOLDING_REGISTERS),
+        RegisterField("battery_power", REG_BAT_POWER, 1, FC_READ_HOLDING_REGISTERS),
+        RegisterField("max_charge", REG_BAT_MAX_CHARGE_POWER, 1, FC_READ_HOLDING_REGISTERS),
+        RegisterField("max_discharge", REG_BAT_MAX_DISCHARGE_POWER, 1, FC_READ_HOLDING_REGISTERS),
+        RegisterField("grid_power", REG_GRID_TOTAL_ACTIVE_POWER, 2, FC_READ_HOLDING_REGISTERS),
+        RegisterField("pv_power", REG_PV_TOTAL_POWER, 2, FC_READ_HOLDING_REGISTERS),
+        RegisterField("work_mode", REG_INV_WORK_MODE, 1, FC_READ_HOLDING_REGISTERS),
+        RegisterField("export_limit", REG_MAX_FEED_INTO_GRID_PERCENT, 1, FC_READ_HOLDING_REGISTERS),
+    )
+
     # Connection defaults
     DEFAULT_PORT = 502
     DEFAULT_SLAVE_ID = 85    # 0x55 — AlphaESS default from register 080FH
@@ -163,6 +186,7 @@ class AlphaESSController(InverterController):
         self._configured_max_export_limit_kw = max_export_limit_kw
         self._original_export_percent: Optional[int] = None  # Previous 0800H for restore
         self._dispatch_active: bool = False                  # Track whether we hold 0722H=1
+        self._status_plan = RegisterReadPlan(self._STATUS_FIELDS, self.READ_PLAN_MAX_GAP)
 
     # ---- Connection lifecycle ----
 
@@ -285,6 +309,10 @@ class AlphaESSController(InverterController):
             _LOGGER.error(f"Error writing to 0x{address:04X}: {e}")
             return False
 
+    async def _read_plan_block(self, function_code: int, address: int, count: int) -> Optional[list]:
+        """Read one register plan block (telemetry is all FC 0x03)."""
+        return await self._read_holding_registers(address, count)
+
     # ---- Type conversion helpers ----
 
     @staticmethod
@@ -325,57 +353,59 @@ class AlphaESSController(InverterController):
 
             attrs: dict = {"host": self.host, "model": self.model or "AlphaESS"}
 
+            regs = await self._status_plan.read(self._read_plan_block)
+
             # Battery SOC (U16, 0.1 %/bit)
-            soc_regs = await self._read_holding_registers(self.REG_BAT_SOC, 1)
+            soc_regs = regs.get("soc")
             if soc_regs:
                 attrs["battery_soc"] = round(soc_regs[0] / self.GAIN_SOC, 1)
 
             # Battery SOH (U16, 0.1 %/bit)
-            soh_regs = await self._read_holding_registers(self.REG_BAT_SOH, 1)
+            soh_regs = regs.get("soh")
             if soh_regs:
                 attrs["battery_soh"] = round(soh_regs[0] / self.GAIN_SOC, 1)
 
             # Battery capacity (U16, 0.1 kWh/bit)
-            cap_regs = await self._read_holding_registers(self.REG_BAT_CAPACITY, 1)
+            cap_regs = regs.get("capacity")
             if cap_regs:
                 attrs["battery_capacity_kwh"] = round(cap_regs[0] / 10.0, 2)
 
             # Battery power (S16, 1 W/bit) — − = charge, + = discharge (PowerSync convention)
-            bat_regs = await self._read_holding_registers(self.REG_BAT_POWER, 1)
+            bat_regs = regs.get("battery_power")
             if bat_regs:
                 bat_w = self._to_signed16(bat_regs[0])
                 attrs["battery_power_w"] = bat_w
                 attrs["battery_power_kw"] = round(bat_w / 1000.0, 3)
 
             # Battery max charge/discharge power (U16, 1 W/bit) — BMS limits
-            max_ch = await self._read_holding_registers(self.REG_BAT_MAX_CHARGE_POWER, 1)
+            max_ch = regs.get("max_charge")
             if max_ch:
                 attrs["battery_max_charge_power_w"] = max_ch[0]
-            max_dis = await self._read_holding_registers(self.REG_BAT_MAX_DISCHARGE_POWER, 1)
+            max_dis = regs.get("max_discharge")
             if max_dis:
                 attrs["battery_max_discharge_power_w"] = max_dis[0]
 
             # Grid total active power (S32, 1 W/bit) — assumed + = import
-            grid_regs = await self._read_holding_registers(self.REG_GRID_TOTAL_ACTIVE_POWER, 2)
-            if grid_regs and len(grid_regs) >= 2:
+            grid_regs = regs.get("grid_power")
+            if grid_regs:
                 grid_w = self._to_signed32(grid_regs[0], grid_regs[1])
                 attrs["grid_power_w"] = grid_w
                 attrs["grid_power_kw"] = round(grid_w / 1000.0, 3)
 
             # PV total power (U32, 1 W/bit)
-            pv_regs = await self._read_holding_registers(self.REG_PV_TOTAL_POWER, 2)
-            if pv_regs and len(pv_regs) >= 2:
+            pv_regs = regs.get("pv_power")
+            if pv_regs:
                 pv_w = self._to_unsigned32(pv_regs[0], pv_regs[1])
                 attrs["pv_power_w"] = pv_w
                 attrs["pv_power_kw"] = round(pv_w / 1000.0, 3)
 
             # Inverter work mode (U16) — raw value, enum mapping TBD from hardware testing
-            wm_regs = await self._read_holding_registers(self.REG_INV_WORK_MODE, 1)
+            wm_regs = regs.get("work_mode")
             if wm_regs:
                 attrs["work_mode_raw"] = wm_regs[0]
 
             # Export limit (U16, 1 %/bit)
-            export_regs = await self._read_holding_registers(self.REG_MAX_FEED_INTO_GRID_PERCENT, 1)
+            export_regs = regs.get("export_limit")
             is_curtailed = False
             if export_regs:
                 export_pct = export_regs[0]
@@ -394,6 +424,7 @@ class AlphaESSController(InverterController):
             status = InverterStatus.CURTAILED if is_curtailed else InverterStatus.ONLINE
             if is_curtailed:
                 attrs["curtailment_mode"] = "zero_export"
+            attrs.update(self._status_plan.last_poll.to_attributes())
 
             self._last_state = InverterState(
                 status=status,
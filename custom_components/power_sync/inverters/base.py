@@ -5,13 +5,21 @@ and implement the required methods.
 """
 import asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import ClassVar, Optional
 import logging
+import time
 
 _LOGGER = logging.getLogger(__name__)
 
+# Modbus function codes used by register read plans
+FC_READ_HOLDING_REGISTERS = 0x03
+FC_READ_INPUT_REGISTERS = 0x04
+# Modbus spec limit for one FC 0x03/0x04 request
+MAX_READ_REGISTERS = 125
+
 
 class InverterStatus(Enum):
     """Inverter connection and operational status."""
@@ -47,6 +55,163 @@ class InverterState:
         return result
 
 
+@dataclass(frozen=True)
+class RegisterField:
+    """One value in a driver's register map (0-indexed pymodbus address)."""
+    name: str
+    address: int
+    count: int = 1
+    function_code: int = FC_READ_HOLDING_REGISTERS
+
+
+@dataclass(frozen=True)
+class RegisterBlock:
+    """One multi-register read covering one or more fields."""
+    function_code: int
+    address: int
+    count: int
+    fields: tuple[RegisterField, ...]
+
+
+@dataclass
+class RegisterPollStats:
+    """Round-trip count and latency of one register plan read."""
+    round_trips: int = 0
+    latency_ms: float = 0.0
+    failed_blocks: int = 0
+    missing: list[str] = field(default_factory=list)
+
+    def to_attributes(self) -> dict:
+        """Return the stats as inverter state attributes."""
+        return {
+            "modbus_round_trips": self.round_trips,
+            "modbus_poll_ms": round(self.latency_ms, 1),
+        }
+
+
+# reader(function_code, address, count) -> registers, or None on error
+RegisterReader = Callable[[int, int, int], Awaitable[Optional[list]]]
+
+
+def plan_register_blocks(
+    fields: Iterable[RegisterField],
+    max_gap: int = 8,
+    max_count: int = MAX_READ_REGISTERS,
+) -> list[RegisterBlock]:
+    """Merge fields into the fewest reads per function code.
+
+    Fields are merged while the unused registers between them number at most
+    ``max_gap`` and the block stays within ``max_count`` registers.
+
+    Args:
+        fields: Register map entries to read
+        max_gap: Largest run of unrequested registers to read through
+        max_count: Largest block, in registers
+
+    Returns:
+        Blocks ordered by function code, then address
+    """
+    blocks: list[RegisterBlock] = []
+    ordered = sorted(fields, key=lambda f: (f.function_code, f.address, f.count))
+    current: list[RegisterField] = []
+    start = end = 0
+    for reg in ordered:
+        reg_end = reg.address + reg.count
+        if (
+            current
+            and reg.function_code == current[0].function_code
+            and reg.address - end <= max_gap
+            and max(end, reg_end) - start <= max_count
+        ):
+            current.append(reg)
+            end = max(end, reg_end)
+            continue
+        if current:
+            blocks.append(RegisterBlock(current[0].function_code, start, end - start, tuple(current)))
+        current = [reg]
+        start, end = reg.address, reg_end
+    if current:
+        blocks.append(RegisterBlock(current[0].function_code, start, end - start, tuple(current)))
+    return blocks
+
+
+class RegisterReadPlan:
+    """Coalesced multi-register reads for a driver's register map.
+
+    Drivers declare their telemetry as ``RegisterField`` entries and call
+    ``read()`` once per poll instead of one request per value. Each field's
+    registers are sliced out of its block, so existing decode helpers keep
+    working on the same lists they used to read individually.
+
+    Some firmware rejects a read that spans an unmapped register. When a
+    block fails but its fields read fine one at a time, the block is split
+    for the lifetime of the plan so later polls do not repeat the failure.
+    """
+
+    def __init__(
+        self,
+        fields: Iterable[RegisterField],
+        max_gap: int = 8,
+        max_count: int = MAX_READ_REGISTERS,
+    ):
+        """Plan reads for ``fields``; see ``plan_register_blocks``."""
+        self.fields = tuple(fields)
+        names = [reg.name for reg in self.fields]
+        if len(names) != len(set(names)):
+            raise ValueError(f"Duplicate register field names: {names}")
+        self.blocks = plan_register_blocks(self.fields, max_gap, max_count)
+        self.last_poll: Optional[RegisterPollStats] = None
+
+    async def read(self, reader: RegisterReader) -> dict[str, list]:
+        """Read every block and return raw registers keyed by field name.
+
+        Fields whose registers could not be read are left out of the result
+        and listed in ``last_poll.missing``.
+        """
+        stats = RegisterPollStats()
+        values: dict[str, list] = {}
+        started = time.monotonic()
+        planned: list[RegisterBlock] = []
+        for block in self.blocks:
+            registers = await reader(block.function_code, block.address, block.count)
+            stats.round_trips += 1
+            if registers is not None and len(registers) >= block.count:
+                for reg in block.fields:
+                    offset = reg.address - block.address
+                    values[reg.name] = list(registers[offset:offset + reg.count])
+                planned.append(block)
+                continue
+            if len(block.fields) == 1:
+                stats.missing.append(block.fields[0].name)
+                planned.append(block)
+                continue
+
+            stats.failed_blocks += 1
+            split = []
+            for reg in block.fields:
+                registers = await reader(reg.function_code, reg.address, reg.count)
+                stats.round_trips += 1
+                if registers is not None and len(registers) >= reg.count:
+                    values[reg.name] = list(registers[:reg.count])
+                else:
+                    stats.missing.append(reg.name)
+                split.append(RegisterBlock(reg.function_code, reg.address, reg.count, (reg,)))
+            if any(reg.name in values for reg in block.fields):
+                # The link is fine, the combined read is not: keep it split
+                _LOGGER.debug(
+                    "Splitting Modbus read block FC%d %d+%d after it failed while "
+                    "its fields read individually",
+                    block.function_code, block.address, block.count,
+                )
+                planned.extend(split)
+            else:
+                planned.append(block)
+        self.blocks = planned
+        stats.latency_ms = (time.monotonic() - started) * 1000
+        self.last_poll = stats
+        return values
+
+
 class InverterController(ABC):
     """Abstract base class for inverter controllers.
 
@@ -83,7 +83,15 @@ def _import_async_modbus_serial_client():
 AsyncModbusTcpClient = _import_async_modbus_tcp_client()
 from pymodbus.exceptions import ModbusException
 
-from .base import InverterController, InverterState, InverterStatus
+from .base import (
+    FC_READ_HOLDING_REGISTERS,
+    FC_READ_INPUT_REGISTERS,
+    InverterController,
+    InverterState,
+    InverterStatus,
+    RegisterField,
+    RegisterReadPlan,
+)
 
 # pymodbus 3.10+ renamed 'slave' to 'device_id'
 def _detect_slave_kwarg() -> str:
@@ -393,6 +401,8 @@ class FoxESSController(InverterController):
     H3 Smart models have native WiFi Modbus TCP (no external adapter needed).
     """
 
+    READ_PLAN_MAX_GAP = 16
+
     def __init__(
         self,
         host: str,
@@ -442,6 +452,8 @@ class FoxESSController(InverterController):
             self._model_family = FoxESSModelFamily.UNKNOWN
 
         self._register_map: Optional[FoxESSRegisterMap] = REGISTER_MAPS.get(self._model_family)
+        # Status read plans per model family (detect_model can switch maps)
+        self._status_plans: dict[FoxESSModelFamily, RegisterReadPlan] = {}
 
     async def connect(self) -> bool:
         """Establish Modbus connection."""
@@ -589,20 +601,71 @@ class FoxESSController(InverterController):
             return value - 0x100000000
         return value
 
-    async def _read_pv_power_kw(self, address: int, gain: int) -> tuple[float | None, list[int] | None]:
-        """Read a PV string power register using the active model's encoding."""
-        if not address:
-            return None, None
-        if self._register_map and self._register_map.pv_power_is_32bit:
-            raw = await self._read_holding_registers(address - 1, 2)
-            if raw and len(raw) == 2:
-                return ((raw[0] << 16) | raw[1]) / gain, raw
-            return None, raw
+    @staticmethod
+    def _status_fields(reg: FoxESSRegisterMap) -> tuple[RegisterField, ...]:
+        """Return the registers get_status reads for a model's register map.
 
-        raw = await self._read_data_register(address, 1)
-        if raw:
-            return raw[0] / gain, raw
-        return None, raw
+        32-bit values are always holding registers starting one below the
+        mapped (low word) address, matching the individual reads they replace.
+        """
+        data_fc = FC_READ_HOLDING_REGISTERS if reg.all_holding else FC_READ_INPUT_REGISTERS
+        fields = [RegisterField("battery_soc", reg.battery_soc, 1, data_fc)]
+
+        def add(name: str, address: int, is_32bit: bool = False) -> None:
+            if not address:
+                return
+            if is_32bit:
+                fields.append(RegisterField(name, address - 1, 2, FC_READ_HOLDING_REGISTERS))
+            else:
+                fields.append(RegisterField(name, address, 1, data_fc))
+
+        add("battery_power", reg.battery_power, reg.battery_power_is_32bit)
+        add("pv1_power", reg.pv1_power, reg.pv_power_is_32bit)
+        add("pv2_power", reg.pv2_power, reg.pv_power_is_32bit)
+        add("pv3_power", reg.pv3_power, reg.pv_power_is_32bit)
+        add("grid_power", reg.grid_power, reg.grid_power_is_32bit)
+        add("ct2_power", reg.ct2_power, reg.ct2_power_is_32bit)
+        add("load_power", reg.load_power)
+        if reg.supports_work_mode_rw:
+            for name in ("work_mode", "min_soc", "max_charge_current", "max_discharge_current"):
+                address = getattr(reg, name)
+                if address:
+                    fields.append(RegisterField(name, address, 1, FC_READ_HOLDING_REGISTERS))
+        add("battery_voltage", reg.battery_voltage)
+        add("battery_temperature", reg.battery_temperature)
+        add("soh", reg.soh)
+        if reg.nominal_power_w:
+            fields.append(RegisterField("nominal_power_w", reg.nominal_power_w, 2, data_fc))
+        add("nominal_energy_kwh", reg.nominal_energy_kwh)
+        if reg.total_charged_energy_kwh:
+            fields.append(
+                RegisterField("total_charged_energy_kwh", reg.total_charged_energy_kwh, 2, data_fc)
+            )
+        return tuple(fields)
+
+    def _status_plan(self) -> RegisterReadPlan:
+        """Return the status read plan for the active register map."""
+        plan = self._status_plans.get(self._model_family)
+        if plan is None:
+            plan = RegisterReadPlan(self._status_fields(self._register_map), self.READ_PLAN_MAX_GAP)
+            self._status_plans[self._model_family] = plan
+        return plan
+
+    async def _read_plan_block(self, function_code: int, address: int, count: int) -> Optional[list[int]]:
+        """Read one register plan block with the matching function code."""
+        if function_code == FC_READ_INPUT_REGISTERS:
+            return await self._read_input_registers(address, count)
+        return await self._read_holding_registers(address, count)
+
+    def _pv_power_kw(self, raw: Optional[list[int]], gain: int) -> Optional[float]:
+        """Decode a PV string power register using the active model's encoding."""
+        if not raw:
+            return None
+        if self._register_map and self._register_map.pv_power_is_32bit:
+            if len(raw) == 2:
+                return ((raw[0] << 16) | raw[1]) / gain
+            return None
+        return raw[0] / gain
 
     # ---- Model detection ----
 
@@ -696,8 +759,10 @@ class FoxESSController(InverterController):
         }
 
         try:
+            regs = await self._status_plan().read(self._read_plan_block)
+
             # Battery SOC
-            soc_raw = await self._read_data_register(reg.battery_soc, 1)
+            soc_raw = regs.get("battery_soc")
             battery_soc = soc_raw[0] if soc_raw else None
             attrs["battery_soc"] = battery_soc
 
@@ -708,14 +773,13 @@ class FoxESSController(InverterController):
             bp_gain = reg.battery_pv_gain or reg.power_gain
 
             # Battery power
+            bp_raw = regs.get("battery_power")
             if reg.battery_power_is_32bit and reg.battery_power:
-                bp_raw = await self._read_holding_registers(reg.battery_power - 1, 2)
                 if bp_raw and len(bp_raw) == 2:
                     battery_power_kw = self._to_signed32(bp_raw[0], bp_raw[1]) / bp_gain
                 else:
                     battery_power_kw = None
             elif reg.battery_power:
-                bp_raw = await self._read_data_register(reg.battery_power, 1)
                 battery_power_kw = self._to_signed16(bp_raw[0]) / bp_gain if bp_raw else None
             else:
                 battery_power_kw = None
@@ -723,9 +787,12 @@ class FoxESSController(InverterController):
             attrs["battery_power_w"] = battery_power_kw * 1000 if battery_power_kw is not None else None
 
             # PV power
-            pv1_kw, pv1_raw = await self._read_pv_power_kw(reg.pv1_power, bp_gain)
-            pv2_kw, pv2_raw = await self._read_pv_power_kw(reg.pv2_power, bp_gain)
-            pv3_kw, pv3_raw = await self._read_pv_power_kw(reg.pv3_power, bp_gain)
+            pv1_raw = regs.get("pv1_power")
+            pv2_raw = regs.get("pv2_power")
+            pv3_raw = regs.get("pv3_power")
+            pv1_kw = self._pv_power_kw(pv1_raw, bp_gain)
+            pv2_kw = self._pv_power_kw(pv2_raw, bp_gain)
+            pv3_kw = self._pv_power_kw(pv3_raw, bp_gain)
             total_pv_kw = (pv1_kw or 0) + (pv2_kw or 0) + (pv3_kw or 0)
             attrs["pv1_power_kw"] = pv1_kw
             attrs["pv2_power_kw"] = pv2_kw
@@ -742,14 +809,13 @@ class FoxESSController(InverterController):
             )
 
             # Grid power
+            gp_raw = regs.get("grid_power")
             if reg.grid_power_is_32bit and reg.grid_power:
-                gp_raw = await self._read_holding_registers(reg.grid_power - 1, 2)
                 if gp_raw and len(gp_raw) == 2:
                     grid_power_kw = self._to_signed32(gp_raw[0], gp_raw[1]) / grid_gain
                 else:
                     grid_power_kw = None
             elif reg.grid_power:
-                gp_raw = await self._read_data_register(reg.grid_power, 1)
                 grid_power_kw = self._to_signed16(gp_raw[0]) / grid_gain if gp_raw else None
             else:
                 grid_power_kw = None
@@ -762,17 +828,14 @@ class FoxESSController(InverterController):
             # CT2 power (AC-coupled inverter meter)
             ct2_power_kw = 0.0
             if reg.ct2_power:
-                ct2_raw = None
+                ct2_raw = regs.get("ct2_power")
                 if reg.ct2_power_is_32bit:
-                    ct2_raw = await self._read_holding_registers(reg.ct2_power - 1, 2)
                     if ct2_raw and len(ct2_raw) == 2:
                         ct2_power_kw = self._to_signed32(ct2_raw[0], ct2_raw[1]) / grid_gain
                     else:
                         _LOGGER.debug("FoxESS CT2 read failed: reg=%d, raw=%s", reg.ct2_power, ct2_raw)
-                else:
-                    ct2_raw = await self._read_data_register(reg.ct2_power, 1)
-                    if ct2_raw:
-                        ct2_power_kw = self._to_signed16(ct2_raw[0]) / grid_gain
+                elif ct2_raw:
+                    ct2_power_kw = self._to_signed16(ct2_raw[0]) / grid_gain
                 _LOGGER.debug("FoxESS CT2 raw: reg=%d raw=%s ct2=%.3f kW, gain=%d, 32bit=%s",
                               reg.ct2_power, list(ct2_raw) if ct2_raw else None, ct2_power_kw,
                               grid_gain, reg.ct2_power_is_32bit)
@@ -784,7 +847,7 @@ class FoxESSController(InverterController):
             # Load/home power
             load_power_is_calculated = False
             if reg.load_power:
-                lp_raw = await self._read_data_register(reg.load_power, 1)
+                lp_raw = regs.get("load_power")
                 load_power_kw = lp_raw[0] / bp_gain if lp_raw else None
             else:
                 # H3-Pro/H3-Smart: no load register, calculate from energy balance
@@ -811,7 +874,7 @@ class FoxESSController(InverterController):
 
             # Work mode (holding register)
             if reg.work_mode and reg.supports_work_mode_rw:
-                wm_raw = await self._read_holding_registers(reg.work_mode, 1)
+                wm_raw = regs.get("work_mode")
                 work_mode = wm_raw[0] if wm_raw else None
             else:
                 work_mode = None
@@ -821,7 +884,7 @@ class FoxESSController(InverterController):
 
             # Min SOC / backup reserve
             if reg.min_soc and reg.supports_work_mode_rw:
-                ms_raw = await self._read_holding_registers(reg.min_soc, 1)
+                ms_raw = regs.get("min_soc")
                 min_soc = ms_raw[0] if ms_raw else None
             else:
                 min_soc = None
@@ -829,14 +892,14 @@ class FoxESSController(InverterController):
 
             # Charge/discharge current limits
             if reg.max_charge_current and reg.supports_work_mode_rw:
-                mc_raw = await self._read_holding_registers(reg.max_charge_current, 1)
+                mc_raw = regs.get("max_charge_current")
                 max_charge_a = mc_raw[0] / GAIN_CURRENT if mc_raw else None
             else:
                 max_charge_a = None
             attrs["max_charge_current_a"] = max_charge_a
 
             if reg.max_discharge_current and reg.supports_work_mode_rw:
-                md_raw = await self._read_holding_registers(reg.max_discharge_current, 1)
+                md_raw = regs.get("max_discharge_current")
                 max_discharge_a = md_raw[0] / GAIN_CURRENT if md_raw else None
             else:
                 max_discharge_a = None
@@ -849,7 +912,7 @@ class FoxESSController(InverterController):
             # H3-Pro 25 kW systems at ~15 kW = 50 A × 300 V.
             battery_voltage_v = None
             if reg.battery_voltage:
-                bv_raw = await self._read_data_register(reg.battery_voltage, 1)
+                bv_raw = regs.get("battery_voltage")
                 if bv_raw:
                     battery_voltage_v = bv_raw[0] / reg.battery_voltage_gain
             attrs["battery_voltage_v"] = battery_voltage_v
@@ -857,32 +920,34 @@ class FoxESSController(InverterController):
             # Battery temperature
             battery_temp = None
             if reg.battery_temperature:
-                bt_raw = await self._read_data_register(reg.battery_temperature, 1)
+                bt_raw = regs.get("battery_temperature")
                 if bt_raw:
                     battery_temp = self._to_signed16(bt_raw[0]) / GAIN_TEMPERATURE
             attrs["battery_temperature"] = battery_temp
 
             # H3-Smart extended registers
             if reg.soh:
-                soh_raw = await self._read_data_register(reg.soh, 1)
+                soh_raw = regs.get("soh")
                 attrs["soh"] = soh_raw[0] if soh_raw else None
 
             if reg.nominal_power_w:
-                np_raw = await self._read_data_register(reg.nominal_power_w, 2)
+                np_raw = regs.get("nominal_power_w")
                 attrs["nominal_power_w"] = (
                     (np_raw[0] << 16) | np_raw[1] if np_raw and len(np_raw) == 2 else None
                 )
 
             if reg.nominal_energy_kwh:
-                ne_raw = await self._read_data_register(reg.nominal_energy_kwh, 1)
+                ne_raw = regs.get("nominal_energy_kwh")
                 attrs["nominal_energy_kwh"] = ne_raw[0] / 100.0 if ne_raw else None
 
             if reg.total_charged_energy_kwh:
-                tc_raw = await self._read_data_register(reg.total_charged_energy_kwh, 2)
+                tc_raw = regs.get("total_charged_energy_kwh")
                 attrs["total_charged_energy_kwh"] = (
                     ((tc_raw[0] << 16) | tc_raw[1]) / 100.0 if tc_raw and len(tc_raw) == 2 else None
                 )
 
+            attrs.update(self._status_plan().last_poll.to_attributes())
+
             is_curtailed = False  # Determined by export limit state if tracked
 
             return InverterState(
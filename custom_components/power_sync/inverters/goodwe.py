@@ -13,7 +13,13 @@ from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 import pymodbus
 
-from .base import InverterController, InverterState, InverterStatus
+from .base import (
+    InverterController,
+    InverterState,
+    InverterStatus,
+    RegisterField,
+    RegisterReadPlan,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -75,6 +81,31 @@ class GoodWeController(InverterController):
     MODE_FAULT = 2
     MODE_CHECK = 4
 
+    # Status poll register map, read in coalesced blocks (see RegisterReadPlan).
+    # The 35103-35200 running data fits one read, as in the goodwe library;
+    # each request reconnects, so fewer requests matter here.
+    READ_PLAN_MAX_GAP = 32
+    _STATUS_FIELDS = (
+        RegisterField("pv1_voltage", REG_PV1_VOLTAGE),
+        RegisterField("pv1_current", REG_PV1_CURRENT),
+        RegisterField("pv1_power", REG_PV1_POWER, 2),
+        RegisterField("pv2_voltage", REG_PV2_VOLTAGE),
+        RegisterField("pv2_current", REG_PV2_CURRENT),
+        RegisterField("pv2_power", REG_PV2_POWER, 2),
+        RegisterField("daily_pv", REG_DAILY_PV),
+        RegisterField("grid_power", REG_GRID_POWER),
+        RegisterField("daily_export", REG_DAILY_EXPORT),
+        RegisterField("daily_import", REG_DAILY_IMPORT),
+        RegisterField("temp_air", REG_TEMP_AIR),
+        RegisterField("battery_voltage", REG_BATTERY_VOLTAGE),
+        RegisterField("battery_current", REG_BATTERY_CURRENT),
+        RegisterField("battery_power", REG_BATTERY_POWER, 2),
+        RegisterField("work_mode", REG_WORK_MODE),
+        RegisterField("battery_soc", REG_BATTERY_SOC),
+        RegisterField("export_limit_enabled", REG_EXPORT_LIMIT_ENABLED),
+        RegisterField("export_limit", REG_EXPORT_LIMIT),
+    )
+
     # Timeout for Modbus operations
     TIMEOUT_SECONDS = 10.0
     RESET_CONNECTION_AFTER_REQUEST = True
@@ -98,6 +129,7 @@ class GoodWeController(InverterController):
         self._client: Optional[AsyncModbusTcpClient] = None
         self._lock = asyncio.Lock()
         self._request_lock = asyncio.Lock()
+        self._status_plan = RegisterReadPlan(self._STATUS_FIELDS, self.READ_PLAN_MAX_GAP)
 
     async def connect(self) -> bool:
         """Connect to the GoodWe inverter via Modbus TCP."""
@@ -219,30 +251,9 @@ class GoodWeController(InverterController):
             _LOGGER.debug(f"Error reading register {address}: {e}")
             return None
 
-    async def _read_register_block(self, address: int, count: int) -> dict[int, int]:
-        """Read a block of registers and return address-indexed values."""
-        registers = await self._read_register(address, count)
-        if not registers:
-            return {}
-        return {
-            address + offset: value
-            for offset, value in enumerate(registers)
-        }
-
-    def _block_values(
-        self,
-        registers: dict[int, int],
-        address: int,
-        count: int = 1,
-    ) -> Optional[list[int]]:
-        """Return values from a register block when the full range is present."""
-        values: list[int] = []
-        for offset in range(count):
-            register = address + offset
-            if register not in registers:
-                return None
-            values.append(registers[register])
-        return values
+    async def _read_plan_block(self, function_code: int, address: int, count: int) -> Optional[list]:
+        """Read one register plan block (telemetry is all FC 0x03)."""
+        return await self._read_register(address, count)
 
     def _to_signed16(self, value: int) -> int:
         """Convert unsigned 16-bit to signed."""
@@ -337,91 +348,85 @@ class GoodWeController(InverterController):
         attrs = {}
 
         try:
-            pv_block = await self._read_register_block(self.REG_PV1_VOLTAGE, 16)
-            grid_block = await self._read_register_block(self.REG_GRID_POWER, 20)
-            battery_block = await self._read_register_block(self.REG_TEMP_AIR, 10)
-            soc_block = await self._read_register_block(self.REG_BATTERY_SOC, 1)
-            export_block = await self._read_register_block(
-                self.REG_EXPORT_LIMIT_ENABLED,
-                2,
-            )
+            regs = await self._status_plan.read(self._read_plan_block)
 
             # Read PV1 data
-            pv1_voltage = self._block_values(pv_block, self.REG_PV1_VOLTAGE, 1)
+            pv1_voltage = regs.get("pv1_voltage")
             if pv1_voltage:
                 attrs["pv1_voltage"] = round(pv1_voltage[0] * 0.1, 1)
 
-            pv1_current = self._block_values(pv_block, self.REG_PV1_CURRENT, 1)
+            pv1_current = regs.get("pv1_current")
             if pv1_current:
                 attrs["pv1_current"] = round(pv1_current[0] * 0.1, 1)
 
-            pv1_power = self._block_values(pv_block, self.REG_PV1_POWER, 2)
-            if pv1_power and len(pv1_power) >= 2:
+            pv1_power = regs.get("pv1_power")
+            if pv1_power:
                 attrs["pv1_power"] = self._to_unsigned32(pv1_power[0], pv1_power[1])
 
             # Read PV2 data
-            pv2_voltage = self._block_values(pv_block, self.REG_PV2_VOLTAGE, 1)
+            pv2_voltage = regs.get("pv2_voltage")
             if pv2_voltage:
                 attrs["pv2_voltage"] = round(pv2_voltage[0] * 0.1, 1)
 
-            pv2_current = self._block_values(pv_block, self.REG_PV2_CURRENT, 1)
+            pv2_current = regs.get("pv2_current")
             if pv2_current:
                 attrs["pv2_current"] = round(pv2_current[0] * 0.1, 1)
 
-            pv2_power = self._block_values(pv_block, self.REG_PV2_POWER, 2)
-            if pv2_power and len(pv2_power) >= 2:
+            pv2_power = regs.get("pv2_power")
+            if pv2_power:
                 attrs["pv2_power"] = self._to_unsigned32(pv2_power[0], pv2_power[1])
 
             # Read battery data
-            battery_voltage = self._block_values(battery_block, self.REG_BATTERY_VOLTAGE, 1)
+            battery_voltage = regs.get("battery_voltage")
             if battery_voltage:
                 attrs["battery_voltage"] = round(battery_voltage[0] * 0.1, 1)
 
-            battery_current = self._block_values(battery_block, self.REG_BATTERY_CURRENT, 1)
+            battery_current = regs.get("battery_current")
             if battery_current:
                 attrs["battery_current"] = round(self._to_signed16(battery_current[0]) * 0.1, 1)
 
-            battery_power = self._block_values(battery_block, self.REG_BATTERY_POWER, 2)
-            if battery_power and len(battery_power) >= 2:
+            battery_power = regs.get("battery_power")
+            if battery_power:
                 attrs["battery_power"] = self._to_signed32(battery_power[0], battery_power[1])
 
-            battery_soc = self._block_values(soc_block, self.REG_BATTERY_SOC, 1)
+            battery_soc = regs.get("battery_soc")
             if battery_soc:
                 attrs["battery_level"] = battery_soc[0]
 
             # Read grid power
-            grid_power = self._block_values(grid_block, self.REG_GRID_POWER, 1)
+            grid_power = regs.get("grid_power")
             if grid_power:
                 attrs["grid_power"] = self._to_signed16(grid_power[0])
 
             # Read temperatures
-            temp_air = self._block_values(battery_block, self.REG_TEMP_AIR, 1)
+            temp_air = regs.get("temp_air")
             if temp_air:
                 attrs["inverter_temperature"] = round(self._to_signed16(temp_air[0]) * 0.1, 1)
 
             # Read daily energy
-            daily_pv = self._block_values(pv_block, self.REG_DAILY_PV, 1)
+            daily_pv = regs.get("daily_pv")
             if daily_pv:
                 attrs["daily_pv_generation"] = round(daily_pv[0] * 0.1, 2)
 
-            daily_export = self._block_values(grid_block, self.REG_DAILY_EXPORT, 1)
+            daily_export = regs.get("daily_export")
             if daily_export:
                 attrs["daily_export"] = round(daily_export[0] * 0.1, 2)
 
-            daily_import = self._block_values(grid_block, self.REG_DAILY_IMPORT, 1)
+            daily_import = regs.get("daily_import")
             if daily_import:
                 attrs["daily_import"] = round(daily_import[0] * 0.1, 2)
 
+            # Work mode (mapped to a running state by get_status)
+            work_mode = regs.get("work_mode")
+            if work_mode:
+                attrs["work_mode_raw"] = work_mode[0]
+
             # Read export limit status
-            export_enabled = self._block_values(
-                export_block,
-                self.REG_EXPORT_LIMIT_ENABLED,
-                1,
-            )
+            export_enabled = regs.get("export_limit_enabled")
             if export_enabled:
                 attrs["export_limit_enabled"] = export_enabled[0] == 1
 
-            export_limit = self._block_values(export_block, self.REG_EXPORT_LIMIT, 1)
+            export_limit = regs.get("export_limit")
             if export_limit:
                 attrs["export_limit_w"] = export_limit[0]
 
@@ -457,13 +462,12 @@ class GoodWeController(InverterController):
                     attributes={"host": self.host, "model": self.model or "ET/EH Series"},
                 )
 
-            # Read work mode
-            work_mode = await self._read_register(self.REG_WORK_MODE, 1)
+            attrs.update(self._status_plan.last_poll.to_attributes())
             status = InverterStatus.ONLINE
             is_curtailed = False
 
-            if work_mode:
-                mode_value = work_mode[0]
+            mode_value = attrs.get("work_mode_raw")
+            if mode_value is not None:
                 if mode_value == self.MODE_NORMAL:
                     status = InverterStatus.ONLINE
                     attrs["running_state"] = "normal"
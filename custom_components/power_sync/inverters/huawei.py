@@ -13,7 +13,13 @@ from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 import pymodbus
 
-from .base import InverterController, InverterState, InverterStatus
+from .base import (
+    InverterController,
+    InverterState,
+    InverterStatus,
+    RegisterField,
+    RegisterReadPlan,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +90,25 @@ class HuaweiController(InverterController):
     STATUS_FAULT = 0x0300
     STATUS_STANDBY_NO_GRID = 0x0400
 
+    # Status poll register map, read in coalesced blocks (see RegisterReadPlan).
+    # 32064-32089 (DC/AC power, temperature, status) share one read.
+    READ_PLAN_MAX_GAP = 16
+    _STATUS_FIELDS = (
+        RegisterField("pv1_voltage", REG_PV1_VOLTAGE),
+        RegisterField("pv1_current", REG_PV1_CURRENT),
+        RegisterField("pv2_voltage", REG_PV2_VOLTAGE),
+        RegisterField("pv2_current", REG_PV2_CURRENT),
+        RegisterField("input_power", REG_INPUT_POWER, 2),
+        RegisterField("active_power", REG_ACTIVE_POWER, 2),
+        RegisterField("temperature", REG_INVERTER_TEMP),
+        RegisterField("device_status", REG_DEVICE_STATUS),
+        RegisterField("daily_yield", REG_DAILY_YIELD, 2),
+        RegisterField("battery_power", REG_BATTERY_POWER, 2),
+        RegisterField("battery_soc", REG_BATTERY_SOC),
+        RegisterField("grid_power", REG_GRID_POWER, 2),
+        RegisterField("control_mode", REG_ACTIVE_POWER_CONTROL_MODE),
+    )
+
     # Timeout for Modbus operations
     TIMEOUT_SECONDS = 10.0
 
@@ -105,6 +130,7 @@ class HuaweiController(InverterController):
         super().__init__(host, port, slave_id, model)
         self._client: Optional[AsyncModbusTcpClient] = None
         self._lock = asyncio.Lock()
+        self._status_plan = RegisterReadPlan(self._STATUS_FIELDS, self.READ_PLAN_MAX_GAP)
 
     async def connect(self) -> bool:
         """Connect to the Huawei inverter via Modbus TCP."""
@@ -222,6 +248,10 @@ class HuaweiController(InverterController):
             _LOGGER.debug(f"Error reading register {address}: {e}")
             return None
 
+    async def _read_plan_block(self, function_code: int, address: int, count: int) -> Optional[list]:
+        """Read one register plan block (telemetry is all FC 0x03)."""
+        return await self._read_register(address, count)
+
     def _to_signed16(self, value: int) -> int:
         """Convert unsigned 16-bit to signed."""
         if value >= 0x8000:
@@ -346,73 +376,75 @@ class HuaweiController(InverterController):
         attrs = {}
 
         try:
+            regs = await self._status_plan.read(self._read_plan_block)
+
             # Read PV1 data
-            pv1_voltage = await self._read_register(self.REG_PV1_VOLTAGE, 1)
+            pv1_voltage = regs.get("pv1_voltage")
             if pv1_voltage:
                 attrs["pv1_voltage"] = round(pv1_voltage[0] / 10.0, 1)
 
-            pv1_current = await self._read_register(self.REG_PV1_CURRENT, 1)
+            pv1_current = regs.get("pv1_current")
             if pv1_current:
                 attrs["pv1_current"] = round(pv1_current[0] / 100.0, 2)
 
             # Read PV2 data
-            pv2_voltage = await self._read_register(self.REG_PV2_VOLTAGE, 1)
+            pv2_voltage = regs.get("pv2_voltage")
             if pv2_voltage:
                 attrs["pv2_voltage"] = round(pv2_voltage[0] / 10.0, 1)
 
-            pv2_current = await self._read_register(self.REG_PV2_CURRENT, 1)
+            pv2_current = regs.get("pv2_current")
             if pv2_current:
                 attrs["pv2_current"] = round(pv2_current[0] / 100.0, 2)
 
             # Read input power (DC)
-            input_power = await self._read_register(self.REG_INPUT_POWER, 2)
-            if input_power and len(input_power) >= 2:
+            input_power = regs.get("input_power")
+            if input_power:
                 # kW * 1000 -> W
                 power_kw = self._to_signed32(input_power[0], input_power[1]) / 1000.0
                 attrs["input_power"] = round(power_kw * 1000)  # Convert to W
 
             # Read active power (AC)
-            active_power = await self._read_register(self.REG_ACTIVE_POWER, 2)
-            if active_power and len(active_power) >= 2:
+            active_power = regs.get("active_power")
+            if active_power:
                 power_kw = self._to_signed32(active_power[0], active_power[1]) / 1000.0
                 attrs["active_power"] = round(power_kw * 1000)  # Convert to W
 
             # Read inverter temperature
-            temp = await self._read_register(self.REG_INVERTER_TEMP, 1)
+            temp = regs.get("temperature")
             if temp:
                 attrs["inverter_temperature"] = round(self._to_signed16(temp[0]) / 10.0, 1)
 
             # Read daily yield
-            daily_yield = await self._read_register(self.REG_DAILY_YIELD, 2)
-            if daily_yield and len(daily_yield) >= 2:
+            daily_yield = regs.get("daily_yield")
+            if daily_yield:
                 yield_kwh = self._to_unsigned32(daily_yield[0], daily_yield[1]) / 100.0
                 attrs["daily_pv_generation"] = round(yield_kwh, 2)
 
             # Read battery data (may not be present on non-hybrid models)
-            battery_soc = await self._read_register(self.REG_BATTERY_SOC, 1)
+            battery_soc = regs.get("battery_soc")
             if battery_soc and battery_soc[0] != 0xFFFF:
                 attrs["battery_level"] = round(battery_soc[0] / 10.0, 1)
 
-            battery_power = await self._read_register(self.REG_BATTERY_POWER, 2)
-            if battery_power and len(battery_power) >= 2:
+            battery_power = regs.get("battery_power")
+            if battery_power:
                 power_w = self._to_signed32(battery_power[0], battery_power[1])
                 if power_w != 0x7FFFFFFF:  # Check for invalid value
                     attrs["battery_power"] = power_w
 
             # Read grid power (requires Smart Power Sensor)
-            grid_power = await self._read_register(self.REG_GRID_POWER, 2)
-            if grid_power and len(grid_power) >= 2:
+            grid_power = regs.get("grid_power")
+            if grid_power:
                 power_w = self._to_signed32(grid_power[0], grid_power[1])
                 if power_w != 0x7FFFFFFF:  # Check for invalid value
                     attrs["grid_power"] = power_w
 
             # Read device status
-            device_status = await self._read_register(self.REG_DEVICE_STATUS, 1)
+            device_status = regs.get("device_status")
             if device_status:
                 attrs["device_status_code"] = device_status[0]
 
             # Read active power control mode
-            control_mode = await self._read_register(self.REG_ACTIVE_POWER_CONTROL_MODE, 1)
+            control_mode = regs.get("control_mode")
             if control_mode:
                 mode_value = control_mode[0]
                 attrs["active_power_control_mode"] = mode_value
@@ -457,6 +489,8 @@ class HuaweiController(InverterController):
                     attributes={"host": self.host, "model": self.model or "SUN2000"},
                 )
 
+            attrs.update(self._status_plan.last_poll.to_attributes())
+
             # Determine status from device status code
             status = InverterStatus.ONLINE
             is_curtailed = False
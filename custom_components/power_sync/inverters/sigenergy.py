@@ -14,7 +14,15 @@ from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 import pymodbus
 
-from .base import InverterController, InverterState, InverterStatus
+from .base import (
+    FC_READ_INPUT_REGISTERS,
+    InverterController,
+    InverterState,
+    InverterStatus,
+    RegisterField,
+    RegisterPollStats,
+    RegisterReadPlan,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -115,6 +123,28 @@ class SigenergyController(InverterController):
     # Sigenergy uses different slave IDs for different register levels:
     # - Plant-level registers (30001-30099): Slave ID 247
     # - Inverter-level registers (30500+): Slave ID 1 (or specific inverter address)
+    # Status poll register plans (see RegisterReadPlan)
+    READ_PLAN_MAX_GAP = 32
+    _PLANT_FIELDS = (
+        RegisterField("grid_power", REG_GRID_SENSOR_POWER, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("battery_soc", REG_ESS_SOC, 1, FC_READ_INPUT_REGISTERS),
+        RegisterField("pv_power", REG_PV_POWER, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("battery_power", REG_ESS_POWER, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("battery_capacity", REG_ESS_RATED_CAPACITY, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("battery_soh", REG_ESS_SOH, 1, FC_READ_INPUT_REGISTERS),
+        RegisterField("third_party_pv_power", REG_THIRD_PARTY_PV_POWER, 2, FC_READ_INPUT_REGISTERS),
+    )
+    _INVERTER_FIELDS = (
+        RegisterField("active_power", REG_INV_ACTIVE_POWER, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("battery_power", REG_INV_ESS_POWER, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("battery_soc", REG_INV_SOC, 1, FC_READ_INPUT_REGISTERS),
+        RegisterField("pv_power", REG_INV_PV_POWER, 2, FC_READ_INPUT_REGISTERS),
+    )
+    _EXPORT_LIMIT_FIELDS = (
+        RegisterField("grid_export_limit", REG_GRID_EXPORT_LIMIT, 2),
+        RegisterField("pcs_export_limit", REG_PCS_EXPORT_LIMIT, 2),
+    )
+
     DEFAULT_PORT = 502
     DEFAULT_SLAVE_ID = 247  # Plant address - will auto-switch to 1 for inverter registers
     DEFAULT_INVERTER_SLAVE_ID = 1  # Default inverter address
@@ -157,6 +187,9 @@ class SigenergyController(InverterController):
         self._inverter_slave_id = slave_id if slave_id != self.DEFAULT_SLAVE_ID else self.DEFAULT_INVERTER_SLAVE_ID
         self._modbus_transaction_depth = 0
         self._modbus_transaction_owner = None
+        self._plant_plan = RegisterReadPlan(self._PLANT_FIELDS, self.READ_PLAN_MAX_GAP)
+        self._inverter_plan = RegisterReadPlan(self._INVERTER_FIELDS, self.READ_PLAN_MAX_GAP)
+        self._export_limit_plan = RegisterReadPlan(self._EXPORT_LIMIT_FIELDS, self.READ_PLAN_MAX_GAP)
 
     @property
     def _modbus_lock(self) -> asyncio.Lock:
@@ -354,6 +387,16 @@ class SigenergyController(InverterController):
                 _LOGGER.debug(f"Error reading input register {address} [slave={effective_slave}]: {e}")
                 return None
 
+    async def _read_plan_block(self, function_code: int, address: int, count: int) -> Optional[list]:
+        """Read one plant-level register plan block."""
+        if function_code == FC_READ_INPUT_REGISTERS:
+            return await self._read_input_registers(address, count)
+        return await self._read_holding_registers(address, count)
+
+    async def _read_inverter_plan_block(self, function_code: int, address: int, count: int) -> Optional[list]:
+        """Read one inverter-level register plan block from the inverter slave."""
+        return await self._read_input_registers(address, count, slave_id=self._inverter_slave_id)
+
     def _to_signed32(self, high: int, low: int) -> int:
         """Convert two unsigned 16-bit registers to signed 32-bit."""
         value = (high << 16) | low
@@ -580,9 +623,10 @@ class SigenergyController(InverterController):
         """Try to read plant-level registers."""
         attrs = {}
         success_count = 0
+        regs = await self._plant_plan.read(self._read_plan_block)
 
         # Read PV power (S32, 2 registers) — DC-coupled solar only
-        pv_power_regs = await self._read_input_registers(self.REG_PV_POWER, 2)
+        pv_power_regs = regs.get("pv_power")
         if pv_power_regs and len(pv_power_regs) >= 2:
             pv_power_kw = self._to_signed32(pv_power_regs[0], pv_power_regs[1]) / self.GAIN_POWER
             attrs["pv_power_kw"] = round(pv_power_kw, 2)
@@ -590,7 +634,7 @@ class SigenergyController(InverterController):
             success_count += 1
 
         # Read third-party PV power (S32, 2 registers) — AC-coupled solar via Smart Port
-        tp_pv_regs = await self._read_input_registers(self.REG_THIRD_PARTY_PV_POWER, 2)
+        tp_pv_regs = regs.get("third_party_pv_power")
         if tp_pv_regs and len(tp_pv_regs) >= 2:
             tp_pv_kw = self._to_signed32(tp_pv_regs[0], tp_pv_regs[1]) / self.GAIN_POWER
             # Only include positive values (generation); 0 is normal for systems without Smart Port
@@ -598,38 +642,39 @@ class SigenergyController(InverterController):
                 attrs["third_party_pv_power_kw"] = round(tp_pv_kw, 2)
 
         # Read battery SOC (U16)
-        soc_regs = await self._read_input_registers(self.REG_ESS_SOC, 1)
+        soc_regs = regs.get("battery_soc")
         if soc_regs:
             attrs["battery_soc"] = round(soc_regs[0] / self.GAIN_SOC, 1)
             success_count += 1
 
         # Read grid sensor power (S32, 2 registers)
-        grid_power_regs = await self._read_input_registers(self.REG_GRID_SENSOR_POWER, 2)
+        grid_power_regs = regs.get("grid_power")
         if grid_power_regs and len(grid_power_regs) >= 2:
             grid_power_kw = self._to_signed32(grid_power_regs[0], grid_power_regs[1]) / self.GAIN_POWER
             attrs["grid_power_kw"] = round(grid_power_kw, 2)
             success_count += 1
 
         # Read battery power (S32, 2 registers)
-        ess_power_regs = await self._read_input_registers(self.REG_ESS_POWER, 2)
+        ess_power_regs = regs.get("battery_power")
         if ess_power_regs and len(ess_power_regs) >= 2:
             ess_power_kw = self._to_signed32(ess_power_regs[0], ess_power_regs[1]) / self.GAIN_POWER
             attrs["battery_power_kw"] = round(ess_power_kw, 2)
             success_count += 1
 
         # Read battery SOH (U16, gain 10)
-        soh_regs = await self._read_input_registers(self.REG_ESS_SOH, 1)
+        soh_regs = regs.get("battery_soh")
         if soh_regs:
             attrs["battery_soh"] = round(soh_regs[0] / self.GAIN_SOC, 1)
 
         # Read rated capacity (U32, gain 100, kWh)
-        capacity_regs = await self._read_input_registers(self.REG_ESS_RATED_CAPACITY, 2)
+        capacity_regs = regs.get("battery_capacity")
         if capacity_regs and len(capacity_regs) >= 2:
             capacity_kwh = self._to_unsigned32(capacity_regs[0], capacity_regs[1]) / self.GAIN_ENERGY
             attrs["battery_capacity_kwh"] = round(capacity_kwh, 2)
 
         attrs["_success_count"] = success_count
         attrs["_register_level"] = "plant"
+        attrs["_poll"] = self._plant_plan.last_poll
         return attrs
 
     async def _read_inverter_registers(self) -> dict:
@@ -641,9 +686,10 @@ class SigenergyController(InverterController):
         success_count = 0
         inv_slave = self._inverter_slave_id
         _LOGGER.debug(f"Reading inverter registers with slave ID {inv_slave}")
+        regs = await self._inverter_plan.read(self._read_inverter_plan_block)
 
         # Read inverter PV power (S32, 2 registers)
-        pv_power_regs = await self._read_input_registers(self.REG_INV_PV_POWER, 2, slave_id=inv_slave)
+        pv_power_regs = regs.get("pv_power")
         if pv_power_regs and len(pv_power_regs) >= 2:
             pv_power_kw = self._to_signed32(pv_power_regs[0], pv_power_regs[1]) / self.GAIN_POWER
             attrs["pv_power_kw"] = round(pv_power_kw, 2)
@@ -651,20 +697,20 @@ class SigenergyController(InverterController):
             success_count += 1
 
         # Read inverter battery SOC (U16)
-        soc_regs = await self._read_input_registers(self.REG_INV_SOC, 1, slave_id=inv_slave)
+        soc_regs = regs.get("battery_soc")
         if soc_regs:
             attrs["battery_soc"] = round(soc_regs[0] / self.GAIN_SOC, 1)
             success_count += 1
 
         # Read inverter active power (S32, 2 registers) - use as grid proxy
-        active_power_regs = await self._read_input_registers(self.REG_INV_ACTIVE_POWER, 2, slave_id=inv_slave)
+        active_power_regs = regs.get("active_power")
         if active_power_regs and len(active_power_regs) >= 2:
             active_power_kw = self._to_signed32(active_power_regs[0], active_power_regs[1]) / self.GAIN_POWER
             attrs["active_power_kw"] = round(active_power_kw, 2)
             success_count += 1
 
         # Read inverter battery power (S32, 2 registers)
-        ess_power_regs = await self._read_input_registers(self.REG_INV_ESS_POWER, 2, slave_id=inv_slave)
+        ess_power_regs = regs.get("battery_power")
         if ess_power_regs and len(ess_power_regs) >= 2:
             ess_power_kw = self._to_signed32(ess_power_regs[0], ess_power_regs[1]) / self.GAIN_POWER
             attrs["battery_power_kw"] = round(ess_power_kw, 2)
@@ -673,6 +719,7 @@ class SigenergyController(InverterController):
         attrs["_success_count"] = success_count
         attrs["_register_level"] = "inverter"
         attrs["_inverter_slave_id"] = inv_slave
+        attrs["_poll"] = self._inverter_plan.last_poll
         return attrs
 
     async def get_energy_summary(self) -> dict:
@@ -774,12 +821,15 @@ class SigenergyController(InverterController):
             # Clean up internal tracking fields
             attrs.pop("_success_count", None)
             register_level = attrs.pop("_register_level", "unknown")
+            polls = [attrs.pop("_poll", None)]
 
             # Read export limit for curtailment status (only available at plant level)
             export_limit = None
             is_curtailed = False
             if not self._use_inverter_registers:
-                export_limit_regs = await self._read_holding_registers(self.REG_GRID_EXPORT_LIMIT, 2)
+                limit_regs = await self._export_limit_plan.read(self._read_plan_block)
+                polls.append(self._export_limit_plan.last_poll)
+                export_limit_regs = limit_regs.get("grid_export_limit")
                 if export_limit_regs and len(export_limit_regs) >= 2:
                     export_limit = self._to_unsigned32(export_limit_regs[0], export_limit_regs[1])
                     is_curtailed = export_limit < 100  # Less than 0.1 kW threshold
@@ -789,7 +839,7 @@ class SigenergyController(InverterController):
                         attrs["export_limit_kw"] = "unlimited"
 
                 # Also read PCS export limit for diagnostics
-                pcs_limit_regs = await self._read_holding_registers(self.REG_PCS_EXPORT_LIMIT, 2)
+                pcs_limit_regs = limit_regs.get("pcs_export_limit")
                 if pcs_limit_regs and len(pcs_limit_regs) >= 2:
                     pcs_limit = self._to_unsigned32(pcs_limit_regs[0], pcs_limit_regs[1])
                     if pcs_limit < self.EXPORT_LIMIT_UNLIMITED and pcs_limit != self.EXPORT_LIMIT_INVALID:
@@ -821,6 +871,11 @@ class SigenergyController(InverterController):
             attrs["model"] = self.model or "Sigenergy"
             attrs["host"] = self.host
             attrs["register_level"] = register_level
+            polls = [poll for poll in polls if poll is not None]
+            attrs.update(RegisterPollStats(
+                round_trips=sum(poll.round_trips for poll in polls),
+                latency_ms=sum(poll.latency_ms for poll in polls),
+            ).to_attributes())
 
             # In zero-export mode, PV is not limited - only grid export is blocked
             self._last_state = InverterState(
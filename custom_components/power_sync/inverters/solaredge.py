@@ -13,7 +13,7 @@ import math
 import re
 from typing import Any, Optional
 
-from .base import InverterController, InverterState, InverterStatus
+from .base import InverterController, InverterState, InverterStatus, RegisterField, RegisterReadPlan
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -297,6 +297,11 @@ class SolarEdgeController(InverterController):
 
     REG_INVERTER_DATA = 40071
     REG_ACTIVE_POWER_LIMIT = 0xF001
+    # Status poll: SunSpec inverter model block plus the power-limit register
+    _STATUS_FIELDS = (
+        RegisterField("inverter_data", REG_INVERTER_DATA, 38),
+        RegisterField("active_power_limit", REG_ACTIVE_POWER_LIMIT),
+    )
     TIMEOUT_SECONDS = 10.0
     DEFAULT_RATED_POWER_W = 5000
 
@@ -328,6 +333,7 @@ class SolarEdgeController(InverterController):
         )
         self._hass = hass
         self._client = None
+        self._status_plan = RegisterReadPlan(self._STATUS_FIELDS)
         self._lock = asyncio.Lock()
         self._slave_in_client = False
         self._slave_param = "device_id"
@@ -456,11 +462,10 @@ class SolarEdgeController(InverterController):
             "rated_ac_power_w": self.rated_power_w,
         }
 
-        limit_pct = await self._get_active_power_limit()
-        if limit_pct is not None:
-            attrs["active_power_limit_percent"] = limit_pct
-
         if self._use_entity_mode:
+            limit_pct = await self._get_active_power_limit()
+            if limit_pct is not None:
+                attrs["active_power_limit_percent"] = limit_pct
             is_curtailed = limit_pct is not None and limit_pct < 100
             return InverterState(
                 status=InverterStatus.CURTAILED if is_curtailed else InverterStatus.ONLINE,
@@ -469,8 +474,14 @@ class SolarEdgeController(InverterController):
                 attributes=attrs,
             )
 
-        telemetry = await self._read_inverter_telemetry()
+        regs = await self._status_plan.read(self._read_plan_block)
+        limit_regs = regs.get("active_power_limit")
+        limit_pct = int(limit_regs[0]) if limit_regs else None
+        if limit_pct is not None:
+            attrs["active_power_limit_percent"] = limit_pct
+        telemetry = self._decode_inverter_telemetry(regs.get("inverter_data"))
         attrs.update(telemetry)
+        attrs.update(self._status_plan.last_poll.to_attributes())
         status_code = telemetry.get("status_code")
         status_text = telemetry.get("status")
         is_curtailed = bool(
@@ -546,8 +557,7 @@ class SolarEdgeController(InverterController):
             return None
         return int(regs[0])
 
-    async def _read_inverter_telemetry(self) -> dict[str, object]:
-        regs = await self._read_holding_registers(self.REG_INVERTER_DATA, 38)
+    def _decode_inverter_telemetry(self, regs: list[int] | None) -> dict[str, object]:
         if not regs:
             return {}
 
@@ -565,6 +575,9 @@ class SolarEdgeController(InverterController):
             "status": self.STATUS_TEXT.get(status_code, f"unknown_{status_code}"),
         }
 
+    async def _read_plan_block(self, function_code: int, address: int, count: int) -> list[int] | None:
+        return await self._read_holding_registers(address, count)
+
     async def _read_holding_registers(self, address: int, count: int) -> list[int] | None:
         if not self._client or not self._client.connected:
             if not await self.connect():
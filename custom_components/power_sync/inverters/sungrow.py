@@ -13,7 +13,15 @@ from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 import pymodbus
 
-from .base import InverterController, InverterState, InverterStatus
+from .base import (
+    FC_READ_HOLDING_REGISTERS,
+    FC_READ_INPUT_REGISTERS,
+    InverterController,
+    InverterState,
+    InverterStatus,
+    RegisterField,
+    RegisterReadPlan,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +73,10 @@ REGISTER_MAPS = {
     },
 }
 
+# Register map keys held in holding registers; everything else is telemetry
+# in input registers (with a holding-register fallback, see _read_any_register).
+HOLDING_REGISTER_KEYS = frozenset({"power_limit_toggle", "power_limit_percent"})
+
 # Model name to register map mapping
 # Keys are normalized (lowercase, no dots/dashes/spaces) to match model_key
 # ALL SG residential RS series (SG2.5RS to SG20RS) use the same register layout
@@ -151,6 +163,11 @@ class SungrowController(InverterController):
     TIMEOUT_SECONDS = 3.0
     CONNECT_TIMEOUT_SECONDS = 2.0
 
+    # The status registers of both maps span 5001-5037 with at most 16
+    # unmapped registers between them; read them as one block where the
+    # firmware allows (see RegisterReadPlan).
+    READ_PLAN_MAX_GAP = 16
+
     def __init__(
         self,
         host: str,
@@ -179,6 +196,9 @@ class SungrowController(InverterController):
         model_key = (model or "").lower().replace(".", "").replace("-", "").replace(" ", "")
         map_name = MODEL_MAP.get(model_key, "sg10rs")  # Default to sg10rs
         self._reg_map = REGISTER_MAPS[map_name]
+        self._status_plan = RegisterReadPlan(
+            self._status_fields(self._reg_map), self.READ_PLAN_MAX_GAP
+        )
 
         # Parse rated capacity from model name for load-following
         self._rated_capacity_w = self._parse_capacity_from_model(model)
@@ -411,35 +431,50 @@ class SungrowController(InverterController):
         _LOGGER.debug(f"Input register read failed at {address}, trying holding registers")
         return await self._read_register(address, count)
 
-    async def _read_register_from_map(self, key: str, use_holding: bool = False) -> Optional[tuple]:
-        """Read a register using the model-specific register map.
+    @staticmethod
+    def _status_fields(reg_map: dict) -> tuple[RegisterField, ...]:
+        """Return the status poll fields for one model register map."""
+        return tuple(
+            RegisterField(
+                key,
+                reg_info[0],
+                reg_info[1],
+                FC_READ_HOLDING_REGISTERS
+                if key in HOLDING_REGISTER_KEYS
+                else FC_READ_INPUT_REGISTERS,
+            )
+            for key, reg_info in reg_map.items()
+            if reg_info
+        )
+
+    async def _read_plan_block(self, function_code: int, address: int, count: int) -> Optional[list]:
+        """Read one register plan block by function code."""
+        if function_code == FC_READ_HOLDING_REGISTERS:
+            return await self._read_register(address, count)
+        return await self._read_any_register(address, count)
+
+    def _map_value(self, regs: dict, key: str) -> Optional[tuple]:
+        """Decode one register map value from a plan read.
 
         Args:
+            regs: Raw registers keyed by register map key
             key: Register key name (e.g., 'dc_power', 'daily_yield')
-            use_holding: If True, use holding registers instead of input
 
         Returns:
             Tuple of (raw_value, scaled_value) or None if not available/failed
         """
         reg_info = self._reg_map.get(key)
-        if not reg_info:
+        values = regs.get(key)
+        if not reg_info or not values:
             return None
 
-        address, count, scale = reg_info
-
-        if use_holding:
-            regs = await self._read_register(address, count)
-        else:
-            regs = await self._read_any_register(address, count)
-
-        if not regs:
-            return None
+        _address, count, scale = reg_info
 
         # Convert based on register count
         if count == 2:
-            raw_value = self._to_unsigned32(regs)
+            raw_value = self._to_unsigned32(values)
         else:
-            raw_value = regs[0]
+            raw_value = values[0]
 
         scaled_value = raw_value * scale
         return (raw_value, scaled_value)
@@ -448,13 +483,16 @@ class SungrowController(InverterController):
         """Read all registers using model-specific register map.
 
         Automatically uses the correct register addresses based on the
-        detected model family (SG10RS vs SG.05RS, etc.).
+        detected model family (SG10RS vs SG.05RS, etc.). The raw running
+        state, when the model has one, is returned under ``_running_state``.
         """
         attrs = {}
 
         try:
+            regs = await self._status_plan.read(self._read_plan_block)
+
             # Read DC/Active power - most important reading
-            power_result = await self._read_register_from_map("dc_power")
+            power_result = self._map_value(regs, "dc_power")
             if power_result:
                 attrs["dc_power"] = int(power_result[1])
                 _LOGGER.debug(f"Sungrow power: {attrs['dc_power']}W")
@@ -463,32 +501,32 @@ class SungrowController(InverterController):
                 _LOGGER.debug(f"Failed to read power register for model {self.model}")
 
             # Read daily yield
-            daily_result = await self._read_register_from_map("daily_yield")
+            daily_result = self._map_value(regs, "daily_yield")
             if daily_result:
                 attrs["daily_pv_generation"] = round(daily_result[1], 2)
 
             # Read total yield
-            total_result = await self._read_register_from_map("total_yield")
+            total_result = self._map_value(regs, "total_yield")
             if total_result:
                 attrs["total_pv_generation"] = round(total_result[1], 1)
 
             # Read MPPT values
-            mppt1_v = await self._read_register_from_map("mppt1_voltage")
-            mppt1_i = await self._read_register_from_map("mppt1_current")
+            mppt1_v = self._map_value(regs, "mppt1_voltage")
+            mppt1_i = self._map_value(regs, "mppt1_current")
             if mppt1_v and mppt1_i:
                 attrs["mppt1_voltage"] = round(mppt1_v[1], 1)
                 attrs["mppt1_current"] = round(mppt1_i[1], 1)
                 attrs["mppt1_power"] = round(attrs["mppt1_voltage"] * attrs["mppt1_current"], 0)
 
-            mppt2_v = await self._read_register_from_map("mppt2_voltage")
-            mppt2_i = await self._read_register_from_map("mppt2_current")
+            mppt2_v = self._map_value(regs, "mppt2_voltage")
+            mppt2_i = self._map_value(regs, "mppt2_current")
             if mppt2_v and mppt2_i:
                 attrs["mppt2_voltage"] = round(mppt2_v[1], 1)
                 attrs["mppt2_current"] = round(mppt2_i[1], 1)
                 attrs["mppt2_power"] = round(attrs["mppt2_voltage"] * attrs["mppt2_current"], 0)
 
             # Read temperature
-            temp_result = await self._read_register_from_map("temperature")
+            temp_result = self._map_value(regs, "temperature")
             if temp_result:
                 # Some models use signed values
                 temp_scale = self._reg_map["temperature"][2]
@@ -498,26 +536,30 @@ class SungrowController(InverterController):
                     attrs["inverter_temperature"] = temp_result[1]
 
             # Read grid voltage
-            voltage_result = await self._read_register_from_map("grid_voltage")
+            voltage_result = self._map_value(regs, "grid_voltage")
             if voltage_result:
                 attrs["grid_voltage"] = round(voltage_result[1], 1)
 
             # Read grid frequency
-            freq_result = await self._read_register_from_map("grid_frequency")
+            freq_result = self._map_value(regs, "grid_frequency")
             if freq_result:
                 attrs["grid_frequency"] = round(freq_result[1], 2)
 
             # Read power limit settings (holding registers)
-            limit_toggle = await self._read_register_from_map("power_limit_toggle", use_holding=True)
+            limit_toggle = self._map_value(regs, "power_limit_toggle")
             if limit_toggle:
                 attrs["power_limit_enabled"] = limit_toggle[0] == self.POWER_LIMIT_ENABLED
                 _LOGGER.debug(f"Sungrow power limit toggle: {limit_toggle[0]}")
 
-            limit_percent = await self._read_register_from_map("power_limit_percent", use_holding=True)
+            limit_percent = self._map_value(regs, "power_limit_percent")
             if limit_percent:
                 attrs["power_limit_percent"] = min(limit_percent[1], 100)
                 _LOGGER.debug(f"Sungrow power limit percent: {attrs['power_limit_percent']}%")
 
+            running_state = self._map_value(regs, "running_state")
+            if running_state:
+                attrs["_running_state"] = running_state[0]
+
             _LOGGER.info(f"Sungrow register read complete: {len(attrs)} attributes collected")
 
         except Exception as e:
@@ -708,6 +750,7 @@ class SungrowController(InverterController):
 
             # Read all available registers
             attrs = await self._read_all_registers()
+            running_state = attrs.pop("_running_state", None)
 
             # Get power output from attrs
             power_output = attrs.get("dc_power")
@@ -723,16 +766,11 @@ class SungrowController(InverterController):
                     attributes={"host": self.host, "model": self.model or "SG Series"},
                 )
 
-            # Read running state register if available for this model
-            running_state_reg = self._reg_map.get("running_state")
-            running_state = None
+            attrs.update(self._status_plan.last_poll.to_attributes())
             is_curtailed = False
 
-            if running_state_reg:
-                state_regs = await self._read_input_register(running_state_reg[0], 1)
-                if state_regs:
-                    running_state = state_regs[0]
-                    _LOGGER.debug(f"Sungrow running_state register {running_state_reg[0]}: 0x{running_state:04X} ({running_state})")
+            if running_state is not None:
+                _LOGGER.debug(f"Sungrow running_state register {self._reg_map['running_state'][0]}: 0x{running_state:04X} ({running_state})")
 
             # Determine status based on running state (if available) or power output
             if running_state is not None:
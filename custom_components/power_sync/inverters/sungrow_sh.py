@@ -16,7 +16,15 @@ from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 import pymodbus
 
-from .base import InverterController, InverterState, InverterStatus
+from .base import (
+    FC_READ_HOLDING_REGISTERS,
+    FC_READ_INPUT_REGISTERS,
+    InverterController,
+    InverterState,
+    InverterStatus,
+    RegisterField,
+    RegisterReadPlan,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -137,6 +145,36 @@ class SungrowSHController(InverterController):
     # Fallback battery voltage for kW to Amp conversion (used until real voltage is read)
     BATTERY_VOLTAGE_FALLBACK = 48      # Typical LFP battery pack voltage
 
+    # ===== Coalesced telemetry reads =====
+    # Every request is paced by MESSAGE_WAIT_SECONDS for WiNet-S stability,
+    # so polls read the register map in a few multi-register blocks instead
+    # of one request per value (see RegisterReadPlan).
+    READ_PLAN_MAX_GAP = 16
+    _BATTERY_TELEMETRY_FIELDS = (
+        RegisterField("battery_power_s32", REG_BATTERY_POWER_S32, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("battery_current", REG_BATTERY_CURRENT_PRECISE, 1, FC_READ_INPUT_REGISTERS),
+        RegisterField("daily_battery_charge", REG_DAILY_BATTERY_CHARGE, 1, FC_READ_INPUT_REGISTERS),
+        RegisterField("inverter_temp", REG_INVERTER_TEMP, 1, FC_READ_INPUT_REGISTERS),
+        RegisterField("daily_pv", REG_DAILY_PV, 1, FC_READ_INPUT_REGISTERS),
+        RegisterField("daily_import", REG_DAILY_IMPORT, 1, FC_READ_INPUT_REGISTERS),
+        RegisterField("daily_export", REG_DAILY_EXPORT, 1, FC_READ_INPUT_REGISTERS),
+        RegisterField("total_import", REG_TOTAL_IMPORT, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("total_export", REG_TOTAL_EXPORT, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("load_power", REG_LOAD_POWER, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("export_power", REG_EXPORT_POWER, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("meter_power", REG_METER_ACTIVE_POWER, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("pv_dc", REG_TOTAL_DC_POWER, 2, FC_READ_INPUT_REGISTERS),
+    )
+    _STATUS_FIELDS = _BATTERY_TELEMETRY_FIELDS + (
+        RegisterField("battery", REG_BATTERY_VOLTAGE, 7, FC_READ_INPUT_REGISTERS),
+        RegisterField("total_pv", REG_TOTAL_PV, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("active_power", REG_TOTAL_ACTIVE_POWER, 2, FC_READ_INPUT_REGISTERS),
+        RegisterField("grid_frequency", REG_GRID_FREQUENCY, 1, FC_READ_INPUT_REGISTERS),
+        RegisterField("phase_a_voltage", REG_PHASE_A_VOLTAGE, 1, FC_READ_INPUT_REGISTERS),
+        RegisterField("export_limit", REG_EXPORT_LIMIT_SETTING, 1, FC_READ_HOLDING_REGISTERS),
+        RegisterField("export_mode", REG_EXPORT_LIMIT_ENABLED, 1, FC_READ_HOLDING_REGISTERS),
+    )
+
     # Timeout for Modbus operations
     TIMEOUT_SECONDS = 10.0
     CONNECT_TIMEOUT_SECONDS = 3.0
@@ -173,6 +211,10 @@ class SungrowSHController(InverterController):
         self._in_forced_stop: bool = False
         self._ems_registers_supported: bool = True  # Set False if 13049 reads fail (SH10RS+SBH)
         self._rate_limit_writable: bool | None = None  # None = untested, True/False = cached result
+        self._status_plan = RegisterReadPlan(self._STATUS_FIELDS, self.READ_PLAN_MAX_GAP)
+        self._battery_plan = RegisterReadPlan(
+            self._BATTERY_TELEMETRY_FIELDS, self.READ_PLAN_MAX_GAP
+        )
 
     async def connect(self) -> bool:
         """Connect to the Sungrow SH inverter via Modbus TCP."""
@@ -380,6 +422,12 @@ class SungrowSHController(InverterController):
             finally:
                 self._last_request_finished_at = time.monotonic()
 
+    async def _read_plan_block(self, function_code: int, address: int, count: int) -> Optional[list]:
+        """Read one register plan block with its function code."""
+        if function_code == FC_READ_INPUT_REGISTERS:
+            return await self._read_input_register(address, count)
+        return await self._read_register(address, count)
+
     def _to_signed16(self, value: int) -> int:
         """Convert unsigned 16-bit to signed."""
         if value >= 0x8000:
@@ -459,9 +507,11 @@ class SungrowSHController(InverterController):
         attrs = {}
 
         try:
-            # Read battery registers (doc 13020-13026) in one batch via FC 0x04
-            battery_regs = await self._read_input_register(self.REG_BATTERY_VOLTAGE, 7)
-            if battery_regs and len(battery_regs) >= 7:
+            regs = await self._status_plan.read(self._read_plan_block)
+
+            # Battery registers (doc 13020-13026) via FC 0x04
+            battery_regs = regs.get("battery")
+            if battery_regs:
                 voltage = round(battery_regs[0] * 0.1, 1)
                 attrs["battery_voltage"] = voltage
                 if voltage > 0:
@@ -478,110 +528,110 @@ class SungrowSHController(InverterController):
             # Register 13022 can report unsigned on some SH-series firmware, making
             # charge/discharge indistinguishable. Register 5214 is S32 word-swapped
             # and is the authoritative signed value used by the reference Sungrow integration.
-            batt_power_s32 = await self._read_input_register(self.REG_BATTERY_POWER_S32, 2)
-            if batt_power_s32 and len(batt_power_s32) >= 2:
+            batt_power_s32 = regs.get("battery_power_s32")
+            if batt_power_s32:
                 battery_power = self._to_signed32(batt_power_s32[0], batt_power_s32[1])
                 if self._valid_s32(battery_power):
                     attrs["battery_power"] = battery_power
 
             # mkaiser tracks battery current at 5631 now; Sungrow docs recommend
             # it over the older 13021 register used in the compact battery block.
-            battery_current = await self._read_input_register(self.REG_BATTERY_CURRENT_PRECISE, 1)
+            battery_current = regs.get("battery_current")
             if battery_current and self._valid_u16(battery_current[0]):
                 attrs["battery_current"] = round(self._to_signed16(battery_current[0]) * 0.1, 1)
 
-            # Read daily PV generation
-            daily_pv = await self._read_input_register(self.REG_DAILY_PV, 1)
+            daily_pv = regs.get("daily_pv")
             if daily_pv:
                 attrs["daily_pv_generation"] = round(daily_pv[0] * 0.1, 2)
 
-            # Read total PV generation (32-bit)
-            total_pv = await self._read_input_register(self.REG_TOTAL_PV, 2)
-            if total_pv and len(total_pv) >= 2:
+            # Total PV generation (32-bit)
+            total_pv = regs.get("total_pv")
+            if total_pv:
                 attrs["total_pv_generation"] = round(self._to_unsigned32(total_pv[0], total_pv[1]) * 0.1, 1)
 
-            # Read load power (S32 with U16 fallback for older firmware)
-            load_power = await self._read_input_register(self.REG_LOAD_POWER, 2)
-            if load_power and len(load_power) >= 2:
+            # Load power (S32 with U16 fallback for older firmware)
+            load_power = regs.get("load_power")
+            if load_power:
                 attrs["load_power"] = self._read_power_s32_with_fallback(
                     load_power, "load_power",
                 )
 
-            # Read export power (S32 with U16 fallback)
-            export_power = await self._read_input_register(self.REG_EXPORT_POWER, 2)
-            if export_power and len(export_power) >= 2:
+            # Export power (S32 with U16 fallback)
+            export_power = regs.get("export_power")
+            if export_power:
                 attrs["export_power"] = self._read_power_s32_with_fallback(
                     export_power, "export_power",
                 )
 
             # Preferred grid meter reading: +import, -export. This avoids sign
             # ambiguity in the older export-power register on mixed firmware.
-            meter_power = await self._read_input_register(self.REG_METER_ACTIVE_POWER, 2)
-            if meter_power and len(meter_power) >= 2:
+            meter_power = regs.get("meter_power")
+            if meter_power:
                 meter_active_power = self._to_signed32(meter_power[0], meter_power[1])
                 if self._valid_s32(meter_active_power):
                     attrs["meter_power"] = meter_active_power
 
-            # Read total active power (S32 with U16 fallback)
-            active_power = await self._read_input_register(self.REG_TOTAL_ACTIVE_POWER, 2)
-            if active_power and len(active_power) >= 2:
+            # Total active power (S32 with U16 fallback)
+            active_power = regs.get("active_power")
+            if active_power:
                 attrs["active_power"] = self._read_power_s32_with_fallback(
                     active_power, "active_power",
                 )
 
-            # Read PV DC power (doc 5017-5018, U32, for direct solar measurement)
-            pv_dc = await self._read_input_register(self.REG_TOTAL_DC_POWER, 2)
-            if pv_dc and len(pv_dc) >= 2:
+            # PV DC power (doc 5017-5018, U32, for direct solar measurement)
+            pv_dc = regs.get("pv_dc")
+            if pv_dc:
                 attrs["pv_power"] = self._to_unsigned32(pv_dc[0], pv_dc[1])
 
-            # Read daily import/export
-            daily_import = await self._read_input_register(self.REG_DAILY_IMPORT, 1)
+            daily_import = regs.get("daily_import")
             if daily_import:
                 attrs["daily_import"] = round(daily_import[0] * 0.1, 2)
 
-            # Read total (lifetime) import energy (32-bit unsigned)
-            total_import = await self._read_input_register(self.REG_TOTAL_IMPORT, 2)
-            if total_import and len(total_import) >= 2:
+            # Total (lifetime) import energy (32-bit unsigned)
+            total_import = regs.get("total_import")
+            if total_import:
                 attrs["total_import"] = round(self._to_unsigned32(total_import[0], total_import[1]) * 0.1, 1)
 
-            daily_export = await self._read_input_register(self.REG_DAILY_EXPORT, 1)
+            daily_export = regs.get("daily_export")
             if daily_export:
                 attrs["daily_export"] = round(daily_export[0] * 0.1, 2)
 
-            # Read total (lifetime) export energy (32-bit unsigned)
-            total_export = await self._read_input_register(self.REG_TOTAL_EXPORT, 2)
-            if total_export and len(total_export) >= 2:
+            # Total (lifetime) export energy (32-bit unsigned)
+            total_export = regs.get("total_export")
+            if total_export:
                 attrs["total_export"] = round(self._to_unsigned32(total_export[0], total_export[1]) * 0.1, 1)
 
-            # Read daily battery charge
-            daily_charge = await self._read_input_register(self.REG_DAILY_BATTERY_CHARGE, 1)
+            daily_charge = regs.get("daily_battery_charge")
             if daily_charge:
                 attrs["daily_battery_charge"] = round(daily_charge[0] * 0.1, 2)
 
-            # Read inverter temperature (from 5xxx input register range)
-            inv_temp = await self._read_input_register(self.REG_INVERTER_TEMP, 1)
+            # Inverter temperature (from 5xxx input register range)
+            inv_temp = regs.get("inverter_temp")
             if inv_temp:
                 attrs["inverter_temperature"] = round(self._to_signed16(inv_temp[0]) * 0.1, 1)
 
-            # Read grid frequency
-            grid_freq = await self._read_input_register(self.REG_GRID_FREQUENCY, 1)
+            grid_freq = regs.get("grid_frequency")
             if grid_freq:
                 attrs["grid_frequency"] = round(grid_freq[0] * 0.01, 2)
 
-            # Read phase A voltage
-            voltage = await self._read_input_register(self.REG_PHASE_A_VOLTAGE, 1)
+            voltage = regs.get("phase_a_voltage")
             if voltage:
                 attrs["grid_voltage"] = round(voltage[0] * 0.1, 1)
 
-            # Read export limit status (holding registers)
-            export_limit = await self._read_register(self.REG_EXPORT_LIMIT_SETTING, 1)
+            # Export limit status (holding registers)
+            export_limit = regs.get("export_limit")
             if export_limit:
                 attrs["export_limit_w"] = export_limit[0]
 
-            export_mode = await self._read_register(self.REG_EXPORT_LIMIT_ENABLED, 1)
+            export_mode = regs.get("export_mode")
             if export_mode:
                 attrs["export_limit_enabled"] = export_mode[0] == self.EXPORT_LIMIT_ENABLE
 
+            # Only report poll stats alongside real data; an empty dict means
+            # the inverter is asleep.
+            if attrs:
+                attrs.update(self._status_plan.last_poll.to_attributes())
+
         except Exception as e:
             _LOGGER.warning(f"Error reading some registers: {e}")
 
@@ -1225,81 +1275,84 @@ class SungrowSHController(InverterController):
             data["battery_temp"] = round(self._to_signed16(battery_regs[5]) * 0.1, 1)
             data["daily_battery_discharge"] = round(battery_regs[6] * 0.1, 2)
 
+            regs = await self._battery_plan.read(self._read_plan_block)
+
             # Override battery_power with the S32 signed register (5214-5215).
             # Register 13022 can report unsigned on some SH-series firmware, making
             # charge/discharge indistinguishable. Register 5214 is S32 word-swapped
             # and is the authoritative signed value used by the reference Sungrow integration.
-            batt_power_s32 = await self._read_input_register(self.REG_BATTERY_POWER_S32, 2)
-            if batt_power_s32 and len(batt_power_s32) >= 2:
+            batt_power_s32 = regs.get("battery_power_s32")
+            if batt_power_s32:
                 battery_power = self._to_signed32(batt_power_s32[0], batt_power_s32[1])
                 if self._valid_s32(battery_power):
                     data["battery_power"] = battery_power
 
             # Prefer the current register recommended by the mkaiser mapping.
-            battery_current = await self._read_input_register(self.REG_BATTERY_CURRENT_PRECISE, 1)
+            battery_current = regs.get("battery_current")
             if battery_current and self._valid_u16(battery_current[0]):
                 data["battery_current"] = round(self._to_signed16(battery_current[0]) * 0.1, 1)
 
-            # Read daily battery charge
-            daily_charge = await self._read_input_register(self.REG_DAILY_BATTERY_CHARGE, 1)
+            daily_charge = regs.get("daily_battery_charge")
             if daily_charge:
                 data["daily_battery_charge"] = round(daily_charge[0] * 0.1, 2)
 
-            inv_temp = await self._read_input_register(self.REG_INVERTER_TEMP, 1)
+            inv_temp = regs.get("inverter_temp")
             if inv_temp:
                 data["inverter_temperature"] = round(self._to_signed16(inv_temp[0]) * 0.1, 1)
 
-            # Read daily energy registers (hardware-tracked, more reliable than
+            # Daily energy registers (hardware-tracked, more reliable than
             # software accumulator which can be polluted by transient bad reads)
-            daily_pv = await self._read_input_register(self.REG_DAILY_PV, 1)
+            daily_pv = regs.get("daily_pv")
             if daily_pv:
                 data["daily_pv_generation"] = round(daily_pv[0] * 0.1, 2)
 
-            daily_import = await self._read_input_register(self.REG_DAILY_IMPORT, 1)
+            daily_import = regs.get("daily_import")
             if daily_import:
                 data["daily_import"] = round(daily_import[0] * 0.1, 2)
 
-            daily_export = await self._read_input_register(self.REG_DAILY_EXPORT, 1)
+            daily_export = regs.get("daily_export")
             if daily_export:
                 data["daily_export"] = round(daily_export[0] * 0.1, 2)
 
-            # Read total (lifetime) import/export — used to derive daily values
+            # Total (lifetime) import/export — used to derive daily values
             # when daily registers read 0 (SH10RS + SBH has no daily registers)
-            total_import = await self._read_input_register(self.REG_TOTAL_IMPORT, 2)
-            if total_import and len(total_import) >= 2:
+            total_import = regs.get("total_import")
+            if total_import:
                 data["total_import"] = round(self._to_unsigned32(total_import[0], total_import[1]) * 0.1, 1)
 
-            total_export = await self._read_input_register(self.REG_TOTAL_EXPORT, 2)
-            if total_export and len(total_export) >= 2:
+            total_export = regs.get("total_export")
+            if total_export:
                 data["total_export"] = round(self._to_unsigned32(total_export[0], total_export[1]) * 0.1, 1)
 
-            # Read load power (S32 with U16 fallback for older firmware)
-            load_power = await self._read_input_register(self.REG_LOAD_POWER, 2)
-            if load_power and len(load_power) >= 2:
+            # Load power (S32 with U16 fallback for older firmware)
+            load_power = regs.get("load_power")
+            if load_power:
                 data["load_power"] = self._read_power_s32_with_fallback(
                     load_power, "load_power",
                 )
 
-            # Read export power (S32 with U16 fallback)
-            export_power = await self._read_input_register(self.REG_EXPORT_POWER, 2)
-            if export_power and len(export_power) >= 2:
+            # Export power (S32 with U16 fallback)
+            export_power = regs.get("export_power")
+            if export_power:
                 data["export_power"] = self._read_power_s32_with_fallback(
                     export_power, "export_power",
                 )
 
             # mkaiser's source-of-truth mapping recommends meter active power
             # for direct smart-meter systems: positive import, negative export.
-            meter_power = await self._read_input_register(self.REG_METER_ACTIVE_POWER, 2)
-            if meter_power and len(meter_power) >= 2:
+            meter_power = regs.get("meter_power")
+            if meter_power:
                 meter_active_power = self._to_signed32(meter_power[0], meter_power[1])
                 if self._valid_s32(meter_active_power):
                     data["meter_power"] = meter_active_power
 
-            # Read PV DC power (doc 5017-5018, U32, for direct solar measurement)
-            pv_dc = await self._read_input_register(self.REG_TOTAL_DC_POWER, 2)
-            if pv_dc and len(pv_dc) >= 2:
+            # PV DC power (doc 5017-5018, U32, for direct solar measurement)
+            pv_dc = regs.get("pv_dc")
+            if pv_dc:
                 data["pv_power"] = self._to_unsigned32(pv_dc[0], pv_dc[1])
 
+            data.update(self._battery_plan.last_poll.to_attributes())
+
             # Read EMS mode (holding registers — may not be supported on SH-RS + SBH)
             if self._ems_registers_supported:
                 ems_mode = await self._read_register(self.REG_EMS_MODE, 1)
@@ -0,0 +1,181 @@
+"""Register HTTP views whose implementation is imported on first request.
+
+The mobile app expects every PowerSync endpoint to exist regardless of which
+battery or EV features are configured, so views cannot simply be skipped.
+Instead the rarely-used groups (EV handlers, vendor settings screens) live in
+their own modules and are registered as ``LazyView`` shells: the route table
+is built from the static ``LazyViewSpec`` below, and the real view module is
+imported in the executor the first time one of its routes is hit.
+
+``tests/test_lazy_views.py`` keeps these specs in sync with the view classes.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import sys
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class LazyViewSpec:
+    """Routing metadata for one view class in a lazily imported module."""
+
+    class_name: str
+    url: str
+    name: str
+    methods: tuple[str, ...]
+    with_entry: bool = False
+    requires_auth: bool = True
+
+
+def _ev(class_name: str, path: str, methods: tuple[str, ...], with_entry: bool = False):
+    return LazyViewSpec(
+        class_name,
+        f"/api/power_sync/ev/{path}",
+        "api:power_sync:ev:" + path.replace("/{vehicle_id}", "").replace("/", ":"),
+        methods,
+        with_entry,
+    )
+
+
+def _vendor(class_name: str, path: str) -> LazyViewSpec:
+    return LazyViewSpec(
+        class_name,
+        f"/api/power_sync/{path}",
+        f"api:power_sync:{path}",
+        ("get", "post"),
+    )
+
+
+VENDOR_VIEWS_MODULE = "vendor_views"
+VENDOR_VIEWS: tuple[LazyViewSpec, ...] = (
+    _vendor("SigenergySettingsView", "sigenergy_settings"),
+    _vendor("SungrowSettingsView", "sungrow_settings"),
+    _vendor("SungrowDiagnosticsView", "sungrow_diagnostics"),
+    _vendor("FoxESSSettingsView", "foxess_settings"),
+    _vendor("GoodWeSettingsView", "goodwe_settings"),
+)
+
+EV_VIEWS_MODULE = "ev_views"
+EV_VIEWS: tuple[LazyViewSpec, ...] = (
+    _ev("EVStatusView", "status", ("get",)),
+    _ev("EVVehiclesView", "vehicles", ("get",)),
+    _ev("EVVehiclesSyncView", "vehicles/sync", ("post",)),
+    _ev("EVVehicleCommandView", "vehicles/{vehicle_id}/command", ("post",)),
+    _ev("SolarSurplusStatusView", "solar_surplus_status", ("get",)),
+    _ev("VehicleChargingConfigView", "vehicle_config", ("get", "post", "delete")),
+    _ev("SolarSurplusConfigView", "solar_surplus_config", ("get", "post")),
+    _ev("ChargingSessionsView", "sessions", ("get",)),
+    _ev("ChargingStatisticsView", "statistics", ("get",)),
+    _ev("ChargingScheduleView", "schedule", ("get", "post")),
+    _ev("SurplusForecastView", "surplus_forecast", ("get",)),
+    _ev("ChargingBoostView", "boost", ("post",), True),
+    _ev("EVWidgetDataView", "widget_data", ("get",), True),
+    _ev("EVLoadpointStatusView", "loadpoints/status", ("get",), True),
+    _ev("OCPPChargersView", "ocpp_chargers", ("get",), True),
+    _ev("OCPPChargerStartView", "ocpp_chargers/start", ("post",), True),
+    _ev("OCPPChargerStopView", "ocpp_chargers/stop", ("post",), True),
+    _ev("PriceRecommendationView", "price_recommendation", ("get",), True),
+    _ev("AutoScheduleSettingsView", "auto_schedule/settings", ("get", "post"), True),
+    _ev("AutoScheduleStatusView", "auto_schedule/status", ("get",), True),
+    _ev("AutoScheduleToggleView", "auto_schedule/toggle", ("post",), True),
+    _ev(
+        "PriceLevelChargingSettingsView",
+        "price_level_charging/settings",
+        ("get", "post"),
+        True,
+    ),
+    _ev("PriceLevelChargingStatusView", "price_level_charging/status", ("get",), True),
+    _ev(
+        "ScheduledChargingSettingsView",
+        "scheduled_charging/settings",
+        ("get", "post"),
+        True,
+    ),
+    _ev("ScheduledChargingStatusView", "scheduled_charging/status", ("get",), True),
+    _ev("EVChargingCoordinatorStatusView", "coordinator/status", ("get",), True),
+    _ev("HomePowerSettingsView", "home_power/settings", ("get", "post"), True),
+)
+
+# Legacy ``from custom_components.power_sync import <View>`` names -> module
+LAZY_VIEW_MODULES: dict[str, str] = {
+    **{spec.class_name: VENDOR_VIEWS_MODULE for spec in VENDOR_VIEWS},
+    **{spec.class_name: EV_VIEWS_MODULE for spec in EV_VIEWS},
+}
+
+
+class LazyView(HomeAssistantView):
+    """Route shell that imports and builds the real view on first request."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        module: str,
+        spec: LazyViewSpec,
+        entry: Any = None,
+    ) -> None:
+        self._hass = hass
+        self._module = f"{__package__}.{module}"
+        self._spec = spec
+        self._entry = entry
+        self._view: HomeAssistantView | None = None
+        self.url = spec.url
+        self.name = spec.name
+        self.requires_auth = spec.requires_auth
+        for method in spec.methods:
+            setattr(self, method, self._forwarder(method))
+
+    @property
+    def loaded(self) -> bool:
+        """Return True once the real view has been built."""
+        return self._view is not None
+
+    async def async_resolve(self) -> HomeAssistantView:
+        """Import the view module off the event loop and build the view once."""
+        if self._view is None:
+            module = sys.modules.get(self._module)
+            if module is None:
+                module = await self._hass.async_add_executor_job(
+                    importlib.import_module, self._module
+                )
+            if self._view is None:
+                view_cls = getattr(module, self._spec.class_name)
+                args = (self._hass, self._entry) if self._spec.with_entry else (self._hass,)
+                self._view = view_cls(*args)
+                _LOGGER.debug("Loaded lazy view %s", self._spec.class_name)
+        return self._view
+
+    def _forwarder(
+        self, method: str
+    ) -> Callable[..., Coroutine[Any, Any, web.StreamResponse]]:
+        async def handler(request: web.Request, **match_info: Any) -> web.StreamResponse:
+            view = await self.async_resolve()
+            return await getattr(view, method)(request, **match_info)
+
+        handler.__name__ = method
+        return handler
+
+
+def register_lazy_views(
+    hass: HomeAssistant,
+    module: str,
+    specs: tuple[LazyViewSpec, ...],
+    entry: Any = None,
+) -> dict[str, LazyView]:
+    """Register a group of lazily imported views; return them by class name."""
+    views = {}
+    for spec in specs:
+        view = LazyView(hass, module, spec, entry if spec.with_entry else None)
+        hass.http.register_view(view)
+        views[spec.class_name] = view
+    return views
@@ -16,11 +16,16 @@ self-consumption behavior.
 """
 from __future__ import annotations
 
+import contextvars
 import logging
 import math
 import time
+from array import array
+from collections.abc import Callable
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
+from itertools import accumulate
 from typing import Any
 
 from homeassistant.util import dt as dt_util
@@ -38,7 +43,9 @@ from .ev_load_plan import (
     expected_ev_policy_profile,
     normalize_ev_charge_plan,
 )
+from .lazy_import import ensure_loaded, optional_module
 from .schedule_reader import ScheduleAction, OptimizationSchedule
+from .solve_cache import normalize_cache_value, optimizer_state
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -235,59 +242,177 @@ def _fallback_ev_source_series(
             sources[vehicle_id]["grid"][slot] = remaining
     return sources
 
-# Try to import the HiGHS solver; fall back to greedy if unavailable.
-try:
-    import highspy
-
-    HIGHS_AVAILABLE = True
-except ImportError:
-    HIGHS_AVAILABLE = False
-    highspy = None
+def _warn_highspy_unavailable() -> None:
     _LOGGER.warning(
         "highspy not available — using greedy fallback optimizer. "
         "Install highspy for optimal LP-based scheduling."
     )
 
 
+def _highspy_import_failed(err: ImportError) -> None:
+    global HIGHS_AVAILABLE
+    HIGHS_AVAILABLE = False
+    _LOGGER.debug("highspy import failed: %s", err)
+    _warn_highspy_unavailable()
+
+
+# HiGHS solver; fall back to greedy if unavailable. Imported by the first
+# solve rather than at integration load.
+highspy = optional_module("highspy", _highspy_import_failed)
+HIGHS_AVAILABLE = highspy is not None
+if not HIGHS_AVAILABLE:
+    _warn_highspy_unavailable()
+
+
+def _numpy_import_failed(err: ImportError) -> None:
+    global NUMPY_AVAILABLE
+    NUMPY_AVAILABLE = False
+    _LOGGER.debug("numpy import failed, using the array CSR builder: %s", err)
+
+
+# NumPy ships with highspy and vectorizes the CSR compression below; the
+# ``array`` fallback keeps the builder usable without it.
+np = optional_module("numpy", _numpy_import_failed)
+NUMPY_AVAILABLE = np is not None
+
+
+def _numpy_ready() -> bool:
+    return NUMPY_AVAILABLE and ensure_loaded(np)
+
+
 class _LpMatrix:
-    """Minimal row-oriented sparse matrix for building LP constraints.
+    """Array-backed sparse matrix for building LP constraints.
 
     Implements just the subset of ``scipy.sparse.lil_matrix`` the optimizer
     relies on — ``shape``, ``m[i, j] = v`` assignment, ``m[i, j]`` lookup,
-    ``.nnz``, ``.tocsr()`` (a no-op) and per-row iteration — so we can build the
+    ``.nnz``, ``.tocsr()`` and per-row iteration — so we can build the
     constraint matrices and feed HiGHS directly without depending on scipy.
+
+    Assignments append to flat ``array`` triplet buffers rather than per-row
+    dicts. ``tocsr()`` compresses them once into CSR start/index/value arrays
+    (NumPy when available): the last write to an entry wins and explicit
+    zeros are dropped, exactly like item assignment on a dict row.
     """
 
-    __slots__ = ("shape", "_rows")
+    __slots__ = ("shape", "_row", "_col", "_val", "_csr")
 
     def __init__(self, shape, dtype=float):
         rows, cols = int(shape[0]), int(shape[1])
         self.shape = (rows, cols)
-        self._rows: list[dict[int, float]] = [dict() for _ in range(rows)]
+        self._row = array("i")
+        self._col = array("i")
+        self._val = array("d")
+        self._csr: tuple | None = None
 
     def __setitem__(self, key, value) -> None:
         i, j = key
-        value = float(value)
-        if value == 0.0:
-            self._rows[i].pop(j, None)
-        else:
-            self._rows[i][j] = value
+        self._row.append(i)
+        self._col.append(j)
+        self._val.append(float(value))
+        self._csr = None
 
     def __getitem__(self, key) -> float:
         i, j = key
-        return self._rows[i].get(j, 0.0)
+        start, index, value = self.csr_arrays()
+        lo, hi = int(start[i]), int(start[i + 1])
+        pos = bisect_left(index, j, lo, hi)
+        if pos < hi and index[pos] == j:
+            return float(value[pos])
+        return 0.0
 
     @property
     def nnz(self) -> int:
-        return sum(len(r) for r in self._rows)
+        return len(self.csr_arrays()[2])
 
     def tocsr(self) -> "_LpMatrix":
+        self.csr_arrays()
         return self
 
+    def csr_arrays(self) -> tuple:
+        """Return ``(start, index, value)`` CSR arrays, columns sorted per row."""
+        if self._csr is None:
+            self._csr = self._compress()
+        return self._csr
+
+    def _compress(self) -> tuple:
+        n_rows, n_cols = self.shape
+        if len(self._row) and (
+            min(self._row) < 0 or max(self._row) >= n_rows
+        ):
+            raise IndexError("LP matrix row index out of range")
+        if _numpy_ready():
+            rows = np.asarray(self._row, dtype=np.int64)
+            cols = np.asarray(self._col, dtype=np.int64)
+            vals = np.asarray(self._val, dtype=np.float64)
+            keys = rows * n_cols + cols
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            last_write = np.ones(len(order), dtype=bool)
+            last_write[:-1] = sorted_keys[1:] != sorted_keys[:-1]
+            order = order[last_write]
+            order = order[vals[order] != 0.0]
+            start = np.searchsorted(
+                rows[order], np.arange(n_rows + 1), side="left"
+            ).astype(np.int32)
+            return start, cols[order].astype(np.int32), vals[order]
+
+        keys = [row * n_cols + col for row, col in zip(self._row, self._col)]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        counts = [0] * (n_rows + 1)
+        index = array("i")
+        value = array("d")
+        for position, entry in enumerate(order):
+            if (
+                position + 1 < len(order)
+                and keys[order[position + 1]] == keys[entry]
+            ):
+                continue
+            entry_value = self._val[entry]
+            if entry_value == 0.0:
+                continue
+            counts[self._row[entry] + 1] += 1
+            index.append(self._col[entry])
+            value.append(entry_value)
+        start = array("i", accumulate(counts))
+        return start, index, value
+
     def iter_rows(self):
         """Yield (row_index, [col indices], [values]) for non-trivial use."""
-        for i, row in enumerate(self._rows):
-            yield i, list(row.keys()), list(row.values())
+        start, index, value = self.csr_arrays()
+        for i in range(self.shape[0]):
+            lo, hi = int(start[i]), int(start[i + 1])
+            yield i, [int(col) for col in index[lo:hi]], [
+                float(v) for v in value[lo:hi]
+            ]
+
+
+def _stack_csr(first: _LpMatrix, second: _LpMatrix) -> tuple:
+    """Return the row-wise concatenation of two matrices as CSR arrays."""
+    start_a, index_a, value_a = first.csr_arrays()
+    start_b, index_b, value_b = second.csr_arrays()
+    offset = len(value_a)
+    if _numpy_ready():
+        return (
+            np.concatenate(
+                (
+                    np.asarray(start_a, dtype=np.int32),
+                    np.asarray(start_b[1:], dtype=np.int32) + offset,
+                )
+            ),
+            np.concatenate(
+                (np.asarray(index_a, dtype=np.int32), np.asarray(index_b, dtype=np.int32))
+            ),
+            np.concatenate(
+                (np.asarray(value_a, dtype=np.float64), np.asarray(value_b, dtype=np.float64))
+            ),
+        )
+    start = array("i", start_a)
+    start.extend(pos + offset for pos in start_b[1:])
+    index = array("i", index_a)
+    index.extend(index_b)
+    value = array("d", value_a)
+    value.extend(value_b)
+    return start, index, value
 
 
 class _HighsResult:
@@ -303,48 +428,83 @@ class _HighsResult:
         self.fun = fun
 
 
-def _solve_lp_highs(
-    c, A_ub, b_ub, A_eq, b_eq, bounds, time_limit, integer_indices=None
-):
-    """Solve a standard-form LP with HiGHS and return a linprog-like result.
+class _HighsModelArrays:
+    """Flat column/row/CSR arrays describing one LP/MILP for HiGHS."""
 
-    minimize  c·x   s.t.   A_ub·x <= b_ub,  A_eq·x == b_eq,  bounds[j] on x[j].
+    __slots__ = (
+        "cost",
+        "col_lower",
+        "col_upper",
+        "row_lower",
+        "row_upper",
+        "start",
+        "index",
+        "value",
+        "integers",
+    )
 
-    Mirrors ``scipy.optimize.linprog(method="highs")``: an optimal solve sets
-    ``success=True``, and so does a time/iteration-limited solve that still
-    holds a feasible incumbent (that incumbent is returned instead of being
-    discarded); infeasible/unbounded — and limited solves with no feasible
-    incumbent — report success=False with a message string (``"infeasible"``
-    substring preserved so the caller's self-consumption fallback still
-    triggers).
-    """
-    inf = highspy.kHighsInf
+    def __init__(self, c, A_ub, b_ub, A_eq, b_eq, bounds, integer_indices=None):
+        inf = highspy.kHighsInf
+        self.cost = [float(value) for value in c]
+        self.col_lower = [-inf if lo is None else float(lo) for lo, _ in bounds]
+        self.col_upper = [inf if hi is None else float(hi) for _, hi in bounds]
+        # Equality rows first (lower == upper == b_eq[i]), then inequality
+        # rows (-inf <= row·x <= b_ub[i]).
+        eq_rows = A_eq.shape[0]
+        ub_rows = A_ub.shape[0]
+        eq_rhs = [float(b_eq[i]) for i in range(eq_rows)]
+        self.row_lower = eq_rhs + [-inf] * ub_rows
+        self.row_upper = eq_rhs + [float(b_ub[i]) for i in range(ub_rows)]
+        self.start, self.index, self.value = _stack_csr(A_eq, A_ub)
+        self.integers = tuple(sorted(int(index) for index in integer_indices or ()))
+
+    @property
+    def pattern(self) -> tuple:
+        """Hashable structure key: dimensions, integrality and sparsity."""
+        return (
+            len(self.cost),
+            len(self.row_lower),
+            self.integers,
+            bytes(self.start),
+            bytes(self.index),
+        )
+
+    def to_highs_lp(self):
+        """Assemble a ``HighsLp`` for a single ``passModel`` call."""
+        lp = highspy.HighsLp()
+        lp.num_col_ = len(self.cost)
+        lp.num_row_ = len(self.row_lower)
+        lp.col_cost_ = self.cost
+        lp.col_lower_ = self.col_lower
+        lp.col_upper_ = self.col_upper
+        lp.row_lower_ = self.row_lower
+        lp.row_upper_ = self.row_upper
+        matrix = lp.a_matrix_
+        matrix.format_ = highspy.MatrixFormat.kRowwise
+        matrix.num_col_ = lp.num_col_
+        matrix.num_row_ = lp.num_row_
+        matrix.start_ = self.start
+        matrix.index_ = self.index
+        matrix.value_ = self.value
+        if self.integers:
+            integrality = [highspy.HighsVarType.kContinuous] * lp.num_col_
+            for index in self.integers:
+                integrality[index] = highspy.HighsVarType.kInteger
+            lp.integrality_ = integrality
+        return lp
+
+
+def _new_highs(model: _HighsModelArrays):
+    """Create a quiet HiGHS instance loaded with ``model``."""
     h = highspy.Highs()
     h.setOptionValue("output_flag", False)
     h.setOptionValue("log_to_console", False)
-    h.setOptionValue("time_limit", float(time_limit))
+    h.passModel(model.to_highs_lp())
+    return h
 
-    # Columns carry the objective coefficients and variable bounds; constraint
-    # coefficients are supplied row-by-row below, so each column starts empty.
-    for j in range(len(c)):
-        lo, hi = bounds[j]
-        lo = -inf if lo is None else float(lo)
-        hi = inf if hi is None else float(hi)
-        h.addCol(float(c[j]), lo, hi, 0, [], [])
-    for index in integer_indices or ():
-        h.setInteger(int(index))
-
-    # Equality rows: lower == upper == b_eq[i].
-    for i, idx, val in A_eq.iter_rows():
-        rhs = float(b_eq[i])
-        h.addRow(rhs, rhs, len(idx), idx, val)
-
-    # Inequality rows: -inf <= row·x <= b_ub[i].
-    for i, idx, val in A_ub.iter_rows():
-        h.addRow(-inf, float(b_ub[i]), len(idx), idx, val)
-
-    h.run()
 
+def _highs_result(h) -> _HighsResult:
+    """Translate a completed HiGHS run into a linprog-like result."""
     model_status = h.getModelStatus()
     message = h.modelStatusToString(model_status)
     optimal = model_status == highspy.HighsModelStatus.kOptimal
@@ -378,6 +538,208 @@ def _solve_lp_highs(
         fun=fun,
     )
 
+
+class _HighsSession:
+    """One HiGHS model reused by the consecutive solves of an optimize() call.
+
+    Command-mode projection and cost-neutral reconciliation re-solve the LP up
+    to ``MODE_PROJECTION_MAX_ITERATIONS`` times. When a pass has the same
+    sparsity pattern and integrality as the model already loaded, only the
+    changed costs, bounds, row bounds and coefficients are pushed into the
+    existing instance, so HiGHS hot-starts from the retained basis instead of
+    loading the model again. A MILP pass is seeded with the previous
+    incumbent. Any structural change rebuilds the model.
+    """
+
+    __slots__ = (
+        "_highs",
+        "_pattern",
+        "_model",
+        "_last_x",
+        "solve_count",
+        "build_count",
+        "update_count",
+        "warm_start_count",
+        "build_time_s",
+        "solve_time_s",
+        "simplex_iterations",
+    )
+
+    def __init__(self) -> None:
+        self._highs = None
+        self._pattern: tuple | None = None
+        self._model: _HighsModelArrays | None = None
+        self._last_x: list[float] | None = None
+        self.solve_count = 0
+        self.build_count = 0
+        self.update_count = 0
+        self.warm_start_count = 0
+        self.build_time_s = 0.0
+        self.solve_time_s = 0.0
+        self.simplex_iterations = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return session counters for ``OptimizerResult.solver_session``."""
+        return {
+            "solve_count": self.solve_count,
+            "build_count": self.build_count,
+            "update_count": self.update_count,
+            "warm_start_count": self.warm_start_count,
+            "build_time_s": round(self.build_time_s, 4),
+            "solve_time_s": round(self.solve_time_s, 4),
+            "simplex_iterations": self.simplex_iterations,
+        }
+
+    def solve(
+        self, c, A_ub, b_ub, A_eq, b_eq, bounds, time_limit, integer_indices=None
+    ) -> _HighsResult:
+        """Solve the given model, reusing the loaded instance when possible."""
+        build_start = time.monotonic()
+        model = _HighsModelArrays(
+            c, A_ub, b_ub, A_eq, b_eq, bounds, integer_indices
+        )
+        pattern = model.pattern
+
+        h = self._highs
+        reused = False
+        if h is not None and pattern == self._pattern:
+            try:
+                self._update(h, model)
+                reused = True
+            except Exception as err:  # pragma: no cover - defensive rebuild
+                _LOGGER.debug("HiGHS session update failed, rebuilding: %s", err)
+        if reused:
+            self.update_count += 1
+        else:
+            h = _new_highs(model)
+            self.build_count += 1
+        h.setOptionValue("time_limit", float(time_limit))
+
+        # An LP keeps its simplex basis across in-place updates. A MILP
+        # restarts branch-and-bound, so hand it the previous incumbent.
+        n_cols = len(model.cost)
+        warm = reused and not model.integers
+        if (
+            model.integers
+            and self._last_x is not None
+            and len(self._last_x) == n_cols
+        ):
+            try:
+                h.setSolution(n_cols, list(range(n_cols)), self._last_x)
+                warm = True
+            except Exception as err:  # pragma: no cover - start is optional
+                _LOGGER.debug("HiGHS MIP start rejected: %s", err)
+        if warm:
+            self.warm_start_count += 1
+
+        self._highs = h
+        self._pattern = pattern
+        self._model = model
+        self.build_time_s += time.monotonic() - build_start
+
+        run_start = time.monotonic()
+        h.run()
+        self.solve_time_s += time.monotonic() - run_start
+        self.solve_count += 1
+        self.simplex_iterations += int(
+            getattr(h.getInfo(), "simplex_iteration_count", 0) or 0
+        )
+        result = _highs_result(h)
+        if result.success:
+            self._last_x = result.x
+        return result
+
+    def _update(self, h, model: _HighsModelArrays) -> None:
+        """Push only the entries that differ from the loaded model."""
+        loaded = self._model
+        changed = [
+            j for j, value in enumerate(model.cost) if value != loaded.cost[j]
+        ]
+        if changed:
+            h.changeColsCost(
+                len(changed), changed, [model.cost[j] for j in changed]
+            )
+        changed = [
+            j
+            for j in range(len(model.cost))
+            if model.col_lower[j] != loaded.col_lower[j]
+            or model.col_upper[j] != loaded.col_upper[j]
+        ]
+        if changed:
+            h.changeColsBounds(
+                len(changed),
+                changed,
+                [model.col_lower[j] for j in changed],
+                [model.col_upper[j] for j in changed],
+            )
+        changed = [
+            i
+            for i in range(len(model.row_lower))
+            if model.row_lower[i] != loaded.row_lower[i]
+            or model.row_upper[i] != loaded.row_upper[i]
+        ]
+        if changed:
+            h.changeRowsBounds(
+                len(changed),
+                changed,
+                [model.row_lower[i] for i in changed],
+                [model.row_upper[i] for i in changed],
+            )
+        if _numpy_ready():
+            positions = np.flatnonzero(
+                np.asarray(model.value) != np.asarray(loaded.value)
+            ).tolist()
+        else:
+            positions = [
+                pos
+                for pos, (value, old) in enumerate(zip(model.value, loaded.value))
+                if value != old
+            ]
+        for pos in positions:
+            row = bisect_right(model.start, pos) - 1
+            h.changeCoeff(row, int(model.index[pos]), float(model.value[pos]))
+
+
+# Solves issued while a session is active reuse its HiGHS instance. A context
+# variable keeps concurrent optimize() calls on different executor threads
+# from sharing one model, and leaves the ``_solve_lp_highs`` call contract
+# untouched for callers that replace it.
+_ACTIVE_HIGHS_SESSION: contextvars.ContextVar[_HighsSession | None] = (
+    contextvars.ContextVar("power_sync_highs_session", default=None)
+)
+
+
+def _solve_lp_highs(
+    c, A_ub, b_ub, A_eq, b_eq, bounds, time_limit, integer_indices=None
+):
+    """Solve a standard-form LP with HiGHS and return a linprog-like result.
+
+    minimize  c·x   s.t.   A_ub·x <= b_ub,  A_eq·x == b_eq,  bounds[j] on x[j].
+
+    Mirrors ``scipy.optimize.linprog(method="highs")``: an optimal solve sets
+    ``success=True``, and so does a time/iteration-limited solve that still
+    holds a feasible incumbent (that incumbent is returned instead of being
+    discarded); infeasible/unbounded — and limited solves with no feasible
+    incumbent — report success=False with a message string (``"infeasible"``
+    substring preserved so the caller's self-consumption fallback still
+    triggers).
+
+    Inside an active ``_HighsSession`` the solve is delegated to the session
+    so repeated passes reuse one model.
+    """
+    session = _ACTIVE_HIGHS_SESSION.get()
+    if session is not None:
+        return session.solve(
+            c, A_ub, b_ub, A_eq, b_eq, bounds, time_limit, integer_indices
+        )
+
+    h = _new_highs(
+        _HighsModelArrays(c, A_ub, b_ub, A_eq, b_eq, bounds, integer_indices)
+    )
+    h.setOptionValue("time_limit", float(time_limit))
+    h.run()
+    return _highs_result(h)
+
 # Action detection threshold (W) — below this, treat as idle to avoid rapid switching
 ACTION_THRESHOLD_W = 100.0
 
@@ -407,6 +769,33 @@ LP_FAR_PERIOD_MINUTES = 60
 LP_PRICE_SPLIT_THRESHOLD = 0.02
 LP_POWER_SPLIT_THRESHOLD_KW = ACTION_THRESHOLD_W / 1000.0
 
+# Receding-horizon re-solve. When the previous plan still describes the
+# horizon beyond the near tier, only the first LP_NEAR_HORIZON_HOURS are
+# re-optimized and the previous tail is carried forward. Drift beyond these
+# tolerances, or too many consecutive incremental solves, forces a full solve.
+RECEDING_HORIZON_SOC_TOLERANCE = 0.02
+RECEDING_HORIZON_PRICE_TOLERANCE = 0.005
+RECEDING_HORIZON_POWER_TOLERANCE_KW = 0.2
+RECEDING_HORIZON_MAX_INCREMENTAL_SOLVES = 6
+_RECEDING_HORIZON_SERIES_TOLERANCE = {
+    "import_prices": RECEDING_HORIZON_PRICE_TOLERANCE,
+    "export_prices": RECEDING_HORIZON_PRICE_TOLERANCE,
+    "solar": RECEDING_HORIZON_POWER_TOLERANCE_KW,
+    "load": RECEDING_HORIZON_POWER_TOLERANCE_KW,
+}
+# Slot-indexed optimizer state is compared per slot after the shift rather
+# than as part of the configuration signature.
+_RECEDING_HORIZON_SLOT_STATE = frozenset(
+    {
+        "export_reserve_floor_slots",
+        "_active_grid_export_limits_w",
+        "_quota_import_group_ids",
+        "_quota_export_group_ids",
+        "pre_window_slot",
+        "receding_horizon_max_incremental_solves",
+    }
+)
+
 # Profit Max prefill guard: count most, but not all, forecast net solar before
 # the export window and keep a small SOC buffer for forecast error.
 PRE_WINDOW_SOLAR_CREDIT_FACTOR = 0.80
@@ -420,6 +809,12 @@ DEADLINE_IMPORT_BIAS_SOLAR_MIN_SOC = 0.03
 _UNSET = object()
 
 
+def _receding_value_changed(previous: Any, current: Any, tolerance: float) -> bool:
+    if previous is None or current is None or isinstance(current, bool):
+        return previous != current
+    return abs(float(previous) - float(current)) > tolerance
+
+
 @dataclass(frozen=True)
 class _LpPeriod:
     """Internal LP period mapped to a range of base schedule slots."""
@@ -475,6 +870,15 @@ class OptimizerResult:
     future_export_protection_floor_slots: list[float] | None = None
     free_import_command_slots: list[bool] = field(default_factory=list)
     solar_curtailment_w: list[float] | None = None
+    # HiGHS session counters across every pass of this solve: solve/build
+    # counts, model build time and simplex iterations.
+    solver_session: dict[str, Any] = field(default_factory=dict)
+    # Per-slot LP flows (kW) before schedule rendering. A receding-horizon
+    # re-solve renders the carried tail from these, not from the actions.
+    lp_flows_kw: dict[str, list[float]] = field(default_factory=dict)
+    # Per-slot inputs and configuration signature the plan answers; the next
+    # optimize() call compares against them before re-solving incrementally.
+    horizon_inputs: dict[str, Any] | None = None
 
 
 class BatteryOptimizer:
@@ -526,6 +930,14 @@ class BatteryOptimizer:
         # that the below-reserve adjustment fires at INFO instead of WARNING.
         # (SOC below reserve is expected during intentional force discharge.)
         self.suppress_reserve_warning: bool = False
+        # Optional SolveResultCache installed by the coordinator; None solves
+        # every call.
+        self.result_cache = None
+        # Consecutive near-window re-solves allowed before a full solve; 0
+        # always solves the whole horizon.
+        self.receding_horizon_max_incremental_solves = (
+            RECEDING_HORIZON_MAX_INCREMENTAL_SOLVES
+        )
         self._below_reserve_recovery_target: float | None = None
         self.export_reserve_floor: float = 0.0
         self.export_reserve_floor_slots: list[float] | None = None
@@ -796,6 +1208,7 @@ class BatteryOptimizer:
         profit_max_solar_export_slots: bool | list[bool] | None = None,
         manual_control: dict[str, Any] | None = None,
         ev_plan: EVChargePlan | None = None,
+        previous_result: OptimizerResult | None = None,
     ) -> OptimizerResult:
         """
         Run the LP optimization.
@@ -848,10 +1261,18 @@ class BatteryOptimizer:
                 export credit when the final plan's import cost is substituted.
             cost_neutral_plan: Provider-neutral date-partitioned budgets. When
                 supplied, this replaces the legacy scalar/mask constraint.
+            previous_result: The plan published by the previous solve. When
+                the horizon has only moved forward and SOC and forecasts
+                beyond the near tier are within the receding-horizon
+                tolerances, only the near tier is re-solved and the rest of
+                this plan is carried forward.
 
         Returns:
             OptimizerResult with schedule and metadata
         """
+        # Snapshot the arguments before any local is bound: the result cache
+        # keys on exactly what the caller passed.
+        cache_arguments = dict(locals())
         start_time = time.monotonic()
 
         # Align all arrays to the same length
@@ -859,6 +1280,24 @@ class BatteryOptimizer:
             import_prices, export_prices, solar_forecast, load_forecast
         )
 
+        cache = self.result_cache
+        cache_key = (
+            cache.key_for(self, cache_arguments)
+            if cache is not None and n_steps > 0
+            else None
+        )
+        if cache_key is not None:
+            cached = cache.get(cache_key, schedule_timestamps)
+            if cached is not None:
+                # Reconciliation reads the caps a real solve would have left.
+                self._last_grid_export_limits_w = (
+                    self._normalize_grid_export_limits(
+                        grid_export_limits_w, n_steps
+                    )
+                )
+                cached.solve_time_s = time.monotonic() - start_time
+                return cached
+
         if n_steps == 0:
             _LOGGER.warning("No forecast data available, returning empty schedule")
             return self._empty_result()
@@ -1033,8 +1472,99 @@ class BatteryOptimizer:
         )
 
         try:
-            if HIGHS_AVAILABLE:
+            if HIGHS_AVAILABLE and ensure_loaded(highspy):
+                session = _HighsSession()
+                session_token = _ACTIVE_HIGHS_SESSION.set(session)
                 try:
+                    def _publish(result: OptimizerResult) -> OptimizerResult:
+                        result.solve_time_s = time.monotonic() - start_time
+                        result.modeled_backup_reserve = modeled_backup_reserve
+                        result.modeled_export_reserve_floor = (
+                            modeled_export_reserve_floor
+                        )
+                        result.modeled_export_reserve_floor_slots = (
+                            modeled_export_reserve_floor_slots
+                        )
+                        result.solver_session = session.stats()
+                        if cache_key is not None:
+                            result.lp_stats["solve_cache_lookup"] = "miss"
+                            cache.put(cache_key, schedule_timestamps, result)
+                        return result
+
+                    horizon_inputs = self._receding_horizon_inputs(
+                        schedule_timestamps,
+                        {
+                            "import_prices": import_prices,
+                            "export_prices": export_prices,
+                            "solar": solar_forecast,
+                            "load": load_forecast,
+                            "allow_battery_export": allow_battery_export,
+                            "block_battery_charge": block_battery_charge,
+                            "grid_charge_allowed": grid_charge_allowed,
+                            "priority_export_slots": priority_export_slots,
+                            "profit_max_solar_export_slots": (
+                                profit_max_solar_export_slots
+                            ),
+                            "export_reserve_floor": (
+                                self.export_reserve_floor_slots
+                                or [None] * n_steps
+                            ),
+                            "grid_export_limits_w": (
+                                self._active_grid_export_limits_w
+                                or [None] * n_steps
+                            ),
+                        },
+                        {
+                            "cost_function": cost_function,
+                            "acquisition_cost_kwh": acquisition_cost_kwh,
+                            "allow_grid_charge": allow_grid_charge,
+                            "disable_idle": disable_idle,
+                        },
+                        unsupported=bool(
+                            ev_plan is not None
+                            or cost_neutral_plan is not None
+                            or any(mode is not None for mode in manual_mode_slots)
+                            or any(export_bonus_prices)
+                            or any(import_bonus_prices)
+                            or any(self._quota_import_group_ids or ())
+                            or any(self._quota_export_group_ids or ())
+                            or (
+                                self.pre_window_slot is not None
+                                and self.pre_window_soc_target > 0.0
+                            )
+                        ),
+                    )
+                    shift, receding_reason = self._receding_horizon_shift(
+                        previous_result,
+                        horizon_inputs,
+                        current_soc,
+                    )
+                    if shift is not None:
+                        result = self._solve_receding_horizon(
+                            previous_result,
+                            shift,
+                            horizon_inputs,
+                            n_steps,
+                            import_prices,
+                            export_prices,
+                            solar_forecast,
+                            load_forecast,
+                            current_soc,
+                            cost_function,
+                            acquisition_cost_kwh,
+                            allow_battery_export,
+                            block_battery_charge,
+                            allow_grid_charge,
+                            grid_charge_allowed,
+                            schedule_timestamps,
+                            priority_export_slots,
+                            disable_idle,
+                            profit_max_solar_export_slots,
+                        )
+                        if result is not None:
+                            return _publish(result)
+                        receding_reason = "window_infeasible"
+
                     def _run_lp_once(
                         plan: CostNeutralPlan | None,
                         account_for_planned_imports: bool | dict[str, bool],
@@ -1187,15 +1717,17 @@ class BatteryOptimizer:
                         result.lp_stats[
                             "cost_neutral_reconciliation_iterations"
                         ] = reconciliation_iterations
-                    result.solve_time_s = time.monotonic() - start_time
-                    result.modeled_backup_reserve = modeled_backup_reserve
-                    result.modeled_export_reserve_floor = modeled_export_reserve_floor
-                    result.modeled_export_reserve_floor_slots = (
-                        modeled_export_reserve_floor_slots
-                    )
-                    return result
+                    result.lp_stats["receding_horizon"] = {
+                        "mode": "full",
+                        "reason": receding_reason,
+                    }
+                    if result.solver_used == "highs":
+                        result.horizon_inputs = horizon_inputs
+                    return _publish(result)
                 except Exception as e:
                     _LOGGER.error(f"LP solver failed, falling back to greedy: {e}")
+                finally:
+                    _ACTIVE_HIGHS_SESSION.reset(session_token)
 
             # Greedy fallback
             result = self._solve_greedy(
@@ -1243,6 +1775,303 @@ class BatteryOptimizer:
             self._active_grid_export_limits_w = previous_grid_export_limits
             self._prevent_simultaneous_grid_flow = previous_direction_guard
 
+    def _receding_horizon_inputs(
+        self,
+        schedule_timestamps: list[datetime] | None,
+        series: dict[str, list[Any]],
+        scalars: dict[str, Any],
+        unsupported: bool,
+    ) -> dict[str, Any]:
+        """Record what a plan answers for the next solve's receding check."""
+        n = len(series["import_prices"])
+        timestamps = list(schedule_timestamps or [])[:n]
+        return {
+            # Plans stamped from the wall clock are never shifted.
+            "timestamps": timestamps if len(timestamps) == n else [],
+            "series": {
+                name: (list(values) + [None] * n)[:n]
+                for name, values in series.items()
+            },
+            "signature": (
+                self.interval_minutes,
+                normalize_cache_value(scalars),
+                optimizer_state(self, _RECEDING_HORIZON_SLOT_STATE),
+            ),
+            "unsupported": unsupported,
+            "incremental_solves": 0,
+        }
+
+    def _receding_horizon_shift(
+        self,
+        previous_result: OptimizerResult | None,
+        horizon_inputs: dict[str, Any],
+        current_soc: float,
+    ) -> tuple[int | None, str]:
+        """Return how many slots the previous plan moved, or why it can't be reused.
+
+        The previous plan is reusable when it was a HiGHS plan for the same
+        configuration, the horizon start moved forward by whole slots, the
+        measured SOC is where that plan expected it, and every input past the
+        near tier still matches what the carried-forward tail was solved for.
+        """
+        if self.receding_horizon_max_incremental_solves <= 0:
+            return None, "disabled"
+        previous_inputs = (
+            previous_result.horizon_inputs if previous_result is not None else None
+        )
+        if not previous_inputs:
+            return None, "no_previous_plan"
+        if previous_result.solver_used != "highs" or not previous_result.feasible:
+            return None, "previous_not_highs"
+        if horizon_inputs["unsupported"] or previous_inputs["unsupported"]:
+            return None, "unsupported_constraints"
+        if previous_inputs["signature"] != horizon_inputs["signature"]:
+            return None, "configuration_changed"
+        if (
+            previous_inputs["incremental_solves"]
+            >= self.receding_horizon_max_incremental_solves
+        ):
+            return None, "refresh_due"
+        timestamps = horizon_inputs["timestamps"]
+        previous_timestamps = previous_inputs["timestamps"]
+        if not timestamps or not previous_timestamps:
+            return None, "no_timestamps"
+        interval_s = self.interval_minutes * 60
+        offset_s = (timestamps[0] - previous_timestamps[0]).total_seconds()
+        shift = int(offset_s // interval_s)
+        if shift < 1 or offset_s != shift * interval_s:
+            return None, "not_shifted"
+
+        n = len(timestamps)
+        previous_n = len(previous_timestamps)
+        window = int(LP_NEAR_HORIZON_HOURS * 60) // self.interval_minutes
+        actions = previous_result.schedule.actions
+        if len(actions) != previous_n or any(
+            len(previous_result.lp_flows_kw.get(name, ())) != previous_n
+            for name in (
+                "grid_import",
+                "grid_export",
+                "battery_charge",
+                "battery_discharge",
+            )
+        ):
+            return None, "previous_plan_incomplete"
+        if window >= n or shift + window >= previous_n:
+            return None, "horizon_too_short"
+
+        expected_soc = actions[shift - 1].soc
+        if (
+            expected_soc is None
+            or abs(current_soc - expected_soc) > RECEDING_HORIZON_SOC_TOLERANCE
+        ):
+            return None, "soc_drift"
+
+        covered = min(n, previous_n - shift)
+        for name, values in horizon_inputs["series"].items():
+            previous_values = previous_inputs["series"].get(name)
+            if previous_values is None or len(previous_values) != previous_n:
+                return None, "forecast_changed"
+            tolerance = _RECEDING_HORIZON_SERIES_TOLERANCE.get(name, 1e-9)
+            for idx in range(window, covered):
+                if _receding_value_changed(
+                    previous_values[idx + shift], values[idx], tolerance
+                ):
+                    return None, "forecast_changed"
+        return shift, "eligible"
+
+    def _solve_receding_horizon(
+        self,
+        previous_result: OptimizerResult,
+        shift: int,
+        horizon_inputs: dict[str, Any],
+        n: int,
+        import_prices: list[float],
+        export_prices: list[float],
+        solar: list[float],
+        load: list[float],
+        soc_0: float,
+        cost_function: str,
+        acquisition_cost_kwh: float,
+        allow_battery_export: list[bool],
+        block_battery_charge: list[bool],
+        allow_grid_charge: bool,
+        grid_charge_allowed: list[bool],
+        schedule_timestamps: list[datetime],
+        priority_export_slots: list[bool],
+        disable_idle: bool,
+        profit_max_solar_export_slots: list[bool],
+    ) -> OptimizerResult | None:
+        """Re-solve the near tier and carry the previous plan's tail forward.
+
+        The near window is an ordinary LP solve whose last period must hold
+        the SOC the previous plan reached at the same instant. The tail keeps
+        the previous plan's battery and grid flows, slots past the previous
+        horizon follow solar and load, and the joined flows go through
+        ``_build_schedule`` once so SOC, actions and costs stay consistent.
+        Returns None when the window cannot meet the boundary SOC.
+        """
+        window = int(LP_NEAR_HORIZON_HOURS * 60) // self.interval_minutes
+        previous_actions = previous_result.schedule.actions
+        covered = min(n, len(previous_actions) - shift)
+        boundary_soc = previous_actions[shift + window - 1].soc
+        if boundary_soc is None:
+            return None
+
+        def _splice(near_values, previous_values) -> list[float]:
+            near_values = list(near_values or [0.0] * window)
+            previous_values = list(previous_values or [0.0] * (covered + shift))
+            return (
+                near_values[:window]
+                + previous_values[window + shift:covered + shift]
+                + [0.0] * (n - covered)
+            )
+
+        free_import_command_slots = self._quota_backed_free_import_command_slots(
+            import_prices,
+            [0.0] * n,
+            None,
+            solar,
+            load,
+        )
+
+        def _render(
+            near: OptimizerResult,
+        ) -> tuple[dict[str, list[float]], OptimizationSchedule]:
+            flows = {
+                name: _splice(values, previous_result.lp_flows_kw[name])
+                for name, values in near.lp_flows_kw.items()
+            }
+            for t in range(covered, n):
+                # Slots the previous horizon never reached: plain
+                # self-consumption until the next full solve plans them.
+                surplus_kw = solar[t] - load[t]
+                charge_kw = min(max(0.0, surplus_kw), self.max_charge_kw)
+                discharge_kw = min(max(0.0, -surplus_kw), self.max_discharge_kw)
+                flows["battery_charge"][t] = charge_kw
+                flows["battery_discharge"][t] = discharge_kw
+                flows["grid_import"][t] = max(0.0, -surplus_kw - discharge_kw)
+                flows["grid_export"][t] = max(0.0, surplus_kw - charge_kw)
+            schedule = self._build_schedule(
+                n,
+                list(flows["grid_import"]),
+                list(flows["grid_export"]),
+                list(flows["battery_charge"]),
+                list(flows["battery_discharge"]),
+                solar, load, soc_0, import_prices, export_prices,
+                block_battery_charge,
+                schedule_timestamps,
+                allow_grid_charge,
+                grid_charge_allowed,
+                priority_export_slots,
+                disable_idle,
+                free_import_command_slots,
+                profit_max_solar_export_slots,
+                [None] * n,
+            )
+            return flows, schedule
+
+        near = self._solve_lp(
+            window,
+            import_prices[:window],
+            export_prices[:window],
+            solar[:window],
+            load[:window],
+            soc_0,
+            cost_function,
+            acquisition_cost_kwh,
+            allow_battery_export[:window],
+            block_battery_charge[:window],
+            allow_grid_charge,
+            grid_charge_allowed[:window],
+            schedule_timestamps=schedule_timestamps[:window],
+            priority_export_slots=priority_export_slots[:window],
+            disable_idle=disable_idle,
+            profit_max_solar_export_slots=profit_max_solar_export_slots[:window],
+            terminal_soc_floor=boundary_soc,
+            project_schedule=lambda result: _render(result)[1],
+        )
+        if near.solver_used != "highs" or not near.feasible:
+            return None
+        lp_flows_kw, schedule = _render(near)
+        handover_soc = schedule.actions[window - 1].soc
+        if (
+            handover_soc is None
+            or handover_soc < boundary_soc - RECEDING_HORIZON_SOC_TOLERANCE
+        ):
+            # Command-mode projection could not keep the window's boundary;
+            # the carried tail would start from the wrong SOC.
+            return None
+        solar_curtailment_w = _splice(
+            near.solar_curtailment_w,
+            previous_result.solar_curtailment_w,
+        )
+        protection_floor = _splice(
+            near.future_export_protection_floor_slots,
+            previous_result.future_export_protection_floor_slots,
+        )
+        grid_import, grid_export = self._grid_flows_from_schedule(
+            schedule, n, solar, load
+        )
+        n_24h = min(n, int(24 * 60 / self.interval_minutes))
+        predicted_cost = sum(
+            import_prices[t] * grid_import[t] * self.dt_hours
+            - export_prices[t] * grid_export[t] * self.dt_hours
+            for t in range(n_24h)
+        )
+        baseline_cost = self._calculate_baseline_cost(
+            n_24h, import_prices, export_prices, solar, load
+        )
+        schedule.predicted_cost = round(predicted_cost, 2)
+        schedule.predicted_savings = round(baseline_cost - predicted_cost, 2)
+
+        # The carried tail answers the inputs it was solved for, not today's:
+        # record those so drift is measured against the tail's own basis.
+        previous_series = previous_result.horizon_inputs["series"]
+        horizon_inputs["series"] = {
+            name: (
+                values[:window]
+                + previous_series[name][window + shift:covered + shift]
+                + values[covered:]
+            )
+            for name, values in horizon_inputs["series"].items()
+        }
+        incremental_solves = (
+            previous_result.horizon_inputs["incremental_solves"] + 1
+        )
+        horizon_inputs["incremental_solves"] = incremental_solves
+        lp_stats = dict(near.lp_stats)
+        lp_stats["receding_horizon"] = {
+            "mode": "incremental",
+            "shift_slots": shift,
+            "window_slots": window,
+            "carried_slots": covered - window,
+            "appended_slots": n - covered,
+            "boundary_soc": round(boundary_soc, 4),
+            "incremental_solves": incremental_solves,
+        }
+        return OptimizerResult(
+            schedule=schedule,
+            objective_value=near.objective_value,
+            solver_used="highs",
+            feasible=True,
+            grid_import_w=[v * 1000 for v in grid_import],
+            grid_export_w=[v * 1000 for v in grid_export],
+            battery_to_grid_w=list(schedule.battery_export_w),
+            lp_stats=lp_stats,
+            reserve_recommendation=self._build_reserve_recommendation(
+                schedule,
+                solar,
+                load,
+            ),
+            future_export_protection_floor_slots=(
+                protection_floor if any(protection_floor) else None
+            ),
+            free_import_command_slots=free_import_command_slots,
+            solar_curtailment_w=solar_curtailment_w,
+            lp_flows_kw=lp_flows_kw,
+            horizon_inputs=horizon_inputs,
+        )
+
     def _align_forecasts(
         self,
         import_prices: list[float],
@@ -2380,6 +3209,10 @@ class BatteryOptimizer:
         manual_required_charge_kw: list[float] | None = None,
         manual_required_discharge_kw: list[float] | None = None,
         ev_plan: EVChargePlan | None = None,
+        terminal_soc_floor: float | None = None,
+        project_schedule: (
+            Callable[[OptimizerResult], OptimizationSchedule] | None
+        ) = None,
     ) -> OptimizerResult:
         """
         Solve the LP formulation using the HiGHS solver (highspy).
@@ -2389,6 +3222,9 @@ class BatteryOptimizer:
             x[n..2n-1]  = grid_export[t]  (kW, >= 0)
             x[2n..3n-1] = battery_charge[t] (kW, >= 0)
             x[3n..4n-1] = battery_discharge[t] (kW, >= 0)
+
+        ``project_schedule`` renders a pass in a wider context (a near window
+        joined to its carried tail) before command modes are derived from it.
         """
         # If SOC is below the optimiser reserve, self-consumption can still use
         # the battery down to the hardware reserve. Keep the optimiser reserve
@@ -2402,6 +3238,10 @@ class BatteryOptimizer:
         priority_export_slots = priority_export_slots or [False] * n
         cost_neutral_slots = cost_neutral_slots or [False] * n
         terminal_weight_override: float | None = None
+        if terminal_soc_floor is not None:
+            # A near-window solve ends at the previous plan's boundary SOC;
+            # that plan already prices the energy held past the window.
+            terminal_weight_override = 0.0
         if _soc_below_reserve:
             effective_reserve = self._natural_self_consumption_floor(soc_0)
             log = _LOGGER.info if self.suppress_reserve_warning else _LOGGER.warning
@@ -2487,11 +3327,19 @@ class BatteryOptimizer:
                     required_charge_kw=fixed_manual_charge,
                     required_discharge_kw=fixed_manual_discharge,
                     ev_plan=ev_plan,
+                    terminal_soc_floor=terminal_soc_floor,
                 )
                 result.lp_stats["mode_iterations"] = iteration + 1
                 if result.solver_used != "highs":
                     if last_result is not None:
-                        _LOGGER.warning(
+                        # Near windows are checked against their handover SOC
+                        # and fall back to a full solve, so this is expected.
+                        log = (
+                            _LOGGER.debug
+                            if terminal_soc_floor is not None
+                            else _LOGGER.warning
+                        )
+                        log(
                             "Optimizer command-mode projection became infeasible on "
                             "pass %d; using the previous physically projected HiGHS plan",
                             iteration + 1,
@@ -2508,7 +3356,11 @@ class BatteryOptimizer:
                     return result
 
                 next_modes, next_required = self._schedule_mode_constraints(
-                    result.schedule,
+                    (
+                        project_schedule(result)
+                        if project_schedule is not None
+                        else result.schedule
+                    ),
                     n,
                 )
                 for idx, fixed_mode in enumerate(fixed_manual_modes[:n]):
@@ -2744,6 +3596,7 @@ class BatteryOptimizer:
         required_charge_kw: list[float] | None = None,
         required_discharge_kw: list[float] | None = None,
         ev_plan: EVChargePlan | None = None,
+        terminal_soc_floor: float | None = None,
     ) -> OptimizerResult:
         """Inner LP solver (separated for SOC-below-reserve guard in _solve_lp)."""
         formulation_start = time.monotonic()
@@ -3911,6 +4764,8 @@ class BatteryOptimizer:
                 )
                 A_ub_rows += 1
 
+        if terminal_soc_floor is not None:
+            A_ub_rows += 1
         if ev_charge_active:
             # One soft EV energy-delivery row per cumulative deadline stage.
             A_ub_rows += len(ev_stages)
@@ -4410,6 +5265,14 @@ class BatteryOptimizer:
                 # can then proceed without forcing a later grid top-up.
                 b_ub.append(0.0)
 
+        # === Receding-horizon boundary ===
+        # A near-window re-solve hands the remaining horizon to the previous
+        # plan, so the window must end holding at least the energy that plan
+        # expected at the boundary.
+        if terminal_soc_floor is not None:
+            A_ub[len(b_ub), energy_var(p_n)] = -1.0
+            b_ub.append(-max(0.0, min(1.0, terminal_soc_floor)) * cap)
+
         solar_prefill_ceilings = self._pre_window_solar_prefill_ceilings(
             pre_window_boundary=pre_window_boundary,
             target_soc=pre_window_effective_target,
@@ -5066,6 +5929,13 @@ class BatteryOptimizer:
             [value + max(0.0, ev_charge_kw[t]) for t, value in enumerate(load)],
         )
 
+        lp_flows_kw = {
+            "grid_import": list(grid_import),
+            "grid_export": list(grid_export),
+            "battery_charge": list(battery_charge),
+            "battery_discharge": list(battery_discharge),
+        }
+
         # Build schedule with action mapping
         schedule = self._build_schedule(
             n, grid_import, grid_export, battery_charge, battery_discharge,
@@ -5240,6 +6110,7 @@ class BatteryOptimizer:
             ),
             free_import_command_slots=free_import_command_slots,
             solar_curtailment_w=[value * 1000 for value in solar_curtailment],
+            lp_flows_kw=lp_flows_kw,
             ev_charge_by_vehicle_w={
                 vehicle_id: [value * 1000 for value in series]
                 for vehicle_id, series in ev_charge_kw_by_vehicle.items()
@@ -10,9 +10,11 @@ import asyncio
 import calendar
 import logging
 import math
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
@@ -32,8 +34,17 @@ from .cost_neutral import (
     elapsed_settlement_seconds,
 )
 from .schedule_reader import OptimizationSchedule, ScheduleAction
+from .solve_cache import SolveResultCache, normalize_cache_value, optimizer_state
+from .solver_pool import (
+    SolveCancelledError,
+    SolveRequest,
+    SolverProcessPool,
+    SolverWorkerError,
+    apply_solve_state,
+)
 from .executor import ScheduleExecutor, ExecutionStatus, BatteryAction
 from .load_estimator import LoadEstimator, SolcastForecaster
+from .load_history import LOAD_HISTORY_STORE_VERSION
 from .manual_control import (
     ManualControlProjection,
     build_manual_control_projection,
@@ -83,9 +94,8 @@ from ..tariff_quota import (
     custom_tariff_quota_hash,
 )
 from ..tariff_time import (
-    find_matching_tou_period,
+    compile_tariff_timeline,
     period_entries,
-    tariff_components_for_datetime,
 )
 from ..zerohero import (
     GLOBIRD_PLAN_NOT_ZEROHERO,
@@ -254,9 +264,9 @@ def _flow_power_network_tariff_rate(
     tariff_code: str,
 ) -> float | None:
     """Return the Flow Power v2 network tariff rate for an interval."""
-    from ..tariff_utils import get_network_tariff_rate
+    from ..tariff_utils import network_tariff_table
 
-    return get_network_tariff_rate(when, network, tariff_code)
+    return network_tariff_table(network, tariff_code).rate_at(when)
 
 
 def _hhmm_to_minutes(value: Any, default: str = "17:15") -> int:
@@ -327,6 +337,16 @@ class OptimizationConfig:
     manual_backup_reserve: float | None = None
 
 
+@dataclass(frozen=True)
+class ForecastSnapshot:
+    """Forecast sensor data published once per completed solve."""
+
+    version: int
+    data: Mapping[str, Any]
+    load_summary: dict | None
+    key: tuple
+
+
 # Update interval for the coordinator
 UPDATE_INTERVAL = timedelta(minutes=FIXED_OPTIMIZATION_INTERVAL_MINUTES)
 
@@ -480,11 +500,24 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._planned_ev_load_entity_id: str | None = None
         self._warned_dual_ev_overlay = False
         self._pending_ev_charge_plan: Any | None = None
+        # Out-of-process LP solver (on by default); None solves in the HA
+        # executor. A pool whose workers never complete a solve is bypassed
+        # for the rest of the session.
+        self._solver_pool: SolverProcessPool | None = None
+        self._solver_pool_failed = False
+        # Background solves of variants started next to the base solve,
+        # keyed by variant name: (input fingerprint, task).
+        self._speculative_solves: dict[str, tuple[str, asyncio.Task]] = {}
+        self._solve_variant_timings: dict[str, dict[str, Any]] = {}
+        self._solve_variants_started: float | None = None
+        self._solar_export_hold_fallback_used = False
         if self._entry:
             from ..const import (
                 CONF_OPTIMIZATION_EV_INTEGRATION,
                 CONF_OPTIMIZATION_LOAD_ENTITY,
                 CONF_OPTIMIZATION_PLANNED_EV_LOAD_ENTITY,
+                CONF_OPTIMIZATION_SOLVER_PROCESS,
+                DEFAULT_OPTIMIZATION_SOLVER_PROCESS,
             )
             self._configured_load_entity_id = self._entry.options.get(
                 CONF_OPTIMIZATION_LOAD_ENTITY,
@@ -498,6 +531,14 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 CONF_OPTIMIZATION_PLANNED_EV_LOAD_ENTITY,
                 self._entry.data.get(CONF_OPTIMIZATION_PLANNED_EV_LOAD_ENTITY),
             ) or None
+            if self._entry.options.get(
+                CONF_OPTIMIZATION_SOLVER_PROCESS,
+                self._entry.data.get(
+                    CONF_OPTIMIZATION_SOLVER_PROCESS,
+                    DEFAULT_OPTIMIZATION_SOLVER_PROCESS,
+                ),
+            ):
+                self._solver_pool = SolverProcessPool()
 
         # Cached schedule from optimizer
         self._current_schedule: OptimizationSchedule | None = None
@@ -515,6 +556,11 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._last_export_prices: list[float] | None = None     # $/kWh values (LP-adjusted)
         self._last_display_import_prices: list[float] | None = None  # $/kWh actual tariff
         self._last_display_export_prices: list[float] | None = None  # $/kWh actual tariff
+        # Read-only view of the above for sensors/API, rebuilt once per solve
+        self._forecast_version = 0
+        self._forecast_snapshot: ForecastSnapshot | None = None
+        self._forecast_snapshot_builds = 0
+        self._load_summary_cache: tuple | None = None
         # Contractual rates before optimizer-only overlays and bounded quota
         # bonuses. Cost Neutral uses these to value each local settlement day.
         self._last_settlement_import_prices: list[float] | None = None
@@ -4138,6 +4184,9 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             horizon_hours=self._config.horizon_hours,
             target_charge_power_supported=self._supports_target_charge_power(),
         )
+        # Identical back-to-back triggers (boundary tick, price push, settings
+        # save) reuse the previous plan instead of re-running HiGHS.
+        self._optimizer.result_cache = SolveResultCache()
 
         # Initialize load estimator
         load_entity = self._get_load_entity_id()
@@ -4153,6 +4202,11 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             load_entity_id=load_entity,
             interval_minutes=self._config.interval_minutes,
             weather_entity_id=weather_entity,
+            history_store=Store(
+                self.hass,
+                LOAD_HISTORY_STORE_VERSION,
+                f"power_sync.load_history.{self.entry_id}",
+            ),
         )
 
         # Restore away mode timestamps from config entry (persisted across HA restarts)
@@ -5178,6 +5232,10 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if self._ev_coordinator:
             await self._ev_coordinator.stop()
 
+        solver_pool = getattr(self, "_solver_pool", None)
+        if solver_pool is not None:
+            await solver_pool.async_shutdown()
+
         # Flush cost data to disk before shutdown
         await self._cost_store.async_save(self._cost_data_to_save())
 
@@ -5365,6 +5423,12 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 _LOGGER.debug("Optimization already in progress — skipping concurrent request")
                 return False
             _LOGGER.debug("Optimization in progress — queuing forced re-optimization")
+            solver_pool = getattr(self, "_solver_pool", None)
+            if solver_pool is not None and solver_pool.cancel():
+                _LOGGER.info(
+                    "Optimizer: cancelled in-flight solve superseded by a "
+                    "forced re-optimization"
+                )
         await self._optimization_lock.acquire()
         try:
             self._pending_price_timestamps = None
@@ -5971,7 +6035,74 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     ),
                 )
 
+            def _optimizer_args(
+                export_reserve_floor: float | list[float] | None = None,
+                charge_blocked_slots: list[bool] | None = None,
+                solar_export_slots: list[bool] | None = None,
+            ) -> tuple[Any, ...]:
+                return (
+                    import_prices,
+                    export_prices,
+                    solar_forecast,
+                    load_forecast,
+                    soc,
+                    self._cost_function.value,
+                    acq_cost,
+                    battery_export_allowed,
+                    charge_blocked_slots or battery_charge_blocked,
+                    self._config.allow_grid_charge,
+                    grid_charge_allowed,
+                    self._last_zerohero_bonus_prices,
+                    self._last_zerohero_bonus_cap_kwh,
+                    self._last_zerocharge_bonus_prices,
+                    self._last_zerocharge_bonus_cap_kwh,
+                    export_reserve_floor,
+                    schedule_timestamps,
+                    priority_export_slots,
+                    any(priority_export_slots),
+                    self._should_disable_idle_schedule(),
+                    grid_export_limits_w,
+                    bool(
+                        self._last_import_bonus_group_ids
+                        or self._last_export_bonus_group_ids
+                    ),
+                    cost_neutral_cap,
+                    cost_neutral_slots,
+                    cost_neutral_forecast_import_cost,
+                    cost_neutral_fixed_cost_allowance,
+                    cost_neutral_plan,
+                    solar_export_slots or profit_max_solar_export_slots,
+                    manual_control_payload,
+                    ev_charge_plan,
+                    # The published plan seeds a receding-horizon
+                    # re-solve when only the horizon start has moved.
+                    getattr(self, "_last_optimizer_result", None),
+                )
+
+            def _speculate(
+                variant: str,
+                reserve_floor: float | None = None,
+                charge_blocked_slots: list[bool] | None = None,
+                solar_export_slots: list[bool] | None = None,
+            ) -> None:
+                if reserve_floor is not None:
+                    self._optimizer.update_config(backup_reserve=reserve_floor)
+                try:
+                    self._start_speculative_solve(
+                        variant,
+                        _optimizer_args(
+                            charge_blocked_slots=charge_blocked_slots,
+                            solar_export_slots=solar_export_slots,
+                        ),
+                    )
+                finally:
+                    if reserve_floor is not None:
+                        self._optimizer.update_config(
+                            backup_reserve=self._config.backup_reserve
+                        )
+
             async def _run_optimizer_once(
+                variant: str,
                 reserve_floor: float | None = None,
                 export_reserve_floor: float | list[float] | None = None,
                 charge_blocked_slots: list[bool] | None = None,
@@ -5980,52 +6111,63 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if reserve_floor is not None:
                     self._optimizer.update_config(backup_reserve=reserve_floor)
                 try:
-                    return await self.hass.async_add_executor_job(
-                        self._optimizer.optimize,
-                        import_prices,
-                        export_prices,
-                        solar_forecast,
-                        load_forecast,
-                        soc,
-                        self._cost_function.value,
-                        acq_cost,
-                        battery_export_allowed,
-                        charge_blocked_slots or battery_charge_blocked,
-                        self._config.allow_grid_charge,
-                        grid_charge_allowed,
-                        self._last_zerohero_bonus_prices,
-                        self._last_zerohero_bonus_cap_kwh,
-                        self._last_zerocharge_bonus_prices,
-                        self._last_zerocharge_bonus_cap_kwh,
+                    args = _optimizer_args(
                         export_reserve_floor,
-                        schedule_timestamps,
-                        priority_export_slots,
-                        any(priority_export_slots),
-                        self._should_disable_idle_schedule(),
-                        grid_export_limits_w,
-                        bool(
-                            self._last_import_bonus_group_ids
-                            or self._last_export_bonus_group_ids
-                        ),
-                        cost_neutral_cap,
-                        cost_neutral_slots,
-                        cost_neutral_forecast_import_cost,
-                        cost_neutral_fixed_cost_allowance,
-                        cost_neutral_plan,
-                        solar_export_slots or profit_max_solar_export_slots,
-                        manual_control_payload,
-                        ev_charge_plan,
+                        charge_blocked_slots,
+                        solar_export_slots,
                     )
+                    speculative = self._claim_speculative_solve(variant, args)
+                    if speculative is None:
+                        started = time.monotonic()
+                        result = await self._solve_optimizer(*args)
+                        self._record_solve_variant(
+                            variant,
+                            "sequential",
+                            "used",
+                            time.monotonic() - started,
+                            result,
+                        )
+                        return result
                 finally:
                     if reserve_floor is not None:
                         self._optimizer.update_config(
                             backup_reserve=self._config.backup_reserve
                         )
+                result = await self._await_speculative_solve(variant, speculative)
+                if result is not None:
+                    return result
+                return await _run_optimizer_once(
+                    variant,
+                    reserve_floor,
+                    export_reserve_floor,
+                    charge_blocked_slots,
+                    solar_export_slots,
+                )
+
+            # Variants that need nothing from the base plan are solved next to
+            # it in the solver process, which is on by default. The reserve
+            # re-solve is certain when the reference reserve overrides the
+            # configured one; the hold-free fallback is only started when the
+            # previous cycle needed it.
+            self._reset_solve_variants()
+            if solve_reserve_override is not None:
+                _speculate("configured_reserve")
+            if any(profit_max_solar_export_slots) and getattr(
+                self, "_solar_export_hold_fallback_used", False
+            ):
+                _speculate(
+                    "charge_blocked",
+                    solve_reserve_override,
+                    charge_blocked_slots=hard_battery_charge_blocked,
+                    solar_export_slots=[False] * len(import_prices),
+                )
 
             # Run LP in executor thread to avoid blocking event loop
             result: OptimizerResult = await _run_optimizer_once(
-                solve_reserve_override
+                "base", solve_reserve_override
             )
+            if any(profit_max_solar_export_slots):
+                self._solar_export_hold_fallback_used = not result.feasible
             if not result.feasible and any(profit_max_solar_export_slots):
                 _LOGGER.warning(
                     "Profit Max solar-export hold made the solve infeasible; "
@@ -6037,6 +6179,7 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     profit_max_solar_export_slots
                 )
                 result = await _run_optimizer_once(
+                    "charge_blocked",
                     solve_reserve_override,
                     charge_blocked_slots=hard_battery_charge_blocked,
                     solar_export_slots=[False] * len(import_prices),
@@ -6061,6 +6204,7 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         )
                     ]
                     revised_result = await _run_optimizer_once(
+                        "solar_export_revision",
                         solve_reserve_override,
                         charge_blocked_slots=revised_charge_blocked,
                         solar_export_slots=revised_solar_export_slots,
@@ -6236,11 +6380,12 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._current_schedule = result.schedule
             self._last_optimizer_result = result
             self._adopt_solved_ev_series(result)
+            self._bump_forecast_version()
             self._commit_price_forecast_cache(import_prices, export_prices)
 
             reserve_changed = self._apply_auto_reserve_recommendation(result)
             if reserve_changed or used_reference_override:
-                result = await _run_optimizer_once()
+                result = await _run_optimizer_once("configured_reserve")
                 applied_reserve_floor = (
                     self._reserve_ratio(self._config.backup_reserve, 0.0) or 0.0
                 )
@@ -6331,6 +6476,9 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._last_optimizer_result = result
                 self._adopt_solved_ev_series(result)
                 self._last_update_time = dt_util.now()
+                self._bump_forecast_version()
+            self._cancel_speculative_solves()
+            result.lp_stats["solve_variants"] = self._solve_variants_report()
             if cost_neutral_plan is not None:
                 effective_caps = {
                     str(day): max(0.0, float(value))
@@ -6528,13 +6676,187 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             return True
 
+        except SolveCancelledError:
+            _LOGGER.debug("Optimization superseded before its solve finished")
+            return False
         except Exception as e:
             _LOGGER.error("Optimization failed: %s", e, exc_info=True)
             return False
         finally:
+            self._cancel_speculative_solves()
             self._pending_price_timestamps = None
             self._optimization_lock.release()
 
+    async def _solve_optimizer(self, *args: Any) -> OptimizerResult:
+        """Run one ``BatteryOptimizer.optimize`` call off the event loop.
+
+        Uses the solver process when enabled and falls back to the HA
+        executor if the worker fails. A cancelled solve is re-raised so the
+        superseded run stops before publishing.
+        """
+        solver_pool = self._usable_solver_pool()
+        if solver_pool is not None:
+            try:
+                return await solver_pool.solve(self._optimizer, *args)
+            except SolveCancelledError:
+                raise
+            except SolverWorkerError as err:
+                if solver_pool.solves == 0:
+                    # Workers cannot start or crash on this host; stop paying
+                    # for a failed spawn on every cycle.
+                    self._solver_pool_failed = True
+                    _LOGGER.warning(
+                        "Optimizer: solver process unavailable (%s) — solving "
+                        "in the executor until the integration is reloaded",
+                        err,
+                    )
+                else:
+                    _LOGGER.warning(
+                        "Optimizer: solver process failed (%s) — solving in the "
+                        "executor instead",
+                        err,
+                    )
+        return await self.hass.async_add_executor_job(self._optimizer.optimize, *args)
+
+    def _usable_solver_pool(self) -> SolverProcessPool | None:
+        """Return the solver pool unless it is off or has been bypassed."""
+        if getattr(self, "_solver_pool_failed", False):
+            return None
+        return getattr(self, "_solver_pool", None)
+
+    async def _solve_request(
+        self,
+        request: SolveRequest,
+    ) -> tuple[OptimizerResult, dict[str, Any], float]:
+        """Solve a captured optimizer snapshot; return result, state and wall time.
+
+        Only the solver process runs these: cancelling the task terminates the
+        worker, whereas an executor thread would keep solving a variant the
+        cycle no longer needs.
+        """
+        started = time.monotonic()
+        result, state = await self._solver_pool.run(request)
+        return result, state, time.monotonic() - started
+
+    def _solve_fingerprint(self, args: tuple[Any, ...]) -> str:
+        """Return what a solve of ``args`` answers under the current config.
+
+        The trailing ``previous_result`` only selects how a plan is solved,
+        so it is left out.
+        """
+        return repr(
+            (normalize_cache_value(args[:-1]), optimizer_state(self._optimizer))
+        )
+
+    def _reset_solve_variants(self) -> None:
+        self._cancel_speculative_solves()
+        self._speculative_solves = {}
+        self._solve_variant_timings = {}
+        self._solve_variants_started = time.monotonic()
+
+    def _start_speculative_solve(self, variant: str, args: tuple[Any, ...]) -> None:
+        """Solve ``args`` on a snapshot of the optimizer in the background.
+
+        When the solver process is turned off or bypassed, the variant is left
+        to the sequential path.
+        """
+        if self._usable_solver_pool() is None:
+            return
+        request = SolveRequest.from_call(self._optimizer, args)
+        self._speculative_solves[variant] = (
+            self._solve_fingerprint(args),
+            asyncio.create_task(self._solve_request(request)),
+        )
+
+    def _claim_speculative_solve(
+        self,
+        variant: str,
+        args: tuple[Any, ...],
+    ) -> asyncio.Task | None:
+        """Return the background solve of ``variant`` if it answers ``args``."""
+        entry = self._speculative_solves.pop(variant, None)
+        if entry is None:
+            return None
+        fingerprint, task = entry
+        if fingerprint == self._solve_fingerprint(args):
+            return task
+        task.cancel()
+        self._record_solve_variant(variant, "speculative", "stale")
+        return None
+
+    async def _await_speculative_solve(
+        self,
+        variant: str,
+        task: asyncio.Task,
+    ) -> OptimizerResult | None:
+        """Adopt a claimed background solve, or return None if it failed."""
+        try:
+            result, state, wall_s = await task
+        except SolveCancelledError:
+            raise
+        except Exception as err:  # noqa: BLE001 - re-solved sequentially
+            _LOGGER.debug(
+                "Optimizer: speculative %s solve failed (%s) — re-solving",
+                variant,
+                err,
+            )
+            self._record_solve_variant(variant, "speculative", "failed")
+            return None
+        apply_solve_state(self._optimizer, state)
+        self._record_solve_variant(variant, "speculative", "used", wall_s, result)
+        return result
+
+    def _cancel_speculative_solves(self) -> None:
+        """Drop background solves this cycle did not need."""
+        speculative = getattr(self, "_speculative_solves", None)
+        if not speculative:
+            return
+        for variant, (_fingerprint, task) in list(speculative.items()):
+            task.cancel()
+            self._record_solve_variant(variant, "speculative", "unused")
+        speculative.clear()
+
+    def _record_solve_variant(
+        self,
+        variant: str,
+        mode: str,
+        status: str,
+        wall_s: float | None = None,
+        result: OptimizerResult | None = None,
+    ) -> None:
+        timings = getattr(self, "_solve_variant_timings", None)
+        if timings is None:
+            return
+        entry: dict[str, Any] = {
+            "mode": mode,
+            "status": status,
+            "wall_s": round(wall_s, 3) if wall_s is not None else None,
+            "solve_time_s": (
+                round(result.solve_time_s, 3) if result is not None else None
+            ),
+            "feasible": result.feasible if result is not None else None,
+        }
+        previous = timings.get(variant)
+        if previous is not None and previous["status"] in ("stale", "failed"):
+            entry["speculation"] = previous["status"]
+        timings[variant] = entry
+
+    def _solve_variants_report(self) -> dict[str, Any]:
+        """Return this cycle's per-variant solve timings for diagnostics."""
+        timings = getattr(self, "_solve_variant_timings", None) or {}
+        started = getattr(self, "_solve_variants_started", None)
+        variant_wall_s = sum(
+            entry["wall_s"] or 0.0 for entry in timings.values()
+        )
+        cycle_wall_s = time.monotonic() - started if started is not None else None
+        return {
+            "variants": {name: dict(entry) for name, entry in timings.items()},
+            "cycle_wall_s": (
+                round(cycle_wall_s, 3) if cycle_wall_s is not None else None
+            ),
+            "sum_variant_wall_s": round(variant_wall_s, 3),
+        }
+
     async def _execute_current_action_and_publish(
         self,
         current_action: Any | None,
@@ -13871,6 +14193,16 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
                         try:
                             if hasattr(self.hass, "async_add_executor_job"):
+                                from ..tariff_utils import (
+                                    async_ensure_network_tariff_table,
+                                )
+
+                                # Rebuilds only when the NEM day rolls over.
+                                await async_ensure_network_tariff_table(
+                                    self.hass,
+                                    fp_network,
+                                    fp_tariff_code,
+                                )
                                 fp_tariff_rates = await self.hass.async_add_executor_job(
                                     _lookup_flow_power_tariff_rates
                                 )
@@ -14205,6 +14537,40 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         return None
 
+    @staticmethod
+    def _resolve_tou_slot_rates(
+        matched_period: str,
+        buy_rates: Mapping[str, float],
+        sell_rates: Mapping[str, float],
+    ) -> tuple[float, float]:
+        """Return ($/kWh buy, sell) for a matched TOU period with fallbacks."""
+        # buy_rates values are in $/kWh (e.g. 0.48 for 48c)
+        # When the matched period isn't in buy_rates (e.g. GloBird gaps at 14-17, 21-24),
+        # try common fallback period names, then use the median of available rates.
+        buy = buy_rates.get(matched_period)
+        if buy is None:
+            for fallback in ("OFF_PEAK", "PARTIAL_PEAK", "SHOULDER"):
+                if fallback in buy_rates:
+                    buy = buy_rates[fallback]
+                    break
+            if buy is None:
+                # Use median of defined rates (better than arbitrary hardcoded default)
+                defined = sorted(v for v in buy_rates.values() if isinstance(v, (int, float)))
+                buy = defined[len(defined) // 2] if defined else 0.30
+
+        sell = sell_rates.get(matched_period)
+        if sell is None:
+            # Global FiT (ALL key) is the correct fallback for unmatched periods
+            sell = sell_rates.get("ALL")
+        if sell is None:
+            for fallback in ("OFF_PEAK", "PARTIAL_PEAK", "SHOULDER"):
+                if fallback in sell_rates:
+                    sell = sell_rates[fallback]
+                    break
+        if sell is None:
+            sell = 0.0  # No sell rate configured — default to 0 (no export value)
+        return buy, sell
+
     def _generate_tou_price_forecast(
         self, tariff: dict
     ) -> tuple[list[float], list[float]]:
@@ -14248,44 +14614,22 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     sell_rates.get(pname, "?"),
                 )
 
+        # The compiled timeline answers each slot's season and TOU period by
+        # index; rate fallbacks only need resolving once per (season, period).
+        timeline = compile_tariff_timeline(tariff)
+        resolved_rates: dict[tuple[str, str], tuple[float, float]] = {}
         timestamps = self._interval_timestamps(now, n_steps, interval)
         for t, ts in enumerate(timestamps):
-            slot_tou_periods, slot_buy_rates, slot_sell_rates, _ = (
-                tariff_components_for_datetime(tariff, ts)
-            )
-            matched_period = find_matching_tou_period(
-                slot_tou_periods,
-                ts,
-                default="OFF_PEAK",
-                buy_rates=slot_buy_rates,
-                sell_rates=slot_sell_rates,
-            )
-
-            # buy_rates values are in $/kWh (e.g. 0.48 for 48c)
-            # When the matched period isn't in buy_rates (e.g. GloBird gaps at 14-17, 21-24),
-            # try common fallback period names, then use the median of available rates.
-            buy = slot_buy_rates.get(matched_period)
-            if buy is None:
-                for fallback in ("OFF_PEAK", "PARTIAL_PEAK", "SHOULDER"):
-                    if fallback in slot_buy_rates:
-                        buy = slot_buy_rates[fallback]
-                        break
-                if buy is None:
-                    # Use median of defined rates (better than arbitrary hardcoded default)
-                    defined = sorted(v for v in slot_buy_rates.values() if isinstance(v, (int, float)))
-                    buy = defined[len(defined) // 2] if defined else 0.30
-
-            sell = slot_sell_rates.get(matched_period)
-            if sell is None:
-                # Global FiT (ALL key) is the correct fallback for unmatched periods
-                sell = slot_sell_rates.get("ALL")
-            if sell is None:
-                for fallback in ("OFF_PEAK", "PARTIAL_PEAK", "SHOULDER"):
-                    if fallback in slot_sell_rates:
-                        sell = slot_sell_rates[fallback]
-                        break
-            if sell is None:
-                sell = 0.0  # No sell rate configured — default to 0 (no export value)
+            season_name = timeline.season_at(ts)
+            matched_period = timeline.period_at(ts, default="OFF_PEAK")
+            rates = resolved_rates.get((season_name, matched_period))
+            if rates is None:
+                _, slot_buy_rates, slot_sell_rates, _ = timeline.components(ts)
+                rates = self._resolve_tou_slot_rates(
+                    matched_period, slot_buy_rates, slot_sell_rates
+                )
+                resolved_rates[(season_name, matched_period)] = rates
+            buy, sell = rates
 
             # Store actual tariff rates for display before LP adjustment
             display_import.append(buy)
@@ -17012,11 +17356,102 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return non-breaking mobile metadata for grouped optimizer settings."""
         return optimizer_settings_groups()
 
-    def get_forecast_data(self) -> dict[str, Any]:
+    def _bump_forecast_version(self) -> None:
+        """Mark the forecast snapshot stale after a completed solve."""
+        self._forecast_version = getattr(self, "_forecast_version", 0) + 1
+
+    def _forecast_snapshot_key(self) -> tuple:
+        """Return (version, interval slot, source objects) for the snapshot.
+
+        Sources are compared by identity, so a forecast array or setting
+        replaced between solves still invalidates the snapshot. Today/tomorrow
+        load totals depend on the wall clock, so a new optimization interval
+        does too.
+        """
+        interval_s = max(1, int(self._config.interval_minutes)) * 60
+        sources = tuple(
+            getattr(self, name, None)
+            for name in (
+                "_last_solar_forecast",
+                "_last_raw_solar_forecast",
+                "_last_planned_solar_forecast",
+                "_last_solar_curtailment_forecast",
+                "_last_load_forecast",
+                "_last_planned_ev_load_forecast_w",
+                "_last_ev_optimizer_policy",
+                "_last_import_prices",
+                "_last_export_prices",
+                "_last_display_import_prices",
+                "_last_display_export_prices",
+                "_current_schedule",
+                "_last_update_time",
+                "_solar_nowcast_derate",
+                "_last_solar_nowcast_ratio",
+                "away_mode",
+                "profit_max_mode",
+                "charge_by_time_enabled",
+                "battery_efficiency_learning_enabled",
+            )
+        )
+        return (
+            getattr(self, "_forecast_version", 0),
+            int(dt_util.utcnow().timestamp() // interval_s),
+            sources,
+        )
+
+    @staticmethod
+    def _forecast_key_matches(old: tuple, new: tuple) -> bool:
+        return (
+            old[:2] == new[:2]
+            and len(old[2]) == len(new[2])
+            and all(a is b for a, b in zip(old[2], new[2]))
+        )
+
+    def _cached_load_summary(self, key: tuple) -> dict | None:
+        """Summarise the load forecast once per snapshot key.
+
+        Shared by the forecast snapshot and get_api_data(), which runs
+        first on every publish.
+        """
+        cached = getattr(self, "_load_summary_cache", None)
+        if cached is not None and self._forecast_key_matches(cached[0], key):
+            return cached[1]
+        summary = self._summarise_load_forecast()
+        self._load_summary_cache = (key, summary)
+        return summary
+
+    def get_forecast_snapshot(self) -> ForecastSnapshot:
+        """Return the current forecast snapshot, building it at most once per solve."""
+        key = self._forecast_snapshot_key()
+        snapshot = getattr(self, "_forecast_snapshot", None)
+        if snapshot is not None and self._forecast_key_matches(snapshot.key, key):
+            return snapshot
+
+        load_summary = self._cached_load_summary(key)
+        data = self._build_forecast_data(load_summary)
+        data["snapshot_version"] = key[0]
+        snapshot = ForecastSnapshot(
+            version=key[0],
+            data=MappingProxyType(data),
+            load_summary=load_summary,
+            key=key,
+        )
+        self._forecast_snapshot = snapshot
+        self._forecast_snapshot_builds = (
+            getattr(self, "_forecast_snapshot_builds", 0) + 1
+        )
+        return snapshot
+
+    def get_forecast_data(self) -> Mapping[str, Any]:
         """Get forecast data for LP forecast sensors.
 
-        Returns summary values (for sensor state) and full arrays (for attributes).
+        Returns summary values (for sensor state) and full arrays (for
+        attributes) from the shared read-only snapshot.
         """
+        return self.get_forecast_snapshot().data
+
+    def _build_forecast_data(self, load_summary: dict | None) -> dict[str, Any]:
+        """Build the forecast sensor payload from the last solve."""
         data: dict[str, Any] = {
             "available": self._last_solar_forecast is not None,
             "solar_nowcast_derate": round(self._solar_nowcast_derate, 3),
@@ -17064,7 +17499,6 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             data["load_forecast_kwh"] = sum(self._last_load_forecast) * dt_h
             data["load_peak_kw"] = max(self._last_load_forecast)
             data["load_forecast"] = self._last_load_forecast
-            load_summary = self._summarise_load_forecast()
             if load_summary:
                 data["load_today_remaining_kwh"] = load_summary["today_remaining_kwh"]
                 data["load_tomorrow_kwh"] = load_summary["tomorrow_kwh"]
@@ -17329,6 +17763,26 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "feasible": self._last_optimizer_result.feasible,
             }
             lp_stats.update(getattr(self._last_optimizer_result, "lp_stats", {}) or {})
+            solver_session = getattr(
+                self._last_optimizer_result, "solver_session", {}
+            )
+            if solver_session:
+                lp_stats["solver_session"] = dict(solver_session)
+            solver_pool = getattr(self, "_solver_pool", None)
+            result_cache = getattr(self._optimizer, "result_cache", None)
+            if solver_pool is not None:
+                # Each worker keeps its own result cache; its stats travel in
+                # the per-solve report under lp_stats["solver_worker"].
+                lp_stats["solver_pool"] = solver_pool.stats()
+                lp_stats["solver_pool"]["executor_fallback"] = getattr(
+                    self, "_solver_pool_failed", False
+                )
+            elif isinstance(result_cache, SolveResultCache):
+                lp_stats["solve_cache"] = result_cache.stats()
+            lp_stats["forecast_snapshot"] = {
+                "version": getattr(self, "_forecast_version", 0),
+                "builds": getattr(self, "_forecast_snapshot_builds", 0),
+            }
 
         reserve_recommendation = (
             getattr(self._last_optimizer_result, "reserve_recommendation", {}) or {}
@@ -17557,7 +18011,7 @@ class OptimizationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             data["network_envelope"] = network_manager.snapshot.to_dict()
 
         # Add load forecast summary for mobile app
-        load_summary = self._summarise_load_forecast()
+        load_summary = self._cached_load_summary(self._forecast_snapshot_key())
         forecast_summary: dict[str, Any] = {}
         if load_summary:
             forecast_summary.update({
@@ -629,17 +629,14 @@ class EVCoordinator:
                     return f"ble_{prefix}"
 
         try:
-            from homeassistant.helpers import entity_registry as er, device_registry as dr
-            from ..automations.ev_charging_planner import _iter_tesla_vehicle_devices
+            from homeassistant.helpers import entity_registry as er
+            from ..tesla_vehicle_index import tesla_vehicle_index
 
             entity_registry = er.async_get(self.hass)
             entity = getattr(entity_registry, "entities", {}).get(config.entity_id)
             if entity is None or not getattr(entity, "device_id", None):
                 return None
-            device_registry = dr.async_get(self.hass)
-            for device, vehicle_vin in _iter_tesla_vehicle_devices(device_registry):
-                if device.id == entity.device_id:
-                    return vehicle_vin
+            return tesla_vehicle_index(self.hass).device_vin(entity.device_id)
         except Exception as err:
             _LOGGER.debug(
                 "EV optimizer coordinator: could not resolve Tesla identity for %s: %s",
@@ -0,0 +1,93 @@
+"""Deferred imports for the optimizer's optional native dependencies.
+
+numpy and highspy account for most of the integration's warm import time,
+but nothing needs them until the first LP solve or history bucketing run,
+both of which happen off the event loop (in ``SolverProcessPool`` workers
+or HA executor threads). ``optional_module`` checks that a package is
+installed without importing it, and returns a proxy that performs the import
+on first attribute access, so module-level ``np.foo`` / ``highspy.Highs``
+call sites stay unchanged.
+
+An installed package can still fail to import. Callers gate each use on
+``ensure_loaded``, which resolves the proxy and reports the failure through
+the proxy's ``on_import_error`` callback once, so the caller can clear its
+availability flag and take its fallback path.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import threading
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """Module proxy that imports ``name`` on first attribute access."""
+
+    __slots__ = ("_name", "_module", "_lock", "_on_import_error", "_failed")
+
+    def __init__(
+        self,
+        name: str,
+        on_import_error: Callable[[ImportError], None] | None = None,
+    ) -> None:
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_module", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_on_import_error", on_import_error)
+        object.__setattr__(self, "_failed", False)
+
+    def _load(self) -> ModuleType:
+        module = self._module
+        if module is None:
+            # Executor threads can race to the first use
+            with self._lock:
+                module = self._module
+                if module is None:
+                    try:
+                        module = importlib.import_module(self._name)
+                    except ImportError as err:
+                        if not self._failed:
+                            object.__setattr__(self, "_failed", True)
+                            if self._on_import_error is not None:
+                                self._on_import_error(err)
+                        raise
+                    object.__setattr__(self, "_module", module)
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def optional_module(
+    name: str,
+    on_import_error: Callable[[ImportError], None] | None = None,
+) -> LazyModule | None:
+    """Return a lazy proxy for ``name``, or None when it is not installed.
+
+    ``on_import_error`` runs once if the installed package fails to import.
+    """
+    try:
+        if importlib.util.find_spec(name) is None:
+            return None
+    except (ImportError, ValueError):
+        return None
+    return LazyModule(name, on_import_error)
+
+
+def ensure_loaded(module: LazyModule | None) -> bool:
+    """Import ``module`` now; return False if it is missing or fails to import."""
+    if module is None:
+        return False
+    try:
+        module._load()
+    except ImportError:
+        return False
+    return True
@@ -15,7 +15,6 @@ import functools
 import inspect
 import logging
 from collections import defaultdict
-from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Literal
 
@@ -33,9 +32,27 @@ from ..const import (
     SOLCAST_ESTIMATE10,
     SOLCAST_ESTIMATE90,
 )
+from .lazy_import import ensure_loaded, optional_module
+from .load_history import (
+    HISTORY_BUCKET_SECONDS,
+    LoadHistoryBucket,
+    LoadHistoryStore,
+    hourly_load_profiles,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def _numpy_import_failed(err: ImportError) -> None:
+    global NUMPY_AVAILABLE
+    NUMPY_AVAILABLE = False
+    _LOGGER.debug("numpy import failed, bucketing history per state: %s", err)
+
+
+# Columnar history bucketing; imported on first use (an executor job)
+np = optional_module("numpy", _numpy_import_failed)
+NUMPY_AVAILABLE = np is not None
+
 HISTORY_LOOKBACK_DAYS = 30
 AWAY_RECOVERY_DAYS = 7
 RECENCY_HALF_LIFE_DAYS = 14
@@ -52,7 +69,6 @@ RECENT_LOAD_DEADBAND = 0.15
 RECENT_LOAD_BLEND = 0.7
 RECENT_LOAD_MIN_SCALE = 0.8
 RECENT_LOAD_MAX_SCALE = 2.5
-HISTORY_BUCKET_SECONDS = 30 * 60
 HISTORY_BUCKET_MIN_COVERAGE_SECONDS = 25 * 60
 RECENT_LOAD_FULL_CONFIDENCE_SAMPLES = 2
 RECENT_LOAD_FULL_CONFIDENCE_DATES = 3
@@ -61,22 +77,6 @@ ACTIVE_AWAY_LOAD_BLEND = 1.0
 ACTIVE_AWAY_LOAD_MIN_SCALE = 0.2
 
 
-@dataclass(frozen=True, slots=True)
-class LoadHistoryBucket:
-    """One normalized Recorder load interval."""
-
-    start: datetime
-    energy_wh: float
-    coverage_seconds: float
-    source: Literal["states", "statistics"]
-
-    @property
-    def mean_w(self) -> float:
-        """Return mean power over the valid portion of the interval."""
-        if self.coverage_seconds <= 0:
-            return 0.0
-        return self.energy_wh * 3600.0 / self.coverage_seconds
-
 _SOLCAST_ESTIMATE_FIELDS = {
     SOLCAST_ESTIMATE: ("pv_estimate", "pv_estimate50"),
     SOLCAST_ESTIMATE10: ("pv_estimate10", "pv_estimate", "pv_estimate50"),
@@ -116,6 +116,7 @@ class LoadEstimator:
         load_entity_id: str | None = None,
         interval_minutes: int = 5,
         weather_entity_id: str | None = None,
+        history_store: Any | None = None,
     ):
         """
         Initialize the load estimator.
@@ -125,6 +126,7 @@ class LoadEstimator:
             load_entity_id: Entity ID for load sensor (e.g., sensor.power_sync_home_load)
             interval_minutes: Forecast interval in minutes
             weather_entity_id: Optional HA weather entity for temperature-aware forecasting
+            history_store: Optional HA Store persisting finalized history buckets
         """
         self.hass = hass
         self.load_entity_id = load_entity_id
@@ -141,8 +143,12 @@ class LoadEstimator:
         self._history_cache: dict[str, list[tuple[datetime, float]]] = {}
         self._cache_time: datetime | None = None
         self._cache_duration = timedelta(hours=1)
+        # Finalized half-hour buckets; a refresh only reads the Recorder tail.
+        self._history_store = LoadHistoryStore(history_store)
         self._history_diagnostics: dict[str, Any] = {}
         self._recent_load_diagnostics: dict[str, Any] = {}
+        # (history list, days, profiles) last served to the EV planner.
+        self._hourly_profiles: tuple[list, int, dict[str, list[float | None]]] | None = None
 
         # Temperature sensitivity cache
         self._temp_alpha: float | None = None
@@ -185,6 +191,21 @@ class LoadEstimator:
         )
         if not states or end_time <= start_time:
             return []
+        if (
+            NUMPY_AVAILABLE
+            and start_time.tzinfo is not None
+            and end_time.tzinfo is not None
+            and all(state.last_changed.tzinfo is not None for state in states)
+            and ensure_loaded(np)
+        ):
+            return LoadEstimator._columnar_half_hour_buckets(
+                states,
+                start_time,
+                end_time,
+                multiplier,
+                source,
+                allow_zero=allow_zero,
+            )
 
         accumulated: dict[datetime, list[float]] = defaultdict(lambda: [0.0, 0.0])
         for index, state in enumerate(states):
@@ -235,6 +256,90 @@ class LoadEstimator:
         ]
         return sorted(buckets, key=lambda bucket: bucket.start)
 
+    @staticmethod
+    def _columnar_half_hour_buckets(
+        states: list[Any],
+        start_time: datetime,
+        end_time: datetime,
+        multiplier: float,
+        source: Literal["states", "statistics"],
+        *,
+        allow_zero: bool,
+    ) -> list[LoadHistoryBucket]:
+        """NumPy form of the state integration loop for time-sorted, aware states.
+
+        Times are handled as integer microseconds and each interval is
+        expanded into its per-bucket segments, so segment durations and the
+        in-order ``bincount`` sums reproduce the loop's float results exactly.
+        """
+        bucket_us = HISTORY_BUCKET_SECONDS * 1_000_000
+        changed_us = np.rint(
+            np.array([state.last_changed.timestamp() for state in states]) * 1e6
+        ).astype(np.int64)
+        start_us = round(start_time.timestamp() * 1e6)
+        end_us = round(end_time.timestamp() * 1e6)
+
+        watts = np.empty(len(states))
+        for index, state in enumerate(states):
+            try:
+                watts[index] = float(state.state) * multiplier
+            except (ValueError, TypeError):
+                watts[index] = np.nan
+
+        interval_start = np.maximum(changed_us, start_us)
+        interval_end = np.minimum(np.append(changed_us[1:], end_us), end_us)
+        lower_ok = watts >= 0 if allow_zero else watts > 0
+        valid = (interval_end > interval_start) & lower_ok & (watts < 100_000)
+        indices = np.flatnonzero(valid)
+        if not len(indices):
+            return []
+        interval_start = interval_start[indices]
+        interval_end = interval_end[indices]
+
+        first_bucket = interval_start // bucket_us
+        segment_counts = (interval_end - 1) // bucket_us - first_bucket + 1
+        owner = np.repeat(np.arange(len(indices)), segment_counts)
+        segment_offsets = np.arange(len(owner)) - np.repeat(
+            np.cumsum(segment_counts) - segment_counts,
+            segment_counts,
+        )
+        segment_bucket = first_bucket[owner] + segment_offsets
+        segment_start = np.maximum(interval_start[owner], segment_bucket * bucket_us)
+        segment_end = np.minimum(interval_end[owner], (segment_bucket + 1) * bucket_us)
+        seconds = (segment_end - segment_start).astype(np.float64) / 1e6
+        energy_wh = watts[indices][owner] * seconds / 3600.0
+
+        buckets, first_segment, inverse = np.unique(
+            segment_bucket,
+            return_index=True,
+            return_inverse=True,
+        )
+        energy = np.bincount(inverse, weights=energy_wh)
+        coverage = np.bincount(inverse, weights=seconds)
+
+        result: list[LoadHistoryBucket] = []
+        for position in np.flatnonzero(coverage >= HISTORY_BUCKET_MIN_COVERAGE_SECONDS):
+            # The loop keys a bucket by its first contributing interval start,
+            # i.e. max(start_time, last_changed) with ties going to start_time.
+            state_index = int(indices[owner[first_segment[position]]])
+            tzinfo = (
+                start_time.tzinfo
+                if start_us >= changed_us[state_index]
+                else states[state_index].last_changed.tzinfo
+            )
+            result.append(
+                LoadHistoryBucket(
+                    start=datetime.fromtimestamp(
+                        int(buckets[position]) * HISTORY_BUCKET_SECONDS,
+                        tz=tzinfo,
+                    ),
+                    energy_wh=float(energy[position]),
+                    coverage_seconds=float(coverage[position]),
+                    source=source,
+                )
+            )
+        return result
+
     @staticmethod
     def _statistics_to_half_hour_buckets(
         statistics: list[dict[str, Any]] | None,
@@ -337,6 +442,34 @@ class LoadEstimator:
         away_end: datetime | None,
     ) -> tuple[list[tuple[datetime, float]], dict[str, Any]]:
         """Normalize, EV-adjust, merge and away-filter Recorder load history."""
+        merged, diagnostics = cls._normalize_history_buckets(
+            raw_history,
+            statistics,
+            load_entity_id,
+            ev_entity_ids,
+            multipliers,
+            start_time,
+            end_time,
+        )
+        return cls._filter_history_buckets(
+            merged,
+            away_start,
+            away_end,
+            diagnostics,
+        )
+
+    @classmethod
+    def _normalize_history_buckets(
+        cls,
+        raw_history: dict | None,
+        statistics: dict | None,
+        load_entity_id: str,
+        ev_entity_ids: list[str],
+        multipliers: dict[str, float],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> tuple[list[LoadHistoryBucket], dict[str, Any]]:
+        """Normalize, EV-adjust and merge Recorder load history."""
         raw_load = cls._states_to_half_hour_buckets(
             (raw_history or {}).get(load_entity_id, []),
             start_time,
@@ -370,7 +503,21 @@ class LoadEstimator:
 
         cutover = cls._history_cutover(raw_load)
         merged = cls._merge_history_buckets(statistic_load, raw_load, cutover)
+        return merged, {
+            "raw_history_hours": round(len(raw_load) * 0.5, 1),
+            "statistics_history_hours": round(len(statistic_load) * 0.5, 1),
+            "history_cutover": cutover.isoformat() if cutover else None,
+            "ev_history_entities": len(ev_entity_ids),
+        }
 
+    @staticmethod
+    def _filter_history_buckets(
+        merged: list[LoadHistoryBucket],
+        away_start: datetime | None,
+        away_end: datetime | None,
+        source_diagnostics: dict[str, Any],
+    ) -> tuple[list[tuple[datetime, float]], dict[str, Any]]:
+        """Away-filter merged buckets and summarize the usable history."""
         excluded = 0
         if away_start is not None and away_end is not None:
             before = len(merged)
@@ -397,9 +544,11 @@ class LoadEstimator:
             "history_source": (
                 "merged" if len(sources) > 1 else next(iter(sources), "none")
             ),
-            "raw_history_hours": round(len(raw_load) * 0.5, 1),
-            "statistics_history_hours": round(len(statistic_load) * 0.5, 1),
-            "history_cutover": cutover.isoformat() if cutover else None,
+            "raw_history_hours": source_diagnostics.get("raw_history_hours", 0.0),
+            "statistics_history_hours": source_diagnostics.get(
+                "statistics_history_hours", 0.0
+            ),
+            "history_cutover": source_diagnostics.get("history_cutover"),
             "history_span_days": round(
                 (merged[-1].start - merged[0].start).total_seconds() / 86400.0,
                 1,
@@ -411,7 +560,7 @@ class LoadEstimator:
                 }
             ),
             "away_excluded_buckets": excluded,
-            "ev_history_entities": len(ev_entity_ids),
+            "ev_history_entities": source_diagnostics.get("ev_history_entities", 0),
         }
         return [(bucket.start, bucket.mean_w) for bucket in merged], diagnostics
 
@@ -589,52 +738,124 @@ class LoadEstimator:
             multipliers = {self.load_entity_id: multiplier}
             multipliers.update(self._resolve_power_multipliers(self.ev_power_entity_ids))
 
+            # Finalized buckets only depend on these inputs; Away Mode is
+            # applied when reading, so it never invalidates the store.
+            store = self._history_store
+            await store.async_load()
+            signature = repr(
+                (
+                    self.load_entity_id,
+                    list(self.ev_power_entity_ids),
+                    sorted(multipliers.items()),
+                )
+            )
+            tail_start = store.tail_start(signature, start_time, end_time)
+            fetch_start = tail_start or start_time
+
             raw_history: dict = {}
             statistics: dict = {}
+            raw_available = True
             try:
                 raw_history = await instance.async_add_executor_job(
                     get_significant_states,
                     self.hass,
-                    start_time,
+                    fetch_start,
                     end_time,
                     history_entity_ids,
                 )
             except Exception as exc:
+                raw_available = False
                 _LOGGER.warning(
                     "Raw Recorder load history unavailable for %s: %s",
                     self.load_entity_id,
                     exc,
                 )
 
-            try:
-                statistics = await instance.async_add_executor_job(
-                    statistics_during_period,
-                    self.hass,
-                    start_time,
-                    end_time,
-                    set(history_entity_ids),
-                    "hour",
-                    None,
-                    {"mean"},
-                )
-            except Exception as exc:
-                _LOGGER.debug(
-                    "Hourly Recorder statistics unavailable for %s; using raw history: %s",
-                    self.load_entity_id,
-                    exc,
-                )
+            # Hourly statistics only seed history beyond raw-state retention;
+            # an incremental tail is always covered by raw states.
+            if tail_start is None:
+                try:
+                    statistics = await instance.async_add_executor_job(
+                        statistics_during_period,
+                        self.hass,
+                        start_time,
+                        end_time,
+                        set(history_entity_ids),
+                        "hour",
+                        None,
+                        {"mean"},
+                    )
+                except Exception as exc:
+                    _LOGGER.debug(
+                        "Hourly Recorder statistics unavailable for %s; using raw history: %s",
+                        self.load_entity_id,
+                        exc,
+                    )
 
-            result, diagnostics = await self.hass.async_add_executor_job(
-                self._build_normalized_history,
+            fetched, source_diagnostics = await self.hass.async_add_executor_job(
+                self._normalize_history_buckets,
                 raw_history,
                 statistics,
                 self.load_entity_id,
                 self.ev_power_entity_ids,
                 multipliers,
-                start_time,
+                fetch_start,
                 end_time,
+            )
+            if tail_start is None:
+                merged = fetched
+                if raw_available:
+                    cutover = source_diagnostics.get("history_cutover")
+                    store.replace(
+                        signature,
+                        fetched,
+                        start_time,
+                        end_time,
+                        datetime.fromisoformat(cutover) if cutover else None,
+                    )
+                else:
+                    # Without raw states the newest buckets are missing; a
+                    # tail fetch from here would never fill them in.
+                    store.clear()
+            else:
+                if raw_available:
+                    store.extend(fetched, end_time)
+                store.evict(start_time)
+                # The still-open bucket is served from this fetch but never
+                # stored; it is re-read until it is final.
+                merged = store.buckets() + [
+                    bucket
+                    for bucket in fetched
+                    if store.finalized_until is None
+                    or bucket.start >= store.finalized_until
+                ]
+                source_diagnostics = {
+                    "raw_history_hours": round(
+                        sum(1 for b in merged if b.source == "states") * 0.5, 1
+                    ),
+                    "statistics_history_hours": round(
+                        sum(1 for b in merged if b.source == "statistics") * 0.5, 1
+                    ),
+                    "history_cutover": (
+                        store.cutover.isoformat() if store.cutover else None
+                    ),
+                    "ev_history_entities": len(self.ev_power_entity_ids),
+                }
+            store.async_schedule_save()
+
+            result, diagnostics = await self.hass.async_add_executor_job(
+                self._filter_history_buckets,
+                merged,
                 self.away_enabled_at if has_away_window else None,
                 away_end if has_away_window else None,
+                source_diagnostics,
+            )
+            diagnostics.update(
+                {
+                    "history_update": "full" if tail_start is None else "incremental",
+                    "history_fetch_start": fetch_start.isoformat(),
+                    **store.diagnostics(),
+                }
             )
             self._history_diagnostics = diagnostics
 
@@ -672,6 +893,31 @@ class LoadEstimator:
             _LOGGER.error("Error fetching load history for %s: %s", self.load_entity_id, e)
             return []
 
+    async def get_hourly_load_profiles(
+        self,
+        days: int = 14,
+    ) -> dict[str, list[float | None]]:
+        """Return weekday/weekend median kW per local hour over the last ``days``.
+
+        Reads the same cached, normalized half-hour history as the LP
+        forecast, so the EV planner adds no Recorder scan of its own. Returns
+        an empty dict when no history is available.
+        """
+        history = await self._get_load_history()
+        if not history:
+            return {}
+        cached = self._hourly_profiles
+        if cached is not None and cached[0] is history and cached[1] == days:
+            return cached[2]
+        profiles = await self.hass.async_add_executor_job(
+            hourly_load_profiles,
+            history,
+            dt_util.as_local,
+            history[-1][0] - timedelta(days=days),
+        )
+        self._hourly_profiles = (history, days, profiles)
+        return profiles
+
     def _forecast_from_history(
         self,
         history: list[tuple[datetime, float]],
@@ -0,0 +1,264 @@
+"""Incremental store of normalized half-hour load history.
+
+``LoadEstimator`` used to re-read the whole 30 to 90 day Recorder window
+whenever its one-hour result cache expired, then re-integrate every state into
+half-hour buckets. On installs with 1-second load sensors that is hundreds of
+thousands of ``State`` objects per refresh, and almost all of them describe
+buckets that were already final an hour earlier.
+
+``LoadHistoryStore`` keeps the finalized buckets (EV-adjusted, merged from
+statistics and raw states, but not away-filtered) and remembers how far they
+reach. A refresh then only needs the Recorder tail since the last finalized
+bucket. Buckets older than the lookback are evicted, and the store is
+persisted through an HA ``Store`` so a restart does not force a full rebuild.
+Away filtering stays a read-time step, so toggling Away Mode never
+invalidates the store.
+
+``hourly_load_profiles`` condenses the same normalized history into the
+weekday/weekend hour-of-day medians the EV planner's surplus forecast uses,
+so the planner reads the optimizer's history instead of scanning the
+Recorder itself.
+"""
+
+from __future__ import annotations
+
+import logging
+import statistics
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable, Literal
+
+_LOGGER = logging.getLogger(__name__)
+
+HISTORY_BUCKET_SECONDS = 30 * 60
+LOAD_HISTORY_STORE_VERSION = 1
+LOAD_HISTORY_STORE_SAVE_DELAY = 300  # Coalesce writes — flush at most every 5 minutes
+# A longer gap (HA was down, Recorder purged) is rebuilt from statistics
+# instead of trusting raw states to still cover it.
+LOAD_HISTORY_MAX_TAIL = timedelta(days=1)
+
+_SOURCE_CODES = {"states": "s", "statistics": "t"}
+_SOURCES_BY_CODE = {code: source for source, code in _SOURCE_CODES.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class LoadHistoryBucket:
+    """One normalized Recorder load interval."""
+
+    start: datetime
+    energy_wh: float
+    coverage_seconds: float
+    source: Literal["states", "statistics"]
+
+    @property
+    def mean_w(self) -> float:
+        """Return mean power over the valid portion of the interval."""
+        if self.coverage_seconds <= 0:
+            return 0.0
+        return self.energy_wh * 3600.0 / self.coverage_seconds
+
+
+def floor_to_bucket(value: datetime) -> datetime:
+    """Return the half-hour boundary at or before ``value``."""
+    epoch = int(value.timestamp() // HISTORY_BUCKET_SECONDS) * HISTORY_BUCKET_SECONDS
+    return datetime.fromtimestamp(epoch, tz=value.tzinfo or timezone.utc)
+
+
+class LoadHistoryStore:
+    """Finalized half-hour load buckets, extended from the Recorder tail.
+
+    ``signature`` identifies the inputs the buckets were built from (load and
+    EV entities, unit multipliers); any change forces a full rebuild.
+    """
+
+    def __init__(self, store: Any | None = None) -> None:
+        self._store = store
+        self._loaded = store is None
+        self.signature: str | None = None
+        self.covered_from: datetime | None = None
+        self.finalized_until: datetime | None = None
+        self.cutover: datetime | None = None
+        self._buckets: dict[datetime, LoadHistoryBucket] = {}
+        self.full_rebuilds = 0
+        self.incremental_updates = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def async_load(self) -> None:
+        """Restore persisted buckets once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = await self._store.async_load()
+        except Exception as err:  # noqa: BLE001 - history is rebuilt instead
+            _LOGGER.warning("Could not restore load history store: %s", err)
+            return
+        self.from_dict(data)
+
+    def tail_start(
+        self,
+        signature: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> datetime | None:
+        """Return where a Recorder fetch may start, or None for a full rebuild."""
+        if (
+            signature != self.signature
+            or self.covered_from is None
+            or self.finalized_until is None
+        ):
+            return None
+        if start_time < self.covered_from:
+            return None
+        if not (end_time - LOAD_HISTORY_MAX_TAIL <= self.finalized_until <= end_time):
+            return None
+        return self.finalized_until
+
+    def replace(
+        self,
+        signature: str,
+        buckets: list[LoadHistoryBucket],
+        start_time: datetime,
+        end_time: datetime,
+        cutover: datetime | None,
+    ) -> None:
+        """Reset the store from a full-window rebuild."""
+        self.signature = signature
+        self.covered_from = start_time
+        self.finalized_until = floor_to_bucket(end_time)
+        self.cutover = cutover
+        self._buckets = {
+            bucket.start: bucket
+            for bucket in buckets
+            if bucket.start < self.finalized_until
+        }
+        self.full_rebuilds += 1
+
+    def extend(self, buckets: list[LoadHistoryBucket], end_time: datetime) -> None:
+        """Add the tail buckets that are final by ``end_time``."""
+        finalized_until = floor_to_bucket(end_time)
+        for bucket in buckets:
+            if bucket.start < finalized_until:
+                self._buckets[bucket.start] = bucket
+        self.finalized_until = max(self.finalized_until or finalized_until, finalized_until)
+        self.incremental_updates += 1
+
+    def evict(self, start_time: datetime) -> int:
+        """Drop buckets that start before the lookback window."""
+        stale = [start for start in self._buckets if start < start_time]
+        for start in stale:
+            del self._buckets[start]
+        if self.covered_from is None or self.covered_from < start_time:
+            self.covered_from = start_time
+        return len(stale)
+
+    def clear(self) -> None:
+        """Forget every bucket so the next refresh rebuilds the full window."""
+        self.signature = None
+        self.covered_from = None
+        self.finalized_until = None
+        self.cutover = None
+        self._buckets = {}
+
+    def buckets(self) -> list[LoadHistoryBucket]:
+        """Return stored buckets in start order."""
+        return [self._buckets[start] for start in sorted(self._buckets)]
+
+    def async_schedule_save(self) -> None:
+        """Schedule a coalesced write of the store."""
+        if self._store is not None:
+            self._store.async_delay_save(self.to_dict, LOAD_HISTORY_STORE_SAVE_DELAY)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a compact JSON-serializable snapshot."""
+        return {
+            "signature": self.signature,
+            "covered_from": _iso(self.covered_from),
+            "finalized_until": _iso(self.finalized_until),
+            "cutover": _iso(self.cutover),
+            # [epoch seconds, energy Wh, coverage seconds, source code]
+            "buckets": [
+                [
+                    bucket.start.timestamp(),
+                    round(bucket.energy_wh, 4),
+                    round(bucket.coverage_seconds, 3),
+                    _SOURCE_CODES[bucket.source],
+                ]
+                for bucket in self.buckets()
+            ],
+        }
+
+    def from_dict(self, data: dict[str, Any] | None) -> None:
+        """Restore a snapshot from ``to_dict``; malformed data clears the store."""
+        self.clear()
+        if not isinstance(data, dict):
+            return
+        try:
+            buckets = {}
+            for epoch, energy_wh, coverage_seconds, code in data.get("buckets") or []:
+                start = datetime.fromtimestamp(float(epoch), tz=timezone.utc)
+                buckets[start] = LoadHistoryBucket(
+                    start=start,
+                    energy_wh=float(energy_wh),
+                    coverage_seconds=float(coverage_seconds),
+                    source=_SOURCES_BY_CODE[code],
+                )
+            covered_from = _parse_iso(data.get("covered_from"))
+            finalized_until = _parse_iso(data.get("finalized_until"))
+            cutover = _parse_iso(data.get("cutover"))
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Discarding malformed load history store: %s", err)
+            return
+        self.signature = data.get("signature")
+        self.covered_from = covered_from
+        self.finalized_until = finalized_until
+        self.cutover = cutover
+        self._buckets = buckets
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return store counters for load-history diagnostics."""
+        return {
+            "stored_buckets": len(self._buckets),
+            "finalized_until": _iso(self.finalized_until),
+            "full_rebuilds": self.full_rebuilds,
+            "incremental_updates": self.incremental_updates,
+        }
+
+
+def hourly_load_profiles(
+    samples: Iterable[tuple[datetime, float]],
+    to_local: Callable[[datetime], datetime],
+    since: datetime | None = None,
+) -> dict[str, list[float | None]]:
+    """Return median load in kW per local hour for weekdays and weekends.
+
+    ``samples`` are ``(start, mean_w)`` pairs. Hours without samples are None
+    so callers can substitute their own defaults. Pure CPU work over the whole
+    lookback; run it in an executor.
+    """
+    buckets: dict[str, list[list[float]]] = {
+        "weekday": [[] for _ in range(24)],
+        "weekend": [[] for _ in range(24)],
+    }
+    for start, mean_w in samples:
+        if since is not None and start < since:
+            continue
+        local = to_local(start) if start.tzinfo is not None else start
+        day_type = "weekend" if local.weekday() >= 5 else "weekday"
+        buckets[day_type][local.hour].append(mean_w / 1000.0)
+    return {
+        day_type: [statistics.median(values) if values else None for values in hours]
+        for day_type, hours in buckets.items()
+    }
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _parse_iso(value: Any) -> datetime | None:
+    if value is None:
+        return None
+    return datetime.fromisoformat(str(value))
@@ -1,14 +1,42 @@
 """
 Schedule data models for PowerSync optimization.
 
-Provides the ScheduleAction and OptimizationSchedule dataclasses used by
+Provides the ScheduleAction dataclass and the OptimizationSchedule used by
 the built-in LP optimizer and the execution layer.
+
+An OptimizationSchedule stores its slots column-wise: one float array per
+power/SOC series, one list per string series and a single start timestamp
+plus interval (an explicit timestamp list is kept only when slots are not
+evenly spaced). ``schedule.actions`` returns ScheduleAction views over those
+columns, so existing callers that read or edit ``action.soc`` /
+``action.reason`` keep working and their edits land in the columns.
+
+The API and executor payloads are serialized once per schedule version and
+cached; any edit through a view, or assigning a new ``actions`` list, starts
+a new version. An edit only drops the cached payloads built from the edited
+column, so annotating reasons keeps the ISO timestamps. Cached payloads are
+handed out as shallow copies because callers add keys (grid arrays, prices)
+to the API response.
 """
 from __future__ import annotations
 
+import math
+from array import array
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Sequence
+
+_FLOAT_FIELDS = ("power_w", "battery_charge_w", "battery_discharge_w", "ev_charge_w")
+_TEXT_FIELDS = ("action", "reason", "control_source", "control_action")
+_CONSUME_ACTIONS = frozenset(("self_consumption", "consume", "off_grid"))
+_EXPORT_ACTIONS = frozenset(("export", "discharge"))
+# Cached payloads built from only some columns, and those columns; every
+# other payload is dropped on any edit.
+_PAYLOAD_FIELDS = {
+    "timestamps": frozenset(("timestamp",)),
+    "battery_export_w": frozenset(("action", "power_w", "battery_discharge_w")),
+    "battery_consume_w": frozenset(("action", "power_w", "battery_discharge_w")),
+}
 
 
 @dataclass
@@ -30,95 +58,469 @@ class ScheduleAction:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for API response."""
-        legacy_action = (
-            "self_consumption" if self.action == "solar_export" else self.action
+        return _action_payload(
+            self.timestamp.isoformat(),
+            self.action,
+            self.power_w,
+            self.soc,
+            self.reason,
+            self.ev_charge_w,
+            self.control_source,
+            self.control_action,
         )
-        payload = {
-            "timestamp": self.timestamp.isoformat(),
-            "action": legacy_action,
-            "power_w": self.power_w,
-            "soc": self.soc,
-        }
-        if self.action == "solar_export":
-            payload["action_detail"] = "solar_export"
-            payload["action_reason"] = self.reason or "profit_max_solar_export"
-        elif self.reason:
-            payload["action_reason"] = self.reason
-        if self.ev_charge_w > 0:
-            payload["ev_charge_w"] = round(self.ev_charge_w, 1)
-        if self.control_source:
-            payload["control_source"] = self.control_source
-        if self.control_action:
-            payload["control_action"] = self.control_action
-        return payload
 
 
-@dataclass
+def _action_payload(
+    timestamp: str,
+    action: str,
+    power_w: float,
+    soc: float | None,
+    reason: str | None,
+    ev_charge_w: float,
+    control_source: str | None,
+    control_action: str | None,
+) -> dict[str, Any]:
+    """Return the executor/API dict for one slot."""
+    legacy_action = "self_consumption" if action == "solar_export" else action
+    payload = {
+        "timestamp": timestamp,
+        "action": legacy_action,
+        "power_w": power_w,
+        "soc": soc,
+    }
+    if action == "solar_export":
+        payload["action_detail"] = "solar_export"
+        payload["action_reason"] = reason or "profit_max_solar_export"
+    elif reason:
+        payload["action_reason"] = reason
+    if ev_charge_w > 0:
+        payload["ev_charge_w"] = round(ev_charge_w, 1)
+    if control_source:
+        payload["control_source"] = control_source
+    if control_action:
+        payload["control_action"] = control_action
+    return payload
+
+
+def _float_column(values: Iterable[Any]) -> array | list:
+    """Return a packed float array, or a plain list for non-numeric values."""
+    values = list(values)
+    try:
+        return array("d", values)
+    except TypeError:
+        return values
+
+
+def _same_instant_and_offset(expected: datetime, actual: datetime) -> bool:
+    # Aware datetimes sharing a tzinfo compare by wall clock, so also require
+    # the same tzinfo and UTC offset; otherwise isoformat() could differ.
+    return (
+        expected == actual
+        and expected.tzinfo is actual.tzinfo
+        and expected.utcoffset() == actual.utcoffset()
+    )
+
+
+def _shift_instant(value: datetime, delta: timedelta) -> datetime:
+    # Aware arithmetic is wall-clock; shift the instant so a DST change
+    # between the two times cannot move the slot.
+    if value.tzinfo is None:
+        return value + delta
+    return (value.astimezone(timezone.utc) + delta).astimezone(value.tzinfo)
+
+
+class ScheduleColumns:
+    """Struct-of-arrays storage behind an OptimizationSchedule."""
+
+    __slots__ = (
+        "start",
+        "interval",
+        "explicit_timestamps",
+        "power_w",
+        "battery_charge_w",
+        "battery_discharge_w",
+        "ev_charge_w",
+        "soc",
+        "action",
+        "reason",
+        "control_source",
+        "control_action",
+        "version",
+        "_cache",
+    )
+
+    def __init__(self, actions: Iterable[ScheduleAction]) -> None:
+        actions = list(actions)
+        timestamps = [action.timestamp for action in actions]
+        self.start: datetime | None = timestamps[0] if timestamps else None
+        self.interval: timedelta | None = (
+            timestamps[1] - timestamps[0] if len(timestamps) > 1 else None
+        )
+        self.explicit_timestamps: list[datetime] | None = None
+        if len(timestamps) > 1 and not all(
+            _same_instant_and_offset(self.start + self.interval * index, value)
+            for index, value in enumerate(timestamps)
+        ):
+            self.explicit_timestamps = timestamps
+        for name in _FLOAT_FIELDS:
+            setattr(self, name, _float_column(getattr(a, name) for a in actions))
+        # NaN marks a slot without a SOC so the column stays a packed array.
+        self.soc = _float_column(
+            math.nan if a.soc is None else a.soc for a in actions
+        )
+        for name in _TEXT_FIELDS:
+            setattr(self, name, [getattr(a, name) for a in actions])
+        self.version = 0
+        self._cache: dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.action)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def timestamp_at(self, index: int) -> datetime:
+        """Return the start time of slot ``index``."""
+        if self.explicit_timestamps is not None:
+            return self.explicit_timestamps[index]
+        if index == 0 or self.interval is None:
+            return self.start
+        return self.start + self.interval * index
+
+    def timestamps(self) -> list[datetime]:
+        """Return every slot start time."""
+        if self.explicit_timestamps is not None:
+            return list(self.explicit_timestamps)
+        return [self.timestamp_at(index) for index in range(len(self))]
+
+    def iso_timestamps(self) -> list[str]:
+        """Return every slot start time in ISO 8601 form."""
+        count = len(self)
+        start, interval = self.start, self.interval
+        if (
+            self.explicit_timestamps is not None
+            or interval is None
+            or start.utcoffset() != self.timestamp_at(count - 1).utcoffset()
+        ):
+            return [value.isoformat() for value in self.timestamps()]
+        # Evenly spaced slots under one UTC offset: format wall-clock times
+        # and append the shared offset, skipping a tz lookup per slot.
+        value = start.replace(tzinfo=None)
+        suffix = start.isoformat()[len(value.isoformat()):]
+        iso: list[str] = []
+        for _ in range(count):
+            iso.append(value.isoformat() + suffix)
+            value += interval
+        return iso
+
+    def get(self, name: str, index: int) -> Any:
+        """Return one slot value in ScheduleAction form."""
+        if name == "timestamp":
+            return self.timestamp_at(index)
+        value = getattr(self, name)[index]
+        if name == "soc" and isinstance(value, float) and math.isnan(value):
+            return None
+        return value
+
+    def set(self, name: str, index: int, value: Any) -> None:
+        """Write one slot value and start a new schedule version."""
+        if name == "timestamp":
+            if self.explicit_timestamps is None:
+                if _same_instant_and_offset(self.timestamp_at(index), value):
+                    return
+                self.explicit_timestamps = self.timestamps()
+            self.explicit_timestamps[index] = value
+        else:
+            column = getattr(self, name)
+            if name == "soc" and value is None:
+                value = math.nan
+            try:
+                column[index] = value
+            except TypeError:
+                column = list(column)
+                column[index] = value
+                setattr(self, name, column)
+        self.touch(name)
+
+    def shift(self, delta: timedelta, timestamps: Sequence[datetime] = ()) -> None:
+        """Move every slot ``delta`` later as one edit.
+
+        Leading slots take the matching ``timestamps`` (the caller's own,
+        possibly in another tzinfo). Evenly spaced slots only move ``start``
+        unless the shift carries them across a UTC offset change.
+        """
+        count = len(self)
+        known = min(count, len(timestamps))
+        if self.explicit_timestamps is None and count:
+            previous_start = self.start
+            self.start = timestamps[0] if known else previous_start + delta
+            if known > 1 and not _same_instant_and_offset(
+                self.timestamp_at(known - 1), timestamps[known - 1]
+            ):
+                self.start = previous_start
+                self.explicit_timestamps = self.timestamps()
+        if self.explicit_timestamps is not None:
+            self.explicit_timestamps = [
+                timestamps[index] if index < known else _shift_instant(value, delta)
+                for index, value in enumerate(self.explicit_timestamps)
+            ]
+        self.touch("timestamp")
+
+    def touch(self, name: str | None = None) -> None:
+        """Invalidate cached payloads after an edit of column ``name``.
+
+        Without ``name`` every cached payload is dropped.
+        """
+        self.version += 1
+        if name is None:
+            self._cache.clear()
+            return
+        for key in list(self._cache):
+            fields = _PAYLOAD_FIELDS.get(key)
+            if fields is None or name in fields:
+                del self._cache[key]
+
+    def cached(self, key: str, build) -> Any:
+        """Return the payload cached under ``key`` for this version."""
+        value = self._cache.get(key)
+        if value is None:
+            value = self._cache[key] = build()
+        return value
+
+
+def _slot_property(name: str) -> property:
+    if name in ("timestamp", "soc"):
+        def _get(self: "ScheduleSlotView") -> Any:
+            return self._columns.get(name, self._index)
+    else:
+        # Plain columns skip the timestamp/SOC translation in get().
+        def _get(self: "ScheduleSlotView") -> Any:
+            return getattr(self._columns, name)[self._index]
+
+    def _set(self: "ScheduleSlotView", value: Any) -> None:
+        self._columns.set(name, self._index, value)
+
+    return property(_get, _set)
+
+
+class ScheduleSlotView(ScheduleAction):
+    """ScheduleAction backed by one slot of a ScheduleColumns.
+
+    Reads and attribute writes go straight to the columns, so edits made
+    through ``schedule.actions[i]`` are seen by every column accessor.
+    Constructing the class with ScheduleAction fields (as
+    ``dataclasses.replace`` does) returns a detached ScheduleAction.
+    """
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> ScheduleAction:
+        return ScheduleAction(*args, **kwargs)
+
+    @classmethod
+    def bind(cls, columns: ScheduleColumns, index: int) -> "ScheduleSlotView":
+        """Return the view of slot ``index``."""
+        view = object.__new__(cls)
+        object.__setattr__(view, "_columns", columns)
+        object.__setattr__(view, "_index", index)
+        return view
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        return (ScheduleSlotView.bind, (self._columns, self._index))
+
+    timestamp = _slot_property("timestamp")
+    action = _slot_property("action")
+    power_w = _slot_property("power_w")
+    soc = _slot_property("soc")
+    battery_charge_w = _slot_property("battery_charge_w")
+    battery_discharge_w = _slot_property("battery_discharge_w")
+    reason = _slot_property("reason")
+    ev_charge_w = _slot_property("ev_charge_w")
+    control_source = _slot_property("control_source")
+    control_action = _slot_property("control_action")
+
+
 class OptimizationSchedule:
     """Complete optimization schedule."""
-    actions: list[ScheduleAction]
-    predicted_cost: float
-    predicted_savings: float
-    last_updated: datetime | None = None
+
+    def __init__(
+        self,
+        actions: Iterable[ScheduleAction],
+        predicted_cost: float,
+        predicted_savings: float,
+        last_updated: datetime | None = None,
+    ) -> None:
+        self.actions = actions
+        self.predicted_cost = predicted_cost
+        self.predicted_savings = predicted_savings
+        self.last_updated = last_updated
+
+    def __repr__(self) -> str:
+        return (
+            f"OptimizationSchedule(slots={len(self._columns)}, "
+            f"start={self._columns.start!r}, "
+            f"predicted_cost={self.predicted_cost!r}, "
+            f"predicted_savings={self.predicted_savings!r}, "
+            f"last_updated={self.last_updated!r})"
+        )
+
+    @property
+    def actions(self) -> list[ScheduleAction]:
+        """Return ScheduleAction views over the columns, in slot order."""
+        if self._views is None:
+            self._views = [
+                ScheduleSlotView.bind(self._columns, index)
+                for index in range(len(self._columns))
+            ]
+        return self._views
+
+    @actions.setter
+    def actions(self, actions: Iterable[ScheduleAction] | None) -> None:
+        self._columns = ScheduleColumns(actions or [])
+        self._views: list[ScheduleAction] | None = None
+
+    @property
+    def columns(self) -> ScheduleColumns:
+        """Return the column storage (edit slots through views or ``shift``)."""
+        return self._columns
+
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever a slot is edited."""
+        return self._columns.version
+
+    @property
+    def start(self) -> datetime | None:
+        """Return the first slot's start time."""
+        return self._columns.start
+
+    @property
+    def interval(self) -> timedelta | None:
+        """Return the slot spacing, or None for fewer than two slots."""
+        return self._columns.interval
+
+    def _iso_timestamps(self) -> list[str]:
+        return self._columns.cached("timestamps", self._columns.iso_timestamps)
+
+    def _battery_export(self) -> list[float]:
+        def build() -> list[float]:
+            columns = self._columns
+            return [
+                max(0.0, min(power_w, discharge_w))
+                if action in _EXPORT_ACTIONS
+                else 0.0
+                for action, power_w, discharge_w in zip(
+                    columns.action, columns.power_w, columns.battery_discharge_w
+                )
+            ]
+
+        return self._columns.cached("battery_export_w", build)
+
+    def _battery_consume(self) -> list[float]:
+        def build() -> list[float]:
+            columns = self._columns
+            values: list[float] = []
+            for action, export_w, discharge_w in zip(
+                columns.action, self._battery_export(), columns.battery_discharge_w
+            ):
+                if action in _CONSUME_ACTIONS:
+                    values.append(discharge_w)
+                elif action in _EXPORT_ACTIONS:
+                    values.append(max(0.0, discharge_w - export_w))
+                else:
+                    values.append(0.0)
+            return values
+
+        return self._columns.cached("battery_consume_w", build)
 
     @property
     def timestamps(self) -> list[str]:
         """Get list of timestamps as ISO strings."""
-        return [a.timestamp.isoformat() for a in self.actions]
+        return list(self._iso_timestamps())
 
     @property
     def charge_w(self) -> list[float]:
         """Get total battery charge power schedule (positive = charging)."""
-        return [a.battery_charge_w for a in self.actions]
+        return list(self._columns.battery_charge_w)
 
     @property
     def discharge_w(self) -> list[float]:
         """Get total battery discharge power schedule (positive = discharging)."""
-        return [a.battery_discharge_w for a in self.actions]
+        return list(self._columns.battery_discharge_w)
 
     @property
     def ev_charging_w(self) -> list[float]:
         """Get the EV charging load modeled in each schedule slot."""
-        return [max(0.0, float(a.ev_charge_w or 0.0)) for a in self.actions]
+        return [max(0.0, float(value or 0.0)) for value in self._columns.ev_charge_w]
 
     @property
     def battery_consume_w(self) -> list[float]:
         """Get battery-to-home consumption power schedule."""
-        values: list[float] = []
-        for action in self.actions:
-            if action.action in ("self_consumption", "consume", "off_grid"):
-                values.append(action.battery_discharge_w)
-                continue
-            if action.action in ("export", "discharge"):
-                export_w = max(0.0, min(action.power_w, action.battery_discharge_w))
-                values.append(max(0.0, action.battery_discharge_w - export_w))
-                continue
-            values.append(0.0)
-        return values
+        return list(self._battery_consume())
 
     @property
     def battery_export_w(self) -> list[float]:
         """Get battery-to-grid export power schedule."""
-        return [
-            max(0.0, min(a.power_w, a.battery_discharge_w))
-            if a.action in ("export", "discharge")
-            else 0.0
-            for a in self.actions
-        ]
+        return list(self._battery_export())
 
     @property
     def soc(self) -> list[float]:
         """Get SOC schedule (0-1 scale)."""
-        return [a.soc if a.soc is not None else 0.5 for a in self.actions]
+        return [
+            0.5 if value is None or math.isnan(value) else value
+            for value in self._columns.soc
+        ]
 
     def to_executor_schedule(self) -> list[dict[str, Any]]:
         """Convert to executor-compatible format."""
-        return [a.to_dict() for a in self.actions]
+        def build() -> list[dict[str, Any]]:
+            columns = self._columns
+            return [
+                _action_payload(
+                    timestamp,
+                    action,
+                    power_w,
+                    None if soc is None or math.isnan(soc) else soc,
+                    reason,
+                    ev_charge_w,
+                    control_source,
+                    control_action,
+                )
+                for (
+                    timestamp,
+                    action,
+                    power_w,
+                    soc,
+                    reason,
+                    ev_charge_w,
+                    control_source,
+                    control_action,
+                ) in zip(
+                    self._iso_timestamps(),
+                    columns.action,
+                    columns.power_w,
+                    columns.soc,
+                    columns.reason,
+                    columns.ev_charge_w,
+                    columns.control_source,
+                    columns.control_action,
+                )
+            ]
+
+        payload = self._columns.cached("executor", build)
+        return [dict(entry) for entry in payload]
 
     def to_api_response(self) -> dict[str, Any]:
         """Convert to API response format for mobile app."""
+        payload = self._columns.cached("api", self._build_api_response)
+        return {key: list(value) for key, value in payload.items()}
+
+    def _build_api_response(self) -> dict[str, Any]:
+        columns = self._columns
         return {
-            "timestamps": self.timestamps,
+            "timestamps": self._iso_timestamps(),
             "charge_w": self.charge_w,
             "discharge_w": self.discharge_w,
             # Keep EV load inside the canonical schedule contract.  Adding it
@@ -126,12 +528,12 @@ class OptimizationSchedule:
             # with a house-only schedule and recreates impossible energy
             # balances even though the LP modeled the car correctly.
             "ev_charging_w": self.ev_charging_w,
-            "battery_consume_w": self.battery_consume_w,
-            "battery_export_w": self.battery_export_w,
+            "battery_consume_w": self._battery_consume(),
+            "battery_export_w": self._battery_export(),
             "soc": self.soc,
-            "control_source": [a.control_source for a in self.actions],
-            "control_action": [a.control_action for a in self.actions],
-            "action_reason": [a.reason for a in self.actions],
+            "control_source": columns.control_source,
+            "control_action": columns.control_action,
+            "action_reason": columns.reason,
             "grid_import_w": [],
             "grid_export_w": [],
         }
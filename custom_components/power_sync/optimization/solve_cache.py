@@ -0,0 +1,252 @@
+"""Content-addressed cache of BatteryOptimizer results.
+
+The coordinator re-solves on every 5-minute boundary, on price pushes and on
+settings saves, and those triggers often carry inputs identical to the last
+solve. The cache key hashes the normalized ``optimize()`` arguments together
+with the optimizer's own configuration state, so any setting the coordinator
+pushes into the optimizer (reserve, pre-window target, quota groups, resolved
+efficiency parameters, ...) invalidates the entry without explicit hooks.
+
+Absolute slot timestamps are keyed by their spacing only: a hit whose first
+slot differs from the cached one is returned with every timestamp moved to
+the current slot.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Sequence
+
+if TYPE_CHECKING:
+    from .battery_optimizer import BatteryOptimizer, OptimizerResult
+
+
+SOLVE_CACHE_MAX_ENTRIES = 8
+# SOC is bucketed so telemetry jitter below half a percent still hits.
+SOLVE_CACHE_SOC_QUANTUM = 0.005
+
+# Optimizer attributes that are not solve inputs: the cache itself, log-level
+# switches, and state written by a solve for post-solve reconciliation.
+_IGNORED_OPTIMIZER_STATE = frozenset(
+    {
+        "result_cache",
+        "suppress_reserve_warning",
+        "_below_reserve_recovery_target",
+        "_last_grid_export_limits_w",
+    }
+)
+
+# Keyed separately (SOC bucket, timestamp spacing) or not a solve input.
+_UNKEYED_ARGUMENTS = frozenset(
+    {"self", "schedule_timestamps", "current_soc", "previous_result"}
+)
+
+
+def normalize_cache_value(value: Any) -> Any:
+    """Return a deterministic, hashable-by-repr form of an optimizer input."""
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return value if math.isfinite(value) else repr(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value).__name__,
+            tuple(
+                (item.name, normalize_cache_value(getattr(value, item.name)))
+                for item in dataclasses.fields(value)
+            ),
+        )
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                (str(key), normalize_cache_value(item))
+                for key, item in value.items()
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_cache_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(normalize_cache_value(item)) for item in value))
+    return repr(value)
+
+
+def optimizer_state(
+    optimizer: BatteryOptimizer,
+    ignored: frozenset[str] = frozenset(),
+) -> Any:
+    """Return the normalized configuration state of ``optimizer``."""
+    return normalize_cache_value(
+        {
+            name: value
+            for name, value in vars(optimizer).items()
+            if name not in _IGNORED_OPTIMIZER_STATE and name not in ignored
+        }
+    )
+
+
+def _timestamp_offsets(timestamps: Sequence[datetime]) -> tuple[int, ...]:
+    start = timestamps[0]
+    return tuple(int((ts - start).total_seconds()) for ts in timestamps)
+
+
+def _shift_iso(value: Any, delta: timedelta) -> Any:
+    if not isinstance(value, str) or "T" not in value:
+        return value
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    return (parsed + delta).isoformat()
+
+
+class SolveResultCache:
+    """Bounded LRU of optimizer results keyed by normalized solve inputs.
+
+    Lookups and stores happen on executor threads while the status sensor
+    reads ``stats()`` from the event loop, so every access takes the lock.
+    Entries are deep-copied in both directions: callers mutate the returned
+    result during reconciliation.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SOLVE_CACHE_MAX_ENTRIES,
+        soc_quantum: float = SOLVE_CACHE_SOC_QUANTUM,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.soc_quantum = float(soc_quantum)
+        self._entries: OrderedDict[str, tuple[datetime, OptimizerResult]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.last_lookup: str | None = None
+        self.last_key_time_s = 0.0
+
+    def key_for(
+        self,
+        optimizer: BatteryOptimizer,
+        arguments: dict[str, Any],
+    ) -> str | None:
+        """Return the cache key for one ``optimize()`` call, or None.
+
+        Calls without slot timestamps are not cached: the optimizer then
+        stamps the schedule from the wall clock, which the key cannot see.
+        ``previous_result`` only selects how a plan is solved, never which
+        inputs it answers, so it is left out of the key.
+        """
+        timestamps = arguments.get("schedule_timestamps")
+        if not timestamps:
+            return None
+        start = time.monotonic()
+        inputs = {
+            name: value
+            for name, value in arguments.items()
+            if name not in _UNKEYED_ARGUMENTS
+        }
+        soc = float(arguments.get("current_soc") or 0.0)
+        payload = repr(
+            (
+                normalize_cache_value(inputs),
+                round(soc / self.soc_quantum) if self.soc_quantum > 0 else soc,
+                _timestamp_offsets(timestamps),
+                optimizer_state(optimizer),
+            )
+        )
+        key = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        self.last_key_time_s = time.monotonic() - start
+        return key
+
+    def get(
+        self,
+        key: str,
+        timestamps: Sequence[datetime],
+    ) -> OptimizerResult | None:
+        """Return a copy of the cached result aligned to ``timestamps``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                self.last_lookup = "miss"
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.last_lookup = "hit"
+            cached_start, cached = entry
+            result = copy.deepcopy(cached)
+
+        delta = timestamps[0] - cached_start
+        if delta:
+            self._shift_result(result, timestamps, delta)
+        result.lp_stats["solve_cache_lookup"] = "hit"
+        return result
+
+    def put(
+        self,
+        key: str,
+        timestamps: Sequence[datetime],
+        result: OptimizerResult,
+    ) -> None:
+        """Store a copy of ``result`` and evict beyond ``max_entries``."""
+        stored = copy.deepcopy(result)
+        with self._lock:
+            self._entries[key] = (timestamps[0], stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for the optimizer status sensor."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "last_lookup": self.last_lookup,
+                "last_key_time_s": round(self.last_key_time_s, 4),
+            }
+
+    @staticmethod
+    def _shift_result(
+        result: OptimizerResult,
+        timestamps: Sequence[datetime],
+        delta: timedelta,
+    ) -> None:
+        schedule = result.schedule
+        # One edit for the whole schedule keeps it evenly spaced.
+        schedule.columns.shift(delta, timestamps)
+        if schedule.last_updated is not None:
+            schedule.last_updated = schedule.last_updated + delta
+        if result.horizon_inputs and result.horizon_inputs.get("timestamps"):
+            result.horizon_inputs["timestamps"] = [
+                value + delta for value in result.horizon_inputs["timestamps"]
+            ]
+        result.reserve_recommendation = {
+            name: _shift_iso(value, delta)
+            for name, value in (result.reserve_recommendation or {}).items()
+        }
@@ -0,0 +1,429 @@
+"""Out-of-process LP solver workers for the optimization coordinator.
+
+A full-horizon solve spends most of its time building the model in Python
+while holding the GIL, and can take tens of seconds on slow hosts. Running it
+through ``hass.async_add_executor_job`` ties up a shared Home Assistant
+executor thread and contends with the event loop for the interpreter lock.
+
+``SolverProcessPool`` keeps long-lived worker processes instead. Each call
+ships a compact ``SolveRequest`` (the optimizer's configuration state plus
+the ``optimize()`` arguments, float series packed as ``array('d')``) over a
+pipe, the worker runs ``BatteryOptimizer.optimize`` and sends the result
+back together with a memory/latency report. The event loop waits on the
+pipe with ``add_reader``, so no executor thread is held for the solve.
+
+Each worker keeps its own ``SolveResultCache`` and HiGHS session across
+requests. A solve superseded by a newer forced re-optimization is cancelled
+by terminating its worker; the next request starts a fresh one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import pickle
+import runpy
+import time
+import traceback
+from array import array
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+from .solve_cache import SolveResultCache
+from .solver_worker import RUN_NAME as _WORKER_RUN_NAME
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from .battery_optimizer import BatteryOptimizer, OptimizerResult
+
+_LOGGER = logging.getLogger(__name__)
+
+# The base solve plus the coordinator's speculative variants; workers start
+# lazily, so a cycle that needs one solve keeps one process.
+SOLVER_POOL_MAX_WORKERS = 3
+# Spawned workers import only the optimization modules (see solver_worker)
+# instead of inheriting a fork of the Home Assistant process with its event
+# loop and locks.
+SOLVER_POOL_START_METHOD = "spawn"
+SOLVER_WORKER_SHUTDOWN_TIMEOUT_S = 5.0
+_WORKER_ENTRY = Path(__file__).with_name("solver_worker.py")
+
+# Process-local optimizer state that is never shipped to a worker.
+_PROCESS_LOCAL_STATE = frozenset({"result_cache"})
+# State a solve leaves behind for post-solve reconciliation in the caller.
+_SOLVE_OUTPUT_STATE = (
+    "_below_reserve_recovery_target",
+    "_last_grid_export_limits_w",
+)
+
+
+class SolverWorkerError(Exception):
+    """A solver worker raised, died, or could not be started."""
+
+
+class SolveCancelledError(SolverWorkerError):
+    """The solve was cancelled before the worker replied."""
+
+
+def _pack_value(value: Any) -> Any:
+    if (
+        isinstance(value, list)
+        and value
+        and all(
+            isinstance(item, (int, float)) and not isinstance(item, bool)
+            for item in value
+        )
+    ):
+        return array("d", value)
+    if isinstance(value, list):
+        # Background solves must not see the caller's later in-place edits.
+        return list(value)
+    return value
+
+
+def _unpack_value(value: Any) -> Any:
+    if isinstance(value, array):
+        return value.tolist()
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class SolveRequest:
+    """Picklable snapshot of one ``BatteryOptimizer.optimize()`` call."""
+
+    state: dict[str, Any]
+    args: tuple[Any, ...]
+
+    @classmethod
+    def from_call(
+        cls,
+        optimizer: BatteryOptimizer,
+        args: tuple[Any, ...],
+    ) -> SolveRequest:
+        """Capture ``optimizer``'s configuration and the call arguments."""
+        state = {
+            name: _pack_value(value)
+            for name, value in vars(optimizer).items()
+            if name not in _PROCESS_LOCAL_STATE
+        }
+        return cls(state=state, args=tuple(_pack_value(arg) for arg in args))
+
+    def build_optimizer(self) -> BatteryOptimizer:
+        """Return an optimizer carrying the captured configuration."""
+        from .battery_optimizer import BatteryOptimizer
+
+        optimizer = BatteryOptimizer.__new__(BatteryOptimizer)
+        optimizer.__dict__.update(
+            {name: _unpack_value(value) for name, value in self.state.items()}
+        )
+        optimizer.result_cache = None
+        return optimizer
+
+    def call_args(self) -> tuple[Any, ...]:
+        return tuple(_unpack_value(arg) for arg in self.args)
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    # ru_maxrss is reported in KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def run_solve_request(
+    request: SolveRequest,
+    cache: SolveResultCache | None = None,
+) -> tuple[OptimizerResult, dict[str, Any], dict[str, Any]]:
+    """Solve ``request`` in this process.
+
+    Returns the result, the solve-written optimizer state the caller copies
+    back, and the worker half of the per-solve report.
+    """
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    peak_before = _peak_rss_mb()
+
+    optimizer = request.build_optimizer()
+    optimizer.result_cache = cache
+    result = optimizer.optimize(*request.call_args())
+
+    peak_after = _peak_rss_mb()
+    report: dict[str, Any] = {
+        "solve_s": round(time.perf_counter() - started, 4),
+        "cpu_s": round(time.process_time() - cpu_started, 4),
+        "peak_rss_mb": round(peak_after, 1) if peak_after is not None else None,
+        "peak_rss_growth_mb": (
+            round(peak_after - peak_before, 1)
+            if peak_after is not None and peak_before is not None
+            else None
+        ),
+    }
+    if cache is not None:
+        report["solve_cache"] = cache.stats()
+    state = {name: getattr(optimizer, name, None) for name in _SOLVE_OUTPUT_STATE}
+    return result, state, report
+
+
+def apply_solve_state(optimizer: BatteryOptimizer, state: dict[str, Any]) -> None:
+    """Copy the state a solve left behind onto ``optimizer``."""
+    for name, value in state.items():
+        setattr(optimizer, name, value)
+
+
+def _worker_main(conn: Connection) -> None:
+    """Serve solve requests until the parent closes the pipe."""
+    cache = SolveResultCache()
+    solves = 0
+    while True:
+        try:
+            payload = conn.recv_bytes()
+        except (EOFError, OSError):
+            return
+        if not payload:
+            return
+        solves += 1
+        try:
+            result, state, report = run_solve_request(pickle.loads(payload), cache)
+            report["worker_solves"] = solves
+            reply: tuple[Any, ...] = ("ok", result, state, report)
+        except Exception as err:  # noqa: BLE001 - reported to the parent
+            reply = ("error", f"{type(err).__name__}: {err}", traceback.format_exc())
+        try:
+            conn.send_bytes(pickle.dumps(reply, protocol=pickle.HIGHEST_PROTOCOL))
+        except (BrokenPipeError, OSError):
+            return
+
+
+class _Worker:
+    __slots__ = ("process", "conn", "future")
+
+    def __init__(self, process: BaseProcess, conn: Connection) -> None:
+        self.process = process
+        self.conn = conn
+        self.future: asyncio.Future[bytes] | None = None
+
+
+class SolverProcessPool:
+    """Run ``BatteryOptimizer.optimize`` in dedicated worker processes.
+
+    All methods run on the event loop. Workers are started lazily on first
+    use and reused until they fail, are cancelled or the pool is shut down.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = SOLVER_POOL_MAX_WORKERS,
+        start_method: str = SOLVER_POOL_START_METHOD,
+    ) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self._context = multiprocessing.get_context(start_method)
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._idle: list[_Worker] = []
+        self._busy: set[_Worker] = set()
+        self.solves = 0
+        self.cancelled = 0
+        self.failures = 0
+        self.workers_started = 0
+        self.last_report: dict[str, Any] | None = None
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._busy)
+
+    async def solve(self, optimizer: BatteryOptimizer, *args: Any) -> OptimizerResult:
+        """Solve ``optimizer.optimize(*args)`` in a worker process.
+
+        Copies the solve-written reconciliation state back onto ``optimizer``
+        and attaches the per-solve report as ``lp_stats["solver_worker"]``.
+        Raises ``SolveCancelledError`` when ``cancel()`` interrupts the solve
+        and ``SolverWorkerError`` when the worker fails.
+        """
+        result, state = await self.run(SolveRequest.from_call(optimizer, args))
+        apply_solve_state(optimizer, state)
+        return result
+
+    async def run(
+        self,
+        request: SolveRequest,
+    ) -> tuple[OptimizerResult, dict[str, Any]]:
+        """Solve a captured ``request`` in a worker process.
+
+        Returns the result and the solve-written optimizer state, leaving it
+        to the caller to decide which optimizer adopts that state.
+        """
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            payload = pickle.dumps(request, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as err:  # noqa: BLE001 - the caller falls back
+            self.failures += 1
+            raise SolverWorkerError(f"could not pickle solve request: {err}") from err
+        async with self._slots:
+            queued_s = time.perf_counter() - started
+            worker = self._idle.pop() if self._idle else None
+            if worker is None:
+                try:
+                    worker = await loop.run_in_executor(None, self._start_worker)
+                except (OSError, RuntimeError) as err:
+                    self.failures += 1
+                    raise SolverWorkerError(f"could not start worker: {err}") from err
+            data = await self._roundtrip(loop, worker, payload)
+
+        try:
+            reply = pickle.loads(data)
+        except Exception as err:  # noqa: BLE001 - the caller falls back
+            self.failures += 1
+            raise SolverWorkerError(f"could not unpickle worker reply: {err}") from err
+        if reply[0] != "ok":
+            self.failures += 1
+            _LOGGER.debug("Solver worker traceback:\n%s", reply[2])
+            raise SolverWorkerError(reply[1])
+        _status, result, state, report = reply
+        roundtrip_s = time.perf_counter() - started
+        report.update(
+            {
+                "pid": worker.process.pid,
+                "roundtrip_s": round(roundtrip_s, 4),
+                "queued_s": round(queued_s, 4),
+                "ipc_overhead_s": round(max(0.0, roundtrip_s - report["solve_s"]), 4),
+                "request_kb": round(len(payload) / 1024.0, 1),
+                "response_kb": round(len(data) / 1024.0, 1),
+            }
+        )
+        result.lp_stats["solver_worker"] = report
+        self.solves += 1
+        self.last_report = dict(report)
+        return result, state
+
+    async def _roundtrip(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        worker: _Worker,
+        payload: bytes,
+    ) -> bytes:
+        worker.future = loop.create_future()
+        self._busy.add(worker)
+        fileno = worker.conn.fileno()
+        loop.add_reader(fileno, self._on_readable, worker)
+        healthy = False
+        try:
+            worker.conn.send_bytes(payload)
+            data = await worker.future
+            healthy = True
+        except SolveCancelledError:
+            self.cancelled += 1
+            raise
+        except (SolverWorkerError, OSError) as err:
+            self.failures += 1
+            raise SolverWorkerError(
+                f"worker {worker.process.pid} failed: {err}"
+            ) from err
+        finally:
+            loop.remove_reader(fileno)
+            self._busy.discard(worker)
+            worker.future = None
+            if not healthy:
+                # Also covers the awaiting task itself being cancelled: the
+                # worker may still be mid-solve, so it cannot be reused.
+                self._discard(worker)
+        self._idle.append(worker)
+        return data
+
+    @staticmethod
+    def _on_readable(worker: _Worker) -> None:
+        future = worker.future
+        if future is None or future.done():
+            return
+        try:
+            future.set_result(worker.conn.recv_bytes())
+        except (EOFError, OSError) as err:
+            future.set_exception(
+                SolverWorkerError(f"worker exited ({type(err).__name__})")
+            )
+
+    def cancel(self) -> bool:
+        """Abort every in-flight solve; return True if one was running."""
+        cancelled = False
+        for worker in list(self._busy):
+            future = worker.future
+            if future is not None and not future.done():
+                future.set_exception(SolveCancelledError("solve superseded"))
+                cancelled = True
+            if worker.process.is_alive():
+                worker.process.terminate()
+        return cancelled
+
+    async def async_shutdown(self) -> None:
+        """Cancel in-flight solves and stop idle workers.
+
+        The pool stays usable; the next ``solve()`` starts a new worker.
+        """
+        self.cancel()
+        idle, self._idle = self._idle, []
+        if idle:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._stop_workers, idle
+            )
+
+    @staticmethod
+    def _stop_workers(workers: list[_Worker]) -> None:
+        for worker in workers:
+            try:
+                worker.conn.send_bytes(b"")
+            except OSError:
+                pass
+        for worker in workers:
+            worker.process.join(SOLVER_WORKER_SHUTDOWN_TIMEOUT_S)
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+            worker.conn.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool counters and the last solve report."""
+        return {
+            "max_workers": self.max_workers,
+            "workers": len(self._idle) + len(self._busy),
+            "busy": len(self._busy),
+            "solves": self.solves,
+            "cancelled": self.cancelled,
+            "failures": self.failures,
+            "workers_started": self.workers_started,
+            "last_report": dict(self.last_report) if self.last_report else None,
+        }
+
+    def _start_worker(self) -> _Worker:
+        # Reap workers terminated by cancel() so they don't linger as zombies.
+        self._context.active_children()
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=runpy.run_path,
+            args=(str(_WORKER_ENTRY),),
+            kwargs={
+                "init_globals": {
+                    "worker_args": (__package__, str(_WORKER_ENTRY.parent), child_conn)
+                },
+                "run_name": _WORKER_RUN_NAME,
+            },
+            name="powersync-lp-solver",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self.workers_started += 1
+        return _Worker(process, parent_conn)
+
+    @staticmethod
+    def _discard(worker: _Worker) -> None:
+        if worker.process.is_alive():
+            worker.process.terminate()
+        worker.conn.close()
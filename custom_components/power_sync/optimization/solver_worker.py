@@ -0,0 +1,46 @@
+"""Entry point for LP solver worker processes.
+
+``SolverProcessPool`` starts each worker as ``runpy.run_path`` on this file
+rather than on a function inside the integration. A spawned process unpickles
+its target by module name, so a target in ``solver_pool`` would import
+``power_sync/__init__.py`` and, through ``optimization/__init__.py``, the
+optimization coordinator in every worker. ``bootstrap`` registers those
+packages as bare path entries instead, and only the modules a solve needs are
+imported.
+
+Nothing from the integration may be imported here at module level.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+RUN_NAME = "__powersync_solver_worker__"
+
+
+def bootstrap(package: str, package_dir: str, conn: Any) -> None:
+    """Serve solve requests on ``conn`` from ``package``'s solver pool.
+
+    ``package`` is the optimization package's dotted name and ``package_dir``
+    its directory. Packages not yet imported are registered without running
+    their ``__init__`` so the worker unpickles results under the same module
+    names as the parent.
+    """
+    parts = package.split(".")
+    directory = Path(package_dir)
+    for depth in range(len(parts), 0, -1):
+        name = ".".join(parts[:depth])
+        if name not in sys.modules:
+            module = types.ModuleType(name)
+            module.__path__ = [str(directory)]
+            sys.modules[name] = module
+        directory = directory.parent
+    importlib.import_module(f"{package}.solver_pool")._worker_main(conn)
+
+
+if __name__ == RUN_NAME:
+    bootstrap(*worker_args)  # noqa: F821 - supplied through run_path init_globals
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import functools
 import logging
 import time
 from dataclasses import dataclass
@@ -47,6 +48,10 @@ _AUTHORIZED_STATE_CODES = {
     "VERIFIED": 3,
     "REMOVED": 4,
 }
+# config.json only changes when it is written. Our own writes invalidate the
+# cached copy via the transport's config generation; this interval picks up
+# changes made from the Tesla app or through the cloud API.
+_CONFIG_REVALIDATE_SECONDS = 60.0
 _CONNECTED_GRID_STATES = {"active", "systemgridconnected"}
 _OFF_GRID_STATES = {
     "inactive",
@@ -138,6 +143,17 @@ class PowerwallSnapshot:
 class PowerwallLocalClient:
     """RSA-signed local Powerwall client (both PW2 and PW3)."""
 
+    # Poll caches and counters. Class-level defaults keep clients built via
+    # ``__new__`` (tests, partial setups) usable without extra wiring.
+    # The DCQ envelope depends only on the DIN, so it is built once.
+    _dcq_envelope: bytes | None = None
+    _config_cache: dict[str, Any] | None = None
+    _config_cache_generation: int | None = None
+    _config_cache_monotonic: float | None = None
+    _poll_started_monotonic: float | None = None
+    _poll_snapshots = 0
+    _poll_config_reads = 0
+
     def __init__(
         self,
         host: str,
@@ -211,14 +227,19 @@ class PowerwallLocalClient:
         path but POSTs it through the signed v1r transport for sub-100ms
         latency. Returns the decoded JSON payload or None on any failure.
         """
-        try:
-            envelope = build_device_controller_query_envelope(self._din)
-        except Exception as err:
-            _LOGGER.error("DeviceControllerQuery encode failed: %s", err)
-            return None
+        envelope = self._dcq_envelope
+        if envelope is None:
+            try:
+                envelope = build_device_controller_query_envelope(self._din)
+            except Exception as err:
+                _LOGGER.error("DeviceControllerQuery encode failed: %s", err)
+                return None
+            self._dcq_envelope = envelope
 
         try:
-            resp = await self._transport.post_v1r(envelope, self._din)
+            resp = await self._transport.post_v1r(
+                envelope, self._din, idempotent=True
+            )
         except PowerwallUnreachableError:
             raise
         except PowerwallSignatureError:
@@ -234,23 +255,54 @@ class PowerwallLocalClient:
                 resp.fault_name, resp.http_status,
             )
             return None
+        # Sign the next poll's identical request while this one is decoded.
+        self._transport.schedule_presign(envelope, self._din)
 
         try:
-            return parse_device_controller_response(resp.inner_bytes)
+            return await self._transport.async_offload(
+                "decode_dcq", parse_device_controller_response, resp.inner_bytes
+            )
         except Exception as err:
             _LOGGER.warning("DeviceControllerQuery decode error: %s", err)
             return None
 
     async def get_snapshot(self) -> PowerwallSnapshot:
-        """Fetch live status via RSA-signed DCQ + config.json read in parallel."""
+        """Fetch live status via RSA-signed DCQ plus the cached config.json.
+
+        ``config.json`` is re-read alongside the DCQ only after one of our
+        writes, once the revalidation interval lapses, or after
+        ``invalidate_config_cache``; other polls issue just the DCQ.
+        """
         if not self._local_access_enabled or is_loopback_host(self._host):
             raise PowerwallUnreachableError(
                 "Powerwall local access disabled; gateway IP is not configured"
             )
 
-        dcq_task = self._fetch_dcq_local()
-        cfg_task = self._transport.read_config(self._din)
-        dcq, cfg = await asyncio.gather(dcq_task, cfg_task, return_exceptions=True)
+        now = time.monotonic()
+        if self._poll_started_monotonic is None:
+            self._poll_started_monotonic = now
+        self._poll_snapshots += 1
+
+        dcq: Any
+        cfg: Any
+        if self._config_cache_fresh(now):
+            cfg = self._config_cache
+            try:
+                dcq = await self._fetch_dcq_local()
+            except Exception as err:
+                dcq = err
+        else:
+            generation = self._transport.config_generation
+            self._poll_config_reads += 1
+            dcq, cfg = await asyncio.gather(
+                self._fetch_dcq_local(),
+                self._transport.read_config(self._din),
+                return_exceptions=True,
+            )
+            if isinstance(cfg, dict):
+                self._config_cache = cfg
+                self._config_cache_generation = generation
+                self._config_cache_monotonic = now
 
         if isinstance(dcq, BaseException):
             if isinstance(dcq, (PowerwallUnreachableError, PowerwallSignatureError)):
@@ -270,6 +322,39 @@ class PowerwallLocalClient:
 
         return _snapshot_from_dcq(dcq, cfg if isinstance(cfg, dict) else None)
 
+    def _config_cache_fresh(self, now: float) -> bool:
+        return (
+            self._config_cache is not None
+            and self._config_cache_generation == self._transport.config_generation
+            and self._config_cache_monotonic is not None
+            and now - self._config_cache_monotonic < _CONFIG_REVALIDATE_SECONDS
+        )
+
+    def invalidate_config_cache(self) -> None:
+        """Force the next snapshot to re-read ``config.json``."""
+        self._config_cache_monotonic = None
+
+    def poll_request_stats(self) -> dict[str, Any]:
+        """Return signed requests per hour with and without the config cache."""
+        started = self._poll_started_monotonic
+        elapsed_h = (
+            max(time.monotonic() - started, 1.0) / 3600 if started is not None else None
+        )
+        requests = self._poll_snapshots + self._poll_config_reads
+        return {
+            "snapshots": self._poll_snapshots,
+            "config_reads": self._poll_config_reads,
+            "config_cache_hits": self._poll_snapshots - self._poll_config_reads,
+            "config_revalidate_s": _CONFIG_REVALIDATE_SECONDS,
+            # Before caching every snapshot sent a DCQ and a config.json read.
+            "requests_per_hour": (
+                round(requests / elapsed_h) if elapsed_h else None
+            ),
+            "uncached_requests_per_hour": (
+                round(2 * self._poll_snapshots / elapsed_h) if elapsed_h else None
+            ),
+        }
+
     async def verify_pairing(self) -> int | None:
         """Check our key's state on the gateway via list_authorized_clients.
 
@@ -428,6 +513,14 @@ class PowerwallLocalClient:
         diagnostics["errors"] = errors
         return diagnostics
 
+    def transport_stats(self) -> dict[str, Any]:
+        """Return handshake, reuse and latency counters for the v1r session."""
+        return self._transport.stats.as_dict()
+
+    async def async_close(self) -> None:
+        """Close the v1r keep-alive session; the next request reopens it."""
+        await self._transport.async_close()
+
     async def list_authorized_clients(self) -> dict[str, Any] | None:
         """Read authorized clients directly from the local gateway."""
         return await self._transport.list_authorized_clients(self._din)
@@ -647,8 +740,14 @@ class PowerwallLocalClient:
 
         # Both PW2 and PW3: mode=6 off-grid (force=True), mode=1 reconnect
         try:
-            signed_bytes = self._transport.build_signed_island_mode(
-                self._din, off_grid=off_grid, mode_override=mode_override,
+            signed_bytes = await self._transport.async_offload(
+                "sign",
+                functools.partial(
+                    self._transport.build_signed_island_mode,
+                    self._din,
+                    off_grid=off_grid,
+                    mode_override=mode_override,
+                ),
             )
         except Exception as err:
             _LOGGER.error("signed_device_command: failed to build signed bytes: %s", err)
@@ -719,8 +818,14 @@ class PowerwallLocalClient:
         try:
             envelope = build_device_controller_query_envelope(self._din)
             # Use 300 s TTL to absorb Cloudflare → Tesla → Gateway round-trip latency.
-            signed = self._transport.build_signed_bytes(
-                envelope, self._din, ttl_seconds=300
+            signed = await self._transport.async_offload(
+                "sign",
+                functools.partial(
+                    self._transport.build_signed_bytes,
+                    envelope,
+                    self._din,
+                    ttl_seconds=300,
+                ),
             )
         except Exception as err:
             _LOGGER.error("fetch_device_controller_json: failed to build signed bytes: %s", err)
@@ -773,7 +878,11 @@ class PowerwallLocalClient:
             return None
 
         try:
-            result = parse_device_controller_response(base64.b64decode(envelope_b64))
+            result = await self._transport.async_offload(
+                "decode_dcq",
+                parse_device_controller_response,
+                base64.b64decode(envelope_b64),
+            )
             if result is None:
                 _LOGGER.warning("fetch_device_controller_json: failed to extract text from envelope")
             return result
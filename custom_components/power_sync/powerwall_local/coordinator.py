@@ -172,6 +172,16 @@ class PowerwallLocalCoordinator(DataUpdateCoordinator[PowerwallSnapshot | None])
         if not self._client.local_access_enabled:
             return None
 
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry_id, {})
+        if isinstance(entry_data, dict) and (
+            entry_data.get(_BACKUP_RESERVE_WRITE_LOCAL_KEY) is not None
+        ):
+            # A local reserve write is waiting for its readback; keep
+            # re-reading config.json until the gateway reports it.
+            invalidate = getattr(self._client, "invalidate_config_cache", None)
+            if callable(invalidate):
+                invalidate()
+
         try:
             snap = await asyncio.wait_for(
                 self._client.get_snapshot(),
@@ -430,8 +440,24 @@ class PowerwallLocalCoordinator(DataUpdateCoordinator[PowerwallSnapshot | None])
             }
         self.async_update_listeners()
 
+    def _v1r_diagnostics_payload(self) -> dict[str, Any] | None:
+        """Return the Common API diagnostics with live request counters."""
+        diagnostics = getattr(self, "_v1r_diagnostics", None)
+        if diagnostics is None:
+            return None
+        client = getattr(self, "_client", None)
+        payload = dict(diagnostics)
+        for key, getter in (
+            ("transport", "transport_stats"),
+            ("poll_requests", "poll_request_stats"),
+        ):
+            stats = getattr(client, getter, None)
+            if callable(stats):
+                payload[key] = stats()
+        return payload
+
     async def async_shutdown(self) -> None:
-        """Cancel any in-flight background diagnostics during entry unload."""
+        """Cancel background diagnostics and close the v1r session on unload."""
         keepalive_unsub = getattr(self, "_keepalive_unsub", None)
         if callable(keepalive_unsub):
             keepalive_unsub()
@@ -445,13 +471,15 @@ class PowerwallLocalCoordinator(DataUpdateCoordinator[PowerwallSnapshot | None])
             await asyncio.gather(*notification_tasks, return_exceptions=True)
         self._calibration_notification_tasks = set()
         task = getattr(self, "_v1r_diagnostics_task", None)
-        if task is None or task.done():
-            return
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        close = getattr(getattr(self, "_client", None), "async_close", None)
+        if callable(close):
+            await close()
 
     def _update_backup_reserve_offset(self, snap: PowerwallSnapshot) -> None:
         """Detect the local reserve offset by comparing local and cloud readbacks."""
@@ -579,7 +607,7 @@ class PowerwallLocalCoordinator(DataUpdateCoordinator[PowerwallSnapshot | None])
                 "snapshot_available": False,
                 "last_success_ts": self._last_success_ts,
                 "needs_repair": self._needs_repair,
-                "v1r_diagnostics": getattr(self, "_v1r_diagnostics", None),
+                "v1r_diagnostics": self._v1r_diagnostics_payload(),
             }
         ev_power_w, ev_complete = self._observed_ev_power_w()
         load_w = snap.load_w
@@ -622,7 +650,7 @@ class PowerwallLocalCoordinator(DataUpdateCoordinator[PowerwallSnapshot | None])
             "gateway_host": self._client.host,
             "gateway_din": self._client.din,
             "version": self._client.version.value,
-            "v1r_diagnostics": getattr(self, "_v1r_diagnostics", None),
+            "v1r_diagnostics": self._v1r_diagnostics_payload(),
         }
 
     def _observed_ev_power_w(self) -> tuple[float, bool]:
@@ -15,6 +15,8 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import bisect
+import functools
 import ipaddress
 import json
 import logging
@@ -23,8 +25,9 @@ import ssl
 import struct
 import time
 import uuid
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
 
 import aiohttp
 from cryptography.hazmat.primitives import hashes, serialization
@@ -39,11 +42,76 @@ from .exceptions import (
 from ..powerwall_host import normalize_powerwall_gateway_host
 
 _LOGGER = logging.getLogger(__name__)
+_T = TypeVar("_T")
 
 _SIGNATURE_TYPE_RSA = 7
 _DOMAIN_ENERGY_DEVICE = 7
 _TAG_END = 0xFF
 _SIGNATURE_TTL_SECONDS = 12
+# The DCQ poll runs every 2s, so an idle connection kept for 30s survives the
+# gaps between polls and diagnostics reads without holding sockets forever.
+_KEEPALIVE_TIMEOUT_SECONDS = 30.0
+_CONNECTION_POOL_LIMIT = 4
+# A pre-signed poll request is only used while at least this much of its
+# 12s signature TTL remains; the 2s poll normally consumes it ~2s after signing.
+_PRESIGN_MIN_REMAINING_SECONDS = 8
+# Upper bounds (ms) of the v1r request latency histogram; the last bucket is
+# open-ended.
+_LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def _invalidates_config(method):
+    """Bump ``config_generation`` once a gateway write attempt has finished.
+
+    Bumped after the write (even a failed one, which may have partially
+    applied) so a ``config.json`` read that raced the write is recognised as
+    stale by callers caching it against the generation.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: TEDAPIv1rTransport, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self._config_generation += 1
+
+    return wrapper
+
+
+def _timed_call(func: Callable[..., Any], *args: Any) -> tuple[Any, float]:
+    """Run ``func`` and return its result with the elapsed CPU time in ms."""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _parse_routable_message(raw: bytes) -> Any:
+    resp_msg = combined_pb2.RoutableMessage()
+    try:
+        resp_msg.ParseFromString(raw)
+    except Exception as err:
+        raise PowerwallLocalError(f"Malformed v1r response: {err}") from err
+    return resp_msg
+
+
+def _parse_config_blob(inner_bytes: bytes) -> dict[str, Any] | None:
+    try:
+        env = combined_pb2.MessageEnvelope()
+        env.ParseFromString(inner_bytes)
+        if env.HasField("filestore"):
+            blob = env.filestore.readFileResponse.file.blob
+            return json.loads(blob.decode("utf-8"))
+    except Exception as err:
+        _LOGGER.debug("read_config parse error: %s", err)
+    return None
 
 
 def _enum_suffix(enum_type: Any, value: int, prefix: str) -> str:
@@ -163,9 +231,91 @@ class TEDAPIResponse:
     http_status: int | None = None
 
 
+@dataclass
+class TransportStats:
+    """Connection reuse and latency counters for one v1r transport."""
+
+    handshakes: int = 0
+    reused_connections: int = 0
+    requests: int = 0
+    failed_requests: int = 0
+    stale_retries: int = 0
+    sessions_opened: int = 0
+    presigned_hits: int = 0
+    cpu_offloaded_ms: float = 0.0
+    cpu_on_loop_ms: float = 0.0
+    cpu_on_loop_max_ms: float = 0.0
+    last_latency_ms: float | None = None
+    max_latency_ms: float = 0.0
+    total_latency_ms: float = 0.0
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(_LATENCY_BUCKETS_MS) + 1)
+    )
+
+    def record(self, latency_ms: float, ok: bool) -> None:
+        self.requests += 1
+        if not ok:
+            self.failed_requests += 1
+        self.last_latency_ms = latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.total_latency_ms += latency_ms
+        self.latency_buckets[bisect.bisect_left(_LATENCY_BUCKETS_MS, latency_ms)] += 1
+
+    def record_cpu(self, elapsed_ms: float, on_loop: bool) -> None:
+        if on_loop:
+            self.cpu_on_loop_ms += elapsed_ms
+            self.cpu_on_loop_max_ms = max(self.cpu_on_loop_max_ms, elapsed_ms)
+        else:
+            self.cpu_offloaded_ms += elapsed_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"le_{bound}ms" for bound in _LATENCY_BUCKETS_MS]
+        labels.append(f"gt_{_LATENCY_BUCKETS_MS[-1]}ms")
+        return {
+            "handshakes": self.handshakes,
+            "reused_connections": self.reused_connections,
+            "requests": self.requests,
+            "failed_requests": self.failed_requests,
+            "stale_retries": self.stale_retries,
+            "sessions_opened": self.sessions_opened,
+            "presigned_hits": self.presigned_hits,
+            "cpu_offloaded_ms": round(self.cpu_offloaded_ms, 1),
+            "cpu_on_loop_ms": round(self.cpu_on_loop_ms, 1),
+            "cpu_on_loop_max_ms": round(self.cpu_on_loop_max_ms, 1),
+            "last_latency_ms": (
+                round(self.last_latency_ms, 1)
+                if self.last_latency_ms is not None
+                else None
+            ),
+            "avg_latency_ms": (
+                round(self.total_latency_ms / self.requests, 1)
+                if self.requests
+                else None
+            ),
+            "max_latency_ms": round(self.max_latency_ms, 1),
+            "latency_histogram": dict(zip(labels, self.latency_buckets, strict=True)),
+        }
+
+
+@dataclass
+class _PresignedRequest:
+    envelope_bytes: bytes
+    din: str
+    payload: bytes
+    expires_at: float
+
+
 class TEDAPIv1rTransport:
     """Async RSA-signed transport to ``/tedapi/v1r``."""
 
+    # Class-level defaults keep transports built via ``__new__`` usable.
+    _config_generation = 0
+    _presigned: _PresignedRequest | None = None
+    _presign_task: asyncio.Task[None] | None = None
+    # Optional ``(stage, elapsed_ms, on_loop)`` callback for profiling the
+    # CPU-bound signing and protobuf decoding around each request.
+    profile_hook: Callable[[str, float, bool], None] | None = None
+
     def __init__(
         self,
         host: str,
@@ -199,16 +349,68 @@ class TEDAPIv1rTransport:
         # DIN is supplied by the caller from cloud pairing — no Bearer-authed
         # /tedapi/din fetch path remains.
         self._din: str | None = din
+        self._client_session: aiohttp.ClientSession | None = None
+        self._stats = TransportStats()
 
     @property
     def din(self) -> str | None:
         return self._din
 
+    @property
+    def config_generation(self) -> int:
+        """Counter bumped by every config, island-mode or backup write."""
+        return self._config_generation
+
+    @property
+    def stats(self) -> TransportStats:
+        return self._stats
+
     async def _session(self) -> aiohttp.ClientSession:
-        # Fresh session per call keeps connection pooling scoped to the
-        # caller; TEDAPI polling is low rate and the handshake is cheap.
-        connector = aiohttp.TCPConnector(ssl=self._ssl, limit=4)
-        return aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+        """Return the gateway's keep-alive session, reopening it if closed.
+
+        The 2s DCQ poll used to pay a TCP + TLS handshake per request; one
+        long-lived session with a small bounded pool lets consecutive posts
+        reuse the same connection. A closed session (after ``async_close``)
+        is replaced transparently so a reloaded coordinator reconnects.
+        """
+        session = self._client_session
+        if session is None or session.closed:
+            trace = aiohttp.TraceConfig()
+            trace.on_connection_create_end.append(self._on_connection_create_end)
+            trace.on_connection_reuseconn.append(self._on_connection_reuseconn)
+            connector = aiohttp.TCPConnector(
+                ssl=self._ssl,
+                limit=_CONNECTION_POOL_LIMIT,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT_SECONDS,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self._timeout,
+                trace_configs=[trace],
+            )
+            self._client_session = session
+            self._stats.sessions_opened += 1
+        return session
+
+    async def _on_connection_create_end(self, _session, _ctx, _params) -> None:
+        self._stats.handshakes += 1
+
+    async def _on_connection_reuseconn(self, _session, _ctx, _params) -> None:
+        self._stats.reused_connections += 1
+
+    async def async_close(self) -> None:
+        """Close the keep-alive session and release its pooled connections."""
+        presign_task, self._presign_task = self._presign_task, None
+        if presign_task is not None and not presign_task.done():
+            presign_task.cancel()
+            try:
+                await presign_task
+            except asyncio.CancelledError:
+                pass
+        self._presigned = None
+        session, self._client_session = self._client_session, None
+        if session is not None and not session.closed:
+            await session.close()
 
     @staticmethod
     def _tlv(tag: int, value: bytes) -> bytes:
@@ -229,39 +431,120 @@ class TEDAPIv1rTransport:
         )
 
     def _sign(self, payload: bytes) -> bytes:
-        return self._private_key.sign(
-            data=payload,
-            padding=padding.PKCS1v15(),
-            algorithm=hashes.SHA512(),
+        if not _on_event_loop():
+            return self._private_key.sign(
+                data=payload,
+                padding=padding.PKCS1v15(),
+                algorithm=hashes.SHA512(),
+            )
+        # Still reached on the loop by the synchronous build_signed_* helpers;
+        # record it so loop stalls from signing stay visible.
+        signature, elapsed_ms = _timed_call(
+            self._private_key.sign, payload, padding.PKCS1v15(), hashes.SHA512()
         )
+        self._profile("sign", elapsed_ms, on_loop=True)
+        return signature
+
+    def _profile(self, stage: str, elapsed_ms: float, *, on_loop: bool) -> None:
+        self._stats.record_cpu(elapsed_ms, on_loop)
+        hook = self.profile_hook
+        if hook is not None:
+            try:
+                hook(stage, elapsed_ms, on_loop)
+            except Exception:
+                _LOGGER.debug("v1r profile hook failed", exc_info=True)
+
+    async def async_offload(
+        self, stage: str, func: Callable[..., _T], *args: Any
+    ) -> _T:
+        """Run CPU-bound signing or decoding in the executor and profile it.
+
+        RSA-SHA512 signing and protobuf/JSON decoding take several ms per call
+        on Raspberry Pi class hardware, which would otherwise stall the event
+        loop on every poll and command.
+        """
+        result, elapsed_ms = await asyncio.get_running_loop().run_in_executor(
+            None, _timed_call, func, *args
+        )
+        self._profile(stage, elapsed_ms, on_loop=False)
+        return result
 
-    async def post_v1r(self, envelope_bytes: bytes, din: str) -> TEDAPIResponse:
-        """Wrap an envelope in a signed ``RoutableMessage`` and POST it."""
-        routable = combined_pb2.RoutableMessage()
-        routable.to_destination.domain = combined_pb2.DOMAIN_ENERGY_DEVICE
-        routable.protobuf_message_as_bytes = envelope_bytes
-        routable.uuid = str(uuid.uuid4()).encode()
+    def schedule_presign(self, envelope_bytes: bytes, din: str) -> None:
+        """Sign the next copy of a repeating request ahead of time.
 
-        expires_at = math.ceil(time.time()) + _SIGNATURE_TTL_SECONDS
-        tlv = self._build_tlv_payload(
-            din, expires_at, routable.protobuf_message_as_bytes
+        Used for the DCQ poll: the envelope never changes, so the next poll's
+        signed ``RoutableMessage`` is prepared in the executor between polls
+        and ``post_v1r`` sends it without waiting on the signature.
+        """
+        if self._presign_task is not None and not self._presign_task.done():
+            return
+        self._presign_task = asyncio.get_running_loop().create_task(
+            self._async_presign(envelope_bytes, din)
         )
-        signature = self._sign(tlv)
 
-        routable.signature_data.signer_identity.public_key = self._public_key_der
-        routable.signature_data.rsa_data.expires_at = expires_at
-        routable.signature_data.rsa_data.signature = signature
+    async def _async_presign(self, envelope_bytes: bytes, din: str) -> None:
+        # build_signed_bytes rounds expiry up, so this is a lower bound.
+        expires_at = time.time() + _SIGNATURE_TTL_SECONDS
+        try:
+            payload = await self.async_offload(
+                "presign", self.build_signed_bytes, envelope_bytes, din
+            )
+        except Exception as err:
+            _LOGGER.debug("v1r pre-signing failed: %s", err)
+            return
+        self._presigned = _PresignedRequest(envelope_bytes, din, payload, expires_at)
+
+    def _take_presigned(self, envelope_bytes: bytes, din: str) -> bytes | None:
+        presigned = self._presigned
+        if (
+            presigned is None
+            or presigned.envelope_bytes != envelope_bytes
+            or presigned.din != din
+        ):
+            return None
+        # Each signed message carries its own uuid, so use it at most once.
+        self._presigned = None
+        if presigned.expires_at - time.time() < _PRESIGN_MIN_REMAINING_SECONDS:
+            return None
+        self._stats.presigned_hits += 1
+        return presigned.payload
+
+    async def post_v1r(
+        self,
+        envelope_bytes: bytes,
+        din: str,
+        *,
+        idempotent: bool = False,
+    ) -> TEDAPIResponse:
+        """Wrap an envelope in a signed ``RoutableMessage`` and POST it.
+
+        Only ``idempotent`` (read-only) requests are retried when the gateway
+        drops the keep-alive connection. The gateway may already have applied
+        a write before the drop, so writes surface the error instead.
+        """
+        payload = self._take_presigned(envelope_bytes, din)
+        if payload is None:
+            payload = await self.async_offload(
+                "sign", self.build_signed_bytes, envelope_bytes, din
+            )
 
         url = f"https://{self._host}/tedapi/v1r"
-        payload = routable.SerializeToString()
         headers = {"Content-Type": "application/octet-stream"}
 
         _LOGGER.debug(
             "v1r POST to %s with DIN=%s, envelope=%d bytes",
             url, din, len(payload),
         )
-        try:
-            async with await self._session() as sess:
+        for attempt in range(2 if idempotent else 1):
+            if attempt:
+                # A fresh signature, so the retry is never a replay.
+                payload = await self.async_offload(
+                    "sign", self.build_signed_bytes, envelope_bytes, din
+                )
+            started = time.monotonic()
+            ok = False
+            try:
+                sess = await self._session()
                 async with sess.post(url, data=payload, headers=headers) as resp:
                     http_status = resp.status
                     if http_status != 200:
@@ -271,18 +554,25 @@ class TEDAPIv1rTransport:
                         )
                         return TEDAPIResponse(False, None, http_status=http_status)
                     raw = await resp.read()
-        except asyncio.TimeoutError as err:
-            raise PowerwallUnreachableError(
-                f"Timed out connecting to Powerwall gateway at {self._host}"
-            ) from err
-        except aiohttp.ClientError as err:
-            raise PowerwallUnreachableError(str(err)) from err
-
-        resp_msg = combined_pb2.RoutableMessage()
-        try:
-            resp_msg.ParseFromString(raw)
-        except Exception as err:
-            raise PowerwallLocalError(f"Malformed v1r response: {err}") from err
+                    ok = True
+                    break
+            except aiohttp.ServerDisconnectedError as err:
+                # The gateway may drop an idle keep-alive connection between
+                # polls; retry a read once on a fresh connection before
+                # reporting it.
+                if attempt or not idempotent:
+                    raise PowerwallUnreachableError(str(err)) from err
+                self._stats.stale_retries += 1
+            except asyncio.TimeoutError as err:
+                raise PowerwallUnreachableError(
+                    f"Timed out connecting to Powerwall gateway at {self._host}"
+                ) from err
+            except aiohttp.ClientError as err:
+                raise PowerwallUnreachableError(str(err)) from err
+            finally:
+                self._stats.record((time.monotonic() - started) * 1000, ok)
+
+        resp_msg = await self.async_offload("decode", _parse_routable_message, raw)
 
         fault = resp_msg.signed_message_status.message_fault
         if fault != combined_pb2.MESSAGEFAULT_ERROR_NONE:
@@ -392,19 +682,16 @@ class TEDAPIv1rTransport:
         req.domain = combined_pb2.FILE_STORE_API_DOMAIN_CONFIG_JSON
         req.name = "config.json"
 
-        resp = await self.post_v1r(envelope.SerializeToString(), din)
+        resp = await self.post_v1r(
+            envelope.SerializeToString(), din, idempotent=True
+        )
         if not resp.ok or not resp.inner_bytes:
             return None
-        try:
-            env = combined_pb2.MessageEnvelope()
-            env.ParseFromString(resp.inner_bytes)
-            if env.HasField("filestore"):
-                blob = env.filestore.readFileResponse.file.blob
-                return json.loads(blob.decode("utf-8"))
-        except Exception as err:
-            _LOGGER.debug("read_config parse error: %s", err)
-        return None
+        return await self.async_offload(
+            "decode_config", _parse_config_blob, resp.inner_bytes
+        )
 
+    @_invalidates_config
     async def write_config(self, din: str, updates: dict[str, Any]) -> bool:
         """Read-modify-write ``config.json`` via FileStore updateFileRequest.
 
@@ -420,7 +707,9 @@ class TEDAPIv1rTransport:
         r.domain = combined_pb2.FILE_STORE_API_DOMAIN_CONFIG_JSON
         r.name = "config.json"
 
-        read_resp = await self.post_v1r(read_env.SerializeToString(), din)
+        read_resp = await self.post_v1r(
+            read_env.SerializeToString(), din, idempotent=True
+        )
         if not read_resp.ok or not read_resp.inner_bytes:
             return False
 
@@ -466,6 +755,7 @@ class TEDAPIv1rTransport:
         except Exception:
             return False
 
+    @_invalidates_config
     async def set_island_mode(
         self,
         din: str,
@@ -540,6 +830,7 @@ class TEDAPIv1rTransport:
             _LOGGER.warning("set_island_mode: response parse error: %s", err)
         return False
 
+    @_invalidates_config
     async def trigger_islanding(self, din: str) -> bool:
         """Send ``triggerIslandingBlackStartRequest`` — the actual contactor-open command.
 
@@ -587,6 +878,7 @@ class TEDAPIv1rTransport:
             _LOGGER.warning("trigger_islanding: response parse error: %s", err)
         return False
 
+    @_invalidates_config
     async def schedule_manual_backup(self, din: str, duration_s: int) -> bool:
         """Trigger Tesla's "Storm Watch Manual Backup" — holds SOC, stops export.
 
@@ -624,6 +916,7 @@ class TEDAPIv1rTransport:
         except Exception:
             return False
 
+    @_invalidates_config
     async def cancel_manual_backup(self, din: str) -> bool:
         """Cancel an active manual backup event."""
         env = combined_pb2.MessageEnvelope()
@@ -652,7 +945,7 @@ class TEDAPIv1rTransport:
         env.recipient.din = din
         env.teg.get_backup_events_request.SetInParent()
 
-        resp = await self.post_v1r(env.SerializeToString(), din)
+        resp = await self.post_v1r(env.SerializeToString(), din, idempotent=True)
         if not resp.ok or not resp.inner_bytes:
             return None
         try:
@@ -702,7 +995,7 @@ class TEDAPIv1rTransport:
         env.recipient.din = din
         getattr(env.common, request_field).SetInParent()
 
-        resp = await self.post_v1r(env.SerializeToString(), din)
+        resp = await self.post_v1r(env.SerializeToString(), din, idempotent=True)
         if not resp.ok or not resp.inner_bytes:
             return None
         try:
@@ -781,7 +1074,7 @@ class TEDAPIv1rTransport:
         env.recipient.din = din
         env.authorization.list_authorized_clients_request.SetInParent()
 
-        resp = await self.post_v1r(env.SerializeToString(), din)
+        resp = await self.post_v1r(env.SerializeToString(), din, idempotent=True)
         if not resp.ok or not resp.inner_bytes:
             return None
         try:
@@ -305,6 +305,9 @@ async def ensure_client(
         entry, existing
     ):
         return existing
+    if isinstance(existing, PowerwallLocalClient):
+        # Release the stale client's keep-alive connections to the old host.
+        await existing.async_close()
 
     # PowerwallLocalClient constructs the signed TEDAPI transport immediately.
     # Warm the shared SSL context off the event loop first so cloud-only paired
@@ -4266,8 +4266,9 @@ AMBER_USAGE_SENSORS = (
 class LPForecastSensor(PowerSyncCurrencyMixin, CoordinatorEntity, SensorEntity):
     """Sensor for LP optimizer forecast data (solar, load, prices).
 
-    Reads forecast data stored by the OptimizationCoordinator each
-    optimization cycle via get_forecast_data().
+    Reads the read-only forecast snapshot the OptimizationCoordinator
+    publishes each optimization cycle via get_forecast_data(); all LP
+    sensors share one snapshot per solve.
     """
 
     # The "forecast" attribute is a large rolling prediction array (≈48h @ 5min)
@@ -6402,6 +6403,9 @@ class FlowPowerNetworkTariffSensor(PowerSyncCurrencyMixin, SensorEntity):
         }
         if avg_daily is not None:
             attrs["avg_daily_tariff"] = round(avg_daily, 2)
+        rate_table = domain_data.get("fp_network_tariff_table")
+        if rate_table is not None:
+            attrs["rate_table"] = rate_table.stats()
         return _entity_currency_attrs(self, attrs)
 
 
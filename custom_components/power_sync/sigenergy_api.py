@@ -83,8 +83,9 @@ def convert_static_tariff_schedule_to_sigenergy(
     if not isinstance(tou_periods, dict) or not isinstance(buy_rates, dict):
         return [], []
 
-    from .tariff_time import find_matching_tou_period
+    from .tariff_time import compile_tou_week
 
+    week = compile_tou_week(tou_periods, buy_rates, sell_rates)
     base = (now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
     buy_by_sigenergy_day: dict[int, list[dict]] = {}
     sell_by_sigenergy_day: dict[int, list[dict]] = {}
@@ -97,13 +98,7 @@ def convert_static_tariff_schedule_to_sigenergy(
 
         for slot in range(48):
             slot_time = day_base + timedelta(minutes=slot * 30)
-            period = find_matching_tou_period(
-                tou_periods,
-                slot_time,
-                default="OFF_PEAK",
-                buy_rates=buy_rates,
-                sell_rates=sell_rates,
-            )
+            period = week.period_at(slot_time, default="OFF_PEAK")
             period_key = f"PERIOD_{slot_time.hour:02d}_{slot_time.minute:02d}"
             buy = _tariff_rate_for_period(buy_rates, period, default=0.0)
             sell = _tariff_rate_for_period(
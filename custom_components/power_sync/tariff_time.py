@@ -1,12 +1,33 @@
-"""Time-of-use tariff period matching helpers."""
+"""Time-of-use tariff period matching helpers.
+
+``find_matching_tou_period`` is the reference matcher. Anything that prices
+many timestamps against the same tariff should use ``compile_tou_week`` or
+``compile_tariff_timeline`` instead: they evaluate the matcher once per
+boundary segment and answer each timestamp from a dense
+(season, Tesla day, minute-of-day) table.
+"""
 
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
-from datetime import datetime
+import copy
+from datetime import datetime, timedelta
+from functools import lru_cache
 import math
 from typing import Any
 
+_DAY_MINUTES = 24 * 60
+# 2024-01-07 was a Sunday, i.e. Tesla day 0.
+_TESLA_WEEK_START = datetime(2024, 1, 7)
+_TIMELINE_KEYS = (
+    "seasons",
+    "tou_periods",
+    "buy_rates",
+    "sell_rates",
+    "season_buy_rates",
+    "season_sell_rates",
+)
+
 
 def tesla_day_of_week(when: datetime) -> int:
     """Return Tesla day of week for a datetime: Sunday=0, Monday=1."""
@@ -222,3 +243,146 @@ def find_matching_tou_period(
             match[0],
         ),
     )[0]
+
+
+class TouWeekTable:
+    """Matching TOU period for every Tesla day and minute of one week.
+
+    The matcher's answer can only change at a period's start or end minute
+    (or at midnight), so the table is filled by calling
+    ``find_matching_tou_period`` once per segment between those boundaries.
+    Lookups are then a single index, with identical results.
+    """
+
+    __slots__ = ("_slots",)
+
+    def __init__(
+        self,
+        tou_periods: Mapping[str, Any],
+        buy_rates: Mapping[str, float] | None = None,
+        sell_rates: Mapping[str, float] | None = None,
+    ) -> None:
+        boundaries = {0, _DAY_MINUTES}
+        for period_data in tou_periods.values():
+            for period in period_entries(period_data):
+                boundaries.add(_time_minutes(period, "from", 0))
+                boundaries.add(_time_minutes(period, "to", 24))
+        edges = sorted(boundaries)
+
+        slots: list[str | None] = [None] * (7 * _DAY_MINUTES)
+        for day in range(7):
+            day_start = _TESLA_WEEK_START + timedelta(days=day)
+            offset = day * _DAY_MINUTES
+            for start, end in zip(edges, edges[1:]):
+                name = find_matching_tou_period(
+                    tou_periods,
+                    day_start + timedelta(minutes=start),
+                    default=None,
+                    buy_rates=buy_rates,
+                    sell_rates=sell_rates,
+                )
+                slots[offset + start:offset + end] = [name] * (end - start)
+        self._slots = slots
+
+    def period_for(
+        self,
+        tesla_dow: int,
+        minute_of_day: int,
+        default: str = "OFF_PEAK",
+    ) -> str:
+        """Return the period for a Tesla day (Sunday=0) and minute of day."""
+        name = self._slots[(tesla_dow % 7) * _DAY_MINUTES + minute_of_day]
+        return default if name is None else name
+
+    def period_at(self, when: datetime, default: str = "OFF_PEAK") -> str:
+        """Return the period for a local datetime."""
+        return self.period_for(
+            tesla_day_of_week(when),
+            when.hour * 60 + when.minute,
+            default,
+        )
+
+
+class TariffTimeline:
+    """Season-aware TOU lookups compiled from one tariff schedule.
+
+    Accepts the same shape as ``tariff_components_for_datetime`` and
+    resolves each calendar month's season, components and week table once.
+    """
+
+    __slots__ = ("_months",)
+
+    def __init__(self, tariff: Mapping[str, Any]) -> None:
+        by_season: dict[str, tuple[tuple, TouWeekTable]] = {}
+        months: list[tuple[tuple, TouWeekTable] | None] = [None]
+        for month in range(1, 13):
+            components = tariff_components_for_datetime(tariff, datetime(2024, month, 1))
+            season_name = components[3]
+            if season_name not in by_season:
+                by_season[season_name] = (
+                    components,
+                    TouWeekTable(components[0], components[1], components[2]),
+                )
+            months.append(by_season[season_name])
+        self._months = months
+
+    def components(
+        self,
+        when: datetime,
+    ) -> tuple[Mapping[str, Any], Mapping[str, float], Mapping[str, float], str]:
+        """Return what ``tariff_components_for_datetime`` would for ``when``."""
+        return self._months[when.month][0]
+
+    def season_at(self, when: datetime) -> str:
+        """Return the tariff season for a local datetime."""
+        return self._months[when.month][0][3]
+
+    def period_at(self, when: datetime, default: str = "OFF_PEAK") -> str:
+        """Return the season-correct TOU period for a local datetime."""
+        return self._months[when.month][1].period_at(when, default)
+
+
+class _Signed:
+    """Cache key that compares tariff content, not dict identity."""
+
+    __slots__ = ("value", "signature")
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+        self.signature = repr(value)
+
+    def __hash__(self) -> int:
+        return hash(self.signature)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Signed) and self.signature == other.signature
+
+
+@lru_cache(maxsize=16)
+def _compiled_week(key: _Signed) -> TouWeekTable:
+    return TouWeekTable(*copy.deepcopy(key.value))
+
+
+@lru_cache(maxsize=8)
+def _compiled_timeline(key: _Signed) -> TariffTimeline:
+    return TariffTimeline(dict(zip(_TIMELINE_KEYS, copy.deepcopy(key.value))))
+
+
+def compile_tou_week(
+    tou_periods: Mapping[str, Any],
+    buy_rates: Mapping[str, float] | None = None,
+    sell_rates: Mapping[str, float] | None = None,
+) -> TouWeekTable:
+    """Return the shared week table for one set of TOU periods and rates.
+
+    Tables are cached by content, so every caller pricing the same tariff
+    version reuses one build and an edited tariff compiles afresh.
+    """
+    return _compiled_week(_Signed((tou_periods, buy_rates, sell_rates)))
+
+
+def compile_tariff_timeline(tariff: Mapping[str, Any]) -> TariffTimeline:
+    """Return the shared season-aware timeline for a tariff schedule."""
+    return _compiled_timeline(
+        _Signed(tuple(tariff.get(key) for key in _TIMELINE_KEYS))
+    )
@@ -3,6 +3,13 @@
 Provides functions to look up network tariff rates, compute daily averages,
 and discover available tariff codes — all while suppressing the library's
 internal print() statements.
+
+``spot_to_tariff`` is slow enough that per-interval calls add up: every
+price refresh priced each forecast interval and each half-hour PEA slot
+through it. ``NetworkTariffRateTable`` materializes the rates for one
+(network, tariff code) at 5-minute resolution for the next few NEM days,
+persists them through an HA ``Store`` and only computes the slots that are
+new when the day rolls over, so Flow Power consumers read a list instead.
 """
 from __future__ import annotations
 
@@ -10,11 +17,23 @@ import importlib
 import io
 import logging
 import sys
+import time
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+NETWORK_TARIFF_SLOT_SECONDS = 5 * 60
+NETWORK_TARIFF_TABLE_DAYS = 3
+NETWORK_TARIFF_STORE_VERSION = 1
+# A failed build (library missing or broken) is retried at most this often;
+# lookups fall back to direct ``spot_to_tariff`` calls in the meantime.
+NETWORK_TARIFF_RETRY_SECONDS = 15 * 60
+_SLOTS_PER_DAY = 24 * 60 * 60 // NETWORK_TARIFF_SLOT_SECONDS
+# NEM market time (AEST, no daylight saving) — table days start at its midnight.
+_NEM_TZ = timezone(timedelta(hours=10))
+
 
 def with_hysteresis(
     current: float,
@@ -117,6 +136,304 @@ def get_network_tariff_rate(
         return None
 
 
+def _aemo_to_tariff_version() -> str | None:
+    """Return the installed aemo_to_tariff version (blocking metadata read)."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover - stdlib since 3.8
+        return None
+    try:
+        return version("aemo_to_tariff")
+    except PackageNotFoundError:
+        return None
+
+
+class NetworkTariffRateTable:
+    """Precomputed network tariff rates for one (network, tariff code).
+
+    Slot ``i`` holds the rate for the 5-minute interval starting
+    ``start_slot + i`` (in units of ``NETWORK_TARIFF_SLOT_SECONDS`` since the
+    epoch), i.e. exactly what ``get_network_tariff_rate`` returns for any
+    timestamp inside that interval. Lookups outside the table, or for slots
+    the library failed on, fall through to ``get_network_tariff_rate``.
+
+    The table is rebuilt only when the NEM date range moves on or the
+    installed aemo_to_tariff version changes; rates for days already in the
+    table are carried over, so a rollover computes a single new day.
+    """
+
+    def __init__(
+        self,
+        network: str,
+        tariff_code: str,
+        *,
+        days: int = NETWORK_TARIFF_TABLE_DAYS,
+        store: Any | None = None,
+    ) -> None:
+        self.network = network
+        self.tariff_code = tariff_code
+        self.days = days
+        self._store = store
+        self._loaded = store is None
+        self._library_version: str | None = None
+        self._library_checked = False
+        # (start slot, rates) swapped as one tuple so executor readers never
+        # see a start slot paired with another window's rates.
+        self._window: tuple[int | None, list[float | None]] = (None, [])
+        self._table_library: str | None = None
+        self._building = False
+        self._failed_at: float | None = None
+        self.built_at: datetime | None = None
+        self.build_seconds = 0.0
+        self.computed_slots = 0
+        self.hits = 0
+        self.misses = 0
+
+    def attach_store(self, store: Any) -> None:
+        """Persist the table through ``store`` if it has none yet."""
+        if self._store is None:
+            self._store = store
+            self._loaded = False
+
+    @staticmethod
+    def window_start_slot(now: datetime | None = None) -> int:
+        """Return the first slot of the table window containing ``now``."""
+        current = (now or datetime.now(tz=_NEM_TZ)).astimezone(_NEM_TZ)
+        midnight = current.replace(hour=0, minute=0, second=0, microsecond=0)
+        return int(midnight.timestamp()) // NETWORK_TARIFF_SLOT_SECONDS
+
+    def is_current(self, now: datetime | None = None) -> bool:
+        """Return True when the table covers the window for ``now``."""
+        start_slot, rates = self._window
+        return (
+            start_slot == self.window_start_slot(now)
+            and len(rates) == self.days * _SLOTS_PER_DAY
+            and self._table_library == self._library_version
+        )
+
+    def rate_at(self, dt: datetime) -> float | None:
+        """Return the network tariff rate in c/kWh for ``dt``."""
+        start_slot, rates = self._window
+        if start_slot is not None and dt.tzinfo is not None:
+            index = int(dt.timestamp()) // NETWORK_TARIFF_SLOT_SECONDS - start_slot
+            if 0 <= index < len(rates) and rates[index] is not None:
+                self.hits += 1
+                return rates[index]
+        self.misses += 1
+        return get_network_tariff_rate(dt, self.network, self.tariff_code)
+
+    async def async_refresh(self, hass: Any, now: datetime | None = None) -> bool:
+        """Load or (re)build the table for ``now``; return True if it changed."""
+        await self._async_load()
+        if not self._library_checked:
+            self._library_version = await hass.async_add_executor_job(
+                _aemo_to_tariff_version
+            )
+            self._library_checked = True
+        if self.is_current(now) or self._building:
+            return False
+        if (
+            self._failed_at is not None
+            and time.monotonic() - self._failed_at < NETWORK_TARIFF_RETRY_SECONDS
+        ):
+            return False
+
+        start_slot = self.window_start_slot(now)
+        self._building = True
+        try:
+            started = time.perf_counter()
+            rates, computed = await hass.async_add_executor_job(
+                self._build_rates, start_slot
+            )
+            elapsed = time.perf_counter() - started
+        except Exception as err:  # noqa: BLE001 - lookups fall back to direct calls
+            self._failed_at = time.monotonic()
+            _LOGGER.warning(
+                "Could not build network tariff table for %s/%s: %s",
+                self.network, self.tariff_code, err,
+            )
+            return False
+        finally:
+            self._building = False
+
+        self._failed_at = None
+        self._window = (start_slot, rates)
+        self._table_library = self._library_version
+        self.built_at = datetime.now(tz=timezone.utc)
+        self.build_seconds = elapsed
+        self.computed_slots = computed
+        _LOGGER.debug(
+            "Network tariff table for %s/%s built: %d/%d slots computed in %.0f ms",
+            self.network, self.tariff_code, computed, len(rates), elapsed * 1000,
+        )
+        if self._store is not None:
+            self._store.async_delay_save(self.to_dict, 1)
+        return True
+
+    def _build_rates(self, start_slot: int) -> tuple[list[float | None], int]:
+        """Compute the window starting at ``start_slot`` (blocking)."""
+        from aemo_to_tariff import spot_to_tariff
+
+        previous_start, previous_rates = self._window
+        if previous_start is None or self._table_library != self._library_version:
+            previous_start, previous_rates = 0, []
+
+        slot_span = timedelta(seconds=NETWORK_TARIFF_SLOT_SECONDS)
+        rates: list[float | None] = []
+        computed = 0
+        failures = 0
+        last_error: Exception | None = None
+        with _suppress_stdout():
+            for slot in range(start_slot, start_slot + self.days * _SLOTS_PER_DAY):
+                reuse = slot - previous_start
+                if 0 <= reuse < len(previous_rates) and previous_rates[reuse] is not None:
+                    rates.append(previous_rates[reuse])
+                    continue
+                slot_start = datetime.fromtimestamp(
+                    slot * NETWORK_TARIFF_SLOT_SECONDS, tz=_NEM_TZ
+                )
+                computed += 1
+                try:
+                    rate = spot_to_tariff(
+                        interval_time=slot_start + slot_span,
+                        network=self.network,
+                        tariff=self.tariff_code,
+                        rrp=0,
+                        dlf=1.0,
+                        mlf=1.0,
+                        market=1.0,
+                    )
+                    rates.append(float(rate))
+                except Exception as err:  # noqa: BLE001 - counted below
+                    rates.append(None)
+                    failures += 1
+                    last_error = err
+
+        if computed and failures == computed:
+            raise RuntimeError(f"every tariff lookup failed ({last_error})")
+        if failures:
+            _LOGGER.warning(
+                "Network tariff table for %s/%s: %d slot(s) failed, last error: %s",
+                self.network, self.tariff_code, failures, last_error,
+            )
+        return rates, computed
+
+    async def _async_load(self) -> None:
+        """Restore the persisted table once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = await self._store.async_load()
+        except Exception as err:  # noqa: BLE001 - the table is rebuilt instead
+            _LOGGER.warning("Could not restore network tariff table: %s", err)
+            return
+        self.from_dict(data)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot."""
+        start_slot, rates = self._window
+        return {
+            "network": self.network,
+            "tariff_code": self.tariff_code,
+            "library": self._table_library,
+            "start_slot": start_slot,
+            "rates": [round(rate, 6) if rate is not None else None for rate in rates],
+            "built_at": self.built_at.isoformat() if self.built_at else None,
+            "build_seconds": round(self.build_seconds, 4),
+        }
+
+    def from_dict(self, data: dict[str, Any] | None) -> None:
+        """Restore a ``to_dict`` snapshot for the same network and tariff code."""
+        if not isinstance(data, dict):
+            return
+        if (data.get("network"), data.get("tariff_code")) != (
+            self.network,
+            self.tariff_code,
+        ):
+            return
+        try:
+            start_slot = int(data["start_slot"])
+            rates = [
+                float(rate) if rate is not None else None for rate in data["rates"]
+            ]
+            built_at = (
+                datetime.fromisoformat(data["built_at"])
+                if data.get("built_at")
+                else None
+            )
+            build_seconds = float(data.get("build_seconds") or 0.0)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Discarding malformed network tariff table: %s", err)
+            return
+        self._window = (start_slot, rates)
+        self._table_library = data.get("library")
+        self.built_at = built_at
+        self.build_seconds = build_seconds
+
+    def stats(self) -> dict[str, Any]:
+        """Return coverage, build time and hit-rate counters for diagnostics."""
+        start_slot, rates = self._window
+        lookups = self.hits + self.misses
+        window_start = window_end = None
+        if start_slot is not None:
+            window_start = datetime.fromtimestamp(
+                start_slot * NETWORK_TARIFF_SLOT_SECONDS, tz=_NEM_TZ
+            )
+            window_end = window_start + timedelta(
+                seconds=len(rates) * NETWORK_TARIFF_SLOT_SECONDS
+            )
+        return {
+            "network": self.network,
+            "tariff_code": self.tariff_code,
+            "window_start": window_start.isoformat() if window_start else None,
+            "window_end": window_end.isoformat() if window_end else None,
+            "slots": len(rates),
+            "built_at": self.built_at.isoformat() if self.built_at else None,
+            "build_ms": round(self.build_seconds * 1000, 1),
+            "computed_slots": self.computed_slots,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+_RATE_TABLES: dict[tuple[str, str], NetworkTariffRateTable] = {}
+
+
+def network_tariff_table(network: str, tariff_code: str) -> NetworkTariffRateTable:
+    """Return the shared rate table for a network and tariff code."""
+    key = (network, str(tariff_code))
+    table = _RATE_TABLES.get(key)
+    if table is None:
+        table = _RATE_TABLES[key] = NetworkTariffRateTable(network, str(tariff_code))
+    return table
+
+
+async def async_ensure_network_tariff_table(
+    hass: Any,
+    network: str,
+    tariff_code: str,
+    now: datetime | None = None,
+) -> NetworkTariffRateTable:
+    """Return the shared rate table, restored and current for ``now``."""
+    table = network_tariff_table(network, tariff_code)
+    if table._store is None:
+        from homeassistant.helpers.storage import Store
+
+        from .const import DOMAIN
+
+        slug = "".join(
+            char if char.isalnum() else "_"
+            for char in f"{network}_{tariff_code}".lower()
+        )
+        table.attach_store(
+            Store(hass, NETWORK_TARIFF_STORE_VERSION, f"{DOMAIN}.network_tariff.{slug}")
+        )
+    await table.async_refresh(hass, now)
+    return table
+
+
 def compute_avg_daily_tariff(
     network: str,
     tariff_code: str,
@@ -125,7 +442,8 @@ def compute_avg_daily_tariff(
 
     Samples all 48 half-hour slots (using today's date) and averages them.
     This value is subtracted in the v2 PEA formula so that the network
-    tariff component nets to zero over a full day.
+    tariff component nets to zero over a full day. Slots are read from the
+    shared ``NetworkTariffRateTable`` when it covers today.
 
     Args:
         network: aemo_to_tariff network parameter.
@@ -136,26 +454,18 @@ def compute_avg_daily_tariff(
     """
     try:
         from homeassistant.util import dt as dt_util
-        from aemo_to_tariff import spot_to_tariff
 
         now = dt_util.now()  # Uses HA configured timezone
         base_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
+        table = network_tariff_table(network, tariff_code)
         total = 0.0
         count = 0
         for slot in range(48):
-            slot_time = base_date + timedelta(minutes=slot * 30)
-            with _suppress_stdout():
-                rate = spot_to_tariff(
-                    interval_time=_dispatch_interval_end(slot_time),
-                    network=network,
-                    tariff=tariff_code,
-                    rrp=0,
-                    dlf=1.0,
-                    mlf=1.0,
-                    market=1.0,
-                )
-            total += float(rate)
+            rate = table.rate_at(base_date + timedelta(minutes=slot * 30))
+            if rate is None:
+                return None
+            total += rate
             count += 1
 
         if count == 0:
@@ -0,0 +1,207 @@
+"""Registry index of Tesla vehicle devices and their entities.
+
+EV planning resolves plug state, SoC, charge power and location for every
+vehicle on each evaluation. Walking the whole device registry and then the
+whole entity registry per device is quadratic on large installs, so this
+index groups the registry once and is rebuilt only after Home Assistant
+reports a device or entity registry change.
+
+Hosts without an event bus (test doubles, early setup) cannot be told about
+registry changes; the index then rebuilds on every lookup, which keeps
+results identical to a direct scan.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from .const import DOMAIN, TESLA_INTEGRATIONS
+
+_LOGGER = logging.getLogger(__name__)
+
+_DATA_KEY = f"{DOMAIN}_tesla_vehicle_index"
+_DEVICE_REGISTRY_UPDATED = "device_registry_updated"
+_ENTITY_REGISTRY_UPDATED = "entity_registry_updated"
+
+
+def tesla_vehicle_vin(device: Any) -> str | None:
+    """Return the VIN a Tesla-integration device identifies, if any.
+
+    Only a 17-character non-numeric identifier from one of the
+    ``TESLA_INTEGRATIONS`` domains is a vehicle; Powerwalls and Wall
+    Connectors register under the same domains with other identifiers.
+    """
+    for identifier in device.identifiers:
+        if len(identifier) >= 2 and identifier[0] in TESLA_INTEGRATIONS:
+            id_str = str(identifier[1])
+            if len(id_str) == 17 and not id_str.isdigit():
+                return id_str
+    return None
+
+
+class TeslaVehicleIndex:
+    """VIN -> device -> entity lookups over the HA registries.
+
+    Every accessor returns rows in registry order, so callers that stop at
+    the first matching entity see the same entity a full scan would.
+    """
+
+    def __init__(self, hass: Any) -> None:
+        self._hass = hass
+        self._stale = True
+        self._unsubs: list = []
+        self._devices: tuple[tuple[Any, str], ...] = ()
+        self._devices_by_vin: dict[str, tuple[tuple[Any, str], ...]] = {}
+        self._vin_by_device: dict[str, str] = {}
+        self._entities_by_device: dict[str, tuple[Any, ...]] = {}
+        self._vehicle_entities: tuple[tuple[Any, str], ...] = ()
+        self._vins: tuple[str, ...] = ()
+        self.hits = 0
+        self.rebuilds = 0
+
+        listen = getattr(getattr(hass, "bus", None), "async_listen", None)
+        if callable(listen):
+            from homeassistant.core import callback
+            from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+            @callback
+            def _async_invalidate(_event: Any) -> None:
+                self._stale = True
+
+            for event_type in (
+                getattr(dr, "EVENT_DEVICE_REGISTRY_UPDATED", _DEVICE_REGISTRY_UPDATED),
+                getattr(er, "EVENT_ENTITY_REGISTRY_UPDATED", _ENTITY_REGISTRY_UPDATED),
+            ):
+                self._unsubs.append(listen(event_type, _async_invalidate))
+
+    @property
+    def watching(self) -> bool:
+        """Return True when registry events keep the index current."""
+        return bool(self._unsubs)
+
+    def async_shutdown(self) -> None:
+        """Stop listening for registry changes."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self._stale = True
+
+    def _refresh(self) -> None:
+        if not self._stale and self.watching:
+            self.hits += 1
+            return
+
+        from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+        device_registry = dr.async_get(self._hass)
+        entity_registry = er.async_get(self._hass)
+
+        devices: list[tuple[Any, str]] = []
+        devices_by_vin: dict[str, list[tuple[Any, str]]] = {}
+        vin_by_device: dict[str, str] = {}
+        vins: list[str] = []
+        seen_vins: set[str] = set()
+        for device in getattr(device_registry, "devices", {}).values():
+            vin = tesla_vehicle_vin(device)
+            if vin is None:
+                continue
+            row = (device, vin)
+            devices.append(row)
+            devices_by_vin.setdefault(vin, []).append(row)
+            device_id = getattr(device, "id", None)
+            if device_id is not None:
+                vin_by_device[device_id] = vin
+            vin_key = vin.strip().lower()
+            if vin_key not in seen_vins:
+                seen_vins.add(vin_key)
+                vins.append(vin)
+
+        entities_by_device: dict[str, list[Any]] = {}
+        vehicle_entities: list[tuple[Any, str]] = []
+        for entity in getattr(entity_registry, "entities", {}).values():
+            vin = vin_by_device.get(entity.device_id)
+            if vin is None:
+                continue
+            entities_by_device.setdefault(entity.device_id, []).append(entity)
+            vehicle_entities.append((entity, vin))
+
+        self._devices = tuple(devices)
+        self._devices_by_vin = {vin: tuple(rows) for vin, rows in devices_by_vin.items()}
+        self._vin_by_device = vin_by_device
+        self._entities_by_device = {
+            device_id: tuple(entities)
+            for device_id, entities in entities_by_device.items()
+        }
+        self._vehicle_entities = tuple(vehicle_entities)
+        self._vins = tuple(vins)
+        self._stale = False
+        self.rebuilds += 1
+        _LOGGER.debug(
+            "Tesla vehicle index rebuilt: %d device(s), %d entities",
+            len(devices),
+            len(vehicle_entities),
+        )
+
+    def vehicle_devices(self, vin: str | None = None) -> tuple[tuple[Any, str], ...]:
+        """Return ``(device, vin)`` rows, optionally only for one VIN."""
+        self._refresh()
+        if vin is None:
+            return self._devices
+        return self._devices_by_vin.get(vin, ())
+
+    def device_entities(self, device_id: str) -> tuple[Any, ...]:
+        """Return the entity registry entries attached to a vehicle device."""
+        self._refresh()
+        return self._entities_by_device.get(device_id, ())
+
+    def vehicle_entities(self, vin: str | None = None) -> tuple[tuple[Any, str], ...]:
+        """Return ``(entity, vin)`` rows for vehicle devices, optionally one VIN."""
+        self._refresh()
+        if vin is None:
+            return self._vehicle_entities
+        return tuple(
+            (entity, device_vin)
+            for device, device_vin in self._devices_by_vin.get(vin, ())
+            for entity in self._entities_by_device.get(device.id, ())
+        )
+
+    def device_vin(self, device_id: str | None) -> str | None:
+        """Return the VIN for a vehicle device id."""
+        self._refresh()
+        return self._vin_by_device.get(device_id) if device_id else None
+
+    def vins(self) -> tuple[str, ...]:
+        """Return each vehicle VIN once (case-insensitive) in registry order."""
+        self._refresh()
+        return self._vins
+
+    def stats(self) -> dict[str, Any]:
+        """Return lookup hit / rebuild counters for diagnostics."""
+        return {
+            "watching": self.watching,
+            "hits": self.hits,
+            "rebuilds": self.rebuilds,
+            "devices": len(self._devices),
+            "entities": len(self._vehicle_entities),
+        }
+
+
+def tesla_vehicle_index(hass: Any) -> TeslaVehicleIndex:
+    """Return the shared index for ``hass``, creating it on first use."""
+    data = getattr(hass, "data", None)
+    if not isinstance(data, dict):
+        return TeslaVehicleIndex(hass)
+    index = data.get(_DATA_KEY)
+    if index is None:
+        index = data[_DATA_KEY] = TeslaVehicleIndex(hass)
+    return index
+
+
+def async_shutdown_tesla_vehicle_index(hass: Any) -> None:
+    """Drop the shared index and its registry listeners."""
+    data = getattr(hass, "data", None)
+    if isinstance(data, dict):
+        index = data.pop(_DATA_KEY, None)
+        if index is not None:
+            index.async_shutdown()
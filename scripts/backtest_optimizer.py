@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""Offline backtest: replay price, solar and load days through BatteryOptimizer.
+
+Each day is replayed interval by interval the way the coordinator drives the
+optimizer: solve over the remaining horizon, execute only the first
+``ScheduleAction`` against the day's *actual* solar and load, advance the
+simulated battery, and pass the result back as ``previous_result`` so
+receding-horizon re-solves are exercised too.  Days are independent and run
+in parallel on a process pool.
+
+The report covers realized cost against a no-battery baseline, solve latency
+percentiles, the solver mix and every non-HiGHS fallback.  ``--json`` writes
+it for later runs to ``--compare`` against, which exits non-zero when cost,
+p95 latency or the fallback count regress beyond the given tolerances.
+
+Fixture files are JSON::
+
+    {
+      "interval_minutes": 30,
+      "battery": {"capacity_wh": 13500, "max_charge_w": 5000, ...},
+      "optimize": {"allow_battery_export": true},
+      "days": [
+        {
+          "date": "2026-01-05", "utc_offset_hours": 10, "initial_soc": 0.5,
+          "import_prices": [...], "export_prices": [...],
+          "solar_kw": [...], "load_kw": [...],
+          "solar_forecast_kw": [...], "load_forecast_kw": [...]
+        }
+      ]
+    }
+
+Series start at local midnight and may run past the day to give the last
+intervals a full horizon.  Forecasts are optional; without them the replay
+uses the actual series (perfect foresight).  ``battery`` keys are
+``BatteryOptimizer`` constructor arguments and ``optimize`` keys are passed
+to every ``optimize`` call; ``--set key=value`` overrides either.
+
+Run from the repository root:
+    python scripts/backtest_optimizer.py FIXTURE.json [--workers N] [--json OUT]
+    python scripts/backtest_optimizer.py --synthetic 14 [--write-fixture OUT]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import json
+import logging
+import math
+import os
+import random
+import sys
+import time
+import types
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+
+DEFAULT_BATTERY = {
+    "capacity_wh": 13500,
+    "max_charge_w": 5000,
+    "max_discharge_w": 5000,
+    "backup_reserve": 0.20,
+    "horizon_hours": 24,
+}
+
+
+def _install_stubs() -> None:
+    """Install minimal Home Assistant stubs for offline optimizer replays."""
+    ha_root = types.ModuleType("homeassistant")
+    ha_util = types.ModuleType("homeassistant.util")
+    ha_dt = types.ModuleType("homeassistant.util.dt")
+    ha_dt.now = lambda *args, **kwargs: datetime.now(timezone.utc)
+    ha_dt.utcnow = lambda *args, **kwargs: datetime.now(timezone.utc)
+    ha_dt.UTC = timezone.utc
+    ha_util.dt = ha_dt
+    ha_root.util = ha_util
+
+    sys.modules["homeassistant"] = ha_root
+    sys.modules["homeassistant.util"] = ha_util
+    sys.modules["homeassistant.util.dt"] = ha_dt
+
+    ps_module = types.ModuleType("power_sync")
+    ps_module.__path__ = [str(COMPONENT_ROOT)]
+    sys.modules["power_sync"] = ps_module
+
+    optimization_module = types.ModuleType("power_sync.optimization")
+    optimization_module.__path__ = [str(COMPONENT_ROOT / "optimization")]
+    sys.modules["power_sync.optimization"] = optimization_module
+
+
+_OPTIMIZER_MODULE: Any = None
+
+
+def _optimizer_module() -> Any:
+    """Import battery_optimizer behind the stubs once per process."""
+    global _OPTIMIZER_MODULE
+    if _OPTIMIZER_MODULE is None:
+        _install_stubs()
+        _OPTIMIZER_MODULE = importlib.import_module(
+            "power_sync.optimization.battery_optimizer"
+        )
+    return _OPTIMIZER_MODULE
+
+
+def synthetic_days(
+    count: int,
+    interval_minutes: int = 30,
+    lookahead_hours: int = 12,
+    seed: int = 1,
+    start: date = date(2026, 1, 5),
+) -> list[dict[str, Any]]:
+    """Return reproducible TOU-priced days with cloudy solar and noisy load."""
+    rng = random.Random(seed)
+    per_hour = 60 // interval_minutes
+    total = (24 + lookahead_hours) * per_hour
+
+    def hourly_series(day_index: int) -> dict[str, list[float]]:
+        cloud = [rng.uniform(0.35, 1.0) for _ in range(3)]
+        series: dict[str, list[float]] = {
+            "import_prices": [],
+            "export_prices": [],
+            "solar_kw": [],
+            "load_kw": [],
+        }
+        for slot in range(total):
+            hour = (slot / per_hour) % 24
+            offset_day = int(slot / per_hour // 24)
+            if 16 <= hour < 21:
+                buy = 0.48 + (rng.uniform(0.0, 1.2) if rng.random() < 0.02 else 0.0)
+            elif 7 <= hour < 16 or 21 <= hour < 23:
+                buy = 0.28
+            else:
+                buy = 0.16
+            sell = 0.22 if 17 <= hour < 20 else (0.0 if 10 <= hour < 14 else 0.05)
+            daylight = max(0.0, math.sin(math.pi * (hour - 6.0) / 13.0)) if 6 <= hour < 19 else 0.0
+            solar = 6.0 * daylight * cloud[offset_day] * rng.uniform(0.8, 1.0)
+            load = (
+                0.35
+                + (1.2 if 6.5 <= hour < 8.5 else 0.0)
+                + (2.0 if 17 <= hour < 21.5 else 0.0)
+                + rng.uniform(0.0, 0.4)
+            )
+            series["import_prices"].append(round(buy + rng.uniform(-0.01, 0.01), 4))
+            series["export_prices"].append(round(sell, 4))
+            series["solar_kw"].append(round(solar, 3))
+            series["load_kw"].append(round(load, 3))
+        return series
+
+    return [
+        {
+            "date": (start + timedelta(days=index)).isoformat(),
+            "utc_offset_hours": 10,
+            "initial_soc": round(rng.uniform(0.25, 0.6), 3),
+            **hourly_series(index),
+        }
+        for index in range(count)
+    ]
+
+
+def _planned_power_kw(action: Any) -> tuple[float, float]:
+    """Return the power a forced action asks for, (charge_kw, discharge_kw)."""
+    charge_kw = max(0.0, float(action.battery_charge_w or 0.0)) / 1000
+    discharge_kw = max(0.0, float(action.battery_discharge_w or 0.0)) / 1000
+    if action.action == "charge":
+        return charge_kw or max(0.0, action.power_w) / 1000, 0.0
+    return 0.0, discharge_kw or max(0.0, action.power_w) / 1000
+
+
+def simulate_interval(
+    optimizer: Any,
+    action: Any,
+    soc: float,
+    solar_kw: float,
+    load_kw: float,
+    interval_h: float,
+) -> tuple[float, float]:
+    """Execute one action against actual solar/load; return (grid_kw, soc).
+
+    Forced actions (charge, export/discharge) run at the planned power;
+    ``idle`` and ``solar_export`` hold the battery; every other mode is
+    self-consumption and follows the *actual* net load, as the inverter does.
+    Power is clipped to the battery's rate limits, headroom and reserve.
+    """
+    capacity_kwh = optimizer.capacity_wh / 1000
+    charge_eff = getattr(optimizer, "charge_efficiency", optimizer.efficiency)
+    discharge_eff = getattr(optimizer, "discharge_efficiency", optimizer.efficiency)
+    net_kw = load_kw - solar_kw
+    mode = getattr(action, "action", "self_consumption")
+    if mode in ("charge", "export", "discharge"):
+        charge_kw, discharge_kw = _planned_power_kw(action)
+    elif mode in ("idle", "solar_export"):
+        charge_kw = discharge_kw = 0.0
+    else:
+        charge_kw, discharge_kw = max(0.0, -net_kw), max(0.0, net_kw)
+
+    room_kw = max(0.0, 1.0 - soc) * capacity_kwh / (charge_eff * interval_h)
+    available_kw = (
+        max(0.0, soc - optimizer.backup_reserve) * capacity_kwh * discharge_eff / interval_h
+    )
+    charge_kw = min(charge_kw, optimizer.max_charge_w / 1000, room_kw)
+    discharge_kw = min(discharge_kw, optimizer.max_discharge_w / 1000, available_kw)
+    soc += (charge_kw * charge_eff - discharge_kw / discharge_eff) * interval_h / capacity_kwh
+    return net_kw + charge_kw - discharge_kw, min(1.0, max(0.0, soc))
+
+
+def replay_day(
+    day: dict[str, Any],
+    settings: dict[str, Any],
+    module: Any = None,
+) -> dict[str, Any]:
+    """Replay one fixture day and return its cost and solver statistics."""
+    module = module or _optimizer_module()
+    interval_minutes = int(settings.get("interval_minutes", 30))
+    interval_h = interval_minutes / 60
+    day_slots = 24 * 60 // interval_minutes
+    optimizer = module.BatteryOptimizer(
+        interval_minutes=interval_minutes, **settings["battery"]
+    )
+    optimize_kwargs = dict(settings.get("optimize") or {})
+
+    prices = [float(v) for v in day["import_prices"]]
+    export_prices = [float(v) for v in day["export_prices"]]
+    solar = [float(v) for v in day["solar_kw"]]
+    load = [float(v) for v in day["load_kw"]]
+    solar_forecast = [float(v) for v in day.get("solar_forecast_kw") or solar]
+    load_forecast = [float(v) for v in day.get("load_forecast_kw") or load]
+    tz = timezone(timedelta(hours=float(day.get("utc_offset_hours", 0))))
+    start = datetime.combine(date.fromisoformat(day["date"]), datetime.min.time(), tz)
+    timestamps = [start + timedelta(minutes=interval_minutes * i) for i in range(len(prices))]
+    steps = min(day_slots, len(prices), len(solar), len(load))
+
+    soc = float(day.get("initial_soc", 0.5))
+    cost = baseline = 0.0
+    latencies_ms: list[float] = []
+    solvers: Counter[str] = Counter()
+    fallbacks: Counter[str] = Counter()
+    incremental = 0
+    previous = None
+    for step in range(steps):
+        began = time.perf_counter()
+        result = optimizer.optimize(
+            import_prices=prices[step:],
+            export_prices=export_prices[step:],
+            solar_forecast=solar_forecast[step:],
+            load_forecast=load_forecast[step:],
+            current_soc=soc,
+            schedule_timestamps=timestamps[step:],
+            previous_result=previous,
+            **optimize_kwargs,
+        )
+        latencies_ms.append((time.perf_counter() - began) * 1000)
+        solvers[result.solver_used] += 1
+        if result.solver_used != "highs":
+            fallbacks[str(result.lp_stats.get("fallback_reason") or result.solver_used)] += 1
+        if (result.lp_stats.get("receding_horizon") or {}).get("mode") == "incremental":
+            incremental += 1
+        previous = result
+
+        actions = result.schedule.actions
+        grid_kw, soc = simulate_interval(
+            optimizer,
+            actions[0] if actions else None,
+            soc,
+            solar[step],
+            load[step],
+            interval_h,
+        )
+        net_kw = load[step] - solar[step]
+        cost += (max(0.0, grid_kw) * prices[step] - max(0.0, -grid_kw) * export_prices[step]) * interval_h
+        baseline += (max(0.0, net_kw) * prices[step] - max(0.0, -net_kw) * export_prices[step]) * interval_h
+
+    return {
+        "date": day["date"],
+        "intervals": steps,
+        "realized_cost": round(cost, 4),
+        "baseline_cost": round(baseline, 4),
+        "savings": round(baseline - cost, 4),
+        "final_soc": round(soc, 4),
+        "latencies_ms": [round(value, 3) for value in latencies_ms],
+        "solvers": dict(solvers),
+        "fallbacks": dict(fallbacks),
+        "incremental_solves": incremental,
+    }
+
+
+def _replay_worker(day: dict[str, Any], settings: dict[str, Any]) -> dict[str, Any]:
+    return replay_day(day, settings)
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty series."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_backtest(
+    days: list[dict[str, Any]],
+    settings: dict[str, Any],
+    workers: int = 1,
+) -> dict[str, Any]:
+    """Replay every day (in parallel when ``workers > 1``) and summarize."""
+    started = time.perf_counter()
+    if workers > 1 and len(days) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(days))) as pool:
+            results = list(pool.map(_replay_worker, days, [settings] * len(days)))
+    else:
+        results = [replay_day(day, settings) for day in days]
+
+    latencies = [value for result in results for value in result["latencies_ms"]]
+    solvers: Counter[str] = Counter()
+    fallbacks: Counter[str] = Counter()
+    for result in results:
+        solvers.update(result["solvers"])
+        fallbacks.update(result["fallbacks"])
+    return {
+        "settings": settings,
+        "days": [
+            {key: value for key, value in result.items() if key != "latencies_ms"}
+            for result in results
+        ],
+        "realized_cost": round(sum(r["realized_cost"] for r in results), 4),
+        "baseline_cost": round(sum(r["baseline_cost"] for r in results), 4),
+        "savings": round(sum(r["savings"] for r in results), 4),
+        "solves": len(latencies),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 0.50), 3),
+            "p95": round(_percentile(latencies, 0.95), 3),
+            "p99": round(_percentile(latencies, 0.99), 3),
+            "max": round(max(latencies, default=0.0), 3),
+        },
+        "solvers": dict(solvers),
+        "fallbacks": dict(fallbacks),
+        "fallback_count": sum(fallbacks.values()),
+        "incremental_solves": sum(r["incremental_solves"] for r in results),
+        "wall_time_s": round(time.perf_counter() - started, 3),
+    }
+
+
+def compare_reports(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    cost_tolerance: float = 0.005,
+    latency_tolerance: float = 0.5,
+) -> list[str]:
+    """Return human-readable regressions of ``report`` against ``baseline``."""
+    regressions = []
+    cost_limit = baseline["realized_cost"] + max(
+        0.01, abs(baseline["realized_cost"]) * cost_tolerance
+    )
+    if report["realized_cost"] > cost_limit:
+        regressions.append(
+            f"realized cost {report['realized_cost']:.2f} > {cost_limit:.2f} "
+            f"(baseline {baseline['realized_cost']:.2f})"
+        )
+    latency_limit = baseline["latency_ms"]["p95"] * (1 + latency_tolerance)
+    if report["latency_ms"]["p95"] > latency_limit:
+        regressions.append(
+            f"p95 solve latency {report['latency_ms']['p95']:.1f}ms > {latency_limit:.1f}ms "
+            f"(baseline {baseline['latency_ms']['p95']:.1f}ms)"
+        )
+    if report["fallback_count"] > baseline["fallback_count"]:
+        regressions.append(
+            f"solver fallbacks {report['fallback_count']} > {baseline['fallback_count']}"
+        )
+    return regressions
+
+
+def _settings(fixture: dict[str, Any], overrides: list[str]) -> dict[str, Any]:
+    battery = {**DEFAULT_BATTERY, **(fixture.get("battery") or {})}
+    optimize_kwargs = dict(fixture.get("optimize") or {})
+    constructor = set(inspect.signature(_optimizer_module().BatteryOptimizer).parameters)
+    for override in overrides:
+        key, _, raw = override.partition("=")
+        value = json.loads(raw) if raw else True
+        (battery if key in constructor else optimize_kwargs)[key] = value
+    return {
+        "interval_minutes": int(fixture.get("interval_minutes", 30)),
+        "battery": battery,
+        "optimize": optimize_kwargs,
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(f"{'date':12} {'cost':>9} {'baseline':>9} {'savings':>9} {'soc':>6} fallbacks")
+    for day in report["days"]:
+        print(
+            f"{day['date']:12} {day['realized_cost']:9.2f} {day['baseline_cost']:9.2f} "
+            f"{day['savings']:9.2f} {day['final_soc']:6.2f} {sum(day['fallbacks'].values())}"
+        )
+    latency = report["latency_ms"]
+    print(
+        f"{'total':12} {report['realized_cost']:9.2f} {report['baseline_cost']:9.2f} "
+        f"{report['savings']:9.2f}"
+    )
+    print(
+        f"solves={report['solves']} incremental={report['incremental_solves']} "
+        f"p50={latency['p50']:.1f}ms p95={latency['p95']:.1f}ms "
+        f"p99={latency['p99']:.1f}ms max={latency['max']:.1f}ms "
+        f"wall={report['wall_time_s']:.1f}s"
+    )
+    print(f"solvers={report['solvers']} fallbacks={report['fallbacks'] or 'none'}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixture", nargs="?", help="fixture JSON file")
+    parser.add_argument("--synthetic", type=int, metavar="DAYS", help="replay synthetic days")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=JSON")
+    parser.add_argument("--json", metavar="OUT", help="write the report as JSON")
+    parser.add_argument("--write-fixture", metavar="OUT", help="write the replayed days")
+    parser.add_argument("--compare", metavar="REPORT", help="fail on regressions against a report")
+    parser.add_argument("--cost-tolerance", type=float, default=0.005)
+    parser.add_argument("--latency-tolerance", type=float, default=0.5)
+    parser.add_argument("--verbose", action="store_true", help="show optimizer warnings")
+    args = parser.parse_args(argv)
+    # Forked workers inherit this; replays otherwise repeat every solve warning.
+    logging.getLogger("power_sync").setLevel(logging.INFO if args.verbose else logging.ERROR)
+
+    if args.fixture:
+        fixture = json.loads(Path(args.fixture).read_text())
+    elif args.synthetic:
+        fixture = {"interval_minutes": 30, "days": synthetic_days(args.synthetic, seed=args.seed)}
+    else:
+        parser.error("pass a fixture file or --synthetic DAYS")
+
+    if not _optimizer_module().HIGHS_AVAILABLE:
+        print("highspy is not available; every solve will use the greedy fallback")
+    settings = _settings(fixture, args.set)
+    if args.write_fixture:
+        Path(args.write_fixture).write_text(json.dumps({**fixture, **settings}, indent=1))
+
+    report = run_backtest(fixture["days"], settings, workers=args.workers)
+    _print_report(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=1))
+    if args.compare:
+        regressions = compare_reports(
+            report,
+            json.loads(Path(args.compare).read_text()),
+            cost_tolerance=args.cost_tolerance,
+            latency_tolerance=args.latency_tolerance,
+        )
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
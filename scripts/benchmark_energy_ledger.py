@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Measure energy-ledger calendar queries over a year of intervals.
+
+Writes one year of 5-minute ledger records (105,120 intervals) to a temporary
+file and measures what calendar history pays once the ledger covers a range:
+
+* ``startup load``: the one sequential read that rebuilds the rollups,
+* ``year totals`` / ``year day rows``: a Year request's cost totals and its
+  daily rows, answered from the in-memory rollups,
+* ``day hourly rows``: a Day request, a bisected read of that day's records,
+* ``full scan``: summing the year by re-reading every record, the cost a
+  Recorder-style per-request rebuild scales with.
+
+Only ``energy_ledger`` is loaded, so no Home Assistant stubs are needed.
+
+Run from the repository root:
+    python scripts/benchmark_energy_ledger.py [repeats]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+
+LEDGER_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "power_sync"
+    / "energy_ledger.py"
+)
+TZ = ZoneInfo("Australia/Sydney")
+START = datetime(2026, 1, 1, tzinfo=TZ)
+INTERVALS = 365 * 288
+
+
+def _energy_ledger():
+    spec = importlib.util.spec_from_file_location("bench_energy_ledger", LEDGER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_year(module, path: str) -> None:
+    start = int(START.timestamp())
+    records = [
+        (
+            start + slot * module.LEDGER_INTERVAL_SECONDS,
+            0.1 if 72 <= slot % 288 < 216 else 0.0,
+            0.05,
+            0.02,
+            0.01,
+            0.01,
+            0.08,
+            0.015,
+            0.001,
+            0.05,
+            0.02,
+        )
+        for slot in range(INTERVALS)
+    ]
+    module._append_ledger_records(path, records)
+
+
+def _median_ms(run, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    module = _energy_ledger()
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "ledger")
+        _write_year(module, path)
+
+        def load():
+            ledger = module.EnergyLedger(None, path=path)
+            asyncio.run(ledger.async_load(TZ))
+            return ledger
+
+        ledger = load()
+        first, last = date(2026, 1, 1), date(2026, 12, 31)
+        scanned = module._read_ledger_range(path, 0, 2**32)
+        assert abs(
+            ledger.totals(first, last)["grid_import_kwh"]
+            - sum(record[2] for record in scanned)
+        ) < 1e-3
+
+        day_start = datetime(2026, 7, 14, tzinfo=TZ)
+        timings = (
+            ("startup load", lambda: load(), max(1, repeats // 4)),
+            ("year totals", lambda: ledger.totals(first, last), repeats),
+            ("year day rows", lambda: ledger.day_totals(first, last), repeats),
+            (
+                "day hourly rows",
+                lambda: asyncio.run(
+                    ledger.async_hourly_totals(day_start, day_start + timedelta(days=1))
+                ),
+                repeats,
+            ),
+            (
+                "full scan",
+                lambda: sum(
+                    record[2] for record in module._read_ledger_range(path, 0, 2**32)
+                ),
+                max(1, repeats // 4),
+            ),
+        )
+
+        size_kib = Path(path).stat().st_size / 1024
+        print(f"intervals={INTERVALS} (365d x 5min) file={size_kib:.0f}KiB repeats={repeats}")
+        for label, run, count in timings:
+            print(f"{label:18} {_median_ms(run, count):9.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Measure event-loop blocking of the EV planner's load profile refresh.
+
+Generates 30 days of synthetic Recorder states for a chatty load sensor and
+refreshes ``LoadProfileEstimator`` three ways, reporting the longest
+event-loop stall (the largest gap seen by a 1 ms ticker task), wall time and
+how many Recorder history scans each refresh issued:
+
+* ``raw, on loop``: the planner's own 14-day scan with bucketing run inline,
+  which is how every refresh worked before it used the shared history,
+* ``raw, executor``: the same scan with bucketing offloaded; installs
+  without an optimizer load entity still take this path,
+* ``shared history``: the optimizer's ``LoadEstimator`` already holds its
+  cached half-hour history, so the planner only condenses it off the loop.
+
+Home Assistant is stubbed the same way as ``benchmark_startup_import.py``,
+and the fake Recorder slices a pre-built list, so fetch cost is not included.
+
+Run from the repository root:
+    python scripts/benchmark_ev_load_profile.py [state_interval_seconds]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parent.parent
+NOW = datetime(2026, 5, 9, 12, 10, tzinfo=timezone.utc)
+LOAD_ENTITY = "sensor.home_load_power"
+_scans: list[datetime] = []
+_states: list[SimpleNamespace] = []
+
+
+class _FakeRecorder:
+    async def async_add_executor_job(self, func, *args):
+        if func == "history":
+            _hass, start_time, end_time, entity_ids = args
+            _scans.append(start_time)
+            # The planner's legacy scan uses naive wall-clock bounds; only the
+            # window length matters against the synthetic timeline.
+            since = NOW - (end_time - start_time)
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: {
+                    entity_ids[0]: [
+                        state for state in _states if state.last_changed > since
+                    ]
+                },
+            )
+        return {}
+
+
+def _load_modules():
+    sys.path.insert(0, str(ROOT / "scripts"))
+    from benchmark_startup_import import _StubFinder
+
+    sys.meta_path.insert(0, _StubFinder())
+    sys.path.insert(0, str(ROOT))
+    dt_util = importlib.import_module("homeassistant.util.dt")
+    dt_util.now = lambda *args, **kwargs: NOW
+    dt_util.utcnow = lambda: NOW
+    dt_util.as_local = lambda value: value
+    recorder = importlib.import_module("homeassistant.components.recorder")
+    recorder.get_instance = lambda hass: _FakeRecorder()
+    importlib.import_module(
+        "homeassistant.components.recorder.history"
+    ).get_significant_states = "history"
+    importlib.import_module(
+        "homeassistant.components.recorder.statistics"
+    ).statistics_during_period = "statistics"
+    base = "custom_components.power_sync"
+    return (
+        importlib.import_module(f"{base}.automations.ev_charging_planner"),
+        importlib.import_module(f"{base}.optimization.load_estimator"),
+    )
+
+
+def _synthetic_states(step_seconds: int) -> list[SimpleNamespace]:
+    states = []
+    cursor = NOW - timedelta(days=30)
+    step = timedelta(seconds=step_seconds)
+    while cursor < NOW:
+        watts = 300 + (cursor.hour * 53 + cursor.minute * 7 + cursor.second) % 2500
+        states.append(
+            SimpleNamespace(
+                state=str(watts),
+                attributes={"unit_of_measurement": "W"},
+                last_changed=cursor,
+                last_updated=cursor,
+            )
+        )
+        cursor += step
+    return states
+
+
+def _hass(offload: bool) -> SimpleNamespace:
+    pool = ThreadPoolExecutor(max_workers=1)
+
+    async def executor_job(func, *args):
+        if not offload:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+
+    return SimpleNamespace(
+        data={},
+        states=SimpleNamespace(
+            async_entity_ids=lambda domain=None: [LOAD_ENTITY],
+            get=lambda entity_id: SimpleNamespace(
+                attributes={"unit_of_measurement": "W"}
+            ),
+        ),
+        async_add_executor_job=executor_job,
+    )
+
+
+async def _timed(refresh) -> tuple[float, float]:
+    stall = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal stall
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.001)
+            current = time.perf_counter()
+            stall = max(stall, current - last)
+            last = current
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await refresh()
+    elapsed = time.perf_counter() - start
+    done = True
+    await task
+    return stall * 1000, elapsed * 1000
+
+
+def _raw(ev_planner, offload: bool):
+    return ev_planner.LoadProfileEstimator(_hass(offload))
+
+
+def _shared(ev_planner, load_estimator):
+    hass = _hass(offload=True)
+    shared = load_estimator.LoadEstimator(hass, LOAD_ENTITY, interval_minutes=5)
+    # The optimizer refreshed its history earlier in the hour.
+    asyncio.run(shared._get_load_history())
+    hass.data = {
+        "power_sync": {
+            "bench": {
+                "optimization_coordinator": SimpleNamespace(_load_estimator=shared)
+            }
+        }
+    }
+    return ev_planner.LoadProfileEstimator(hass, SimpleNamespace(entry_id="bench"))
+
+
+def main() -> int:
+    step_seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    _states.extend(_synthetic_states(step_seconds))
+    ev_planner, load_estimator = _load_modules()
+
+    print(f"states={len(_states)} interval={step_seconds}s")
+    print(
+        f"{'refresh':16} {'max stall':>10} {'wall':>10} {'scans':>6} "
+        f"{'source':>18}"
+    )
+    for label, refresh in (
+        ("raw, on loop", lambda: _raw(ev_planner, offload=False)),
+        ("raw, executor", lambda: _raw(ev_planner, offload=True)),
+        ("shared history", lambda: _shared(ev_planner, load_estimator)),
+    ):
+        estimator = refresh()
+        _scans.clear()
+        stall_ms, wall_ms = asyncio.run(_timed(estimator.update_from_history))
+        print(
+            f"{label:16} {stall_ms:8.1f}ms {wall_ms:8.1f}ms {len(_scans):6d} "
+            f"{estimator.profile_source:>18}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
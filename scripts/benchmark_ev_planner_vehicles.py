@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Measure Smart Schedule planning cost per tick by vehicle count.
+
+Plans 1, 3 and 6 vehicles the way ``AutoScheduleExecutor.evaluate`` does on
+one tick, cycling through the four charging priorities and a mix of
+departure times, against synthetic 48-hour Amber-style forecasts (UTC
+timestamps, so every row needs a timezone conversion to align). Each
+configuration runs twice:
+
+* ``per-vehicle``: plans outside ``forecast_tick()``, so each vehicle fetches
+  and aligns its own forecasts (the behaviour before the shared frame),
+* ``shared``: plans inside ``forecast_tick()``, so the tick aligns one frame
+  and every vehicle reuses it.
+
+Home Assistant is stubbed the same way as ``benchmark_startup_import.py``.
+
+Run from the repository root:
+    python scripts/benchmark_ev_planner_vehicles.py [--ticks N]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parent.parent
+VEHICLE_COUNTS = (1, 3, 6)
+FORECAST_HOURS = 48
+LOCAL_TZ = timezone(timedelta(hours=10))
+NOW = datetime(2026, 7, 24, 13, 7, tzinfo=LOCAL_TZ)
+
+
+def _load_planner_module():
+    sys.path.insert(0, str(ROOT / "scripts"))
+    from benchmark_startup_import import _StubFinder
+
+    sys.meta_path.insert(0, _StubFinder())
+    sys.path.insert(0, str(ROOT))
+    dt_util = importlib.import_module("homeassistant.util.dt")
+    dt_util.now = lambda *args, **kwargs: NOW
+    dt_util.utcnow = lambda: NOW.astimezone(timezone.utc)
+    dt_util.as_local = lambda value: value.astimezone(LOCAL_TZ)
+    return importlib.import_module(
+        "custom_components.power_sync.automations.ev_charging_planner"
+    )
+
+
+class _SurplusForecaster:
+    def __init__(self, ev_planner):
+        self.ev_planner = ev_planner
+        self.calls = 0
+
+    async def forecast_surplus(self, hours):
+        self.calls += 1
+        start = NOW.replace(minute=0, second=0, microsecond=0)
+        rows = []
+        for offset in range(hours):
+            hour = start + timedelta(hours=offset)
+            solar_kw = max(0.0, 6.0 - abs(hour.hour - 12) * 1.2)
+            rows.append(
+                self.ev_planner.SurplusForecast(
+                    hour=hour.astimezone(timezone.utc).isoformat(),
+                    solar_kw=solar_kw,
+                    load_kw=0.8,
+                    surplus_kw=max(0.0, solar_kw - 1.8),
+                    confidence=0.7,
+                )
+            )
+        return rows
+
+
+class _PriceForecaster:
+    def __init__(self, ev_planner):
+        self.ev_planner = ev_planner
+        self.calls = 0
+
+    async def get_price_forecast(self, hours):
+        self.calls += 1
+        start = NOW.replace(minute=0, second=0, microsecond=0)
+        rows = []
+        for offset in range(hours):
+            hour = start + timedelta(hours=offset)
+            peak = 16 <= hour.hour < 21
+            rows.append(
+                self.ev_planner.PriceForecast(
+                    hour=hour.astimezone(timezone.utc).isoformat(),
+                    import_cents=45.0 if peak else 12.0 + (offset * 7) % 11,
+                    export_cents=5.0,
+                    period="peak" if peak else "offpeak",
+                )
+            )
+        return rows
+
+
+def _planner(ev_planner):
+    hass = SimpleNamespace(data={})
+    entry = SimpleNamespace(entry_id="bench", data={}, options={})
+    planner = object.__new__(ev_planner.ChargingPlanner)
+    planner.hass = hass
+    planner.config_entry = entry
+    planner.surplus_forecaster = _SurplusForecaster(ev_planner)
+    planner.price_forecaster = _PriceForecaster(ev_planner)
+    planner._get_battery_schedule = lambda: [
+        {
+            "timestamp": (NOW + timedelta(hours=offset)).isoformat(),
+            "action": "charge",
+            "power_w": 3000,
+        }
+        for offset in range(0, FORECAST_HOURS, 3)
+    ]
+    planner._grid_capacity_kw = 14.0
+    return planner
+
+
+async def _plan_tick(ev_planner, planner, vehicles: int) -> None:
+    priorities = tuple(ev_planner.ChargingPriority)
+    capacity = ev_planner.resolve_ev_battery_capacity(manual_capacity_kwh=75)
+    for index in range(vehicles):
+        departure = (
+            None
+            if index % 3 == 1
+            else (NOW + timedelta(hours=14 + index * 3)).replace(tzinfo=None)
+        )
+        await planner.plan_charging(
+            vehicle_id=f"vehicle-{index}",
+            current_soc=40 + index * 5,
+            target_soc=80,
+            target_time=departure,
+            resolved_capacity=capacity,
+            charger_power_kw=7.36,
+            priority=priorities[index % len(priorities)],
+        )
+
+
+def _measure(ev_planner, vehicles: int, ticks: int, shared: bool):
+    planner = _planner(ev_planner)
+    samples = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        if shared:
+            with planner.forecast_tick():
+                asyncio.run(_plan_tick(ev_planner, planner, vehicles))
+        else:
+            asyncio.run(_plan_tick(ev_planner, planner, vehicles))
+        samples.append((time.perf_counter() - start) * 1000)
+    fetches = planner.price_forecaster.calls / ticks
+    return statistics.median(samples), fetches
+
+
+def main() -> int:
+    ticks = 50
+    if "--ticks" in sys.argv[1:]:
+        ticks = int(sys.argv[sys.argv.index("--ticks") + 1])
+    ev_planner = _load_planner_module()
+
+    print(
+        f"{'vehicles':>8} {'mode':12} {'tick':>10} {'per vehicle':>12} "
+        f"{'fetches/tick':>13}"
+    )
+    for vehicles in VEHICLE_COUNTS:
+        for mode, shared in (("per-vehicle", False), ("shared", True)):
+            tick_ms, fetches = _measure(ev_planner, vehicles, ticks, shared)
+            print(
+                f"{vehicles:8d} {mode:12} {tick_ms:8.2f}ms "
+                f"{tick_ms / vehicles:10.2f}ms {fetches:13.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Compare a full load history rebuild with an incremental refresh.
+
+Generates a synthetic 30-day Recorder history for a chatty load sensor and
+compares
+
+* a full rebuild: fetch and re-integrate the whole lookback window, which is
+  what every hourly cache expiry used to do, and
+* an incremental refresh one hour later: fetch only the tail since the last
+  finalized half-hour bucket and extend the stored history,
+
+reporting median wall time and tracemalloc peak memory for each. The fake
+Recorder slices a pre-built state list, so fetch cost is not included.
+
+Run from the repository root:
+    python scripts/benchmark_load_history.py [state_interval_seconds]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import statistics
+import sys
+import time
+import tracemalloc
+import types
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+NOW = datetime(2026, 5, 9, 12, 10, tzinfo=timezone.utc)
+_clock = [NOW]
+
+
+def _install_stubs(states: list[SimpleNamespace]) -> None:
+    """Install minimal Home Assistant and Recorder stubs."""
+    ha_root = types.ModuleType("homeassistant")
+    ha_core = types.ModuleType("homeassistant.core")
+    ha_util = types.ModuleType("homeassistant.util")
+    ha_dt = types.ModuleType("homeassistant.util.dt")
+    ha_core.HomeAssistant = object
+    ha_dt.now = lambda: _clock[0]
+    ha_dt.utcnow = lambda: _clock[0]
+    ha_dt.as_local = lambda value: value
+    ha_util.dt = ha_dt
+
+    changed = [state.last_changed for state in states]
+
+    class FakeRecorder:
+        async def async_add_executor_job(self, func, *args):
+            if func == "history":
+                _hass, start_time, end_time, entity_ids = args
+                lo = bisect_right(changed, start_time)
+                hi = bisect_left(changed, end_time)
+                window = states[lo:hi]
+                if lo:
+                    window.insert(
+                        0,
+                        SimpleNamespace(
+                            state=states[lo - 1].state, last_changed=start_time
+                        ),
+                    )
+                return {entity_ids[0]: window}
+            return {}
+
+    components = types.ModuleType("homeassistant.components")
+    recorder = types.ModuleType("homeassistant.components.recorder")
+    history = types.ModuleType("homeassistant.components.recorder.history")
+    stats = types.ModuleType("homeassistant.components.recorder.statistics")
+    recorder.get_instance = lambda hass: FakeRecorder()
+    history.get_significant_states = "history"
+    stats.statistics_during_period = "statistics"
+
+    const = types.ModuleType("power_sync.const")
+    for name in (
+        "DEFAULT_SOLAR_FORECAST_PROVIDER",
+        "DEFAULT_SOLCAST_ESTIMATE_TYPE",
+        "SOLAR_FORECAST_PROVIDER_OPEN_METEO",
+        "SOLAR_FORECAST_PROVIDER_SOLCAST",
+        "SOLAR_FORECAST_PROVIDER_VOLCAST",
+        "SOLCAST_ESTIMATE",
+        "SOLCAST_ESTIMATE10",
+        "SOLCAST_ESTIMATE90",
+    ):
+        setattr(const, name, name.lower())
+    const.SOLAR_FORECAST_PROVIDERS = {}
+
+    ps_module = types.ModuleType("power_sync")
+    ps_module.__path__ = [str(COMPONENT_ROOT)]
+    optimization = types.ModuleType("power_sync.optimization")
+    optimization.__path__ = [str(COMPONENT_ROOT / "optimization")]
+
+    sys.modules.update(
+        {
+            "homeassistant": ha_root,
+            "homeassistant.core": ha_core,
+            "homeassistant.util": ha_util,
+            "homeassistant.util.dt": ha_dt,
+            "homeassistant.components": components,
+            "homeassistant.components.recorder": recorder,
+            "homeassistant.components.recorder.history": history,
+            "homeassistant.components.recorder.statistics": stats,
+            "power_sync": ps_module,
+            "power_sync.const": const,
+            "power_sync.optimization": optimization,
+        }
+    )
+
+
+def _synthetic_states(step_seconds: int) -> list[SimpleNamespace]:
+    start = NOW - timedelta(days=31)
+    end = NOW + timedelta(hours=2)
+    states = []
+    cursor = start
+    step = timedelta(seconds=step_seconds)
+    while cursor < end:
+        watts = 300 + (cursor.hour * 53 + cursor.minute * 7 + cursor.second) % 2500
+        states.append(SimpleNamespace(state=str(watts), last_changed=cursor))
+        cursor += step
+    return states
+
+
+async def _inline_executor(func, *args):
+    return func(*args)
+
+
+def _estimator(module):
+    hass = SimpleNamespace(
+        states=SimpleNamespace(
+            get=lambda entity_id: SimpleNamespace(
+                attributes={"unit_of_measurement": "W"}
+            )
+        ),
+        async_add_executor_job=_inline_executor,
+    )
+    return module.LoadEstimator(hass, "sensor.load", interval_minutes=5)
+
+
+def _full_rebuild(module) -> None:
+    _clock[0] = NOW + timedelta(hours=1)
+    asyncio.run(_estimator(module)._get_load_history())
+
+
+def _incremental_setup(module):
+    _clock[0] = NOW
+    estimator = _estimator(module)
+    asyncio.run(estimator._get_load_history())
+    return estimator
+
+
+def _incremental_refresh(estimator) -> None:
+    _clock[0] = NOW + timedelta(hours=1)
+    estimator.invalidate_cache()
+    asyncio.run(estimator._get_load_history())
+
+
+def _measure(run, prepare=None, runs: int = 5) -> tuple[float, float]:
+    elapsed = []
+    for _ in range(runs):
+        arg = prepare() if prepare else None
+        start = time.perf_counter()
+        run(arg)
+        elapsed.append(time.perf_counter() - start)
+    arg = prepare() if prepare else None
+    tracemalloc.start()
+    run(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(elapsed), peak / 1024 / 1024
+
+
+def main() -> int:
+    step_seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    states = _synthetic_states(step_seconds)
+    _install_stubs(states)
+    module = importlib.import_module("power_sync.optimization.load_estimator")
+
+    full_s, full_mb = _measure(lambda _arg: _full_rebuild(module))
+    incremental_s, incremental_mb = _measure(
+        _incremental_refresh,
+        prepare=lambda: _incremental_setup(module),
+    )
+    print(f"states={len(states)} interval={step_seconds}s lookback=30d")
+    print(f"full rebuild      {full_s * 1000:9.1f}ms peak={full_mb:8.2f}MiB")
+    print(
+        f"incremental (1h)  {incremental_s * 1000:9.1f}ms "
+        f"peak={incremental_mb:8.2f}MiB  "
+        f"speedup={full_s / incremental_s if incremental_s else float('inf'):6.1f}x"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
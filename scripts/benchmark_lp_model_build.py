@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Compare LP model construction from dict rows and from CSR arrays.
+
+Captures the real constraint assignments the optimizer makes for 24h, 48h
+and 72h horizons at 5-minute resolution, then replays them through
+
+* the legacy path: per-row dict matrix, one ``addCol``/``addRow`` per column
+  and row, and
+* the current path: array-backed ``_LpMatrix`` compressed to CSR and loaded
+  with a single ``passModel`` call,
+
+reporting median build time and tracemalloc peak memory for each.
+
+Run from the repository root:
+    python scripts/benchmark_lp_model_build.py
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+import types
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+
+
+def _install_stubs() -> None:
+    """Install minimal Home Assistant stubs for local optimizer benchmarking."""
+    ha_root = types.ModuleType("homeassistant")
+    ha_util = types.ModuleType("homeassistant.util")
+    ha_dt = types.ModuleType("homeassistant.util.dt")
+    ha_dt.now = lambda *args, **kwargs: datetime.now(timezone.utc)
+    ha_dt.utcnow = lambda *args, **kwargs: datetime.now(timezone.utc)
+    ha_dt.UTC = timezone.utc
+    ha_util.dt = ha_dt
+    ha_root.util = ha_util
+
+    sys.modules["homeassistant"] = ha_root
+    sys.modules["homeassistant.util"] = ha_util
+    sys.modules["homeassistant.util.dt"] = ha_dt
+
+    ps_module = types.ModuleType("power_sync")
+    ps_module.__path__ = [str(COMPONENT_ROOT)]
+    sys.modules["power_sync"] = ps_module
+
+    optimization_module = types.ModuleType("power_sync.optimization")
+    optimization_module.__path__ = [str(COMPONENT_ROOT / "optimization")]
+    sys.modules["power_sync.optimization"] = optimization_module
+
+
+class _DictRowMatrix:
+    """The previous row-of-dicts builder, kept here as the baseline."""
+
+    def __init__(self, shape):
+        self.shape = shape
+        self._rows = [dict() for _ in range(shape[0])]
+
+    def __setitem__(self, key, value):
+        i, j = key
+        value = float(value)
+        if value == 0.0:
+            self._rows[i].pop(j, None)
+        else:
+            self._rows[i][j] = value
+
+    def iter_rows(self):
+        for i, row in enumerate(self._rows):
+            yield i, list(row.keys()), list(row.values())
+
+
+def _capture_case(module, hours: int) -> dict:
+    """Record every matrix assignment and the solve inputs for one horizon."""
+    n = hours * 12
+    recorded: list[tuple] = []
+    captured: dict = {}
+    real_matrix = module._LpMatrix
+
+    class _RecordingMatrix(real_matrix):
+        __slots__ = ("_log",)
+
+        def __init__(self, shape, dtype=float):
+            super().__init__(shape, dtype)
+            self._log = []
+            recorded.append((shape, self._log))
+
+        def __setitem__(self, key, value):
+            self._log.append((key, value))
+            super().__setitem__(key, value)
+
+    def _capture(c, A_ub, b_ub, A_eq, b_eq, bounds, time_limit, integer_indices=None):
+        if not captured:
+            captured.update(
+                c=list(c),
+                b_ub=list(b_ub),
+                b_eq=list(b_eq),
+                bounds=list(bounds),
+                integer_indices=list(integer_indices or ()),
+                matrices=list(recorded[-2:]),
+            )
+        return module._HighsResult(x=None, success=False, message="captured", status=0, fun=None)
+
+    original_solve = module._solve_lp_highs
+    module._LpMatrix = _RecordingMatrix
+    module._solve_lp_highs = _capture
+    try:
+        optimizer = module.BatteryOptimizer(
+            capacity_wh=13500,
+            max_charge_w=7000,
+            max_discharge_w=7000,
+            backup_reserve=0.20,
+            interval_minutes=5,
+            horizon_hours=hours,
+        )
+        optimizer.optimize(
+            import_prices=[0.08 if i % 12 < 4 else 0.35 for i in range(n)],
+            export_prices=[0.05 if i % 24 < 12 else 0.45 for i in range(n)],
+            solar_forecast=[4.0 if 96 <= i % 288 < 192 else 0.0 for i in range(n)],
+            load_forecast=[0.7] * n,
+            current_soc=0.50,
+            allow_battery_export=[i % 24 >= 12 for i in range(n)],
+        )
+    finally:
+        module._LpMatrix = real_matrix
+        module._solve_lp_highs = original_solve
+    return captured
+
+
+def _legacy_build(module, case) -> None:
+    highspy = module.highspy
+    inf = highspy.kHighsInf
+    (eq_shape, eq_log), (ub_shape, ub_log) = case["matrices"]
+    A_eq = _DictRowMatrix(eq_shape)
+    for key, value in eq_log:
+        A_eq[key] = value
+    A_ub = _DictRowMatrix(ub_shape)
+    for key, value in ub_log:
+        A_ub[key] = value
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+    for j, cost in enumerate(case["c"]):
+        lo, hi = case["bounds"][j]
+        h.addCol(
+            float(cost),
+            -inf if lo is None else float(lo),
+            inf if hi is None else float(hi),
+            0,
+            [],
+            [],
+        )
+    for index in case["integer_indices"]:
+        h.setInteger(int(index))
+    for i, idx, val in A_eq.iter_rows():
+        rhs = float(case["b_eq"][i])
+        h.addRow(rhs, rhs, len(idx), idx, val)
+    for i, idx, val in A_ub.iter_rows():
+        h.addRow(-inf, float(case["b_ub"][i]), len(idx), idx, val)
+
+
+def _csr_build(module, case) -> None:
+    (eq_shape, eq_log), (ub_shape, ub_log) = case["matrices"]
+    A_eq = module._LpMatrix(eq_shape)
+    for key, value in eq_log:
+        A_eq[key] = value
+    A_ub = module._LpMatrix(ub_shape)
+    for key, value in ub_log:
+        A_ub[key] = value
+    module._new_highs(
+        module._HighsModelArrays(
+            case["c"],
+            A_ub,
+            case["b_ub"],
+            A_eq,
+            case["b_eq"],
+            case["bounds"],
+            case["integer_indices"],
+        )
+    )
+
+
+def _measure(build, module, case, runs: int = 5) -> tuple[float, float]:
+    elapsed = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        build(module, case)
+        elapsed.append(time.perf_counter() - start)
+    tracemalloc.start()
+    build(module, case)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(elapsed), peak / 1024 / 1024
+
+
+def main() -> int:
+    _install_stubs()
+    module = importlib.import_module("power_sync.optimization.battery_optimizer")
+    # The capture hook reports a failed solve; keep that out of the table.
+    logging.getLogger(module.__name__).setLevel(logging.CRITICAL)
+    if not module.HIGHS_AVAILABLE:
+        print("highspy is not available; LP build benchmark cannot run")
+        return 1
+
+    print(f"numpy={'yes' if module.NUMPY_AVAILABLE else 'no'}")
+    for hours in (24, 48, 72):
+        case = _capture_case(module, hours)
+        legacy_s, legacy_mb = _measure(_legacy_build, module, case)
+        csr_s, csr_mb = _measure(_csr_build, module, case)
+        print(
+            f"{hours:3d}h cols={len(case['c']):6d} "
+            f"rows={len(case['b_eq']) + len(case['b_ub']):6d}  "
+            f"dict+addRow={legacy_s * 1000:8.1f}ms peak={legacy_mb:6.2f}MiB  "
+            f"csr+passModel={csr_s * 1000:8.1f}ms peak={csr_mb:6.2f}MiB  "
+            f"speedup={legacy_s / csr_s if csr_s else float('inf'):4.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
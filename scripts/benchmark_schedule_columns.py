@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Compare a list-of-actions OptimizationSchedule with the columnar one.
+
+Builds a 72-hour, 5-minute schedule (864 slots) and compares the previous
+representation (a list of ``ScheduleAction`` dataclasses, re-serialized on
+every call) with the column-backed ``OptimizationSchedule``:
+
+* retained memory of the schedule, measured with ``tracemalloc``,
+* ``to_api_response`` and ``to_executor_schedule`` with nothing cached
+  (cold, as on a new schedule), on the first call after a reason edit (which
+  keeps the ISO timestamps) and on repeat calls (cached), which is what
+  every API hit and sensor update between optimizer runs pays.
+
+Only ``schedule_reader`` is loaded, so no Home Assistant stubs are needed.
+
+Run from the repository root:
+    python scripts/benchmark_schedule_columns.py [repeats]
+"""
+
+from __future__ import annotations
+
+import gc
+import importlib.util
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+
+SCHEDULE_READER_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "power_sync"
+    / "optimization"
+    / "schedule_reader.py"
+)
+SLOTS = 72 * 12
+START = datetime(2026, 5, 3, 8, 30, tzinfo=ZoneInfo("Australia/Sydney"))
+
+
+def _schedule_reader():
+    spec = importlib.util.spec_from_file_location(
+        "bench_schedule_reader", SCHEDULE_READER_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _actions(module) -> list:
+    kinds = ("charge", "idle", "self_consumption", "export", "solar_export")
+    return [
+        module.ScheduleAction(
+            timestamp=START + timedelta(minutes=5 * slot),
+            action=kinds[(slot // 12) % len(kinds)],
+            power_w=float(500 + (slot * 37) % 4500),
+            soc=0.2 + (slot % 144) / 200,
+            battery_charge_w=float((slot * 53) % 5000),
+            battery_discharge_w=float((slot * 71) % 5000),
+            reason="price_spread" if slot % 7 == 0 else None,
+            ev_charge_w=7200.0 if 40 <= slot % 288 < 60 else 0.0,
+        )
+        for slot in range(SLOTS)
+    ]
+
+
+class _ListSchedule:
+    """The previous representation: per-action storage, no payload cache."""
+
+    def __init__(self, actions: list) -> None:
+        self.actions = actions
+
+    def _battery_export_w(self) -> list[float]:
+        return [
+            max(0.0, min(a.power_w, a.battery_discharge_w))
+            if a.action in ("export", "discharge")
+            else 0.0
+            for a in self.actions
+        ]
+
+    def _battery_consume_w(self) -> list[float]:
+        values = []
+        for a in self.actions:
+            if a.action in ("self_consumption", "consume", "off_grid"):
+                values.append(a.battery_discharge_w)
+            elif a.action in ("export", "discharge"):
+                export_w = max(0.0, min(a.power_w, a.battery_discharge_w))
+                values.append(max(0.0, a.battery_discharge_w - export_w))
+            else:
+                values.append(0.0)
+        return values
+
+    def to_api_response(self) -> dict:
+        return {
+            "timestamps": [a.timestamp.isoformat() for a in self.actions],
+            "charge_w": [a.battery_charge_w for a in self.actions],
+            "discharge_w": [a.battery_discharge_w for a in self.actions],
+            "ev_charging_w": [
+                max(0.0, float(a.ev_charge_w or 0.0)) for a in self.actions
+            ],
+            "battery_consume_w": self._battery_consume_w(),
+            "battery_export_w": self._battery_export_w(),
+            "soc": [a.soc if a.soc is not None else 0.5 for a in self.actions],
+            "control_source": [a.control_source for a in self.actions],
+            "control_action": [a.control_action for a in self.actions],
+            "action_reason": [a.reason for a in self.actions],
+            "grid_import_w": [],
+            "grid_export_w": [],
+        }
+
+    def to_executor_schedule(self) -> list:
+        return [action.to_dict() for action in self.actions]
+
+
+def _retained_kib(build) -> tuple[float, object]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    value = build()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return size / 1024, value
+
+
+def _median_ms(run, repeats: int, before=None) -> float:
+    samples = []
+    for _ in range(repeats):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    module = _schedule_reader()
+
+    list_kib, actions = _retained_kib(lambda: _actions(module))
+    legacy = _ListSchedule(actions)
+    columnar_kib, schedule = _retained_kib(
+        lambda: module.OptimizationSchedule(_actions(module), 0.0, 0.0)
+    )
+    # The columnar schedule's transient action list is freed once built.
+    assert schedule.to_api_response() == legacy.to_api_response()
+    assert schedule.to_executor_schedule() == legacy.to_executor_schedule()
+
+    def edit():
+        schedule.actions[0].reason = schedule.actions[0].reason
+
+    print(f"slots={SLOTS} (72h x 5min) repeats={repeats}")
+    print(f"{'':22} {'list of actions':>16} {'columnar':>12}")
+    print(f"{'retained memory':22} {list_kib:13.0f}KiB {columnar_kib:9.0f}KiB")
+    for label, method in (
+        ("to_api_response", "to_api_response"),
+        ("to_executor_schedule", "to_executor_schedule"),
+    ):
+        legacy_ms = _median_ms(getattr(legacy, method), repeats)
+        cold_ms = _median_ms(
+            getattr(schedule, method), repeats, before=schedule.columns.touch
+        )
+        edited_ms = _median_ms(getattr(schedule, method), repeats, before=edit)
+        warm_ms = _median_ms(getattr(schedule, method), repeats)
+        print(
+            f"{label:22} {legacy_ms:14.2f}ms {cold_ms:7.2f}ms cold"
+            f" {edited_ms:7.2f}ms after edit {warm_ms:7.2f}ms cached"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""Measure integration import time and resident memory per config.
+
+Imports ``custom_components.power_sync`` in a fresh interpreter for three
+configurations and then resolves the lazily loaded view modules that config's
+first requests would pull in:
+
+* ``tesla``: Tesla battery only, no EV, no vendor settings screens,
+* ``sigenergy``: Sigenergy only, so ``vendor_views`` is loaded,
+* ``all``: every feature, so ``vendor_views`` and ``ev_views`` are loaded.
+
+Each profile is measured ``cold``, without PowerSync's bytecode (first start
+after install or upgrade), and ``warm``, reusing the bytecode just written.
+Only PowerSync's cached bytecode is dropped for ``cold``; the stdlib and
+third-party packages stay compiled, as they are on a real install.
+Home Assistant and voluptuous are replaced by an attribute-absorbing stub, and
+the modules Home Assistant has always loaded before an integration (aiohttp,
+asyncio) are imported before timing starts, so the numbers cover what
+PowerSync itself adds. The ``heavy`` column lists the optional native
+packages (numpy, highspy) the import pulled in.
+
+Run from the repository root:
+    python scripts/benchmark_startup_import.py [--importtime] [--repeat N]
+
+Each row is the median of ``--repeat`` runs (default 3).
+
+``--importtime`` also runs each warm profile under ``python -X importtime``
+and lists the slowest PowerSync and heavy modules by cumulative time.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.abc
+import importlib.machinery
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+PROFILES = {
+    "tesla": (),
+    "sigenergy": ("vendor_views",),
+    "all": ("vendor_views", "ev_views"),
+}
+STUBBED_PACKAGES = ("homeassistant", "voluptuous")
+# Already imported by Home Assistant core before any integration loads
+HOST_MODULES = ("asyncio", "aiohttp", "aiohttp.web")
+HEAVY_MODULES = ("numpy", "highspy")
+
+
+class _Anything(type):
+    """Class that returns another stub class for any attribute or call."""
+
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Anything(name, (object,), {})
+
+    def __call__(cls, *args, **kwargs):
+        # Decorator use (``@callback``) must hand the function back unchanged.
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return _Anything(cls.__name__, (object,), {})
+
+    def __getitem__(cls, key):
+        return cls
+
+    def __or__(cls, other):
+        return cls
+
+    __ror__ = __or__
+
+
+class _StubModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = _Anything(name, (object,), {})
+        setattr(self, name, value)
+        return value
+
+
+class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def find_spec(self, fullname, path, target=None):
+        if fullname.split(".")[0] in STUBBED_PACKAGES:
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        module = _StubModule(spec.name)
+        module.__path__ = []
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+def _rss_mib() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _child(profile: str) -> None:
+    sys.meta_path.insert(0, _StubFinder())
+    sys.path.insert(0, str(ROOT))
+    for module in HOST_MODULES:
+        importlib.import_module(module)
+    baseline_mib = _rss_mib()
+
+    start = time.perf_counter()
+    importlib.import_module("custom_components.power_sync")
+    setup_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for module in PROFILES[profile]:
+        importlib.import_module(f"custom_components.power_sync.{module}")
+    lazy_s = time.perf_counter() - start
+
+    print(
+        json.dumps(
+            {
+                "setup_ms": setup_s * 1000,
+                "lazy_ms": lazy_s * 1000,
+                "rss_mib": _rss_mib(),
+                "baseline_mib": baseline_mib,
+                "modules": sum(
+                    1 for name in sys.modules if name.startswith("custom_components")
+                ),
+                "heavy": [name for name in HEAVY_MODULES if name in sys.modules],
+            }
+        )
+    )
+
+
+def _run_child(profile: str, pycache: str, importtime: bool = False):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    args = [sys.executable]
+    if importtime:
+        args += ["-X", "importtime"]
+    result = subprocess.run(
+        [*args, __file__, "--child", profile],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def _slowest_modules(importtime_log: str, limit: int = 8) -> list[tuple[int, str]]:
+    rows = []
+    for line in importtime_log.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) != 3 or (
+            "power_sync" not in parts[2] and parts[2].strip() not in HEAVY_MODULES
+        ):
+            continue
+        try:
+            rows.append((int(parts[1]), parts[2].strip()))
+        except ValueError:
+            continue
+    return sorted(rows, reverse=True)[:limit]
+
+
+def _drop_powersync_bytecode(pycache: str) -> None:
+    """Remove PowerSync's cached bytecode, keeping stdlib and third-party."""
+    shutil.rmtree(
+        Path(pycache) / ROOT.relative_to(ROOT.anchor) / "custom_components",
+        ignore_errors=True,
+    )
+
+
+def main() -> int:
+    if len(sys.argv) == 3 and sys.argv[1] == "--child":
+        _child(sys.argv[2])
+        return 0
+    importtime = "--importtime" in sys.argv[1:]
+    repeat = 3
+    if "--repeat" in sys.argv[1:]:
+        repeat = max(1, int(sys.argv[sys.argv.index("--repeat") + 1]))
+
+    print(
+        f"{'profile':10} {'cache':5} {'setup':>10} {'lazy views':>11} "
+        f"{'total':>10} {'rss':>9} {'delta':>9} {'modules':>8}  heavy"
+    )
+    with tempfile.TemporaryDirectory(prefix="powersync-pyc-") as pycache:
+        # Compile the stdlib and third-party packages once, outside the timings
+        _run_child("all", pycache)
+        for profile in PROFILES:
+            for cache in ("cold", "warm"):
+                runs = []
+                for _ in range(repeat):
+                    if cache == "cold":
+                        _drop_powersync_bytecode(pycache)
+                    runs.append(_run_child(profile, pycache)[0])
+                # Median by total time; run-to-run noise is large on shared hosts
+                runs.sort(key=lambda run: run["setup_ms"] + run["lazy_ms"])
+                stats = runs[len(runs) // 2]
+                print(
+                    f"{profile:10} {cache:5} {stats['setup_ms']:8.1f}ms "
+                    f"{stats['lazy_ms']:9.1f}ms "
+                    f"{stats['setup_ms'] + stats['lazy_ms']:8.1f}ms "
+                    f"{stats['rss_mib']:6.1f}MiB "
+                    f"{stats['rss_mib'] - stats['baseline_mib']:6.1f}MiB "
+                    f"{stats['modules']:8d}  {','.join(stats['heavy']) or '-'}"
+                )
+            if importtime:
+                _, log = _run_child(profile, pycache, importtime=True)
+                for cumulative_us, name in _slowest_modules(log):
+                    print(f"    {cumulative_us / 1000:8.1f}ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Compare per-slot TOU scans with the compiled tariff timeline.
+
+Prices a 48-hour, 5-minute optimizer horizon (576 slots) that crosses a
+season boundary, against a two-season tariff with layered weekday/weekend
+windows, three ways:
+
+* ``per-slot scan``: ``tariff_components_for_datetime`` plus
+  ``find_matching_tou_period`` for every slot, as the optimizer used to do,
+* ``compile + gather``: build the timeline from scratch (cold cache),
+  then index every slot,
+* ``cached gather``: the timeline for this tariff version already exists,
+  which is the steady state between tariff edits.
+
+Reports the median wall time of each. Only ``tariff_time`` is loaded, so no
+Home Assistant stubs are needed.
+
+Run from the repository root:
+    python scripts/benchmark_tou_timeline.py [repeats]
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+
+TARIFF_TIME_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "power_sync"
+    / "tariff_time.py"
+)
+START = datetime(2026, 10, 31, 0, 0)
+SLOTS = 48 * 12
+
+
+def _tariff_time():
+    spec = importlib.util.spec_from_file_location("bench_tariff_time", TARIFF_TIME_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def _window(from_day, to_day, from_hour, to_hour, **minutes):
+    return {
+        "fromDayOfWeek": from_day,
+        "toDayOfWeek": to_day,
+        "fromHour": from_hour,
+        "toHour": to_hour,
+        **minutes,
+    }
+
+
+def _tariff() -> dict:
+    winter = {
+        "OFF_PEAK": {"periods": [_window(0, 6, 0, 0)]},
+        "SHOULDER": {"periods": [_window(1, 5, 7, 15), _window(6, 0, 7, 22)]},
+        "PEAK": {"periods": [_window(1, 5, 15, 21, fromMinute=30)]},
+        "SUPER_OFF_PEAK": {"periods": [_window(0, 6, 23, 6, toMinute=30)]},
+    }
+    summer = {
+        **winter,
+        "PEAK": {"periods": [_window(1, 5, 14, 20), _window(6, 0, 17, 19)]},
+        "FREE": {"periods": [_window(0, 6, 11, 14)]},
+    }
+    return {
+        "tou_periods": winter,
+        "buy_rates": {"OFF_PEAK": 0.22, "SHOULDER": 0.31, "PEAK": 0.48},
+        "sell_rates": {"ALL": 0.05},
+        "seasons": {
+            "Winter": {"fromMonth": 4, "toMonth": 10, "tou_periods": winter},
+            "Summer": {"fromMonth": 11, "toMonth": 3, "tou_periods": summer},
+        },
+        "season_buy_rates": {
+            "Winter": {"OFF_PEAK": 0.22, "SHOULDER": 0.31, "PEAK": 0.48, "SUPER_OFF_PEAK": 0.12},
+            "Summer": {"OFF_PEAK": 0.2, "SHOULDER": 0.29, "PEAK": 0.55, "FREE": 0.0},
+        },
+        "season_sell_rates": {
+            "Winter": {"ALL": 0.05},
+            "Summer": {"ALL": 0.04, "PEAK": 0.12},
+        },
+    }
+
+
+def _scan(tariff_time, tariff, timestamps) -> list[str]:
+    periods = []
+    for ts in timestamps:
+        tou_periods, buy_rates, sell_rates, _ = tariff_time.tariff_components_for_datetime(
+            tariff, ts
+        )
+        periods.append(
+            tariff_time.find_matching_tou_period(
+                tou_periods,
+                ts,
+                default="OFF_PEAK",
+                buy_rates=buy_rates,
+                sell_rates=sell_rates,
+            )
+        )
+    return periods
+
+
+def _gather(tariff_time, tariff, timestamps) -> list[str]:
+    timeline = tariff_time.compile_tariff_timeline(tariff)
+    return [timeline.period_at(ts) for ts in timestamps]
+
+
+def _median_ms(run, repeats: int, before=None) -> float:
+    samples = []
+    for _ in range(repeats):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    tariff_time = _tariff_time()
+    tariff = _tariff()
+    timestamps = [START + timedelta(minutes=5 * slot) for slot in range(SLOTS)]
+    assert _scan(tariff_time, tariff, timestamps) == _gather(tariff_time, tariff, timestamps)
+
+    def clear_cache():
+        tariff_time._compiled_timeline.cache_clear()
+        tariff_time._compiled_week.cache_clear()
+
+    scan_ms = _median_ms(lambda: _scan(tariff_time, tariff, timestamps), repeats)
+    cold_ms = _median_ms(
+        lambda: _gather(tariff_time, tariff, timestamps),
+        repeats,
+        before=clear_cache,
+    )
+    warm_ms = _median_ms(lambda: _gather(tariff_time, tariff, timestamps), repeats)
+
+    print(f"slots={SLOTS} (48h x 5min, crosses Winter -> Summer) repeats={repeats}")
+    print(f"per-slot scan     {scan_ms:8.2f}ms")
+    print(f"compile + gather  {cold_ms:8.2f}ms  speedup={scan_ms / cold_ms:6.1f}x")
+    print(f"cached gather     {warm_ms:8.2f}ms  speedup={scan_ms / warm_ms:6.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import importlib.util
+import io
 import logging
+import zipfile
 from pathlib import Path
 
 
@@ -24,8 +26,11 @@ def _load_aemo_api_module():
 
 
 class _FakeResponse:
-    def __init__(self, *, text=None, json_data=None, error=None, enter_error=None):
+    def __init__(
+        self, *, text=None, json_data=None, body=None, error=None, enter_error=None
+    ):
         self._text = text
+        self._body = body
         self._json_data = json_data
         self._error = error
         self._enter_error = enter_error
@@ -48,6 +53,9 @@ class _FakeResponse:
     async def json(self):
         return self._json_data
 
+    async def read(self):
+        return self._body or b""
+
 
 class _FakeSession:
     closed = False
@@ -154,3 +162,90 @@ def test_json_fallback_timeout_returns_none(caplog):
         "Error fetching AEMO prices (JSON fallback)" in record.getMessage()
         for record in caplog.records
     )
+
+
+_DISPATCH_FILE = "PUBLIC_DISPATCHIS_202606011620_0000000520378945.zip"
+
+
+def _dispatch_zip(trailing_rows: int = 0) -> bytes:
+    lines = [
+        "C,NEMP.WORLD,DISPATCHIS,AEMO,PUBLIC,2026/06/01,16:15:07,0000000520378945",
+        "I,DISPATCH,PRICE,5,SETTLEMENTDATE,RUNNO,REGIONID,DISPATCHINTERVAL,INTERVENTION,RRP",
+    ]
+    for index, region in enumerate(("NSW1", "QLD1", "SA1", "TAS1", "VIC1")):
+        lines.append(
+            f'D,DISPATCH,PRICE,5,"2026/06/01 16:20:00",1,{region},20260601196,1,999'
+        )
+        lines.append(
+            f'D,DISPATCH,PRICE,5,"2026/06/01 16:20:00",1,{region},20260601196,0,{100 + index}.5'
+        )
+    # Later tables; a malformed row proves parsing stopped before reaching them
+    lines.append('D,DISPATCH,PRICE,5,"2026/06/01 16:20:00",1,NSW1,20260601196,0,oops')
+    lines.extend(f"D,DISPATCH,UNIT_SOLUTION,3,row{i}" for i in range(trailing_rows))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("PUBLIC_DISPATCHIS_202606011620.CSV", "\n".join(lines) + "\n")
+    return buffer.getvalue()
+
+
+class _DispatchSession(_FakeSession):
+    def __init__(self, module, body):
+        super().__init__(module)
+        self._body = body
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        if url == self._module.AEMOAPIClient.DISPATCH_URL:
+            return _FakeResponse(text=f'<a href="{_DISPATCH_FILE}">{_DISPATCH_FILE}</a>')
+        if url.endswith(_DISPATCH_FILE):
+            return _FakeResponse(body=self._body)
+        raise AssertionError(f"unexpected URL: {url}")
+
+
+def test_dispatch_parse_streams_price_rows_and_stops_after_all_regions():
+    module = _load_aemo_api_module()
+    client = module.AEMOAPIClient.__new__(module.AEMOAPIClient)
+
+    prices = client._parse_dispatch_zip(_dispatch_zip(trailing_rows=50))
+
+    assert set(prices) == set(module.AEMOAPIClient.REGIONS)
+    assert prices["NSW1"]["price"] == 100.5
+    assert prices["VIC1"]["price"] == 104.5
+    assert prices["SA1"]["timestamp"] == "2026/06/01 16:20:00"
+
+
+def test_dispatch_file_is_downloaded_once_across_instances():
+    module = _load_aemo_api_module()
+    body = _dispatch_zip()
+    session = _DispatchSession(module, body)
+    first = module.AEMOAPIClient(session)
+    second = module.AEMOAPIClient(session)
+    zip_url = f"{module.AEMOAPIClient.DISPATCH_URL}{_DISPATCH_FILE}"
+
+    async def run():
+        return await asyncio.gather(
+            first.get_current_prices_with_file(),
+            second.get_current_prices_with_file(),
+        )
+
+    results = asyncio.run(run())
+
+    for prices, is_new, filename in results:
+        assert prices["QLD1"]["price"] == 101.5
+        assert is_new is True
+        assert filename == _DISPATCH_FILE
+    assert session.urls.count(zip_url) == 1
+
+    third = module.AEMOAPIClient(session)
+    prices, is_new, _filename = asyncio.run(third.get_current_prices_with_file())
+    assert prices["QLD1"]["price"] == 101.5
+    assert is_new is True
+    assert session.urls.count(zip_url) == 1
+
+    diagnostics = module.AEMOAPIClient.dispatch_diagnostics()
+    assert diagnostics["downloads"] == 1
+    assert diagnostics["bytes_downloaded"] == len(body)
+    assert diagnostics["last_bytes"] == len(body)
+    assert diagnostics["shared_hits"] == 2
+    assert diagnostics["last_parse_ms"] >= 0
+    assert diagnostics["cached_file"] == _DISPATCH_FILE
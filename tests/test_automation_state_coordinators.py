@@ -6,6 +6,7 @@ import ast
 import asyncio
 import logging
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from types import ModuleType, SimpleNamespace
@@ -17,23 +18,24 @@ AUTOMATIONS_PATH = ROOT / "custom_components" / "power_sync" / "automations" / "
 TRIGGERS_PATH = ROOT / "custom_components" / "power_sync" / "automations" / "triggers.py"
 
 
-def _load_engine_method(name: str, namespace: dict[str, Any]):
+def _load_engine_method(name: str, namespace: dict[str, Any], *extra: str):
     tree = ast.parse(AUTOMATIONS_PATH.read_text())
     engine = next(
         node
         for node in tree.body
         if isinstance(node, ast.ClassDef) and node.name == "AutomationEngine"
     )
-    method = next(
+    methods = [
         node
         for node in engine.body
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == name
-    )
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        and node.name in (name, *extra)
+    ]
     extracted = ast.ClassDef(
         name="_ExtractedEngine",
         bases=[],
         keywords=[],
-        body=[method],
+        body=methods,
         decorator_list=[],
     )
     module = ast.fix_missing_locations(ast.Module(body=[extracted], type_ignores=[]))
@@ -53,6 +55,22 @@ def _load_trigger_function(name: str, namespace: dict[str, Any]):
     return namespace[name]
 
 
+def _load_module_constant(path: Path, name: str):
+    tree = ast.parse(path.read_text())
+    node = next(
+        node
+        for node in tree.body
+        if isinstance(node, (ast.Assign, ast.AnnAssign))
+        and name in [
+            target.id
+            for target in (
+                node.targets if isinstance(node, ast.Assign) else [node.target]
+            )
+        ]
+    )
+    return ast.literal_eval(node.value)
+
+
 def test_automation_current_state_includes_supported_battery_coordinators():
     tree = ast.parse(AUTOMATIONS_PATH.read_text())
     method = next(
@@ -618,3 +636,173 @@ def test_automation_ev_state_prefers_targetable_ble_when_activity_ties():
 
     assert state["is_charging"] is True
     assert state["vehicle_id"] == "ble_tesla_flinn"
+
+
+def test_required_state_facets_cover_triggers_conditions_and_actions():
+    namespace = {
+        "Any": Any,
+        "Dict": Dict,
+        **{
+            name: _load_module_constant(TRIGGERS_PATH, name)
+            for name in (
+                "TRIGGER_STATE_FACETS",
+                "CONDITION_STATE_FACETS",
+                "ACTION_STATE_FACETS",
+            )
+        },
+    }
+    required_state_facets = _load_trigger_function("required_state_facets", namespace)
+
+    assert required_state_facets(
+        {
+            "trigger": {"trigger_type": "price"},
+            "conditions": [{"condition_type": "battery"}],
+            "actions": [{"action_type": "force_charge"}],
+        }
+    ) == {"prices"}
+    assert required_state_facets({"trigger": {"trigger_type": "battery"}}) == set()
+    assert required_state_facets(
+        {
+            "trigger": {"trigger_type": "time"},
+            "if_conditions": [{"condition_type": "weather"}],
+            "conditions": [{"condition_type": "solar_forecast"}],
+            "actions": [{"action_type": "stop_ev_charging"}],
+        }
+    ) == {"weather", "solar_forecast", "ev"}
+    assert required_state_facets(
+        {
+            "trigger": {"trigger_type": "ocpp"},
+            "notification_only": True,
+            "actions": [{"action_type": "stop_ev_charging"}],
+        }
+    ) == {"ocpp"}
+
+    # Every evaluator type must declare its facets, even if it needs none.
+    source = TRIGGERS_PATH.read_text()
+    trigger_types = set(_load_module_constant(TRIGGERS_PATH, "TRIGGER_STATE_FACETS"))
+    condition_types = set(_load_module_constant(TRIGGERS_PATH, "CONDITION_STATE_FACETS"))
+    for trigger_type in trigger_types:
+        assert f'"{trigger_type}"' in source
+    assert condition_types <= trigger_types | {"time"}
+
+
+def _facet_engine(monkeypatch, fetched):
+    power_sync = ModuleType("power_sync")
+    power_sync.__path__ = []
+    const = ModuleType("power_sync.const")
+    const.DOMAIN = "power_sync"
+    const.CONF_AEMO_REGION = "aemo_region"
+    monkeypatch.setitem(sys.modules, "power_sync", power_sync)
+    monkeypatch.setitem(sys.modules, "power_sync.const", const)
+
+    engine_class = _load_engine_method(
+        "_async_get_current_state",
+        {
+            "Any": Any,
+            "Dict": Dict,
+            "Optional": Optional,
+            "datetime": datetime,
+            "timezone": timezone,
+            "time": time,
+            "STATE_FACET_TTL_SECONDS": _load_module_constant(
+                AUTOMATIONS_PATH, "STATE_FACET_TTL_SECONDS"
+            ),
+            "_LOGGER": logging.getLogger(__name__),
+            "__package__": "power_sync.automations",
+        },
+        "_async_get_facet",
+        "get_state_diagnostics",
+    )
+    engine = object.__new__(engine_class)
+    engine._facet_cache = {}
+    engine._facet_stats = {}
+    engine._last_facets = []
+    engine._config_entry = SimpleNamespace(entry_id="entry", options={}, data={})
+    engine._hass = SimpleNamespace(
+        config=SimpleNamespace(time_zone="UTC"),
+        data={
+            "power_sync": {
+                "entry": {
+                    "tesla_coordinator": SimpleNamespace(
+                        data={"battery_level": 55, "grid_power": 1.0}
+                    ),
+                    "amber_coordinator": SimpleNamespace(
+                        data={
+                            "current": [
+                                {"channelType": "general", "perKwh": 31.0},
+                                {"channelType": "feedIn", "perKwh": -7.0},
+                            ]
+                        }
+                    ),
+                    "force_charge_state": {},
+                    "force_discharge_state": {},
+                }
+            }
+        },
+    )
+
+    def _fetcher(facet, value):
+        async def _fetch():
+            fetched.append(facet)
+            return value
+
+        return _fetch
+
+    engine._async_get_ev_state = _fetcher("ev", {"is_plugged_in": True})
+    engine._async_get_ocpp_state = _fetcher("ocpp", {"status": "charging"})
+    engine._async_get_solar_forecast = _fetcher("solar_forecast", {"source": "solcast"})
+    engine._async_get_weather = _fetcher("weather", "sunny")
+    return engine
+
+
+def test_price_and_battery_automations_skip_ev_ocpp_and_weather(monkeypatch):
+    fetched = []
+    engine = _facet_engine(monkeypatch, fetched)
+
+    state = asyncio.run(engine._async_get_current_state({"prices"}))
+
+    assert fetched == []
+    assert state["battery_percent"] == 55
+    assert state["import_price"] == 0.31
+    assert state["export_price"] == 0.07
+    assert state["ev_state"] == {}
+    assert state["weather"] is None
+
+    state = asyncio.run(engine._async_get_current_state(set()))
+
+    assert fetched == []
+    assert state["battery_percent"] == 55
+    assert state["import_price"] is None
+
+    state = asyncio.run(engine._async_get_current_state())
+
+    assert fetched == ["ev", "ocpp", "solar_forecast", "weather"]
+    assert state["ocpp_state"] == {"status": "charging"}
+    assert state["solcast_forecast"] == {"source": "solcast"}
+
+
+def test_state_facets_are_memoized_per_ttl_and_timed(monkeypatch):
+    fetched = []
+    engine = _facet_engine(monkeypatch, fetched)
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+
+    for _ in range(3):
+        state = asyncio.run(engine._async_get_current_state({"ev", "weather"}))
+        clock[0] += 30
+
+    assert state["weather"] == "sunny"
+    assert fetched == ["ev", "weather", "ev", "ev"]
+
+    clock[0] += 900
+    asyncio.run(engine._async_get_current_state({"weather"}))
+    assert fetched[-1] == "weather"
+
+    diagnostics = engine.get_state_diagnostics()["facets"]
+    assert diagnostics["ev"]["fetches"] == 3
+    assert diagnostics["ev"]["cache_hits"] == 0
+    assert diagnostics["weather"]["fetches"] == 2
+    assert diagnostics["weather"]["cache_hits"] == 2
+    assert diagnostics["weather"]["ttl_s"] == 900
+    assert diagnostics["weather"]["avg_ms"] is not None
+    assert "ocpp" not in diagnostics
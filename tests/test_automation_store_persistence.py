@@ -0,0 +1,178 @@
+"""Tests for batched AutomationStore persistence."""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+ROOT = Path(__file__).resolve().parent.parent
+AUTOMATIONS_PATH = ROOT / "custom_components" / "power_sync" / "automations" / "__init__.py"
+
+
+class _FakeStore:
+    """Minimal HA Store: delayed saves run only when ``fire`` is called."""
+
+    files: dict[str, Any] = {}
+
+    def __init__(self, hass, version, key):
+        self.key = key
+        self.writes = []
+        self.pending = None
+
+    async def async_load(self):
+        return _FakeStore.files.get(self.key)
+
+    async def async_save(self, data):
+        self.pending = None
+        self._write(data)
+
+    def async_delay_save(self, data_func, delay=0):
+        self.pending = (data_func, delay)
+
+    def fire(self):
+        data_func, _delay = self.pending
+        self.pending = None
+        self._write(data_func())
+
+    def _write(self, data):
+        self.writes.append(data)
+        _FakeStore.files[self.key] = data
+
+
+def _load_store_class():
+    tree = ast.parse(AUTOMATIONS_PATH.read_text())
+    body = [
+        node
+        for node in tree.body
+        if (isinstance(node, ast.ClassDef) and node.name == "AutomationStore")
+        or (
+            isinstance(node, ast.Assign)
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id.isupper()
+            and not node.targets[0].id.startswith("_")
+        )
+    ]
+    namespace = {
+        "Any": Any,
+        "Dict": Dict,
+        "HomeAssistant": object,
+        "List": List,
+        "Optional": Optional,
+        "Store": _FakeStore,
+        "datetime": datetime,
+        "time": time,
+        "timezone": timezone,
+        "_LOGGER": logging.getLogger(__name__),
+    }
+    module = ast.fix_missing_locations(ast.Module(body=body, type_ignores=[]))
+    exec(compile(module, str(AUTOMATIONS_PATH), "exec"), namespace)
+    return namespace["AutomationStore"], namespace
+
+
+AutomationStore, NAMESPACE = _load_store_class()
+
+
+def _store(automations):
+    _FakeStore.files = {}
+    store = AutomationStore(object())
+    store._data = {
+        "automations": automations,
+        "next_id": len(automations) + 1,
+        "push_tokens": {"t": {"token": "ExponentPushToken[x]"}},
+    }
+    return store
+
+
+def test_trigger_burst_coalesces_into_one_runtime_write():
+    store = _store([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+
+    for automation_id in (1, 2, 1):
+        assert store.mark_triggered(automation_id) is False
+    store.update_trigger_runtime(2, {"accumulated_kwh": 1.5})
+
+    assert store._store.writes == []
+    assert store._runtime_store.pending[1] == NAMESPACE["RUNTIME_SAVE_DELAY"]
+    store._runtime_store.fire()
+
+    (written,) = store._runtime_store.writes
+    assert set(written["automations"]) == {"1", "2"}
+    assert written["automations"]["2"]["trigger_runtime"] == {"accumulated_kwh": 1.5}
+    assert "push_tokens" not in written
+    stats = store.persistence_stats()
+    assert stats["runtime_writes"] == 1
+    assert stats["definitions_writes"] == 0
+    assert stats["writes_avoided"] == 3
+    assert stats["last_flush_latency_ms"] is not None
+    assert stats["pending"] == []
+
+
+def test_run_once_pause_is_reported_for_immediate_save():
+    store = _store([{"id": 1, "run_once": True}])
+
+    assert store.mark_triggered(1) is True
+    assert store.get_by_id(1)["paused"] is True
+
+
+def test_definitions_file_excludes_runtime_fields_and_load_merges_them():
+    store = _store([{"id": 7, "name": "Cheap", "trigger": {"trigger_type": "price"}}])
+    store._data["ev_runtime_state"] = {"last_commands": {}}
+    store.update_trigger_state(7, 0.12)
+    store.mark_triggered(7)
+
+    asyncio.run(store.async_save())
+
+    definitions = _FakeStore.files[NAMESPACE["STORAGE_KEY"]]
+    runtime = _FakeStore.files[NAMESPACE["RUNTIME_STORAGE_KEY"]]
+    assert definitions["automations"] == [
+        {"id": 7, "name": "Cheap", "trigger": {"trigger_type": "price"}}
+    ]
+    assert "ev_runtime_state" not in definitions
+    assert runtime["automations"]["7"]["last_evaluated_value"] == 0.12
+    assert runtime["ev_runtime_state"] == {"last_commands": {}}
+
+    reloaded = AutomationStore(object())
+    asyncio.run(reloaded.async_load())
+
+    auto = reloaded.get_by_id(7)
+    assert auto["name"] == "Cheap"
+    assert auto["last_evaluated_value"] == 0.12
+    assert "last_triggered_at" in auto
+    assert reloaded._data["ev_runtime_state"] == {"last_commands": {}}
+    assert reloaded.persistence_stats()["pending"] == []
+
+
+def test_legacy_runtime_fields_are_migrated_on_first_save():
+    _FakeStore.files = {
+        NAMESPACE["STORAGE_KEY"]: {
+            "automations": [{"id": 3, "last_triggered_at": "2026-01-01T00:00:00Z"}],
+            "next_id": 4,
+        }
+    }
+    store = AutomationStore(object())
+    asyncio.run(store.async_load())
+
+    assert store.persistence_stats()["pending"] == ["runtime"]
+    asyncio.run(store.async_flush())
+
+    runtime = _FakeStore.files[NAMESPACE["RUNTIME_STORAGE_KEY"]]
+    assert runtime["automations"]["3"]["last_triggered_at"] == "2026-01-01T00:00:00Z"
+    assert store._store.writes == []
+
+
+def test_flush_writes_pending_changes_once():
+    store = _store([{"id": 1}])
+    store.mark_triggered(1)
+    store.mark_triggered(1)
+
+    asyncio.run(store.async_flush())
+    asyncio.run(store.async_flush())
+
+    assert store._store.writes == []
+    assert len(store._runtime_store.writes) == 1
+    assert store.persistence_stats()["writes_avoided"] == 1
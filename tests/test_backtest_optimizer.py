@@ -0,0 +1,121 @@
+"""Tests for the offline optimizer backtest harness."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPT_PATH = ROOT / "scripts" / "backtest_optimizer.py"
+
+_SENTINEL = object()
+
+_STUB_MODULE_NAMES = (
+    "homeassistant",
+    "homeassistant.util",
+    "homeassistant.util.dt",
+    "power_sync",
+    "power_sync.optimization",
+    "power_sync.optimization.battery_efficiency",
+    "power_sync.optimization.battery_optimizer",
+    "power_sync.optimization.schedule_reader",
+)
+
+
+@pytest.fixture()
+def backtest():
+    saved_modules = {
+        name: sys.modules.get(name, _SENTINEL)
+        for name in _STUB_MODULE_NAMES
+    }
+    for name in _STUB_MODULE_NAMES:
+        sys.modules.pop(name, None)
+
+    spec = importlib.util.spec_from_file_location(
+        "power_sync_backtest_optimizer_test", SCRIPT_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    # Pool workers unpickle the replay function by module name.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    module._optimizer_module()
+    try:
+        yield module
+    finally:
+        sys.modules.pop(spec.name, None)
+        for name in _STUB_MODULE_NAMES:
+            if saved_modules[name] is _SENTINEL:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = saved_modules[name]
+
+
+def _settings(backtest) -> dict:
+    return {
+        "interval_minutes": 60,
+        "battery": {**backtest.DEFAULT_BATTERY, "horizon_hours": 12},
+        "optimize": {},
+    }
+
+
+def test_simulated_battery_follows_actual_load_and_respects_limits(backtest):
+    optimizer = backtest._optimizer_module().BatteryOptimizer(
+        capacity_wh=10000, max_charge_w=5000, max_discharge_w=5000, backup_reserve=0.2
+    )
+    optimizer.charge_efficiency = optimizer.discharge_efficiency = 1.0
+
+    # Self-consumption covers the *actual* net load, stopping at the reserve.
+    action = SimpleNamespace(action="self_consumption", power_w=0.0)
+    grid_kw, soc = backtest.simulate_interval(optimizer, action, 0.25, 0.0, 3.0, 1.0)
+    assert grid_kw == pytest.approx(2.5)
+    assert soc == pytest.approx(0.2)
+
+    # A forced charge runs at the planned power, clipped to the headroom.
+    charge = SimpleNamespace(
+        action="charge", power_w=4000.0, battery_charge_w=4000.0, battery_discharge_w=0.0
+    )
+    grid_kw, soc = backtest.simulate_interval(optimizer, charge, 0.9, 0.0, 0.5, 1.0)
+    assert grid_kw == pytest.approx(1.5)
+    assert soc == pytest.approx(1.0)
+
+    idle = SimpleNamespace(action="idle", power_w=0.0)
+    assert backtest.simulate_interval(optimizer, idle, 0.5, 2.0, 0.5, 1.0) == (
+        pytest.approx(-1.5),
+        0.5,
+    )
+
+
+def test_replay_reports_cost_latency_and_solver_mix(backtest):
+    day = backtest.synthetic_days(1, interval_minutes=60, lookahead_hours=6)[0]
+
+    result = backtest.replay_day(day, _settings(backtest))
+
+    assert result["intervals"] == 24
+    assert len(result["latencies_ms"]) == 24
+    assert sum(result["solvers"].values()) == 24
+    assert result["realized_cost"] < result["baseline_cost"]
+    assert 0.0 <= result["final_soc"] <= 1.0
+
+
+def test_parallel_backtest_matches_serial_and_flags_regressions(backtest):
+    days = backtest.synthetic_days(2, interval_minutes=60, lookahead_hours=6, seed=3)
+    settings = _settings(backtest)
+
+    serial = backtest.run_backtest(days, settings, workers=1)
+    parallel = backtest.run_backtest(days, settings, workers=2)
+
+    assert parallel["days"] == serial["days"]
+    assert serial["solves"] == 48
+    assert set(serial["latency_ms"]) == {"p50", "p95", "p99", "max"}
+    assert backtest.compare_reports(serial, serial) == []
+
+    worse = {**serial, "realized_cost": serial["realized_cost"] + 1.0, "fallback_count": 2}
+    regressions = backtest.compare_reports(worse, serial)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("realized cost")
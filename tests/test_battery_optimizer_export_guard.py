@@ -1222,6 +1222,9 @@ def test_solve_lp_highs_keeps_time_limit_incumbent(
         def addRow(self, *args, **kwargs):
             pass
 
+        def passModel(self, lp):
+            self._n_cols = lp.num_col_
+
         def run(self):
             pass
 
@@ -1247,6 +1250,8 @@ def test_solve_lp_highs_keeps_time_limit_incumbent(
     fake_highspy = types.SimpleNamespace(
         kHighsInf=real_highspy.kHighsInf,
         Highs=_FakeHighs,
+        HighsLp=real_highspy.HighsLp,
+        MatrixFormat=real_highspy.MatrixFormat,
         HighsModelStatus=real_highspy.HighsModelStatus,
         kSolutionStatusFeasible=real_highspy.kSolutionStatusFeasible,
     )
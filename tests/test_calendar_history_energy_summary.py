@@ -52,6 +52,9 @@ def _calendar_namespace() -> dict[str, Any]:
         "_find_season_for_month",
         "_weighted_avg_rates",
         "_calendar_current_optimizer_cost_summary",
+        "_calendar_entry_from_ledger_totals",
+        "_calendar_energy_ledger",
+        "_calendar_time_series_from_energy_ledger",
         "_calendar_result_from_energy_summary",
     }
     body: list[ast.stmt] = []
@@ -1291,3 +1294,196 @@ def test_subdaily_hour_averages_both_half_hour_tariff_rates():
     assert result["import_cost"] == 30.0
     assert result["export_earnings"] == 1.6
     assert result["net_cost"] == 28.4
+
+
+def _ledger_coordinator(
+    tmp_path,
+    *,
+    priced: bool = True,
+    start: datetime = datetime(2026, 5, 11, 0, 0, tzinfo=timezone.utc),
+    minutes: int = 5 * 24 * 60,
+):
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(
+        "power_sync_energy_ledger_calendar_test",
+        INIT_PATH.parent / "energy_ledger.py",
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+
+    ledger = module.EnergyLedger(None, path=str(tmp_path / "ledger"))
+    asyncio.run(ledger.async_load(timezone.utc))
+    for minute in range(minutes):
+        grid_in = 0.01
+        ledger.add(
+            start + timedelta(minutes=minute),
+            (
+                0.02, grid_in, 0.0, 0.0, 0.0, 0.03,
+                grid_in * 0.25, 0.0,
+                grid_in if priced or minute % 2 else 0.0, 0.0,
+            ),
+        )
+    accumulator = SimpleNamespace(
+        ledger=ledger,
+        _priced_coverage_is_partial=lambda covered, measured: (
+            covered + max(0.05, measured * 0.02) < measured
+        ),
+    )
+    return SimpleNamespace(_energy_acc=accumulator, data={"energy_summary": {}})
+
+
+def test_ledger_answers_calendar_history_without_recorder(tmp_path):
+    namespace = _calendar_namespace()
+    coordinator = _ledger_coordinator(tmp_path)
+
+    async def unexpected_recorder(*_args: Any, **_kwargs: Any):
+        raise AssertionError("recorder must only backfill ranges before the ledger")
+
+    namespace["_calendar_time_series_from_statistics"] = unexpected_recorder
+    namespace["_calculate_cost_from_statistics"] = unexpected_recorder
+
+    day = asyncio.run(
+        namespace["_calendar_result_from_energy_summary"](
+            SimpleNamespace(), "day", "2026-05-15", coordinator, "entry-1", None, "Sigenergy"
+        )
+    )
+    assert day["history_source"] == "energy_ledger"
+    assert len(day["time_series"]) == 24
+    assert day["time_series"][0]["timestamp"] == "2026-05-15T00:00:00+00:00"
+    assert day["time_series"][0]["grid_import"] == 600.0
+    assert day["cost_summary"]["import_cost"] == 3.6
+    assert day["cost_summary"]["estimated"] is False
+    assert day["energy_ledger"]["first_interval"] == "2026-05-11T00:00:00+00:00"
+    assert day["energy_ledger"]["gaps"] == 0
+
+    week = asyncio.run(
+        namespace["_calendar_result_from_energy_summary"](
+            SimpleNamespace(), "week", "2026-05-16", coordinator, "entry-1", None, "Sigenergy"
+        )
+    )
+    assert week["history_source"] == "energy_ledger"
+    assert [row["timestamp"][:10] for row in week["time_series"]] == [
+        "2026-05-11",
+        "2026-05-12",
+        "2026-05-13",
+        "2026-05-14",
+        "2026-05-15",
+    ]
+    assert week["cost_summary"]["import_cost"] == 18.0
+
+    # May 1 predates the ledger's first interval: Recorder stays the backfill.
+    recorder_periods: list[str] = []
+
+    async def recorder_backfill(_hass: Any, period: str, *_args: Any):
+        recorder_periods.append(period)
+        return [], "long_term_statistics_unavailable"
+
+    namespace["_calendar_time_series_from_statistics"] = recorder_backfill
+    month = asyncio.run(
+        namespace["_calendar_result_from_energy_summary"](
+            SimpleNamespace(), "month", "2026-04-30", coordinator, "entry-1",
+            {"buy_rates": {"ALL": 0.3}, "sell_rates": {}, "seasons": {}, "tou_periods": {}},
+            "Sigenergy",
+        )
+    )
+    assert recorder_periods == ["month"]
+    assert month["history_source"] == "long_term_statistics_unavailable"
+
+
+def test_ledger_withholds_costs_when_priced_coverage_is_partial(tmp_path):
+    namespace = _calendar_namespace()
+    coordinator = _ledger_coordinator(tmp_path, priced=False)
+    cost_periods: list[str] = []
+
+    async def recorder_costs(_hass: Any, period: str, _end_date: str | None):
+        cost_periods.append(period)
+        return None
+
+    namespace["_calculate_cost_from_statistics"] = recorder_costs
+    result = asyncio.run(
+        namespace["_calendar_result_from_energy_summary"](
+            SimpleNamespace(), "day", "2026-05-15", coordinator, "entry-1", None, "Sigenergy"
+        )
+    )
+
+    assert result["history_source"] == "energy_ledger"
+    assert "cost_summary" not in result
+    assert cost_periods == ["day"]
+
+
+def test_ledger_backfills_only_the_range_before_its_first_full_day(tmp_path):
+    namespace = _calendar_namespace()
+    coordinator = _ledger_coordinator(tmp_path)
+    recorder_calls: list[tuple[str, Any]] = []
+    cost_ranges: list[tuple[datetime, datetime]] = []
+
+    async def recorder_backfill(
+        _hass: Any, period: str, _end_date: Any, _coordinator: Any, _entry_id: Any,
+        until: datetime | None = None,
+    ):
+        recorder_calls.append((period, until))
+        return [
+            {"timestamp": "2026-05-01T00:00:00+00:00", "grid_import": 5000.0}
+        ], "long_term_statistics"
+
+    async def recorder_cost_range(_hass: Any, start: datetime, end: datetime):
+        cost_ranges.append((start, end))
+        return {"import_cost": 5.0, "export_earnings": 1.0, "net_cost": 4.0}
+
+    namespace["_calendar_time_series_from_statistics"] = recorder_backfill
+    namespace["_calculate_cost_from_statistics_range"] = recorder_cost_range
+    month = asyncio.run(
+        namespace["_calendar_result_from_energy_summary"](
+            SimpleNamespace(), "month", "2026-05-16", coordinator, "entry-1", None, "Sigenergy"
+        )
+    )
+
+    ledger_start = datetime(2026, 5, 11, tzinfo=timezone.utc)
+    assert recorder_calls == [("month", ledger_start)]
+    assert cost_ranges == [(datetime(2026, 5, 1, tzinfo=timezone.utc), ledger_start)]
+    assert month["history_source"] == "energy_ledger_with_statistics"
+    assert [row["timestamp"][:10] for row in month["time_series"]] == [
+        "2026-05-01",
+        "2026-05-11",
+        "2026-05-12",
+        "2026-05-13",
+        "2026-05-14",
+        "2026-05-15",
+    ]
+    assert month["cost_summary"]["import_cost"] == 23.0
+    assert month["cost_summary"]["export_earnings"] == 1.0
+
+
+def test_ledger_started_mid_day_serves_hours_after_its_first_full_hour(tmp_path):
+    namespace = _calendar_namespace()
+    coordinator = _ledger_coordinator(
+        tmp_path,
+        start=datetime(2026, 5, 15, 9, 40, tzinfo=timezone.utc),
+        minutes=140,
+    )
+    recorder_calls: list[Any] = []
+
+    async def recorder_backfill(*_args: Any, until: datetime | None = None):
+        recorder_calls.append(until)
+        return [], "long_term_statistics_unavailable"
+
+    async def no_recorder_costs(*_args: Any):
+        return None
+
+    namespace["_calendar_time_series_from_statistics"] = recorder_backfill
+    namespace["_calculate_cost_from_statistics_range"] = no_recorder_costs
+    namespace["_calculate_cost_from_statistics"] = no_recorder_costs
+    day = asyncio.run(
+        namespace["_calendar_result_from_energy_summary"](
+            SimpleNamespace(), "day", "2026-05-15", coordinator, "entry-1", None, "Sigenergy"
+        )
+    )
+
+    assert recorder_calls == [datetime(2026, 5, 15, 10, 0, tzinfo=timezone.utc)]
+    assert day["history_source"] == "energy_ledger_with_statistics"
+    assert [row["timestamp"][11:13] for row in day["time_series"]] == ["10", "11"]
+    # The 09:40-10:00 intervals have no Recorder cost to pair with, and the
+    # whole-day Recorder cost fallback has none either.
+    assert "cost_summary" not in day
@@ -13,6 +13,7 @@ from types import SimpleNamespace
 ROOT = Path(__file__).resolve().parent.parent
 CONFIG_FLOW_PATH = ROOT / "custom_components" / "power_sync" / "config_flow.py"
 INIT_PATH = ROOT / "custom_components" / "power_sync" / "__init__.py"
+EV_VIEWS_PATH = INIT_PATH.with_name("ev_views.py")
 CONST_PATH = ROOT / "custom_components" / "power_sync" / "const.py"
 SENSOR_PATH = ROOT / "custom_components" / "power_sync" / "sensor.py"
 STRINGS_PATH = ROOT / "custom_components" / "power_sync" / "strings.json"
@@ -126,9 +127,9 @@ def _options_flow_method(
 
 
 def _init_class_method(
-    class_name: str, method_name: str
+    class_name: str, method_name: str, path: Path = INIT_PATH
 ) -> ast.FunctionDef | ast.AsyncFunctionDef:
-    tree = ast.parse(INIT_PATH.read_text())
+    tree = ast.parse(path.read_text())
     for node in tree.body:
         if isinstance(node, ast.ClassDef) and node.name == class_name:
             for item in node.body:
@@ -604,8 +605,8 @@ def test_ev_charging_sigenergy_charger_slave_id_allows_247():
 
 
 def test_vehicle_config_creation_preserves_sigenergy_fields():
-    source = INIT_PATH.read_text()
-    method = _init_class_method("VehicleChargingConfigView", "post")
+    source = EV_VIEWS_PATH.read_text()
+    method = _init_class_method("VehicleChargingConfigView", "post", EV_VIEWS_PATH)
     method_source = ast.get_source_segment(source, method)
 
     assert method_source is not None
@@ -1797,6 +1798,31 @@ def test_no_idle_option_is_available_for_every_provider():
         assert "BooleanSelector()" in method_source
 
 
+def test_solver_process_toggle_is_exposed_in_optimization_options():
+    source = CONFIG_FLOW_PATH.read_text()
+    method = _options_flow_method("async_step_optimization")
+    method_source = ast.get_source_segment(source, method)
+
+    assert method_source is not None
+    assert (
+        "new_options[CONF_OPTIMIZATION_SOLVER_PROCESS] = solver_process_enabled"
+        in method_source
+    )
+    assert "DEFAULT_OPTIMIZATION_SOLVER_PROCESS" in method_source
+    # The pool is built with the coordinator, so a change reloads the entry.
+    structural = method_source[method_source.index("structural_change = (") :]
+    assert "CONF_OPTIMIZATION_SOLVER_PROCESS" in structural[: structural.index("\n\n")]
+
+    for path in (STRINGS_PATH, TRANSLATIONS_PATH):
+        section = json.loads(path.read_text())["options"]["step"]["optimization"][
+            "sections"
+        ]["dispatch_behaviour"]
+        assert section["data"]["optimization_solver_process"]
+        assert "falls back" in section["data_description"][
+            "optimization_solver_process"
+        ]
+
+
 def test_powerwall_smart_optimization_hides_spread_options():
     source = CONFIG_FLOW_PATH.read_text()
 
@@ -813,3 +813,36 @@ def test_hardware_coverage_latch_respects_daily_materiality(
         assert summary["avg_cost_per_kwh_mtd"] is None
     else:
         assert summary["avg_cost_per_kwh_mtd"] == pytest.approx(-0.071)
+
+
+def test_ledger_intervals_match_accumulator_totals_across_midnight(tmp_path):
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(
+        "power_sync_energy_ledger_accumulator_test",
+        COORDINATOR_PATH.parent / "energy_ledger.py",
+    )
+    ledger_module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(ledger_module)
+
+    clock = _Clock(datetime(2026, 6, 30, 23, 50, 0))
+    accumulator = _new_accumulator(clock)
+    accumulator.ledger = ledger_module.EnergyLedger(None, path=str(tmp_path / "ledger"))
+    asyncio.run(accumulator.ledger.async_load(None))
+
+    june_import = 0.0
+    for _ in range(40):
+        accumulator.update(1.0, 2.0, -0.5, 2.5, buy_price_per_kwh=0.3)
+        if clock.current.day == 30:
+            june_import = accumulator.grid_import_kwh
+        clock.current += timedelta(seconds=30)
+    asyncio.run(accumulator.async_flush())
+
+    june = accumulator.ledger.totals(datetime(2026, 6, 30).date(), datetime(2026, 6, 30).date())
+    july = accumulator.ledger.totals(datetime(2026, 7, 1).date(), datetime(2026, 7, 1).date())
+    assert june["grid_import_kwh"] == pytest.approx(june_import, abs=1e-5)
+    assert july["grid_import_kwh"] == pytest.approx(accumulator.grid_import_kwh, abs=1e-5)
+    assert july["import_cost"] == pytest.approx(accumulator.import_cost_today, abs=1e-5)
+    assert july["battery_charge_kwh"] == pytest.approx(accumulator.battery_charge_kwh, abs=1e-5)
+    assert (tmp_path / "ledger").stat().st_size == accumulator.ledger.records * 44
@@ -0,0 +1,162 @@
+"""Tests for the append-only per-interval energy ledger and its rollups."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+
+LEDGER_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "power_sync"
+    / "energy_ledger.py"
+)
+SYDNEY = ZoneInfo("Australia/Sydney")
+
+
+@pytest.fixture(scope="module")
+def module():
+    spec = importlib.util.spec_from_file_location(
+        "power_sync_energy_ledger_test", LEDGER_PATH
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = loaded
+    spec.loader.exec_module(loaded)
+    yield loaded
+    sys.modules.pop(spec.name, None)
+
+
+def _sample(solar=0.0, grid_in=0.0, grid_out=0.0, load=0.0, buy=None, sell=None):
+    return (
+        solar,
+        grid_in,
+        grid_out,
+        0.0,
+        0.0,
+        load,
+        grid_in * buy if buy is not None else 0.0,
+        grid_out * sell if sell is not None else 0.0,
+        grid_in if buy is not None else 0.0,
+        grid_out if sell is not None else 0.0,
+    )
+
+
+def _feed(ledger, start: datetime, minutes: int, **values) -> None:
+    for minute in range(minutes):
+        ledger.add(start + timedelta(minutes=minute), _sample(**values))
+
+
+def test_records_round_trip_into_identical_rollups(module, tmp_path):
+    path = str(tmp_path / "ledger")
+    ledger = module.EnergyLedger(None, path=path)
+    asyncio.run(ledger.async_load(SYDNEY))
+
+    _feed(ledger, datetime(2026, 5, 31, 23, 0, tzinfo=SYDNEY), 120, grid_in=0.01, buy=0.3)
+    _feed(ledger, datetime(2026, 6, 1, 12, 0, tzinfo=SYDNEY), 30, solar=0.05, grid_out=0.02, sell=0.05)
+    asyncio.run(ledger.async_flush(close_open=True))
+
+    assert (tmp_path / "ledger").stat().st_size == ledger.records * module._RECORD.size
+    restored = module.EnergyLedger(None, path=path)
+    asyncio.run(restored.async_load(SYDNEY))
+
+    for source in (ledger, restored):
+        may = source.totals(date(2026, 5, 1), date(2026, 5, 31))
+        june = source.totals(date(2026, 6, 1), date(2026, 6, 30))
+        assert may["grid_import_kwh"] == pytest.approx(0.6, abs=1e-4)
+        assert may["import_cost"] == pytest.approx(0.18, abs=1e-4)
+        assert june["grid_import_kwh"] == pytest.approx(0.6, abs=1e-4)
+        assert june["solar_kwh"] == pytest.approx(1.5, abs=1e-4)
+        assert june["export_earnings"] == pytest.approx(0.03, abs=1e-4)
+        year = source.totals(date(2026, 1, 1), date(2026, 12, 31))
+        assert year["grid_import_kwh"] == pytest.approx(1.2, abs=1e-4)
+        assert [day for day, _ in source.day_totals(date(2026, 5, 25), date(2026, 6, 7))] == [
+            date(2026, 5, 31),
+            date(2026, 6, 1),
+        ]
+
+
+def test_hourly_rows_merge_file_pending_and_open_intervals(module, tmp_path):
+    path = str(tmp_path / "ledger")
+    ledger = module.EnergyLedger(None, path=path)
+    asyncio.run(ledger.async_load(SYDNEY))
+    start = datetime(2026, 6, 1, 9, 0, tzinfo=SYDNEY)
+    _feed(ledger, start, 60, load=0.02)
+    asyncio.run(ledger.async_flush())
+    # Closed but not yet written, then an interval still in progress.
+    _feed(ledger, start + timedelta(hours=1), 7, load=0.02)
+
+    hours = asyncio.run(
+        ledger.async_hourly_totals(
+            datetime(2026, 6, 1, tzinfo=SYDNEY), datetime(2026, 6, 2, tzinfo=SYDNEY)
+        )
+    )
+
+    assert [hour.hour for hour, _ in hours] == [9, 10]
+    assert hours[0][1]["load_kwh"] == pytest.approx(1.2, abs=1e-4)
+    assert hours[1][1]["load_kwh"] == pytest.approx(0.14, abs=1e-4)
+    assert ledger.range_reads == 1
+
+
+def test_restart_never_writes_behind_the_file_and_drops_torn_records(module, tmp_path):
+    path = tmp_path / "ledger"
+    ledger = module.EnergyLedger(None, path=str(path))
+    asyncio.run(ledger.async_load(timezone.utc))
+    start = datetime(2026, 6, 1, 0, 0, tzinfo=timezone.utc)
+    _feed(ledger, start, 12, solar=0.1)
+    asyncio.run(ledger.async_flush(close_open=True))
+    with path.open("ab") as handle:
+        handle.write(b"\x01\x02\x03")
+
+    restarted = module.EnergyLedger(None, path=str(path))
+    asyncio.run(restarted.async_load(timezone.utc))
+    assert path.stat().st_size == 3 * module._RECORD.size
+    # A clock that stepped back is folded into the last written interval.
+    restarted.add(start + timedelta(minutes=2), _sample(solar=0.5))
+    asyncio.run(restarted.async_flush(close_open=True))
+
+    slots = [record[0] for record in module._RECORD.iter_unpack(path.read_bytes())]
+    assert slots == sorted(slots)
+    assert restarted.history_start(timezone.utc, hourly=True) == start
+    assert restarted.totals(date(2026, 6, 1), date(2026, 6, 1))["solar_kwh"] == pytest.approx(
+        1.7, abs=1e-4
+    )
+
+
+def test_downtime_gaps_are_counted_in_stats_and_history_starts_on_a_boundary(
+    module, tmp_path
+):
+    path = str(tmp_path / "ledger")
+    ledger = module.EnergyLedger(None, path=path)
+    asyncio.run(ledger.async_load(SYDNEY))
+    start = datetime(2026, 6, 1, 9, 40, tzinfo=SYDNEY)
+    _feed(ledger, start, 10, load=0.02)
+    # Home Assistant was down for an hour.
+    _feed(ledger, start + timedelta(minutes=70), 10, load=0.02)
+    asyncio.run(ledger.async_flush(close_open=True))
+
+    restarted = module.EnergyLedger(None, path=path)
+    asyncio.run(restarted.async_load(SYDNEY))
+    _feed(restarted, start + timedelta(minutes=120), 5, load=0.02)
+
+    for source in (ledger, restarted):
+        assert source.history_start(SYDNEY, hourly=True) == datetime(
+            2026, 6, 1, 10, 0, tzinfo=SYDNEY
+        )
+        assert source.history_start(SYDNEY, hourly=False) == datetime(
+            2026, 6, 2, tzinfo=SYDNEY
+        )
+    assert ledger.stats()["gaps"] == 1
+    assert ledger.stats()["missing_intervals"] == 12
+    stats = restarted.stats()
+    assert stats["gaps"] == 2
+    assert stats["missing_intervals"] == 12 + 8
+    assert stats["recent_gaps"][0]["after"] == "2026-05-31T23:45:00+00:00"
+    assert stats["recent_gaps"][0]["missing_intervals"] == 12
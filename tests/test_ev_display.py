@@ -202,16 +202,20 @@ def test_active_dashboard_paths_use_the_shared_display_coordinator() -> None:
         (root / "custom_components/power_sync/sensor.py").read_text()
     )
 
+    ev_views_tree = ast.parse(
+        (root / "custom_components/power_sync/ev_views.py").read_text()
+    )
+
     widget_get = next(
         child
-        for node in init_tree.body
+        for node in ev_views_tree.body
         if isinstance(node, ast.ClassDef) and node.name == "EVWidgetDataView"
         for child in node.body
         if isinstance(child, ast.AsyncFunctionDef) and child.name == "get"
     )
     loadpoint_get = next(
         child
-        for node in init_tree.body
+        for node in ev_views_tree.body
         if isinstance(node, ast.ClassDef) and node.name == "EVLoadpointStatusView"
         for child in node.body
         if isinstance(child, ast.AsyncFunctionDef) and child.name == "get"
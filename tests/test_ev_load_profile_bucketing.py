@@ -202,8 +202,14 @@ class _FakeRecorder:
 
 class _FakeHass:
     def __init__(self, load_entity: str, history_states: list[_FakeState]) -> None:
+        self.data: dict = {}
         self.states = _FakeStates([load_entity])
         self._fake_recorder = _FakeRecorder({load_entity: history_states})
+        self.executor_jobs: list = []
+
+    async def async_add_executor_job(self, func, *args):
+        self.executor_jobs.append(func)
+        return func(*args)
 
 
 LOAD_ENTITY = "sensor.home_load_power"
@@ -278,6 +284,59 @@ def test_load_profile_preserves_kw_sensor_units():
     assert estimator._load_history["weekday"][8] == pytest.approx(1.514)
 
 
+def test_load_profile_bucketing_runs_in_the_executor():
+    state = _FakeState(LOAD_ENTITY, "1200", datetime(2026, 7, 8, 8, 0, tzinfo=timezone.utc))
+    hass = _FakeHass(LOAD_ENTITY, [state])
+
+    estimator = ev_planner.LoadProfileEstimator(hass)
+    _run(estimator.update_from_history(days=14))
+
+    assert hass.executor_jobs == [ev_planner._state_hourly_load_profiles]
+    assert estimator.profile_source == "recorder"
+
+
+def test_load_profile_reads_optimizer_history_without_recorder_scan():
+    """With an optimizer load entity the planner reuses its cached history."""
+    learned = [None] * 24
+    learned[18] = 2.75
+
+    class _SharedEstimator:
+        load_entity_id = "sensor.power_sync_home_load"
+
+        def __init__(self):
+            self.calls = []
+
+        async def get_hourly_load_profiles(self, days):
+            self.calls.append(days)
+            return {"weekday": learned, "weekend": [None] * 24}
+
+    shared = _SharedEstimator()
+    hass = _FakeHass(LOAD_ENTITY, [])
+    hass._fake_recorder = None  # any Recorder scan would bail out early
+    hass.data = {
+        "power_sync": {
+            "entry": {
+                "optimization_coordinator": SimpleNamespace(_load_estimator=shared),
+            }
+        }
+    }
+    entry = SimpleNamespace(entry_id="entry")
+
+    estimator = ev_planner.LoadProfileEstimator(hass, entry)
+    _run(estimator.update_from_history(days=14))
+    _run(estimator.update_from_history(days=14))
+
+    assert shared.calls == [14]
+    assert estimator.profile_source == "optimizer_history"
+    assert estimator._load_history["weekday"][18] == pytest.approx(2.75)
+    assert estimator._load_history["weekday"][3] == pytest.approx(
+        ev_planner.LoadProfileEstimator.DEFAULT_WEEKDAY_PROFILE[3]
+    )
+    assert estimator._load_history["weekend"] == (
+        ev_planner.LoadProfileEstimator.DEFAULT_WEEKEND_PROFILE
+    )
+
+
 # --- HD-16: dual EV-load overlays must not stack ---------------------------
 #
 # `OptimizationCoordinator._run_optimization` overlays EV charging demand
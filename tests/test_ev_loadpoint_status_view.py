@@ -9,11 +9,11 @@ from types import SimpleNamespace
 
 
 ROOT = Path(__file__).resolve().parent.parent
-INIT_PATH = ROOT / "custom_components" / "power_sync" / "__init__.py"
+EV_VIEWS_PATH = ROOT / "custom_components" / "power_sync" / "ev_views.py"
 
 
 def _get_method() -> ast.AsyncFunctionDef:
-    tree = ast.parse(INIT_PATH.read_text())
+    tree = ast.parse(EV_VIEWS_PATH.read_text())
     for node in ast.walk(tree):
         if isinstance(node, ast.ClassDef) and node.name == "EVLoadpointStatusView":
             for child in node.body:
@@ -26,7 +26,7 @@ def _get_method() -> ast.AsyncFunctionDef:
 
 
 def _get_site_snapshot_method() -> ast.FunctionDef:
-    tree = ast.parse(INIT_PATH.read_text())
+    tree = ast.parse(EV_VIEWS_PATH.read_text())
     for node in ast.walk(tree):
         if isinstance(node, ast.ClassDef) and node.name == "EVLoadpointStatusView":
             for child in node.body:
@@ -40,7 +40,7 @@ def _extract_site_snapshot():
     module = ast.Module(body=[method], type_ignores=[])
     ast.fix_missing_locations(module)
     namespace = {"DOMAIN": "power_sync", "math": math}
-    exec(compile(module, str(INIT_PATH), "exec"), namespace)
+    exec(compile(module, str(EV_VIEWS_PATH), "exec"), namespace)
     return namespace["_site_snapshot"]
 
 
@@ -159,7 +159,7 @@ def test_configured_vehicle_profiles_are_kept_as_idle_loadpoints():
 
 
 def _get_async_class_method(class_name: str, method_name: str) -> ast.AsyncFunctionDef:
-    tree = ast.parse(INIT_PATH.read_text())
+    tree = ast.parse(EV_VIEWS_PATH.read_text())
     for node in ast.walk(tree):
         if isinstance(node, ast.ClassDef) and node.name == class_name:
             for child in node.body:
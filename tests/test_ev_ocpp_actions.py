@@ -395,6 +395,29 @@ def _tesla_capability_hass(
     return _Hass(states, registry_entities, registry_devices), vin_a, vin_b
 
 
+def test_tesla_vehicle_lookups_resolve_entities_per_vin():
+    hass, vin_a, vin_b = _tesla_capability_hass()
+    hass.device_registry.devices["car-b"].name = "Second EV"
+    hass.device_registry.devices["car-a"].name = None
+
+    assert asyncio.run(
+        actions._get_tesla_ev_entity(hass, r"number\..*_charge_current", vin_b)
+    ) == "number.car_b_charge_current"
+    assert asyncio.run(
+        actions._get_tesla_ev_entity(
+            hass, r"number\..*_charge_current", "5YJTEST00000000C3",
+            warn_on_missing=False,
+        )
+    ) is None
+    assert actions._get_vehicle_name_from_vin(hass, vin_b) == "Second EV"
+    assert actions._get_vehicle_name_from_vin(hass, vin_a) == vin_a[:8]
+    confirmation = actions._tesla_start_confirmation_entity_ids(
+        hass, _Entry(), vin_a.lower(), {}
+    )
+    assert "number.car_a_charge_current" in confirmation
+    assert not any(entity_id.startswith("number.car_b") for entity_id in confirmation)
+
+
 def test_tesla_active_charger_capability_is_vin_scoped_and_follows_swap():
     hass, vin_a, vin_b = _tesla_capability_hass()
 
@@ -13,7 +13,7 @@ ROOT = Path(__file__).resolve().parent.parent
 
 
 def test_home_power_api_is_additive_default_off_and_merge_compatible():
-    source = (ROOT / "custom_components/power_sync/__init__.py").read_text()
+    source = (ROOT / "custom_components/power_sync/ev_views.py").read_text()
 
     assert '"phase_load_management_supported": True' in source
     assert '"phase_current_entity_l1"' in source
@@ -42,7 +42,7 @@ def test_every_shared_rate_write_reaches_the_final_phase_wrapper():
 
 
 def test_fail_closed_status_is_exposed_through_loadpoint_site_payload():
-    api = (ROOT / "custom_components/power_sync/__init__.py").read_text()
+    api = (ROOT / "custom_components/power_sync/ev_views.py").read_text()
     actions = (
         ROOT / "custom_components/power_sync/automations/actions.py"
     ).read_text()
@@ -87,7 +87,7 @@ def _home_power_settings_view():
     The GET handler is the capability handshake the mobile Home Power Setup
     screen depends on, so it has to be *executed*, not string-matched.
     """
-    source = (ROOT / "custom_components/power_sync/__init__.py").read_text()
+    source = (ROOT / "custom_components/power_sync/ev_views.py").read_text()
     module = ast.parse(source)
     segment = None
     for node in module.body:
@@ -114,7 +114,7 @@ def _home_power_settings_view():
             allocator.PHASE_LOAD_MANAGEMENT_SCHEMA_VERSION
         ),
     }
-    # __init__.py compiles under `from __future__ import annotations`; the
+    # ev_views.py compiles under `from __future__ import annotations`; the
     # extracted segment must too, or its HA type hints resolve eagerly.
     segment = "from __future__ import annotations\n" + segment
     exec(compile(segment, "<HomePowerSettingsView>", "exec"), namespace)
@@ -282,7 +282,7 @@ def test_opted_in_flag_survives_into_the_stored_dynamic_params():
 
 
 def test_quick_charge_timer_does_not_cancel_the_dynamic_controller():
-    init_source = (ROOT / "custom_components/power_sync/__init__.py").read_text()
+    init_source = (ROOT / "custom_components/power_sync/ev_views.py").read_text()
     tree = ast.parse(init_source)
     arm = None
     for node in ast.walk(tree):
@@ -11,6 +11,7 @@ INIT_PATH = (
     / "power_sync"
     / "__init__.py"
 )
+EV_VIEWS_PATH = INIT_PATH.with_name("ev_views.py")
 ACTIONS_PATH = (
     Path(__file__).resolve().parent.parent
     / "custom_components"
@@ -21,7 +22,7 @@ ACTIONS_PATH = (
 
 
 def test_vehicle_command_view_accepts_start_policy_charging():
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     command_start = source.index("class EVVehicleCommandView")
     command_source = source[command_start:source.index("class SolarSurplusStatusView", command_start)]
 
@@ -32,7 +33,7 @@ def test_vehicle_command_view_accepts_start_policy_charging():
 
 
 def test_start_policy_charging_uses_mapping_and_owner_guard():
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     method_start = source.index("    async def _start_policy_charging(")
     method_source = source[method_start:source.index("    async def _start_charging(", method_start)]
 
@@ -45,7 +46,7 @@ def test_start_policy_charging_uses_mapping_and_owner_guard():
 
 
 def test_manual_owner_guard_uses_manual_takeover_policy():
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     method_start = source.index(
         "    def _active_non_manual_owner_message("
     )
@@ -63,7 +64,7 @@ def test_manual_owner_guard_uses_manual_takeover_policy():
 
 
 def test_manual_vehicle_config_lookup_filters_ambiguous_ble_only_vins():
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     method_start = source.index("    def _get_vehicle_charging_config(")
     method_source = source[
         method_start:source.index("    def _manual_session_identity(", method_start)
@@ -75,7 +76,7 @@ def test_manual_vehicle_config_lookup_filters_ambiguous_ble_only_vins():
 
 
 def test_manual_action_params_carries_stored_vehicle_display_name():
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     method_start = source.index("    def _manual_action_params(")
     method_source = source[
         method_start:source.index("    def _generic_charger_ready_for_start(", method_start)
@@ -86,7 +87,7 @@ def test_manual_action_params_carries_stored_vehicle_display_name():
 
 
 def test_widget_data_uses_canonical_display_snapshot():
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     view_start = source.index("class EVWidgetDataView")
     view_source = source[
         view_start:source.index("class EVLoadpointStatusView", view_start)
@@ -98,7 +99,7 @@ def test_widget_data_uses_canonical_display_snapshot():
 
 
 def test_disabling_solar_surplus_awaits_immediate_runtime_teardown():
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     view_start = source.index("class SolarSurplusConfigView")
     view_source = source[
         view_start:source.index("class ChargingSessionsView", view_start)
@@ -118,7 +119,7 @@ def test_disabling_solar_surplus_awaits_immediate_runtime_teardown():
 
 
 def test_policy_quick_stop_does_not_replace_dynamic_controller_timer():
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     method_start = source.index("    def _schedule_policy_quick_stop(")
     method_source = source[method_start:source.index("    async def _start_policy_charging(", method_start)]
 
@@ -138,7 +139,7 @@ def test_dynamic_stop_cancels_policy_quick_stop_timer():
 
 
 def test_manual_quick_session_restart_resumes_deadline_without_start_resend():
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     method_start = source.index("    async def restore_manual_quick_sessions(")
     method_source = source[
         method_start:source.index("    def _schedule_policy_quick_stop(", method_start)
@@ -1640,6 +1640,128 @@ def test_ev_planners_keep_repeated_dst_hours_distinct(monkeypatch):
     assert deadline.can_meet_target is True
 
 
+def test_forecast_frame_aligns_by_absolute_hour_and_head_realigns(monkeypatch):
+    new_york = ZoneInfo("America/New_York")
+    monkeypatch.setattr(
+        ev_planner.dt_util,
+        "as_local",
+        lambda value: value.astimezone(new_york),
+        raising=False,
+    )
+    hours = (
+        "2026-11-01T00:00:00-04:00",
+        "2026-11-01T01:00:00-04:00",
+        "2026-11-01T01:00:00-05:00",
+    )
+    price_forecast = [
+        ev_planner.PriceForecast(
+            hour=hour, import_cents=10.0, export_cents=0.0, period="offpeak"
+        )
+        for hour in hours
+    ]
+    # Surplus rows arrive in a different order and with a non-parseable row.
+    surplus_forecast = [
+        ev_planner.SurplusForecast(
+            hour=hour, solar_kw=kw, load_kw=0.0, surplus_kw=kw, confidence=1.0
+        )
+        for hour, kw in ((hours[2], 3.0), ("not-a-time", 9.0), (hours[0], 1.0))
+    ]
+
+    frame = ev_planner.ForecastFrame.build(
+        surplus_forecast,
+        price_forecast,
+        {"2026-11-01T01:00:00": 2.0},
+    )
+
+    assert frame.price_surplus_index == (2, -1, 0)
+    assert frame.surplus_for_price(2).surplus_kw == 3.0
+    assert frame.surplus_local[1] is None
+    assert frame.price_keys[1] == frame.price_keys[2] == "2026-11-01T01:00:00"
+    assert frame.repeated_price_hours == {"2026-11-01T01:00:00"}
+
+    head = frame.head(2)
+    assert head.price_identity == frame.price_identity[:2]
+    assert head.price_surplus_index == (-1, -1)
+    assert head.repeated_price_hours == frozenset()
+    assert head.battery_power_schedule is frame.battery_power_schedule
+    assert frame.head(24) is frame
+
+
+def test_forecast_tick_shares_one_frame_across_vehicles(monkeypatch):
+    brisbane_tz = timezone(timedelta(hours=10))
+    monkeypatch.setattr(
+        ev_planner.dt_util,
+        "now",
+        lambda: datetime(2026, 7, 24, 1, 0, tzinfo=brisbane_tz),
+    )
+    monkeypatch.setattr(
+        ev_planner.dt_util,
+        "as_local",
+        lambda value: value.astimezone(brisbane_tz),
+        raising=False,
+    )
+    fetched_hours = []
+
+    async def forecast_surplus(hours):
+        fetched_hours.append(hours)
+        return [
+            ev_planner.SurplusForecast(
+                hour=f"2026-07-24T{hour:02d}:00:00",
+                solar_kw=0.0,
+                load_kw=0.0,
+                surplus_kw=0.0,
+                confidence=1.0,
+            )
+            for hour in range(1, 1 + min(hours, 23))
+        ]
+
+    async def get_price_forecast(hours):
+        return [
+            ev_planner.PriceForecast(
+                hour=f"2026-07-24T{hour:02d}:00:00",
+                import_cents=float(30 - hour),
+                export_cents=0.0,
+                period="offpeak",
+            )
+            for hour in range(1, 1 + min(hours, 23))
+        ]
+
+    planner = ev_planner.ChargingPlanner(_FakeHass(), _FakeConfigEntry())
+    planner.surplus_forecaster.forecast_surplus = forecast_surplus
+    planner.price_forecaster.get_price_forecast = get_price_forecast
+    departures = (datetime(2026, 7, 24, 5, 0), None, datetime(2026, 7, 24, 9, 0))
+
+    async def _plan_all():
+        return [
+            await planner.plan_charging(
+                vehicle_id=f"vehicle-{index}",
+                current_soc=50,
+                target_soc=80,
+                target_time=departure,
+                resolved_capacity=ev_planner.resolve_ev_battery_capacity(
+                    manual_capacity_kwh=60
+                ),
+                charger_power_kw=7.36,
+                priority=ev_planner.ChargingPriority.COST_OPTIMIZED,
+            )
+            for index, departure in enumerate(departures)
+        ]
+
+    separate = asyncio.run(_plan_all())
+    assert fetched_hours == [4, 24, 8]
+
+    fetched_hours.clear()
+    with planner.forecast_tick():
+        shared = asyncio.run(_plan_all())
+
+    assert fetched_hours == [24]
+    assert planner.forecast_frame_stats() == {"builds": 4, "hits": 2}
+    assert planner._forecast_frame is None
+    assert [plan.to_dict() for plan in shared] == [
+        plan.to_dict() for plan in separate
+    ]
+
+
 @pytest.mark.parametrize(
     ("current_time", "expected_source"),
     (
@@ -14,7 +14,7 @@ from types import SimpleNamespace
 import pytest
 
 ROOT = Path(__file__).resolve().parent.parent / "custom_components" / "power_sync"
-INIT_PATH = ROOT / "__init__.py"
+EV_VIEWS_PATH = ROOT / "ev_views.py"
 
 sys.modules.setdefault("aiohttp", types.ModuleType("aiohttp"))
 _ha_root = sys.modules.setdefault("homeassistant", types.ModuleType("homeassistant"))
@@ -195,7 +195,7 @@ def test_stable_vehicle_aliases_do_not_duplicate_ble_or_vin_profiles():
 
 def test_vehicle_capacity_api_regenerates_without_charger_command_and_refreshes_optimizer():
     """Capacity writes rebuild matching plans and only schedule optimizer work."""
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     start = source.index("class VehicleChargingConfigView")
     end = source.index("class SolarSurplusConfigView", start)
     view_source = source[start:end]
@@ -209,7 +209,7 @@ def test_vehicle_capacity_api_regenerates_without_charger_command_and_refreshes_
 
 
 def test_vehicle_deletion_releases_smart_schedule_battery_preserve_owner():
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     start = source.index("class VehicleChargingConfigView")
     end = source.index("class SolarSurplusConfigView", start)
     view_source = source[start:end]
@@ -332,7 +332,7 @@ def test_86_kwh_vehicle_from_76_to_80_uses_four_percent_delta():
 
 
 def test_schedule_view_uses_vehicle_scoped_executor_soc(monkeypatch):
-    tree = ast.parse(INIT_PATH.read_text())
+    tree = ast.parse(EV_VIEWS_PATH.read_text())
     method = next(
         item
         for node in tree.body
@@ -342,7 +342,7 @@ def test_schedule_view_uses_vehicle_scoped_executor_soc(monkeypatch):
     )
     namespace = {"__package__": "power_sync"}
     exec(
-        compile(ast.Module(body=[method], type_ignores=[]), str(INIT_PATH), "exec"),
+        compile(ast.Module(body=[method], type_ignores=[]), str(EV_VIEWS_PATH), "exec"),
         namespace,
     )
 
@@ -368,7 +368,7 @@ def test_schedule_view_uses_vehicle_scoped_executor_soc(monkeypatch):
 
 
 def test_schedule_view_uses_same_planner_as_vehicle_scoped_executor(monkeypatch):
-    tree = ast.parse(INIT_PATH.read_text())
+    tree = ast.parse(EV_VIEWS_PATH.read_text())
     method = next(
         item
         for node in tree.body
@@ -378,7 +378,7 @@ def test_schedule_view_uses_same_planner_as_vehicle_scoped_executor(monkeypatch)
     )
     namespace = {"__package__": "power_sync"}
     exec(
-        compile(ast.Module(body=[method], type_ignores=[]), str(INIT_PATH), "exec"),
+        compile(ast.Module(body=[method], type_ignores=[]), str(EV_VIEWS_PATH), "exec"),
         namespace,
     )
 
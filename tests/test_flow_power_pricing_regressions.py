@@ -10,7 +10,7 @@ import json
 import math
 import sys
 import types
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -1491,6 +1491,120 @@ def test_network_tariff_lookup_uses_dispatch_interval_end(monkeypatch):
     assert captured_times[-1] == datetime(2026, 5, 27, 10, 0, tzinfo=tz)
 
 
+def _load_tariff_utils_with_fake_library(monkeypatch, calls):
+    fake_aemo_to_tariff = types.ModuleType("aemo_to_tariff")
+
+    def spot_to_tariff(**kwargs):
+        calls.append(kwargs["interval_time"])
+        interval_time = kwargs["interval_time"].astimezone(
+            timezone(timedelta(hours=10))
+        )
+        return 40.0 if 16 <= interval_time.hour < 21 else 8.0 + interval_time.minute / 100
+
+    fake_aemo_to_tariff.spot_to_tariff = spot_to_tariff
+    monkeypatch.setitem(sys.modules, "aemo_to_tariff", fake_aemo_to_tariff)
+
+    spec = importlib.util.spec_from_file_location(
+        "power_sync_tariff_utils_table_test",
+        COMPONENT_ROOT / "tariff_utils.py",
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "_aemo_to_tariff_version", lambda: "0.7.15")
+    return module
+
+
+class _TableStore:
+    def __init__(self, data=None) -> None:
+        self.data = data
+        self.saves = 0
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay):
+        self.data = json.loads(json.dumps(data_func()))
+        self.saves += 1
+
+
+async def _direct_executor(func, *args):
+    return func(*args)
+
+
+def test_network_tariff_table_matches_direct_lookups_and_rolls_one_day(monkeypatch):
+    calls = []
+    module = _load_tariff_utils_with_fake_library(monkeypatch, calls)
+    hass = SimpleNamespace(async_add_executor_job=_direct_executor)
+    nem_tz = timezone(timedelta(hours=10))
+    now = datetime(2026, 5, 27, 9, 12, tzinfo=nem_tz)
+    table = module.NetworkTariffRateTable("essential", "BLNRSS2", store=_TableStore())
+
+    assert asyncio.run(table.async_refresh(hass, now)) is True
+    assert table.computed_slots == len(calls) == 3 * 288
+    assert asyncio.run(table.async_refresh(hass, now + timedelta(hours=5))) is False
+
+    samples = [
+        datetime(2026, 5, 27, 15, 55, 0, tzinfo=nem_tz),
+        datetime(2026, 5, 27, 15, 59, 59, 999999, tzinfo=nem_tz),
+        datetime(2026, 5, 28, 20, 57, 30, tzinfo=nem_tz),
+        datetime(2026, 5, 29, 6, 0, 5, 123456, tzinfo=timezone.utc),
+    ]
+    table_rates = [table.rate_at(sample) for sample in samples]
+    calls.clear()
+    assert table_rates == [
+        module.get_network_tariff_rate(sample, "essential", "BLNRSS2")
+        for sample in samples
+    ]
+    assert table.stats()["hits"] == 4
+    assert table.stats()["hit_rate"] == 1.0
+
+    calls.clear()
+    assert asyncio.run(table.async_refresh(hass, now + timedelta(days=1))) is True
+    assert table.computed_slots == len(calls) == 288
+    assert min(calls) == datetime(2026, 5, 30, 0, 5, tzinfo=nem_tz)
+    assert table.stats()["window_start"] == "2026-05-28T00:00:00+10:00"
+
+    outside = datetime(2026, 6, 5, 12, 0, tzinfo=nem_tz)
+    assert table.rate_at(outside) == 8.05
+    assert table.misses == 1
+
+
+def test_network_tariff_table_restores_from_store_until_library_changes(monkeypatch):
+    calls = []
+    module = _load_tariff_utils_with_fake_library(monkeypatch, calls)
+    hass = SimpleNamespace(async_add_executor_job=_direct_executor)
+    now = datetime(2026, 5, 27, 9, 12, tzinfo=timezone(timedelta(hours=10)))
+    store = _TableStore()
+
+    asyncio.run(
+        module.NetworkTariffRateTable("essential", "BLNRSS2", store=store)
+        .async_refresh(hass, now)
+    )
+    assert store.saves == 1
+    snapshot = json.loads(json.dumps(store.data))
+    calls.clear()
+
+    restored = module.NetworkTariffRateTable("essential", "BLNRSS2", store=store)
+    assert asyncio.run(restored.async_refresh(hass, now)) is False
+    assert calls == []
+    assert restored.rate_at(now) == 8.15
+
+    other_code = module.NetworkTariffRateTable(
+        "essential", "BLNTOU", store=_TableStore(snapshot)
+    )
+    assert asyncio.run(other_code.async_refresh(hass, now)) is True
+    assert len(calls) == 3 * 288
+
+    calls.clear()
+    monkeypatch.setattr(module, "_aemo_to_tariff_version", lambda: "0.7.16")
+    upgraded = module.NetworkTariffRateTable(
+        "essential", "BLNRSS2", store=_TableStore(snapshot)
+    )
+    assert asyncio.run(upgraded.async_refresh(hass, now)) is True
+    assert len(calls) == 3 * 288
+
+
 def test_flow_power_tariff_refresh_dispatches_sensor_update_signal():
     source = (COMPONENT_ROOT / "__init__.py").read_text()
     tariff_refresh = source[
@@ -1953,7 +1953,7 @@ def test_saved_tariff_prices_calculate_period_before_rate_lookup():
     method_source = ast.get_source_segment(source, method)
 
     assert method_source is not None
-    period_index = method_source.index("current_period = find_matching_tou_period(")
+    period_index = method_source.index("current_period = compile_tou_week(")
     buy_lookup_index = method_source.index("buy_rate = buy_rates.get(current_period")
     assert period_index < buy_lookup_index
 
@@ -162,6 +162,25 @@ def test_foxess_serial_client_import_discards_late_vendored_framer(tmp_path: Pat
         _restore_modules(snapshot)
 
 
+def _register_bank_reader(
+    registers: dict[int, list[int]],
+    reads: list[tuple[int, int]] | None = None,
+):
+    """Return a fake register reader that slices reads out of a register bank."""
+    bank = {
+        address + offset: word
+        for address, words in registers.items()
+        for offset, word in enumerate(words)
+    }
+
+    async def fake_read(address: int, count: int = 1):
+        if reads is not None:
+            reads.append((address, count))
+        return [bank.get(address + offset, 0) for offset in range(count)]
+
+    return fake_read
+
+
 def test_h3_smart_direct_modbus_reads_pv3_power(tmp_path: Path):
     snapshot = _snapshot_modules()
     original_path = list(sys.path)
@@ -197,11 +216,7 @@ def test_h3_smart_direct_modbus_reads_pv3_power(tmp_path: Path):
             39625: [0, 0],
         }
 
-        async def fake_read_holding(address: int, count: int = 1):
-            reads.append((address, count))
-            return holding_registers.get(address, [0] * count)
-
-        controller._read_holding_registers = fake_read_holding
+        controller._read_holding_registers = _register_bank_reader(holding_registers, reads)
 
         status = asyncio.run(controller.get_status())
 
@@ -211,7 +226,10 @@ def test_h3_smart_direct_modbus_reads_pv3_power(tmp_path: Path):
         assert status.attributes["pv3_power_kw"] == 1.5
         assert status.attributes["pv_power_kw"] == 4.5
         assert status.power_output_w == 4500.0
-        assert (39283, 2) in reads
+        assert any(address <= 39283 and address + count >= 39285 for address, count in reads)
+        # 17 telemetry values coalesce into one read per register section.
+        assert len(reads) == 9
+        assert status.attributes["modbus_round_trips"] == 9
     finally:
         sys.path[:] = original_path
         _restore_modules(snapshot)
@@ -277,14 +295,10 @@ def test_kh_direct_modbus_normalizes_grid_import_sign(tmp_path: Path):
             41008: [250],
         }
 
-        async def fake_read_data(address: int, count: int = 1):
-            return data_registers.get(address, [0] * count)
-
-        async def fake_read_holding(address: int, count: int = 1):
-            return holding_registers.get(address, [0] * count)
-
-        controller._read_data_register = fake_read_data
-        controller._read_holding_registers = fake_read_holding
+        input_reads: list[tuple[int, int]] = []
+        holding_reads: list[tuple[int, int]] = []
+        controller._read_input_registers = _register_bank_reader(data_registers, input_reads)
+        controller._read_holding_registers = _register_bank_reader(holding_registers, holding_reads)
 
         status = asyncio.run(controller.get_status())
 
@@ -293,6 +307,10 @@ def test_kh_direct_modbus_normalizes_grid_import_sign(tmp_path: Path):
         assert status.attributes["work_mode_name"] == "Backup"
         assert status.attributes["battery_power_kw"] == -5.78
         assert status.attributes["grid_power_kw"] == 5.0
+        assert status.attributes["min_soc"] == 10
+        assert status.attributes["battery_temperature"] == 25.0
+        assert input_reads == [(31002, 23)]
+        assert holding_reads == [(41000, 10)]
     finally:
         sys.path[:] = original_path
         _restore_modules(snapshot)
@@ -396,7 +414,7 @@ def test_h3_smart_direct_modbus_keeps_last_valid_calculated_load(tmp_path: Path)
                 37635: [1000],
                 39625: [0, 0],
             }
-            return holding_registers.get(address, [0] * count)
+            return await _register_bank_reader(holding_registers)(address, count)
 
         controller._read_holding_registers = fake_read_holding
 
@@ -191,6 +191,7 @@ def test_goodwe_status_reads_telemetry_in_blocks():
             controller.REG_BATTERY_SOC: 83,
             controller.REG_EXPORT_LIMIT_ENABLED: 1,
             controller.REG_EXPORT_LIMIT: 0,
+            controller.REG_WORK_MODE: controller.MODE_NORMAL,
         }
         calls: list[tuple[int, int]] = []
         clients: list[_MappedRegisterClient] = []
@@ -204,14 +205,13 @@ def test_goodwe_status_reads_telemetry_in_blocks():
 
         attrs = asyncio.run(controller._read_all_registers())
 
+        # The running data (PV, grid, battery, work mode) shares one read.
         assert calls == [
-            (controller.REG_PV1_VOLTAGE, 16),
-            (controller.REG_GRID_POWER, 20),
-            (controller.REG_TEMP_AIR, 10),
+            (controller.REG_PV1_VOLTAGE, controller.REG_WORK_MODE - controller.REG_PV1_VOLTAGE + 1),
             (controller.REG_BATTERY_SOC, 1),
             (controller.REG_EXPORT_LIMIT_ENABLED, 2),
         ]
-        assert len(clients) == 5
+        assert len(clients) == 3
         assert all(not client.connected for client in clients)
         assert attrs["pv1_voltage"] == 230.1
         assert attrs["pv1_current"] == 5.2
@@ -230,6 +230,8 @@ def test_goodwe_status_reads_telemetry_in_blocks():
         assert attrs["battery_level"] == 83
         assert attrs["export_limit_enabled"] is True
         assert attrs["export_limit_w"] == 0
+        assert attrs["work_mode_raw"] == controller.MODE_NORMAL
+        assert controller._status_plan.last_poll.round_trips == 3
     finally:
         restore_module()
 
@@ -237,3 +237,26 @@ def test_zerohero_bonus_does_not_force_expensive_prefill(
     ) * (5 / 60) / 1000
 
     assert pre_window_charge_kwh == pytest.approx(0.0)
+
+
+def test_broken_highspy_install_falls_back_to_greedy(
+    battery_optimizer_module, monkeypatch, caplog
+):
+    """An installed highspy that fails to import must not fail the solve."""
+    module = battery_optimizer_module
+    lazy_import = sys.modules["power_sync.optimization.lazy_import"]
+    broken = lazy_import.LazyModule(
+        "power_sync_tests_broken_highspy", module._highspy_import_failed
+    )
+    monkeypatch.setattr(module, "highspy", broken)
+    monkeypatch.setattr(module, "HIGHS_AVAILABLE", True)
+
+    with caplog.at_level("WARNING", logger=module.__name__):
+        first = _optimizer(module).optimize(**_zerohero_kwargs())
+        second = _optimizer(module).optimize(**_zerohero_kwargs())
+
+    assert module.HIGHS_AVAILABLE is False
+    assert first.solver_used == second.solver_used == "greedy"
+    assert _window_exports(first) > 0
+    warnings = [r for r in caplog.records if "highspy not available" in r.message]
+    assert len(warnings) == 1
@@ -570,5 +570,5 @@ def test_automation_engine_exposes_and_persists_grid_import_energy_state():
     assert '"grid_import_today_kwh"' in source
     assert '"trigger_runtime": None' in source
     assert "def update_trigger_runtime(" in source
-    assert "if self._store.runtime_dirty:" in source
-    assert "total_seconds() >= 60" in source
+    assert "self.schedule_runtime_save()" in source
+    assert "RUNTIME_SAVE_DELAY = 60" in source
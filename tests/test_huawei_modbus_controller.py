@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+import types
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+
+
+def _load_huawei_module():
+    saved = {
+        name: sys.modules.get(name)
+        for name in (
+            "pymodbus",
+            "pymodbus.client",
+            "pymodbus.exceptions",
+            "power_sync",
+            "power_sync.inverters",
+            "power_sync.inverters.huawei",
+        )
+    }
+
+    pymodbus = types.ModuleType("pymodbus")
+    pymodbus.__version__ = "3.9.0"
+    pymodbus_client = types.ModuleType("pymodbus.client")
+    pymodbus_exceptions = types.ModuleType("pymodbus.exceptions")
+    pymodbus_client.AsyncModbusTcpClient = object
+    pymodbus_exceptions.ModbusException = type("ModbusException", (Exception,), {})
+
+    sys.modules["pymodbus"] = pymodbus
+    sys.modules["pymodbus.client"] = pymodbus_client
+    sys.modules["pymodbus.exceptions"] = pymodbus_exceptions
+
+    power_sync = types.ModuleType("power_sync")
+    power_sync.__path__ = [str(COMPONENT_ROOT)]
+    sys.modules["power_sync"] = power_sync
+
+    inverters = types.ModuleType("power_sync.inverters")
+    inverters.__path__ = [str(COMPONENT_ROOT / "inverters")]
+    sys.modules["power_sync.inverters"] = inverters
+    sys.modules.pop("power_sync.inverters.huawei", None)
+
+    module = importlib.import_module("power_sync.inverters.huawei")
+
+    def restore() -> None:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+    return module, restore
+
+
+class _RegisterBlockResult:
+    def __init__(self, registers: list[int]) -> None:
+        self.registers = registers
+
+    def isError(self) -> bool:
+        return False
+
+
+class _MappedRegisterClient:
+    def __init__(self, values: dict[int, int], calls: list[tuple[int, int]]) -> None:
+        self.connected = True
+        self.values = values
+        self.calls = calls
+
+    async def read_holding_registers(self, **kwargs):
+        address = kwargs["address"]
+        count = kwargs["count"]
+        self.calls.append((address, count))
+        return _RegisterBlockResult(
+            [
+                self.values.get(address + offset, 0)
+                for offset in range(count)
+            ]
+        )
+
+
+def test_huawei_status_reads_telemetry_in_blocks():
+    module, restore_module = _load_huawei_module()
+    try:
+        controller = module.HuaweiController("192.0.2.20")
+        values = {
+            controller.REG_PV1_VOLTAGE: 3801,
+            controller.REG_PV1_CURRENT: 512,
+            controller.REG_INPUT_POWER + 1: 4200,
+            controller.REG_ACTIVE_POWER + 1: 4000,
+            controller.REG_INVERTER_TEMP: 412,
+            controller.REG_DEVICE_STATUS: controller.STATUS_GRID_CONNECTED,
+            controller.REG_DAILY_YIELD + 1: 1234,
+            controller.REG_BATTERY_POWER: 0xFFFF,
+            controller.REG_BATTERY_POWER + 1: 0xF830,
+            controller.REG_BATTERY_SOC: 655,
+            controller.REG_GRID_POWER + 1: 300,
+            controller.REG_ACTIVE_POWER_CONTROL_MODE: controller.MODE_ZERO_EXPORT,
+        }
+        calls: list[tuple[int, int]] = []
+        controller._client = _MappedRegisterClient(values, calls)
+
+        state = asyncio.run(controller.get_status())
+
+        # 14 single-register reads collapse into one read per register section.
+        assert calls == [
+            (controller.REG_PV1_VOLTAGE, 4),
+            (controller.REG_INPUT_POWER, controller.REG_DEVICE_STATUS - controller.REG_INPUT_POWER + 1),
+            (controller.REG_DAILY_YIELD, 2),
+            (controller.REG_BATTERY_POWER, 4),
+            (controller.REG_GRID_POWER, 2),
+            (controller.REG_ACTIVE_POWER_CONTROL_MODE, 1),
+        ]
+        attrs = state.attributes
+        assert attrs["pv1_voltage"] == 380.1
+        assert attrs["pv1_current"] == 5.12
+        assert attrs["input_power"] == 4200
+        assert attrs["active_power"] == 4000
+        assert attrs["inverter_temperature"] == 41.2
+        assert attrs["daily_pv_generation"] == 12.34
+        assert attrs["battery_level"] == 65.5
+        assert attrs["battery_power"] == -2000
+        assert attrs["grid_power"] == 300
+        assert attrs["modbus_round_trips"] == 6
+        assert state.is_curtailed is True
+        assert state.status == module.InverterStatus.CURTAILED
+    finally:
+        restore_module()
@@ -0,0 +1,219 @@
+"""Tests for lazily imported EV and vendor settings views."""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+import importlib.util
+import types
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import pinned_sys_modules
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+HTTP_METHODS = {"get", "post", "put", "patch", "delete"}
+
+
+def _stub_modules():
+    http = types.ModuleType("homeassistant.components.http")
+    http.HomeAssistantView = object
+    core = types.ModuleType("homeassistant.core")
+    core.HomeAssistant = object
+    package = types.ModuleType("power_sync")
+    package.__path__ = [str(COMPONENT_ROOT)]
+    return {
+        "homeassistant": types.ModuleType("homeassistant"),
+        "homeassistant.components": types.ModuleType("homeassistant.components"),
+        "homeassistant.components.http": http,
+        "homeassistant.core": core,
+        "power_sync": package,
+    }
+
+
+STUBS = _stub_modules()
+
+
+def _load_lazy_views_module():
+    spec = importlib.util.spec_from_file_location(
+        "power_sync.lazy_views", COMPONENT_ROOT / "lazy_views.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    with pinned_sys_modules({**STUBS, "power_sync.lazy_views": module}):
+        spec.loader.exec_module(module)
+    return module
+
+
+lazy_views = _load_lazy_views_module()
+
+
+def _view_classes(filename):
+    source = (COMPONENT_ROOT / filename).read_text()
+    classes = {}
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        attrs = {}
+        methods = set()
+        init_args = []
+        for child in node.body:
+            if isinstance(child, ast.Assign) and isinstance(child.value, ast.Constant):
+                for target in child.targets:
+                    if isinstance(target, ast.Name):
+                        attrs[target.id] = child.value.value
+            elif isinstance(child, ast.AsyncFunctionDef) and child.name in HTTP_METHODS:
+                methods.add(child.name)
+            elif isinstance(child, ast.FunctionDef) and child.name == "__init__":
+                init_args = [arg.arg for arg in child.args.args[1:]]
+        classes[node.name] = (attrs, methods, init_args)
+    return classes
+
+
+@pytest.mark.parametrize(
+    ("module_name", "specs"),
+    [
+        (lazy_views.EV_VIEWS_MODULE, lazy_views.EV_VIEWS),
+        (lazy_views.VENDOR_VIEWS_MODULE, lazy_views.VENDOR_VIEWS),
+    ],
+)
+def test_lazy_view_specs_match_view_classes(module_name, specs):
+    """Route metadata registered up front must match the real view classes."""
+    classes = _view_classes(f"{module_name}.py")
+    for spec in specs:
+        assert spec.class_name in classes, spec.class_name
+        attrs, methods, init_args = classes[spec.class_name]
+        assert attrs.get("url") == spec.url, spec.class_name
+        assert attrs.get("name") == spec.name, spec.class_name
+        assert attrs.get("requires_auth", True) == spec.requires_auth
+        assert set(spec.methods) == methods, spec.class_name
+        assert len(init_args) == (2 if spec.with_entry else 1), spec.class_name
+
+
+def test_every_view_class_in_lazy_modules_is_registered():
+    for module_name, specs in (
+        (lazy_views.EV_VIEWS_MODULE, lazy_views.EV_VIEWS),
+        (lazy_views.VENDOR_VIEWS_MODULE, lazy_views.VENDOR_VIEWS),
+    ):
+        view_names = {
+            name
+            for name, (attrs, _methods, _args) in _view_classes(
+                f"{module_name}.py"
+            ).items()
+            if "url" in attrs
+        }
+        assert view_names == {spec.class_name for spec in specs}
+
+
+def test_init_no_longer_defines_lazy_view_classes():
+    """Moved views must not be redefined in the eagerly imported package."""
+    init_tree = ast.parse((COMPONENT_ROOT / "__init__.py").read_text())
+    defined = {node.name for node in init_tree.body if isinstance(node, ast.ClassDef)}
+    assert not defined & set(lazy_views.LAZY_VIEW_MODULES)
+
+
+def test_init_imports_lazy_view_classes_off_the_event_loop():
+    """Direct ``from . import <View>`` uses must preload the module in the executor."""
+    init_tree = ast.parse((COMPONENT_ROOT / "__init__.py").read_text())
+    lazy_imports = 0
+    for func in ast.walk(init_tree):
+        if not isinstance(func, ast.AsyncFunctionDef):
+            continue
+        nodes = sorted(
+            (node for node in ast.walk(func) if hasattr(node, "lineno")),
+            key=lambda node: (node.lineno, node.col_offset),
+        )
+        preloaded = False
+        for node in nodes:
+            if (
+                isinstance(node, ast.Attribute)
+                and node.attr == "async_add_executor_job"
+            ):
+                preloaded = True
+            if (
+                isinstance(node, ast.ImportFrom)
+                and node.level == 1
+                and node.module is None
+                and any(alias.name in lazy_views.LAZY_VIEW_MODULES for alias in node.names)
+            ):
+                lazy_imports += 1
+                assert preloaded, f"{func.name} imports a lazy view on the event loop"
+    assert lazy_imports
+
+
+class _RealView:
+    instances = []
+
+    def __init__(self, hass, entry=None):
+        self.hass = hass
+        self.entry = entry
+        _RealView.instances.append(self)
+
+    async def get(self, request, **match_info):
+        return ("get", request, match_info, self.entry)
+
+
+def test_lazy_view_imports_module_once_and_forwards_requests():
+    _RealView.instances = []
+    real_module = types.ModuleType("power_sync.fake_views")
+    real_module.FakeView = _RealView
+    imports = []
+
+    async def async_add_executor_job(func, *args):
+        imports.append(args)
+        with pinned_sys_modules({"power_sync.fake_views": real_module}):
+            return func(*args)
+
+    hass = SimpleNamespace(async_add_executor_job=async_add_executor_job)
+    registered = []
+    hass.http = SimpleNamespace(register_view=registered.append)
+    spec = lazy_views.LazyViewSpec(
+        "FakeView", "/api/power_sync/ev/fake/{vehicle_id}", "api:power_sync:ev:fake",
+        ("get",), with_entry=True,
+    )
+    entry = object()
+
+    views = lazy_views.register_lazy_views(hass, "fake_views", (spec,), entry)
+
+    view = views["FakeView"]
+    assert registered == [view]
+    assert view.url == spec.url and view.name == spec.name
+    assert asyncio.iscoroutinefunction(view.get)
+    assert not hasattr(view, "post")
+    assert not view.loaded
+
+    async def _run():
+        first = await view.get("req", vehicle_id="v1")
+        second = await view.get("req2")
+        return first, second
+
+    first, second = asyncio.run(_run())
+
+    assert first == ("get", "req", {"vehicle_id": "v1"}, entry)
+    assert second[1] == "req2"
+    assert imports == [("power_sync.fake_views",)]
+    assert len(_RealView.instances) == 1
+    assert view.loaded
+
+
+def test_lazy_view_reuses_already_imported_module_without_executor():
+    _RealView.instances = []
+    real_module = types.ModuleType("power_sync.fake_views")
+    real_module.FakeView = _RealView
+
+    async def async_add_executor_job(func, *args):
+        raise AssertionError("module already imported")
+
+    hass = SimpleNamespace(async_add_executor_job=async_add_executor_job)
+    spec = lazy_views.LazyViewSpec("FakeView", "/x", "x", ("get",))
+    view = lazy_views.LazyView(hass, "fake_views", spec, entry=object())
+
+    with pinned_sys_modules({"power_sync.fake_views": real_module}):
+        resolved = asyncio.run(view.async_resolve())
+
+    assert resolved is _RealView.instances[0]
+    assert resolved.entry is None
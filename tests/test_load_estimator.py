@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import functools
 import importlib.util
+import math
 import sys
 import types
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
+
 
 ROOT = Path(__file__).resolve().parent.parent
 COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
@@ -291,6 +294,84 @@ def test_state_normalization_does_not_bridge_unavailable_gap(monkeypatch):
     assert [bucket.energy_wh for bucket in buckets] == [500.0, 500.0]
 
 
+def _bucketing_fixtures():
+    start = datetime(2026, 7, 1, 0, 7, 13, 250_001, tzinfo=timezone.utc)
+    aest = timezone(timedelta(hours=10))
+    jittered = []
+    cursor = start - timedelta(minutes=3)
+    for index in range(900):
+        if index % 17 == 0:
+            value = ("unavailable", "0", "-5", "250000", "", None)[index % 6]
+        else:
+            value = str(200 + (index * 37) % 3100 + (index % 7) / 3)
+        jittered.append(SimpleNamespace(state=value, last_changed=cursor))
+        cursor += timedelta(seconds=7 + index % 29, microseconds=(index * 7919) % 1_000_000)
+    mixed_tz = [
+        SimpleNamespace(
+            state=str(800 + minute),
+            last_changed=(start + timedelta(minutes=minute)).astimezone(
+                aest if minute % 2 else timezone.utc
+            ),
+        )
+        for minute in range(0, 240, 13)
+    ]
+    return [
+        (jittered, start, cursor - timedelta(minutes=20)),
+        (mixed_tz, start.astimezone(aest), start + timedelta(hours=4)),
+        (
+            [
+                SimpleNamespace(state="1000", last_changed=start),
+                SimpleNamespace(state="1000", last_changed=start),
+                SimpleNamespace(state="unknown", last_changed=start + timedelta(minutes=45)),
+                SimpleNamespace(state="600", last_changed=start + timedelta(hours=1)),
+            ],
+            start,
+            start + timedelta(hours=3),
+        ),
+    ]
+
+
+def test_columnar_state_bucketing_matches_python_loop(monkeypatch):
+    module = _load_estimator_module(monkeypatch)
+    if not module.NUMPY_AVAILABLE:
+        pytest.skip("numpy unavailable")
+    bucketize = module.LoadEstimator._states_to_half_hour_buckets
+
+    for states, start, end in _bucketing_fixtures():
+        for allow_zero in (False, True):
+            monkeypatch.setattr(module, "NUMPY_AVAILABLE", True)
+            columnar = bucketize(states, start, end, 1.0, allow_zero=allow_zero)
+            monkeypatch.setattr(module, "NUMPY_AVAILABLE", False)
+            looped = bucketize(states, start, end, 1.0, allow_zero=allow_zero)
+
+            assert columnar
+            assert columnar == looped
+            assert [bucket.start.tzinfo for bucket in columnar] == [
+                bucket.start.tzinfo for bucket in looped
+            ]
+
+
+def test_broken_numpy_install_buckets_with_python_loop(monkeypatch):
+    module = _load_estimator_module(monkeypatch)
+    lazy_import = sys.modules["power_sync.optimization.lazy_import"]
+    bucketize = module.LoadEstimator._states_to_half_hour_buckets
+    states, start, end = _bucketing_fixtures()[0]
+    monkeypatch.setattr(module, "NUMPY_AVAILABLE", False)
+    expected = bucketize(states, start, end, 1.0)
+
+    monkeypatch.setattr(
+        module,
+        "np",
+        lazy_import.LazyModule(
+            "power_sync_tests_broken_numpy", module._numpy_import_failed
+        ),
+    )
+    monkeypatch.setattr(module, "NUMPY_AVAILABLE", True)
+
+    assert bucketize(states, start, end, 1.0) == expected
+    assert module.NUMPY_AVAILABLE is False
+
+
 def test_baseline_confidence_counts_distinct_dates_not_updates(monkeypatch):
     module = _load_estimator_module(monkeypatch)
     estimator = module.LoadEstimator(SimpleNamespace(), "sensor.load", interval_minutes=5)
@@ -1705,3 +1786,226 @@ def test_get_forecast_offloads_history_build_to_executor(monkeypatch):
     assert "_forecast_from_history" in offloaded, (
         f"forecast build was not offloaded to the executor; saw {offloaded}"
     )
+
+
+def _install_windowed_recorder(monkeypatch, states_by_entity, calls):
+    """Fake Recorder that, like HA, returns the start-time state plus changes."""
+    history_calls = calls.setdefault("history", [])
+    statistics_calls = calls.setdefault("statistics", [])
+
+    def _window(states, start_time, end_time):
+        before = [state for state in states if state.last_changed <= start_time]
+        window = [
+            state
+            for state in states
+            if start_time < state.last_changed < end_time
+        ]
+        if before:
+            window.insert(
+                0,
+                SimpleNamespace(state=before[-1].state, last_changed=start_time),
+            )
+        return window
+
+    class FakeRecorder:
+        async def async_add_executor_job(self, func, *args):
+            if func == "history":
+                _hass, start_time, end_time, entity_ids = args
+                history_calls.append((start_time, end_time))
+                return {
+                    entity_id: _window(
+                        states_by_entity.get(entity_id, []),
+                        start_time,
+                        end_time,
+                    )
+                    for entity_id in entity_ids
+                }
+            statistics_calls.append(args[1:3])
+            return {}
+
+    components_module = types.ModuleType("homeassistant.components")
+    recorder_module = types.ModuleType("homeassistant.components.recorder")
+    history_module = types.ModuleType("homeassistant.components.recorder.history")
+    statistics_module = types.ModuleType("homeassistant.components.recorder.statistics")
+    recorder_module.get_instance = lambda hass: FakeRecorder()
+    history_module.get_significant_states = "history"
+    statistics_module.statistics_during_period = "statistics"
+    monkeypatch.setitem(sys.modules, "homeassistant.components", components_module)
+    monkeypatch.setitem(sys.modules, "homeassistant.components.recorder", recorder_module)
+    monkeypatch.setitem(
+        sys.modules, "homeassistant.components.recorder.history", history_module
+    )
+    monkeypatch.setitem(
+        sys.modules, "homeassistant.components.recorder.statistics", statistics_module
+    )
+
+
+class _FakeStore:
+    def __init__(self, data=None):
+        self.data = data
+        self.saved = None
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay):
+        self.saved = data_func()
+
+
+def _synthetic_load_states(start, end, step_seconds=600):
+    states = []
+    cursor = start
+    while cursor < end:
+        watts = 400 + (cursor.hour * 37 + cursor.minute) % 900
+        states.append(SimpleNamespace(state=str(watts), last_changed=cursor))
+        cursor += timedelta(seconds=step_seconds)
+    return states
+
+
+def _history_estimator(module, monkeypatch, now_box, store=None):
+    monkeypatch.setattr(module.dt_util, "utcnow", lambda: now_box[0])
+    hass = SimpleNamespace(
+        states=SimpleNamespace(
+            get=lambda entity_id: SimpleNamespace(
+                attributes={"unit_of_measurement": "W"}
+            )
+        ),
+        async_add_executor_job=_fake_executor,
+    )
+    return module.LoadEstimator(
+        hass,
+        "sensor.load",
+        interval_minutes=5,
+        history_store=store,
+    )
+
+
+def test_history_refresh_fetches_only_the_recorder_tail(monkeypatch):
+    module = _load_estimator_module(monkeypatch)
+    first_now = datetime(2026, 5, 9, 12, 10, tzinfo=timezone.utc)
+    later_now = first_now + timedelta(hours=1, minutes=7)
+    states = {
+        "sensor.load": _synthetic_load_states(
+            first_now - timedelta(days=31), later_now
+        )
+    }
+    calls = {}
+    _install_windowed_recorder(monkeypatch, states, calls)
+    now_box = [first_now]
+    estimator = _history_estimator(module, monkeypatch, now_box)
+
+    _run(estimator._get_load_history())
+    now_box[0] = later_now
+    estimator.invalidate_cache()
+    incremental = _run(estimator._get_load_history())
+
+    assert calls["history"][-1] == (
+        datetime(2026, 5, 9, 12, 0, tzinfo=timezone.utc),
+        later_now,
+    )
+    assert len(calls["statistics"]) == 1
+    assert estimator._history_diagnostics["history_update"] == "incremental"
+
+    fresh = _history_estimator(module, monkeypatch, now_box)
+    rebuilt = _run(fresh._get_load_history())
+    assert fresh._history_diagnostics["history_update"] == "full"
+    assert [start for start, _ in incremental] == [start for start, _ in rebuilt]
+    for (_, incremental_w), (_, rebuilt_w) in zip(incremental, rebuilt):
+        assert math.isclose(incremental_w, rebuilt_w, rel_tol=1e-9)
+
+
+def test_history_store_persists_and_resumes_incrementally(monkeypatch):
+    module = _load_estimator_module(monkeypatch)
+    now = datetime(2026, 5, 9, 12, 10, tzinfo=timezone.utc)
+    states = {
+        "sensor.load": _synthetic_load_states(
+            now - timedelta(days=31), now + timedelta(hours=2)
+        )
+    }
+    calls = {}
+    _install_windowed_recorder(monkeypatch, states, calls)
+    now_box = [now]
+    store = _FakeStore()
+    estimator = _history_estimator(module, monkeypatch, now_box, store)
+    first = _run(estimator._get_load_history())
+
+    assert store.saved["finalized_until"] == "2026-05-09T12:00:00+00:00"
+    assert len(store.saved["buckets"]) == len(first)
+
+    now_box[0] = now + timedelta(minutes=45)
+    restored = _history_estimator(
+        module, monkeypatch, now_box, _FakeStore(store.saved)
+    )
+    history = _run(restored._get_load_history())
+
+    assert calls["history"][-1][0] == datetime(2026, 5, 9, 12, 0, tzinfo=timezone.utc)
+    assert restored._history_diagnostics["history_update"] == "incremental"
+    assert history[-1][0] == datetime(2026, 5, 9, 12, 30, tzinfo=timezone.utc)
+    assert history[0][0] >= now_box[0] - timedelta(days=30)
+
+
+def test_history_store_rebuilds_when_load_entity_changes(monkeypatch):
+    module = _load_estimator_module(monkeypatch)
+    now = datetime(2026, 5, 9, 12, 10, tzinfo=timezone.utc)
+    states = _synthetic_load_states(now - timedelta(days=31), now + timedelta(hours=1))
+    calls = {}
+    _install_windowed_recorder(
+        monkeypatch,
+        {"sensor.load": states, "sensor.other_load": states},
+        calls,
+    )
+    now_box = [now]
+    estimator = _history_estimator(module, monkeypatch, now_box)
+    _run(estimator._get_load_history())
+
+    now_box[0] = now + timedelta(minutes=30)
+    estimator.load_entity_id = "sensor.other_load"
+    estimator.invalidate_cache()
+    _run(estimator._get_load_history())
+
+    assert estimator._history_diagnostics["history_update"] == "full"
+    assert calls["history"][-1][0] == now_box[0] - timedelta(days=30)
+    assert len(calls["statistics"]) == 2
+
+
+def test_hourly_load_profiles_reuse_the_cached_history(monkeypatch):
+    module = _load_estimator_module(monkeypatch)
+    now = datetime(2026, 5, 9, 12, 10, tzinfo=timezone.utc)  # Saturday
+    states = {
+        "sensor.load": _synthetic_load_states(now - timedelta(days=31), now)
+    }
+    calls = {}
+    _install_windowed_recorder(monkeypatch, states, calls)
+    estimator = _history_estimator(module, monkeypatch, [now])
+
+    _run(estimator.get_forecast(horizon_hours=1))
+    profiles = _run(estimator.get_hourly_load_profiles(days=14))
+
+    assert len(calls["history"]) == 1
+    assert _run(estimator.get_hourly_load_profiles(days=14)) is profiles
+    assert len(profiles["weekday"]) == len(profiles["weekend"]) == 24
+    # Every day repeats the same pattern: the 03:00 half-hours average 521W
+    # and 551W, so the hour's median is 536W on any day type.
+    assert profiles["weekday"][3] == pytest.approx(0.536)
+    assert profiles["weekend"][3] == profiles["weekday"][3]
+
+
+def test_hourly_load_profiles_leave_unsampled_hours_empty(monkeypatch):
+    module = _load_estimator_module(monkeypatch)
+    start = datetime(2026, 5, 4, 8, tzinfo=timezone.utc)  # Monday
+    samples = [
+        (start - timedelta(days=20), 9000.0),
+        (start, 1000.0),
+        (start + timedelta(minutes=30), 3000.0),
+        (start + timedelta(days=5), 500.0),
+    ]
+
+    profiles = module.hourly_load_profiles(
+        samples,
+        lambda value: value + timedelta(hours=10),
+        since=start - timedelta(days=14),
+    )
+
+    assert profiles["weekday"][18] == pytest.approx(2.0)
+    assert profiles["weekend"][18] == pytest.approx(0.5)
+    assert profiles["weekday"][8] is None
@@ -0,0 +1,185 @@
+"""Regression tests for the array-backed LP matrix and HiGHS passModel path."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+
+_SENTINEL = object()
+
+_STUB_MODULE_NAMES = (
+    "homeassistant",
+    "homeassistant.util",
+    "homeassistant.util.dt",
+    "power_sync",
+    "power_sync.optimization",
+    "power_sync.optimization.battery_efficiency",
+    "power_sync.optimization.battery_optimizer",
+    "power_sync.optimization.schedule_reader",
+)
+
+
+def _install_stubs() -> None:
+    ha_root = types.ModuleType("homeassistant")
+    ha_util = types.ModuleType("homeassistant.util")
+    ha_dt = types.ModuleType("homeassistant.util.dt")
+    ha_dt.now = lambda *args, **kwargs: datetime(2026, 5, 4, 0, 0, tzinfo=timezone.utc)
+    ha_dt.utcnow = lambda *args, **kwargs: datetime(2026, 5, 4, 0, 0, tzinfo=timezone.utc)
+    ha_dt.UTC = timezone.utc
+    ha_util.dt = ha_dt
+    ha_root.util = ha_util
+
+    sys.modules["homeassistant"] = ha_root
+    sys.modules["homeassistant.util"] = ha_util
+    sys.modules["homeassistant.util.dt"] = ha_dt
+
+    ps_module = types.ModuleType("power_sync")
+    ps_module.__path__ = [str(COMPONENT_ROOT)]
+    sys.modules["power_sync"] = ps_module
+
+    optimization_module = types.ModuleType("power_sync.optimization")
+    optimization_module.__path__ = [str(COMPONENT_ROOT / "optimization")]
+    sys.modules["power_sync.optimization"] = optimization_module
+
+
+@pytest.fixture()
+def battery_optimizer_module():
+    saved_modules = {
+        name: sys.modules.get(name, _SENTINEL)
+        for name in _STUB_MODULE_NAMES
+    }
+    for name in _STUB_MODULE_NAMES:
+        sys.modules.pop(name, None)
+
+    _install_stubs()
+    module = importlib.import_module("power_sync.optimization.battery_optimizer")
+    try:
+        yield module
+    finally:
+        for name in _STUB_MODULE_NAMES:
+            if saved_modules[name] is _SENTINEL:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = saved_modules[name]
+
+
+def _fill(module, assignments, shape=(3, 4)):
+    matrix = module._LpMatrix(shape)
+    for (i, j), value in assignments:
+        matrix[i, j] = value
+    return matrix
+
+
+ASSIGNMENTS = [
+    ((0, 3), 1.0),
+    ((0, 1), -2.0),
+    ((2, 0), 4.0),
+    ((0, 3), 5.0),
+    ((2, 2), 0.0),
+    ((2, 0), 0.0),
+    ((2, 1), 3.0),
+]
+
+
+def _as_lists(csr):
+    return tuple([float(v) for v in part] for part in csr)
+
+
+def test_lp_matrix_keeps_last_write_and_drops_zeros(battery_optimizer_module):
+    matrix = _fill(battery_optimizer_module, ASSIGNMENTS)
+
+    assert matrix[0, 3] == 5.0
+    assert matrix[0, 1] == -2.0
+    assert matrix[2, 0] == 0.0
+    assert matrix[1, 1] == 0.0
+    assert matrix.nnz == 3
+    assert list(matrix.iter_rows()) == [
+        (0, [1, 3], [-2.0, 5.0]),
+        (1, [], []),
+        (2, [1], [3.0]),
+    ]
+    assert _as_lists(matrix.csr_arrays()) == (
+        [0.0, 2.0, 2.0, 3.0],
+        [1.0, 3.0, 1.0],
+        [-2.0, 5.0, 3.0],
+    )
+
+
+def test_lp_matrix_array_fallback_matches_numpy(
+    battery_optimizer_module, monkeypatch
+):
+    module = battery_optimizer_module
+    expected = _as_lists(_fill(module, ASSIGNMENTS).csr_arrays())
+
+    monkeypatch.setattr(module, "NUMPY_AVAILABLE", False)
+    matrix = _fill(module, ASSIGNMENTS)
+
+    assert _as_lists(matrix.csr_arrays()) == expected
+    assert matrix[0, 3] == 5.0
+
+
+def test_lp_matrix_assignment_after_compress_invalidates_cache(
+    battery_optimizer_module,
+):
+    matrix = _fill(battery_optimizer_module, ASSIGNMENTS)
+    assert matrix.nnz == 3
+
+    matrix[1, 2] = 7.0
+
+    assert matrix.nnz == 4
+    assert matrix[1, 2] == 7.0
+
+
+def test_lp_matrix_rejects_out_of_range_row(battery_optimizer_module):
+    matrix = battery_optimizer_module._LpMatrix((1, 2))
+    matrix[1, 0] = 1.0
+
+    with pytest.raises(IndexError):
+        matrix.tocsr()
+
+
+def test_pass_model_matches_row_by_row_build(battery_optimizer_module):
+    module = battery_optimizer_module
+    if not module.HIGHS_AVAILABLE:
+        pytest.skip("highspy unavailable")
+    highspy = module.highspy
+    A_eq = _fill(module, [((0, 0), 1.0), ((0, 1), 1.0), ((0, 2), 1.0)], (1, 3))
+    A_ub = _fill(
+        module,
+        [((0, 0), 1.0), ((0, 1), -1.0), ((1, 2), 2.0), ((1, 0), 1.0)],
+        (2, 3),
+    )
+    kwargs = dict(
+        c=[1.0, 2.0, -0.5],
+        A_ub=A_ub,
+        b_ub=[1.0, 6.0],
+        A_eq=A_eq,
+        b_eq=[4.0],
+        bounds=[(0, None), (0, 5), (0, 2)],
+        time_limit=5.0,
+    )
+
+    result = module._solve_lp_highs(**kwargs)
+
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+    for cost, (lo, hi) in zip(kwargs["c"], kwargs["bounds"]):
+        h.addCol(cost, lo, highspy.kHighsInf if hi is None else hi, 0, [], [])
+    for i, idx, val in A_eq.iter_rows():
+        h.addRow(kwargs["b_eq"][i], kwargs["b_eq"][i], len(idx), idx, val)
+    for i, idx, val in A_ub.iter_rows():
+        h.addRow(-highspy.kHighsInf, kwargs["b_ub"][i], len(idx), idx, val)
+    h.run()
+
+    assert result.success is True
+    assert result.x == pytest.approx(list(h.getSolution().col_value))
+    assert result.fun == pytest.approx(h.getObjectiveValue())
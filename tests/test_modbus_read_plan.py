@@ -0,0 +1,143 @@
+"""Tests for the coalesced Modbus register read planner."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+
+
+def _load_base_module():
+    spec = importlib.util.spec_from_file_location(
+        "power_sync_inverter_base_test",
+        COMPONENT_ROOT / "inverters" / "base.py",
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+base = _load_base_module()
+HOLDING = base.FC_READ_HOLDING_REGISTERS
+INPUT = base.FC_READ_INPUT_REGISTERS
+
+
+class _FakeDevice:
+    """Register bank that echoes addresses and can reject some ranges."""
+
+    def __init__(self, unmapped=(), offline=False):
+        self.unmapped = set(unmapped)
+        self.offline = offline
+        self.reads = []
+
+    async def read(self, function_code, address, count):
+        self.reads.append((function_code, address, count))
+        if self.offline:
+            return None
+        span = range(address, address + count)
+        if any(register in self.unmapped for register in span):
+            return None
+        return [function_code * 100000 + register for register in span]
+
+
+def test_plan_merges_nearby_fields_per_function_code():
+    fields = [
+        base.RegisterField("daily_pv", 13001, 1, INPUT),
+        base.RegisterField("battery", 13019, 7, INPUT),
+        base.RegisterField("total_export", 13045, 2, INPUT),
+        base.RegisterField("inverter_temp", 5007, 1, INPUT),
+        base.RegisterField("pv_dc", 5016, 2, INPUT),
+        base.RegisterField("export_limit", 13073, 1, HOLDING),
+        base.RegisterField("export_mode", 13086, 1, HOLDING),
+    ]
+
+    blocks = base.plan_register_blocks(fields, max_gap=20)
+
+    assert [(b.function_code, b.address, b.count) for b in blocks] == [
+        (HOLDING, 13073, 14),
+        (INPUT, 5007, 11),
+        (INPUT, 13001, 46),
+    ]
+
+
+def test_plan_respects_gap_and_block_size_limits():
+    fields = [
+        base.RegisterField("a", 100),
+        base.RegisterField("b", 105),
+        base.RegisterField("c", 140, 2),
+    ]
+
+    assert [
+        (b.address, b.count) for b in base.plan_register_blocks(fields, max_gap=4)
+    ] == [(100, 6), (140, 2)]
+    assert [
+        (b.address, b.count)
+        for b in base.plan_register_blocks(fields, max_gap=64, max_count=20)
+    ] == [(100, 6), (140, 2)]
+    assert [
+        (b.address, b.count) for b in base.plan_register_blocks(fields, max_gap=64)
+    ] == [(100, 42)]
+
+
+def test_read_slices_fields_from_blocks_and_reports_round_trips():
+    plan = base.RegisterReadPlan(
+        [
+            base.RegisterField("soc", 0x0102),
+            base.RegisterField("capacity", 0x0119),
+            base.RegisterField("power", 0x0126),
+            base.RegisterField("grid", 0x0021, 2),
+        ],
+        max_gap=40,
+    )
+    device = _FakeDevice()
+
+    values = asyncio.run(plan.read(device.read))
+
+    assert device.reads == [(HOLDING, 0x0021, 2), (HOLDING, 0x0102, 37)]
+    assert values["soc"] == [HOLDING * 100000 + 0x0102]
+    assert values["power"] == [HOLDING * 100000 + 0x0126]
+    assert values["grid"] == [HOLDING * 100000 + 0x0021, HOLDING * 100000 + 0x0022]
+    assert plan.last_poll.round_trips == 2
+    assert plan.last_poll.missing == []
+    assert plan.last_poll.to_attributes()["modbus_round_trips"] == 2
+
+
+def test_rejected_gap_register_splits_block_for_later_polls():
+    plan = base.RegisterReadPlan(
+        [base.RegisterField("a", 10), base.RegisterField("b", 14)],
+        max_gap=8,
+    )
+    device = _FakeDevice(unmapped={12})
+
+    first = asyncio.run(plan.read(device.read))
+    device.reads.clear()
+    second = asyncio.run(plan.read(device.read))
+
+    assert first == second == {"a": [HOLDING * 100000 + 10], "b": [HOLDING * 100000 + 14]}
+    assert device.reads == [(HOLDING, 10, 1), (HOLDING, 14, 1)]
+    assert plan.last_poll.failed_blocks == 0
+
+
+def test_offline_device_keeps_block_merged_and_reports_missing_fields():
+    plan = base.RegisterReadPlan(
+        [base.RegisterField("a", 10), base.RegisterField("b", 14)],
+        max_gap=8,
+    )
+    device = _FakeDevice(offline=True)
+
+    assert asyncio.run(plan.read(device.read)) == {}
+    assert plan.last_poll.failed_blocks == 1
+    assert plan.last_poll.missing == ["a", "b"]
+    assert [(b.address, b.count) for b in plan.blocks] == [(10, 5)]
+
+
+def test_duplicate_field_names_are_rejected():
+    with pytest.raises(ValueError):
+        base.RegisterReadPlan([base.RegisterField("a", 1), base.RegisterField("a", 2)])
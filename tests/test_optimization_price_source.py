@@ -140,6 +140,8 @@ def _install_power_sync_stubs() -> None:
     const_module.CONF_OPTIMIZATION_LOAD_ENTITY = "optimization_load_entity"
     const_module.CONF_OPTIMIZATION_PLANNED_EV_LOAD_ENTITY = "optimization_planned_ev_load_entity"
     const_module.CONF_OPTIMIZATION_MANUAL_RESERVE = "optimization_manual_reserve"
+    const_module.CONF_OPTIMIZATION_SOLVER_PROCESS = "optimization_solver_process"
+    const_module.DEFAULT_OPTIMIZATION_SOLVER_PROCESS = True
     const_module.CONF_GENERIC_CHARGER_POWER_ENTITY = "generic_charger_power_entity"
     const_module.DEFAULT_SOLAR_FORECAST_PROVIDER = "solcast"
     const_module.DEFAULT_SOLCAST_ESTIMATE_TYPE = "estimate"
@@ -489,6 +491,54 @@ def test_forecast_data_publishes_provenance_atomically_without_changing_legacy(
     assert "solar_curtailment_forecast" not in unavailable
 
 
+def test_forecast_snapshot_is_built_once_per_solve(opt_module, monkeypatch):
+    coordinator = _planned_ev_load_coordinator(opt_module, [])
+    coordinator._config = opt_module.OptimizationConfig(interval_minutes=5)
+    coordinator._solar_nowcast_derate = 1.0
+    coordinator._last_solar_forecast = [4.0, 2.0, 2.0]
+    coordinator._last_load_forecast = [1.0, 1.0, 1.0]
+    coordinator._last_display_import_prices = [0.3, 0.2, 0.1]
+    coordinator._last_planned_ev_load_forecast_w = None
+    coordinator._last_update_time = None
+    summaries = []
+    monkeypatch.setattr(
+        coordinator,
+        "_summarise_load_forecast",
+        lambda: summaries.append(1) or {
+            "today_remaining_kwh": 0.25,
+            "tomorrow_kwh": 0.0,
+            "hourly_today_remaining": [],
+            "hourly_tomorrow": [],
+            "temperature_adjusted": False,
+            "away_mode": False,
+        },
+    )
+    now = [datetime(2026, 5, 3, 8, 1, tzinfo=timezone.utc)]
+    monkeypatch.setattr(opt_module.dt_util, "utcnow", lambda: now[0])
+
+    # Several LP sensors each read state and attributes after one update.
+    first = coordinator.get_forecast_data()
+    for _ in range(12):
+        assert coordinator.get_forecast_data() is first
+    assert coordinator._forecast_snapshot_builds == 1
+    assert summaries == [1]
+    assert first["load_today_remaining_kwh"] == 0.25
+    with pytest.raises(TypeError):
+        first["import_price_avg"] = 0
+
+    coordinator._bump_forecast_version()
+    second = coordinator.get_forecast_data()
+    assert second is not first
+    assert second["snapshot_version"] == first["snapshot_version"] + 1
+    assert coordinator.get_forecast_data() is second
+
+    # A new optimization interval refreshes the clock-dependent load totals.
+    now[0] += timedelta(minutes=5)
+    coordinator.get_forecast_data()
+    assert coordinator._forecast_snapshot_builds == 3
+    assert len(summaries) == 3
+
+
 def test_planned_ev_load_settings_write_and_clear_without_ev_integration(opt_module):
     entry = _Entry(
         data={"optimization_ev_integration": False},
@@ -784,6 +834,20 @@ def test_ev_integration_defaults_to_initial_config_data(opt_module):
     assert coordinator._ev_integration_enabled is True
 
 
+def test_solver_process_is_on_by_default_and_can_be_turned_off(opt_module):
+    def build(options):
+        return opt_module.OptimizationCoordinator(
+            hass=SimpleNamespace(),
+            entry_id="entry-1",
+            battery_system="tesla",
+            battery_controller=SimpleNamespace(),
+            entry=SimpleNamespace(data={}, options=options),
+        )
+
+    assert isinstance(build({})._solver_pool, opt_module.SolverProcessPool)
+    assert build({"optimization_solver_process": False})._solver_pool is None
+
+
 def test_ev_load_subtraction_uses_monitoring_only_generic_charger_entity(opt_module):
     entry = SimpleNamespace(
         data={},
@@ -2601,3 +2665,158 @@ def test_optimizer_direct_meter_keeps_distinct_missing_ev_incomplete(opt_module)
     assert result["observed_ev_power"] == 10.8
     assert result["load_power"] is None
     assert result["home_load_normalization_quality"] == "incomplete"
+
+
+def _speculative_coordinator(opt_module):
+    solved: list[tuple] = []
+
+    async def fake_pool_run(request):
+        solved.append(request.call_args())
+        optimizer = request.build_optimizer()
+        result = SimpleNamespace(
+            feasible=True,
+            solve_time_s=0.01,
+            reserve=optimizer.backup_reserve,
+        )
+        return result, {"_below_reserve_recovery_target": 0.3}
+
+    coordinator = object.__new__(opt_module.OptimizationCoordinator)
+    coordinator._solver_pool = SimpleNamespace(run=fake_pool_run)
+    coordinator._optimizer = opt_module.BatteryOptimizer(
+        capacity_wh=13500,
+        max_charge_w=5000,
+        max_discharge_w=5000,
+        backup_reserve=0.2,
+    )
+    coordinator._reset_solve_variants()
+    return coordinator, solved
+
+
+def test_speculative_variant_is_adopted_when_inputs_match(opt_module):
+    coordinator, solved = _speculative_coordinator(opt_module)
+
+    async def run():
+        coordinator._start_speculative_solve(
+            "configured_reserve", ([0.1, 0.2], [True, False], None)
+        )
+        # previous_result is not part of what the variant answers.
+        task = coordinator._claim_speculative_solve(
+            "configured_reserve", ([0.1, 0.2], [True, False], object())
+        )
+        assert task is not None
+        return await coordinator._await_speculative_solve("configured_reserve", task)
+
+    result = asyncio.run(run())
+
+    assert result.reserve == 0.2
+    assert solved == [([0.1, 0.2], [True, False], None)]
+    assert coordinator._optimizer._below_reserve_recovery_target == 0.3
+    report = coordinator._solve_variants_report()
+    entry = report["variants"]["configured_reserve"]
+    assert (entry["mode"], entry["status"], entry["feasible"]) == (
+        "speculative",
+        "used",
+        True,
+    )
+    assert entry["wall_s"] is not None
+
+
+def test_speculative_variant_is_dropped_when_config_changes(opt_module):
+    coordinator, _solved = _speculative_coordinator(opt_module)
+
+    async def run():
+        args = ([0.1, 0.2], [True, False], None)
+        coordinator._start_speculative_solve("configured_reserve", args)
+        coordinator._start_speculative_solve("charge_blocked", args)
+        coordinator._optimizer.update_config(backup_reserve=0.35)
+        stale = coordinator._claim_speculative_solve("configured_reserve", args)
+        coordinator._cancel_speculative_solves()
+        await asyncio.sleep(0)
+        return stale
+
+    assert asyncio.run(run()) is None
+    variants = coordinator._solve_variants_report()["variants"]
+    assert variants["configured_reserve"]["status"] == "stale"
+    assert variants["charge_blocked"]["status"] == "unused"
+    assert coordinator._speculative_solves == {}
+
+
+def test_speculation_is_skipped_without_the_solver_process(opt_module):
+    coordinator, solved = _speculative_coordinator(opt_module)
+    coordinator._solver_pool = None
+
+    async def run():
+        args = ([0.1, 0.2], [True, False], None)
+        coordinator._start_speculative_solve("configured_reserve", args)
+        return coordinator._claim_speculative_solve("configured_reserve", args)
+
+    assert asyncio.run(run()) is None
+    assert coordinator._speculative_solves == {}
+    assert solved == []
+
+
+def test_default_coordinator_speculates_variants(opt_module):
+    coordinator = opt_module.OptimizationCoordinator(
+        hass=SimpleNamespace(),
+        entry_id="entry-1",
+        battery_system="tesla",
+        battery_controller=SimpleNamespace(),
+        entry=SimpleNamespace(data={}, options={}),
+    )
+    solved = []
+
+    async def fake_pool_run(request):
+        solved.append(request.call_args())
+        return SimpleNamespace(feasible=True, solve_time_s=0.01), {}
+
+    coordinator._solver_pool.run = fake_pool_run
+    coordinator._optimizer = opt_module.BatteryOptimizer(
+        capacity_wh=13500,
+        max_charge_w=5000,
+        max_discharge_w=5000,
+        backup_reserve=0.2,
+    )
+
+    async def run():
+        args = ([0.1, 0.2], [True, False], None)
+        coordinator._reset_solve_variants()
+        coordinator._start_speculative_solve("configured_reserve", args)
+        task = coordinator._claim_speculative_solve("configured_reserve", args)
+        assert task is not None
+        return await coordinator._await_speculative_solve("configured_reserve", task)
+
+    assert asyncio.run(run()).feasible
+    assert solved == [([0.1, 0.2], [True, False], None)]
+
+
+def test_solver_pool_that_never_solves_is_bypassed(opt_module):
+    executor_calls = []
+
+    async def add_executor_job(func, *args):
+        executor_calls.append(args)
+        return SimpleNamespace(feasible=True)
+
+    async def failing_solve(optimizer, *args):
+        pool.failures += 1
+        raise opt_module.SolverWorkerError("could not start worker")
+
+    pool = SimpleNamespace(solves=0, failures=0, solve=failing_solve)
+    coordinator, solved = _speculative_coordinator(opt_module)
+    coordinator._solver_pool = pool
+    coordinator._solver_pool_failed = False
+    coordinator.hass = SimpleNamespace(async_add_executor_job=add_executor_job)
+
+    async def run():
+        first = await coordinator._solve_optimizer([0.1], None)
+        second = await coordinator._solve_optimizer([0.2], None)
+        coordinator._start_speculative_solve("configured_reserve", ([0.1], None))
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first.feasible and second.feasible
+    assert executor_calls == [([0.1], None), ([0.2], None)]
+    # The second cycle goes straight to the executor.
+    assert pool.failures == 1
+    assert coordinator._speculative_solves == {}
+    assert solved == []
@@ -0,0 +1,224 @@
+"""Tests for the column-backed OptimizationSchedule and its payload cache."""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import importlib.util
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+
+SCHEDULE_READER_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "power_sync"
+    / "optimization"
+    / "schedule_reader.py"
+)
+
+
+@pytest.fixture(scope="module")
+def module():
+    spec = importlib.util.spec_from_file_location(
+        "power_sync_schedule_reader_test", SCHEDULE_READER_PATH
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    # dataclasses resolves field annotations through sys.modules.
+    sys.modules[spec.name] = loaded
+    spec.loader.exec_module(loaded)
+    yield loaded
+    sys.modules.pop(spec.name, None)
+
+
+def _actions(module, start: datetime, count: int = 6) -> list:
+    kinds = ["charge", "export", "self_consumption", "solar_export", "idle", "discharge"]
+    return [
+        module.ScheduleAction(
+            timestamp=start + timedelta(minutes=5 * index),
+            action=kinds[index % len(kinds)],
+            power_w=1500.0 + index,
+            soc=None if index == 2 else 0.4 + index / 100,
+            battery_charge_w=2000.0 if index % 6 == 0 else 0.0,
+            battery_discharge_w=2500.0 if index % 6 in (1, 2, 5) else 0.0,
+            reason="peak" if index == 1 else None,
+            ev_charge_w=7200.04 if index == 4 else 0.0,
+            control_source="manual" if index == 5 else None,
+            control_action="discharge" if index == 5 else None,
+        )
+        for index in range(count)
+    ]
+
+
+def _reference_api_response(actions: list) -> dict:
+    def export_w(a):
+        if a.action in ("export", "discharge"):
+            return max(0.0, min(a.power_w, a.battery_discharge_w))
+        return 0.0
+
+    def consume_w(a):
+        if a.action in ("self_consumption", "consume", "off_grid"):
+            return a.battery_discharge_w
+        if a.action in ("export", "discharge"):
+            return max(0.0, a.battery_discharge_w - export_w(a))
+        return 0.0
+
+    return {
+        "timestamps": [a.timestamp.isoformat() for a in actions],
+        "charge_w": [a.battery_charge_w for a in actions],
+        "discharge_w": [a.battery_discharge_w for a in actions],
+        "ev_charging_w": [max(0.0, a.ev_charge_w) for a in actions],
+        "battery_consume_w": [consume_w(a) for a in actions],
+        "battery_export_w": [export_w(a) for a in actions],
+        "soc": [a.soc if a.soc is not None else 0.5 for a in actions],
+        "control_source": [a.control_source for a in actions],
+        "control_action": [a.control_action for a in actions],
+        "action_reason": [a.reason for a in actions],
+        "grid_import_w": [],
+        "grid_export_w": [],
+    }
+
+
+def test_columns_serialize_like_the_per_action_schedule(module):
+    start = datetime(2026, 5, 3, 8, 30, tzinfo=timezone.utc)
+    actions = _actions(module, start)
+    schedule = module.OptimizationSchedule(actions, 1.5, 0.25, start)
+
+    assert schedule.start == start
+    assert schedule.interval == timedelta(minutes=5)
+    assert schedule.columns.explicit_timestamps is None
+    assert [dataclasses.asdict(a) for a in schedule.actions] == [
+        dataclasses.asdict(a) for a in actions
+    ]
+    assert schedule.to_api_response() == _reference_api_response(actions)
+    assert schedule.to_executor_schedule() == [a.to_dict() for a in actions]
+    assert schedule.soc[2] == 0.5
+    assert schedule.actions[2].soc is None
+
+
+def test_payloads_are_cached_per_version_and_rebuilt_after_edits(module):
+    start = datetime(2026, 5, 3, 8, 30, tzinfo=timezone.utc)
+    schedule = module.OptimizationSchedule(_actions(module, start), 0.0, 0.0)
+
+    first = schedule.to_api_response()
+    first["grid_import_w"] = [1.0]
+    first["timestamps"].append("caller-owned")
+    assert schedule.to_api_response()["grid_import_w"] == []
+    assert len(schedule.to_api_response()["timestamps"]) == 6
+    assert schedule.columns._cache["api"] is schedule.columns.cached("api", dict)
+
+    version = schedule.version
+    action = schedule.actions[3]
+    action.action = "export"
+    action.battery_discharge_w = 900.0
+    action.reason = "manual_control_projection"
+    action.soc = None
+
+    assert schedule.version == version + 4
+    response = schedule.to_api_response()
+    assert response["battery_export_w"][3] == 900.0
+    assert response["action_reason"][3] == "manual_control_projection"
+    assert response["soc"][3] == 0.5
+    assert schedule.to_executor_schedule()[3]["action"] == "export"
+
+    schedule.actions = schedule.actions[:2]
+    assert schedule.to_api_response()["timestamps"] == [
+        start.isoformat(),
+        (start + timedelta(minutes=5)).isoformat(),
+    ]
+
+
+def test_irregular_and_dst_timestamps_round_trip(module):
+    sydney = ZoneInfo("Australia/Sydney")
+    # Daylight saving ends at 16:00 UTC, midway through these slots.
+    start_utc = datetime(2026, 4, 4, 14, 0, tzinfo=timezone.utc)
+    start = start_utc.astimezone(sydney)
+    actions = [
+        module.ScheduleAction(
+            timestamp=(start_utc + timedelta(minutes=30 * index)).astimezone(sydney),
+            action="idle",
+            power_w=0.0,
+        )
+        for index in range(8)
+    ]
+    schedule = module.OptimizationSchedule(actions, 0.0, 0.0)
+
+    assert schedule.columns.explicit_timestamps is not None
+    assert schedule.timestamps == [a.timestamp.isoformat() for a in actions]
+    assert schedule.timestamps[3][-6:] != schedule.timestamps[4][-6:]
+
+    shifted = module.OptimizationSchedule(_actions(module, start), 0.0, 0.0)
+    new_start = start + timedelta(minutes=5)
+    for index, action in enumerate(shifted.actions):
+        action.timestamp = new_start + timedelta(minutes=5 * index)
+    assert shifted.timestamps[0] == new_start.isoformat()
+    assert shifted.actions[-1].timestamp == new_start + timedelta(minutes=25)
+
+
+def test_shift_moves_the_start_and_handles_offset_changes(module):
+    sydney = ZoneInfo("Australia/Sydney")
+    start = datetime(2026, 5, 3, 8, 30, tzinfo=sydney)
+    schedule = module.OptimizationSchedule(_actions(module, start), 0.0, 0.0)
+    assert schedule.timestamps == [a.timestamp.isoformat() for a in _actions(module, start)]
+    version = schedule.version
+
+    later = [start + timedelta(minutes=5 * (index + 1)) for index in range(4)]
+    schedule.columns.shift(timedelta(minutes=5), later)
+
+    assert schedule.version == version + 1
+    assert schedule.columns.explicit_timestamps is None
+    assert schedule.timestamps == [
+        (start + timedelta(minutes=5 * (index + 1))).isoformat() for index in range(6)
+    ]
+
+    # Shifted across the end of daylight saving, the slots keep their instants.
+    start_utc = datetime(2026, 4, 4, 15, 0, tzinfo=timezone.utc)
+    schedule = module.OptimizationSchedule(
+        _actions(module, start_utc.astimezone(sydney)), 0.0, 0.0
+    )
+    later = [
+        (start_utc + timedelta(hours=1, minutes=5 * index)).astimezone(sydney)
+        for index in range(6)
+    ]
+    schedule.columns.shift(timedelta(hours=1), later[:3])
+
+    assert schedule.columns.explicit_timestamps is not None
+    assert [a.timestamp for a in schedule.actions] == later
+    assert schedule.timestamps == [value.isoformat() for value in later]
+
+
+def test_edits_keep_payloads_built_from_other_columns(module):
+    start = datetime(2026, 5, 3, 8, 30, tzinfo=ZoneInfo("Australia/Sydney"))
+    schedule = module.OptimizationSchedule(_actions(module, start), 0.0, 0.0)
+    schedule.to_api_response()
+    cache = schedule.columns._cache
+    timestamps = cache["timestamps"]
+
+    schedule.actions[1].reason = "manual_control_projection"
+    assert cache["timestamps"] is timestamps
+    assert "battery_export_w" in cache and "api" not in cache
+
+    schedule.actions[1].battery_discharge_w = 100.0
+    assert "battery_export_w" not in cache
+    assert schedule.to_api_response()["battery_export_w"][1] == 100.0
+    assert cache["timestamps"] is timestamps
+
+
+def test_copies_and_replace_keep_views_consistent(module):
+    start = datetime(2026, 5, 3, 8, 30, tzinfo=timezone.utc)
+    schedule = module.OptimizationSchedule(_actions(module, start), 0.0, 0.0)
+
+    clone = copy.deepcopy(schedule)
+    clone.actions[0].power_w = 10.0
+    assert clone.to_executor_schedule()[0]["power_w"] == 10.0
+    assert schedule.actions[0].power_w == 1500.0
+
+    detached = dataclasses.replace(schedule.actions[1], power_w=5.0)
+    assert type(detached) is module.ScheduleAction
+    assert detached.reason == "peak"
+    assert schedule.actions[1].power_w == 1501.0
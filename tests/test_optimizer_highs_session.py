@@ -0,0 +1,173 @@
+"""Regression tests for the reusable HiGHS solver session."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+
+_SENTINEL = object()
+
+_STUB_MODULE_NAMES = (
+    "homeassistant",
+    "homeassistant.util",
+    "homeassistant.util.dt",
+    "power_sync",
+    "power_sync.optimization",
+    "power_sync.optimization.battery_efficiency",
+    "power_sync.optimization.battery_optimizer",
+    "power_sync.optimization.schedule_reader",
+)
+
+
+def _install_stubs() -> None:
+    ha_root = types.ModuleType("homeassistant")
+    ha_util = types.ModuleType("homeassistant.util")
+    ha_dt = types.ModuleType("homeassistant.util.dt")
+    ha_dt.now = lambda *args, **kwargs: datetime(2026, 5, 4, 0, 0, tzinfo=timezone.utc)
+    ha_dt.utcnow = lambda *args, **kwargs: datetime(2026, 5, 4, 0, 0, tzinfo=timezone.utc)
+    ha_dt.UTC = timezone.utc
+    ha_util.dt = ha_dt
+    ha_root.util = ha_util
+
+    sys.modules["homeassistant"] = ha_root
+    sys.modules["homeassistant.util"] = ha_util
+    sys.modules["homeassistant.util.dt"] = ha_dt
+
+    ps_module = types.ModuleType("power_sync")
+    ps_module.__path__ = [str(COMPONENT_ROOT)]
+    sys.modules["power_sync"] = ps_module
+
+    optimization_module = types.ModuleType("power_sync.optimization")
+    optimization_module.__path__ = [str(COMPONENT_ROOT / "optimization")]
+    sys.modules["power_sync.optimization"] = optimization_module
+
+
+@pytest.fixture()
+def battery_optimizer_module():
+    saved_modules = {
+        name: sys.modules.get(name, _SENTINEL)
+        for name in _STUB_MODULE_NAMES
+    }
+    for name in _STUB_MODULE_NAMES:
+        sys.modules.pop(name, None)
+
+    _install_stubs()
+    module = importlib.import_module("power_sync.optimization.battery_optimizer")
+    if not module.HIGHS_AVAILABLE:
+        pytest.skip("highspy unavailable")
+    try:
+        yield module
+    finally:
+        for name in _STUB_MODULE_NAMES:
+            if saved_modules[name] is _SENTINEL:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = saved_modules[name]
+
+
+def _model(module, rhs: float, cost: float):
+    A_eq = module._LpMatrix((1, 2))
+    A_eq[0, 0] = 1.0
+    A_eq[0, 1] = 1.0
+    A_ub = module._LpMatrix((1, 2))
+    A_ub[0, 0] = 1.0
+    return dict(
+        c=[cost, 1.0],
+        A_ub=A_ub,
+        b_ub=[3.0],
+        A_eq=A_eq,
+        b_eq=[rhs],
+        bounds=[(0, None), (0, 10)],
+        time_limit=5.0,
+    )
+
+
+def test_session_updates_loaded_model_in_place(battery_optimizer_module):
+    module = battery_optimizer_module
+    session = module._HighsSession()
+
+    first = session.solve(**_model(module, rhs=4.0, cost=0.5))
+    second = session.solve(**_model(module, rhs=5.0, cost=2.0))
+
+    assert first.success is True
+    assert first.x == pytest.approx([3.0, 1.0])
+    assert second.success is True
+    assert second.x == pytest.approx([0.0, 5.0])
+    stats = session.stats()
+    assert stats["solve_count"] == 2
+    assert stats["build_count"] == 1
+    assert stats["update_count"] == 1
+    assert stats["warm_start_count"] == 1
+
+
+def test_session_matches_one_shot_solve_after_coefficient_change(
+    battery_optimizer_module,
+):
+    module = battery_optimizer_module
+    session = module._HighsSession()
+    session.solve(**_model(module, rhs=4.0, cost=0.5))
+
+    changed = _model(module, rhs=4.0, cost=0.5)
+    changed["A_ub"][0, 0] = 2.0
+    reused = session.solve(**changed)
+    one_shot = module._solve_lp_highs(**changed)
+
+    assert reused.x == pytest.approx(one_shot.x)
+    assert reused.fun == pytest.approx(one_shot.fun)
+    assert session.stats()["build_count"] == 1
+
+
+def test_session_rebuilds_when_sparsity_pattern_changes(battery_optimizer_module):
+    module = battery_optimizer_module
+    session = module._HighsSession()
+    session.solve(**_model(module, rhs=4.0, cost=0.5))
+
+    changed = _model(module, rhs=4.0, cost=0.5)
+    changed["A_ub"][0, 1] = 1.0
+    changed["b_ub"] = [10.0]
+    result = session.solve(**changed)
+
+    assert result.success is True
+    assert session.stats()["build_count"] == 2
+    assert session.stats()["update_count"] == 0
+
+
+def test_optimize_reports_session_stats_and_restores_context(
+    battery_optimizer_module,
+):
+    module = battery_optimizer_module
+    optimizer = module.BatteryOptimizer(
+        capacity_wh=13500,
+        max_charge_w=7000,
+        max_discharge_w=7000,
+        backup_reserve=0.05,
+        interval_minutes=5,
+        horizon_hours=1,
+    )
+    n = 12
+
+    result = optimizer.optimize(
+        import_prices=[0.05] * 6 + [0.40] * 6,
+        export_prices=[0.02] * 6 + [0.30] * 6,
+        solar_forecast=[0.0] * n,
+        load_forecast=[0.5] * n,
+        current_soc=0.50,
+        allow_battery_export=[True] * n,
+    )
+
+    assert result.solver_used == "highs"
+    stats = result.solver_session
+    assert stats["solve_count"] == result.lp_stats["mode_iterations"]
+    assert stats["build_count"] + stats["update_count"] == stats["solve_count"]
+    assert stats["build_time_s"] >= 0.0
+    assert stats["simplex_iterations"] >= 0
+    assert module._ACTIVE_HIGHS_SESSION.get() is None
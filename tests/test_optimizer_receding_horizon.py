@@ -0,0 +1,254 @@
+"""Regression tests for the receding-horizon incremental re-solve."""
+
+from __future__ import annotations
+
+import importlib
+import math
+import sys
+import types
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+
+_SENTINEL = object()
+
+_STUB_MODULE_NAMES = (
+    "homeassistant",
+    "homeassistant.util",
+    "homeassistant.util.dt",
+    "power_sync",
+    "power_sync.optimization",
+    "power_sync.optimization.battery_efficiency",
+    "power_sync.optimization.battery_optimizer",
+    "power_sync.optimization.schedule_reader",
+    "power_sync.optimization.solve_cache",
+)
+
+_START = datetime(2026, 5, 4, 0, 0, tzinfo=timezone.utc)
+_HORIZON_HOURS = 12
+_N = _HORIZON_HOURS * 12
+
+
+def _install_stubs() -> None:
+    ha_root = types.ModuleType("homeassistant")
+    ha_util = types.ModuleType("homeassistant.util")
+    ha_dt = types.ModuleType("homeassistant.util.dt")
+    ha_dt.now = lambda *args, **kwargs: _START
+    ha_dt.utcnow = lambda *args, **kwargs: _START
+    ha_dt.UTC = timezone.utc
+    ha_util.dt = ha_dt
+    ha_root.util = ha_util
+
+    sys.modules["homeassistant"] = ha_root
+    sys.modules["homeassistant.util"] = ha_util
+    sys.modules["homeassistant.util.dt"] = ha_dt
+
+    ps_module = types.ModuleType("power_sync")
+    ps_module.__path__ = [str(COMPONENT_ROOT)]
+    sys.modules["power_sync"] = ps_module
+
+    optimization_module = types.ModuleType("power_sync.optimization")
+    optimization_module.__path__ = [str(COMPONENT_ROOT / "optimization")]
+    sys.modules["power_sync.optimization"] = optimization_module
+
+
+@pytest.fixture()
+def battery_optimizer_module():
+    saved_modules = {
+        name: sys.modules.get(name, _SENTINEL)
+        for name in _STUB_MODULE_NAMES
+    }
+    for name in _STUB_MODULE_NAMES:
+        sys.modules.pop(name, None)
+
+    _install_stubs()
+    module = importlib.import_module("power_sync.optimization.battery_optimizer")
+    if not module.HIGHS_AVAILABLE:
+        pytest.skip("highspy unavailable")
+    try:
+        yield module
+    finally:
+        for name in _STUB_MODULE_NAMES:
+            if saved_modules[name] is _SENTINEL:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = saved_modules[name]
+
+
+def _optimizer(module):
+    return module.BatteryOptimizer(
+        capacity_wh=13500,
+        max_charge_w=5000,
+        max_discharge_w=5000,
+        backup_reserve=0.20,
+        interval_minutes=5,
+        horizon_hours=_HORIZON_HOURS,
+    )
+
+
+def _solar(slot: int) -> float:
+    day_slot = slot % 144
+    if not 36 <= day_slot < 108:
+        return 0.0
+    return 5.0 * math.sin(math.pi * (day_slot - 36) / 72)
+
+
+def _inputs(shift: int = 0, **overrides):
+    """Cheap overnight import, a solar midday, then an evening export peak."""
+    slots = range(shift, shift + _N)
+    kwargs = dict(
+        import_prices=[
+            0.10 if i % 144 < 36 else 0.45 if 100 <= i % 144 < 130 else 0.25
+            for i in slots
+        ],
+        export_prices=[0.30 if 100 <= i % 144 < 130 else 0.05 for i in slots],
+        solar_forecast=[_solar(i) for i in slots],
+        load_forecast=[0.8 + 0.4 * (i % 144 >= 100) for i in slots],
+        allow_battery_export=True,
+        schedule_timestamps=[_START + timedelta(minutes=5 * i) for i in slots],
+    )
+    kwargs.update(overrides)
+    return kwargs
+
+
+def _shifted_solve(module, **overrides):
+    optimizer = _optimizer(module)
+    first = optimizer.optimize(current_soc=0.40, **_inputs())
+    soc = first.schedule.actions[0].soc
+    inputs = _inputs(shift=1)
+    inputs.update(overrides)
+    second = optimizer.optimize(
+        current_soc=overrides.pop("current_soc", soc),
+        previous_result=first,
+        **{k: v for k, v in inputs.items() if k != "current_soc"},
+    )
+    return optimizer, first, second
+
+
+def test_shifted_horizon_resolves_only_the_near_window(battery_optimizer_module):
+    module = battery_optimizer_module
+    optimizer, first, second = _shifted_solve(module)
+    window = module.LP_NEAR_HORIZON_HOURS * 12
+
+    assert first.lp_stats["receding_horizon"] == {
+        "mode": "full",
+        "reason": "no_previous_plan",
+    }
+    stats = second.lp_stats["receding_horizon"]
+    assert stats["mode"] == "incremental"
+    assert stats["shift_slots"] == 1
+    assert stats["window_slots"] == window
+    assert stats["carried_slots"] == _N - 1 - window
+    assert stats["appended_slots"] == 1
+    assert len(second.schedule.actions) == _N
+    assert second.schedule.actions[0].timestamp == _START + timedelta(minutes=5)
+    assert len(second.grid_import_w) == _N
+
+    full = optimizer.optimize(
+        current_soc=first.schedule.actions[0].soc,
+        **_inputs(shift=1),
+    )
+    assert second.schedule.predicted_cost == pytest.approx(
+        full.schedule.predicted_cost, abs=0.05
+    )
+    for incremental, reference in zip(
+        second.schedule.actions[:-1], full.schedule.actions[:-1]
+    ):
+        assert incremental.soc == pytest.approx(reference.soc, abs=0.02)
+
+
+def test_near_window_ends_at_the_previous_plan_boundary_soc(
+    battery_optimizer_module,
+):
+    module = battery_optimizer_module
+    _, first, second = _shifted_solve(module)
+    window = module.LP_NEAR_HORIZON_HOURS * 12
+
+    boundary = first.schedule.actions[window].soc
+    assert second.lp_stats["receding_horizon"]["boundary_soc"] == pytest.approx(
+        boundary, abs=1e-4
+    )
+    assert second.schedule.actions[window - 1].soc >= boundary - 1e-3
+    # The carried tail keeps the previous plan's export peak.
+    assert second.schedule.battery_export_w[99:129] == pytest.approx(
+        first.schedule.battery_export_w[100:130], abs=1.0
+    )
+
+
+@pytest.mark.parametrize(
+    ("overrides", "reason"),
+    [
+        ({"current_soc": 0.90}, "soc_drift"),
+        (
+            {"export_prices": [0.05] * _N},
+            "forecast_changed",
+        ),
+        ({"disable_idle": True}, "configuration_changed"),
+    ],
+)
+def test_drift_beyond_tolerance_forces_a_full_solve(
+    battery_optimizer_module,
+    overrides,
+    reason,
+):
+    _, _, second = _shifted_solve(battery_optimizer_module, **overrides)
+
+    assert second.lp_stats["receding_horizon"] == {
+        "mode": "full",
+        "reason": reason,
+    }
+    assert second.horizon_inputs["incremental_solves"] == 0
+
+
+def test_near_window_price_change_stays_incremental(battery_optimizer_module):
+    prices = _inputs(shift=1)["import_prices"]
+    prices[:6] = [-0.05] * 6
+
+    _, _, second = _shifted_solve(battery_optimizer_module, import_prices=prices)
+
+    assert second.lp_stats["receding_horizon"]["mode"] == "incremental"
+    assert second.schedule.actions[0].action == "charge"
+
+
+def test_consecutive_incremental_solves_are_capped(battery_optimizer_module):
+    module = battery_optimizer_module
+    optimizer = _optimizer(module)
+    optimizer.receding_horizon_max_incremental_solves = 2
+    previous = optimizer.optimize(current_soc=0.40, **_inputs())
+    modes = []
+    for shift in range(1, 5):
+        previous = optimizer.optimize(
+            current_soc=previous.schedule.actions[0].soc,
+            previous_result=previous,
+            **_inputs(shift=shift),
+        )
+        modes.append(previous.lp_stats["receding_horizon"].get("reason", "incremental"))
+
+    assert modes == ["incremental", "incremental", "refresh_due", "incremental"]
+
+
+def test_unreachable_boundary_falls_back_to_a_full_solve(battery_optimizer_module):
+    module = battery_optimizer_module
+    optimizer = _optimizer(module)
+    window = module.LP_NEAR_HORIZON_HOURS * 12
+    first = optimizer.optimize(current_soc=0.40, **_inputs())
+    first.schedule.actions[window].soc = 1.0
+    blocked = [True] * window + [False] * (_N - window)
+
+    second = optimizer.optimize(
+        current_soc=first.schedule.actions[0].soc,
+        previous_result=first,
+        **_inputs(shift=1, block_battery_charge=blocked),
+    )
+
+    assert second.lp_stats["receding_horizon"] == {
+        "mode": "full",
+        "reason": "window_infeasible",
+    }
+    assert second.solver_used == "highs"
+    assert len(second.schedule.actions) == _N
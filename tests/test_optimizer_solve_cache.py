@@ -0,0 +1,233 @@
+"""Regression tests for the content-addressed optimizer result cache."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+
+_SENTINEL = object()
+
+_STUB_MODULE_NAMES = (
+    "homeassistant",
+    "homeassistant.util",
+    "homeassistant.util.dt",
+    "power_sync",
+    "power_sync.optimization",
+    "power_sync.optimization.battery_efficiency",
+    "power_sync.optimization.battery_optimizer",
+    "power_sync.optimization.schedule_reader",
+    "power_sync.optimization.solve_cache",
+)
+
+
+def _install_stubs() -> None:
+    ha_root = types.ModuleType("homeassistant")
+    ha_util = types.ModuleType("homeassistant.util")
+    ha_dt = types.ModuleType("homeassistant.util.dt")
+    ha_dt.now = lambda *args, **kwargs: datetime(2026, 5, 4, 0, 0, tzinfo=timezone.utc)
+    ha_dt.utcnow = lambda *args, **kwargs: datetime(2026, 5, 4, 0, 0, tzinfo=timezone.utc)
+    ha_dt.UTC = timezone.utc
+    ha_util.dt = ha_dt
+    ha_root.util = ha_util
+
+    sys.modules["homeassistant"] = ha_root
+    sys.modules["homeassistant.util"] = ha_util
+    sys.modules["homeassistant.util.dt"] = ha_dt
+
+    ps_module = types.ModuleType("power_sync")
+    ps_module.__path__ = [str(COMPONENT_ROOT)]
+    sys.modules["power_sync"] = ps_module
+
+    optimization_module = types.ModuleType("power_sync.optimization")
+    optimization_module.__path__ = [str(COMPONENT_ROOT / "optimization")]
+    sys.modules["power_sync.optimization"] = optimization_module
+
+
+@pytest.fixture()
+def battery_optimizer_module():
+    saved_modules = {
+        name: sys.modules.get(name, _SENTINEL)
+        for name in _STUB_MODULE_NAMES
+    }
+    for name in _STUB_MODULE_NAMES:
+        sys.modules.pop(name, None)
+
+    _install_stubs()
+    module = importlib.import_module("power_sync.optimization.battery_optimizer")
+    if not module.HIGHS_AVAILABLE:
+        pytest.skip("highspy unavailable")
+    module.solve_cache = importlib.import_module(
+        "power_sync.optimization.solve_cache"
+    )
+    try:
+        yield module
+    finally:
+        for name in _STUB_MODULE_NAMES:
+            if saved_modules[name] is _SENTINEL:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = saved_modules[name]
+
+
+START = datetime(2026, 5, 4, 0, 0, tzinfo=timezone.utc)
+
+
+def _timestamps(start=START, n=12):
+    return [start + timedelta(minutes=5 * idx) for idx in range(n)]
+
+
+def _inputs(**overrides):
+    n = 12
+    inputs = dict(
+        import_prices=[0.05] * 6 + [0.40] * 6,
+        export_prices=[0.02] * 6 + [0.30] * 6,
+        solar_forecast=[0.0] * n,
+        load_forecast=[0.5] * n,
+        current_soc=0.50,
+        allow_battery_export=[True] * n,
+        schedule_timestamps=_timestamps(),
+    )
+    inputs.update(overrides)
+    return inputs
+
+
+def _cached_optimizer(module, monkeypatch, **cache_kwargs):
+    optimizer = module.BatteryOptimizer(
+        capacity_wh=13500,
+        max_charge_w=7000,
+        max_discharge_w=7000,
+        backup_reserve=0.05,
+        interval_minutes=5,
+        horizon_hours=1,
+    )
+    optimizer.result_cache = module.solve_cache.SolveResultCache(**cache_kwargs)
+    calls = []
+    real_solve = module._solve_lp_highs
+
+    def counting_solve(*args, **kwargs):
+        calls.append(1)
+        return real_solve(*args, **kwargs)
+
+    monkeypatch.setattr(module, "_solve_lp_highs", counting_solve)
+    return optimizer, calls
+
+
+def test_identical_inputs_reuse_cached_result(battery_optimizer_module, monkeypatch):
+    module = battery_optimizer_module
+    optimizer, calls = _cached_optimizer(module, monkeypatch)
+
+    first = optimizer.optimize(**_inputs())
+    solves = len(calls)
+    second = optimizer.optimize(**_inputs())
+
+    assert len(calls) == solves
+    assert second.lp_stats["solve_cache_lookup"] == "hit"
+    assert [a.action for a in second.schedule.actions] == [
+        a.action for a in first.schedule.actions
+    ]
+    assert second.objective_value == first.objective_value
+    stats = optimizer.result_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_returned_result_is_isolated_from_cache(battery_optimizer_module, monkeypatch):
+    module = battery_optimizer_module
+    optimizer, _calls = _cached_optimizer(module, monkeypatch)
+
+    first = optimizer.optimize(**_inputs())
+    first.schedule.actions[0].action = "mutated"
+    first.lp_stats["caller"] = True
+    second = optimizer.optimize(**_inputs())
+
+    assert second.schedule.actions[0].action != "mutated"
+    assert "caller" not in second.lp_stats
+
+
+def test_changed_inputs_or_config_miss(battery_optimizer_module, monkeypatch):
+    module = battery_optimizer_module
+    optimizer, calls = _cached_optimizer(module, monkeypatch)
+
+    optimizer.optimize(**_inputs())
+    solves = len(calls)
+    optimizer.optimize(**_inputs(import_prices=[0.05] * 5 + [0.40] * 7))
+    assert len(calls) > solves
+
+    solves = len(calls)
+    optimizer.update_config(backup_reserve=0.10)
+    optimizer.optimize(**_inputs())
+    assert len(calls) > solves
+    assert optimizer.result_cache.stats()["hits"] == 0
+
+
+def test_soc_is_quantized_into_buckets(battery_optimizer_module, monkeypatch):
+    module = battery_optimizer_module
+    optimizer, calls = _cached_optimizer(module, monkeypatch, soc_quantum=0.01)
+
+    optimizer.optimize(**_inputs(current_soc=0.500))
+    solves = len(calls)
+    optimizer.optimize(**_inputs(current_soc=0.502))
+    assert len(calls) == solves
+
+    optimizer.optimize(**_inputs(current_soc=0.53))
+    assert len(calls) > solves
+
+
+def test_hit_is_shifted_to_current_slot(battery_optimizer_module, monkeypatch):
+    module = battery_optimizer_module
+    optimizer, calls = _cached_optimizer(module, monkeypatch)
+    flat = dict(
+        import_prices=[0.30] * 12,
+        export_prices=[0.05] * 12,
+        allow_battery_export=[False] * 12,
+    )
+
+    optimizer.optimize(**_inputs(**flat))
+    solves = len(calls)
+    later = _timestamps(START + timedelta(minutes=5))
+    shifted = optimizer.optimize(**_inputs(**flat, schedule_timestamps=later))
+
+    assert len(calls) == solves
+    assert [a.timestamp for a in shifted.schedule.actions] == later
+    assert shifted.horizon_inputs["timestamps"] == later
+    # The shift moves the start once instead of rewriting every slot.
+    assert shifted.schedule.columns.explicit_timestamps is None
+
+
+def test_calls_without_timestamps_are_not_cached(
+    battery_optimizer_module, monkeypatch
+):
+    module = battery_optimizer_module
+    optimizer, calls = _cached_optimizer(module, monkeypatch)
+
+    optimizer.optimize(**_inputs(schedule_timestamps=None))
+    solves = len(calls)
+    optimizer.optimize(**_inputs(schedule_timestamps=None))
+
+    assert len(calls) == 2 * solves
+    assert optimizer.result_cache.stats()["entries"] == 0
+
+
+def test_lru_evicts_oldest_entry(battery_optimizer_module, monkeypatch):
+    module = battery_optimizer_module
+    optimizer, calls = _cached_optimizer(module, monkeypatch, max_entries=2)
+
+    for load in (0.4, 0.5, 0.6):
+        optimizer.optimize(**_inputs(load_forecast=[load] * 12))
+    solves = len(calls)
+    optimizer.optimize(**_inputs(load_forecast=[0.6] * 12))
+    assert len(calls) == solves
+    optimizer.optimize(**_inputs(load_forecast=[0.4] * 12))
+    assert len(calls) > solves
+
+    stats = optimizer.result_cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 2
@@ -0,0 +1,313 @@
+"""Regression tests for the out-of-process optimizer solver pool."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import multiprocessing
+import pickle
+import sys
+import textwrap
+import threading
+import time
+import types
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+
+_SENTINEL = object()
+
+_STUB_MODULE_NAMES = (
+    "homeassistant",
+    "homeassistant.util",
+    "homeassistant.util.dt",
+    "power_sync",
+    "power_sync.optimization",
+    "power_sync.optimization.battery_efficiency",
+    "power_sync.optimization.battery_optimizer",
+    "power_sync.optimization.schedule_reader",
+    "power_sync.optimization.solve_cache",
+    "power_sync.optimization.solver_pool",
+)
+
+START = datetime(2026, 5, 4, 0, 0, tzinfo=timezone.utc)
+
+# Most tests fork workers so they inherit the stubbed modules; production
+# spawns them (see test_spawned_worker_imports_only_the_optimization_modules).
+requires_fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork start method unavailable",
+)
+pytestmark = pytest.mark.filterwarnings(
+    "ignore:This process .* is multi-threaded:DeprecationWarning"
+)
+
+
+def _install_stubs() -> None:
+    ha_root = types.ModuleType("homeassistant")
+    ha_util = types.ModuleType("homeassistant.util")
+    ha_dt = types.ModuleType("homeassistant.util.dt")
+    ha_dt.now = lambda *args, **kwargs: START
+    ha_dt.utcnow = lambda *args, **kwargs: START
+    ha_dt.UTC = timezone.utc
+    ha_util.dt = ha_dt
+    ha_root.util = ha_util
+
+    sys.modules["homeassistant"] = ha_root
+    sys.modules["homeassistant.util"] = ha_util
+    sys.modules["homeassistant.util.dt"] = ha_dt
+
+    ps_module = types.ModuleType("power_sync")
+    ps_module.__path__ = [str(COMPONENT_ROOT)]
+    sys.modules["power_sync"] = ps_module
+
+    optimization_module = types.ModuleType("power_sync.optimization")
+    optimization_module.__path__ = [str(COMPONENT_ROOT / "optimization")]
+    sys.modules["power_sync.optimization"] = optimization_module
+
+
+@pytest.fixture()
+def modules():
+    saved_modules = {
+        name: sys.modules.get(name, _SENTINEL)
+        for name in _STUB_MODULE_NAMES
+    }
+    for name in _STUB_MODULE_NAMES:
+        sys.modules.pop(name, None)
+
+    _install_stubs()
+    optimizer_module = importlib.import_module(
+        "power_sync.optimization.battery_optimizer"
+    )
+    if not optimizer_module.HIGHS_AVAILABLE:
+        pytest.skip("highspy unavailable")
+    pool_module = importlib.import_module("power_sync.optimization.solver_pool")
+    try:
+        yield optimizer_module, pool_module
+    finally:
+        for name in _STUB_MODULE_NAMES:
+            if saved_modules[name] is _SENTINEL:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = saved_modules[name]
+
+
+def _optimizer(module):
+    return module.BatteryOptimizer(
+        capacity_wh=13500,
+        max_charge_w=7000,
+        max_discharge_w=7000,
+        backup_reserve=0.05,
+        interval_minutes=5,
+        horizon_hours=1,
+    )
+
+
+def _args():
+    n = 12
+    return (
+        [0.05] * 6 + [0.40] * 6,
+        [0.02] * 6 + [0.30] * 6,
+        [0.0] * n,
+        [0.5] * n,
+        0.50,
+        "cost",
+        0.0,
+        [True] * n,
+        False,
+        True,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        [START + timedelta(minutes=5 * idx) for idx in range(n)],
+    )
+
+
+def _plan(result):
+    return [(a.action, round(a.soc, 4)) for a in result.schedule.actions]
+
+
+def test_request_round_trip_matches_direct_solve(modules):
+    optimizer_module, pool_module = modules
+    optimizer = _optimizer(optimizer_module)
+    optimizer.result_cache = object()
+
+    request = pool_module.SolveRequest.from_call(optimizer, _args())
+    assert "result_cache" not in request.state
+    assert isinstance(request.args[0], array)
+    assert request.args[7] == [True] * 12
+
+    result, state, report = pool_module.run_solve_request(
+        pickle.loads(pickle.dumps(request))
+    )
+    direct = _optimizer(optimizer_module)
+    expected = direct.optimize(*_args())
+
+    assert _plan(result) == _plan(expected)
+    assert result.objective_value == pytest.approx(expected.objective_value)
+    assert set(state) == {
+        "_below_reserve_recovery_target",
+        "_last_grid_export_limits_w",
+    }
+    assert state["_below_reserve_recovery_target"] == (
+        direct._below_reserve_recovery_target
+    )
+    assert report["solve_s"] >= 0.0
+    assert "peak_rss_mb" in report
+
+
+@requires_fork
+def test_pool_solves_in_a_reused_worker(modules):
+    optimizer_module, pool_module = modules
+    optimizer = _optimizer(optimizer_module)
+    optimizer._last_grid_export_limits_w = [0.0] * 12
+    expected = _optimizer(optimizer_module).optimize(*_args())
+
+    async def run():
+        pool = pool_module.SolverProcessPool(start_method="fork")
+        try:
+            first = await pool.solve(optimizer, *_args())
+            second = await pool.solve(optimizer, *_args())
+        finally:
+            await pool.async_shutdown()
+        return pool, first, second
+
+    pool, first, second = asyncio.run(run())
+
+    assert _plan(first) == _plan(expected)
+    assert optimizer._last_grid_export_limits_w is None
+    report = second.lp_stats["solver_worker"]
+    assert report["worker_solves"] == 2
+    assert report["solve_cache"]["hits"] == 1
+    assert report["roundtrip_s"] >= report["solve_s"]
+    stats = pool.stats()
+    assert (stats["solves"], stats["workers_started"], stats["workers"]) == (2, 1, 0)
+
+
+@requires_fork
+def test_cancel_terminates_superseded_solve(modules, monkeypatch):
+    optimizer_module, pool_module = modules
+    optimizer = _optimizer(optimizer_module)
+    real_run = pool_module.run_solve_request
+
+    def slow_run(request, cache=None):
+        time.sleep(30)
+        return real_run(request, cache)
+
+    async def run():
+        pool = pool_module.SolverProcessPool(start_method="fork")
+        monkeypatch.setattr(pool_module, "run_solve_request", slow_run)
+        stale = asyncio.create_task(pool.solve(optimizer, *_args()))
+        while not pool.busy:
+            await asyncio.sleep(0.01)
+        monkeypatch.setattr(pool_module, "run_solve_request", real_run)
+        started = time.monotonic()
+        assert pool.cancel() is True
+        with pytest.raises(pool_module.SolveCancelledError):
+            await stale
+        elapsed = time.monotonic() - started
+        fresh = await pool.solve(optimizer, *_args())
+        await pool.async_shutdown()
+        return pool, fresh, elapsed
+
+    pool, fresh, elapsed = asyncio.run(run())
+
+    assert elapsed < 5
+    assert fresh.feasible
+    stats = pool.stats()
+    assert (stats["cancelled"], stats["workers_started"]) == (1, 2)
+
+
+@requires_fork
+def test_worker_exception_is_reported_and_worker_reused(modules):
+    optimizer_module, pool_module = modules
+    optimizer = _optimizer(optimizer_module)
+    bad_args = ("not-a-price-list",) + _args()[1:]
+
+    async def run():
+        pool = pool_module.SolverProcessPool(start_method="fork")
+        try:
+            with pytest.raises(pool_module.SolverWorkerError):
+                await pool.solve(optimizer, *bad_args)
+            result = await pool.solve(optimizer, *_args())
+        finally:
+            await pool.async_shutdown()
+        return pool, result
+
+    pool, result = asyncio.run(run())
+
+    assert result.feasible
+    stats = pool.stats()
+    assert (stats["failures"], stats["workers_started"]) == (1, 1)
+
+
+def _write_homeassistant_stub(root: Path) -> None:
+    """Write an importable ``homeassistant.util.dt`` for spawned workers."""
+    util = root / "homeassistant" / "util"
+    util.mkdir(parents=True)
+    (root / "homeassistant" / "__init__.py").write_text("")
+    (util / "__init__.py").write_text("")
+    (util / "dt.py").write_text(
+        textwrap.dedent(
+            """
+            from datetime import datetime, timezone
+
+            UTC = timezone.utc
+
+
+            def now(time_zone=None):
+                return datetime.now(UTC)
+            """
+        )
+    )
+
+
+def test_spawned_worker_imports_only_the_optimization_modules(
+    modules, tmp_path, monkeypatch
+):
+    optimizer_module, pool_module = modules
+    # A spawned worker cannot see the stubs above. The file stub is just
+    # enough for the optimizer; importing power_sync/__init__.py would fail.
+    _write_homeassistant_stub(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    optimizer = _optimizer(optimizer_module)
+    expected = _optimizer(optimizer_module).optimize(*_args())
+
+    async def run():
+        pool = pool_module.SolverProcessPool(start_method="spawn")
+        try:
+            result = await pool.solve(optimizer, *_args())
+        finally:
+            await pool.async_shutdown()
+        return pool, result
+
+    pool, result = asyncio.run(run())
+
+    assert type(result) is optimizer_module.OptimizerResult
+    assert _plan(result) == _plan(expected)
+    stats = pool.stats()
+    assert (stats["solves"], stats["failures"], stats["workers_started"]) == (1, 0, 1)
+
+
+def test_unpicklable_request_raises_worker_error_before_starting(modules):
+    optimizer_module, pool_module = modules
+    optimizer = _optimizer(optimizer_module)
+    optimizer.profile_lock = threading.Lock()
+
+    async def run():
+        pool = pool_module.SolverProcessPool(start_method="spawn")
+        with pytest.raises(pool_module.SolverWorkerError, match="pickle"):
+            await pool.solve(optimizer, *_args())
+        return pool
+
+    stats = asyncio.run(run()).stats()
+    assert (stats["failures"], stats["workers_started"]) == (1, 0)
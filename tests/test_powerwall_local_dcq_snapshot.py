@@ -929,3 +929,120 @@ def test_snapshot_from_dcq_empty_alerts():
     dcq["control"]["alerts"] = {"active": []}
     snap = client_mod._snapshot_from_dcq(dcq, None)
     assert snap.alerts == []
+
+
+def test_shutdown_closes_client_session_and_payload_includes_transport_stats():
+    class _SessionClient:
+        closed = 0
+
+        def transport_stats(self):
+            return {"handshakes": 1, "reused_connections": 9}
+
+        async def async_close(self):
+            self.closed += 1
+
+    coord = coordinator_mod.PowerwallLocalCoordinator.__new__(
+        coordinator_mod.PowerwallLocalCoordinator
+    )
+    coord._client = _SessionClient()
+    coord._v1r_diagnostics = {"available": True, "error": None}
+
+    payload = coord._v1r_diagnostics_payload()
+    asyncio.run(coord.async_shutdown())
+
+    assert payload["transport"] == {"handshakes": 1, "reused_connections": 9}
+    assert "transport" not in coord._v1r_diagnostics
+    assert coord._client.closed == 1
+
+
+class _ConfigCountingTransport:
+    def __init__(self):
+        self.config_generation = 0
+        self.config_reads = 0
+
+    async def read_config(self, din):
+        self.config_reads += 1
+        cfg = _sample_cfg()
+        cfg["site_info"]["backup_reserve_percent"] = 10 + self.config_reads
+        return cfg
+
+
+def _config_cache_client(monkeypatch, clock):
+    client = client_mod.PowerwallLocalClient(
+        "192.168.1.50",
+        version=client_mod.PowerwallVersion.PW3,
+        private_key_pem=b"dummy",
+        din="DIN123",
+    )
+    client._transport = _ConfigCountingTransport()
+    dcq_calls = []
+
+    async def _fetch_dcq_local():
+        dcq_calls.append(True)
+        return _sample_dcq()
+
+    client._fetch_dcq_local = _fetch_dcq_local
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: clock[0])
+    return client, dcq_calls
+
+
+def test_snapshot_reuses_config_until_write_or_revalidation(monkeypatch):
+    clock = [1000.0]
+    client, dcq_calls = _config_cache_client(monkeypatch, clock)
+
+    async def _poll():
+        snap = await client.get_snapshot()
+        return snap.raw["config"]["site_info"]["backup_reserve_percent"]
+
+    assert asyncio.run(_poll()) == 11
+    clock[0] += 2
+    assert asyncio.run(_poll()) == 11
+    assert client._transport.config_reads == 1
+
+    # One of our writes bumps the generation and forces a re-read.
+    client._transport.config_generation += 1
+    assert asyncio.run(_poll()) == 12
+    clock[0] += 2
+    assert asyncio.run(_poll()) == 12
+
+    clock[0] += client_mod._CONFIG_REVALIDATE_SECONDS
+    assert asyncio.run(_poll()) == 13
+
+    client.invalidate_config_cache()
+    assert asyncio.run(_poll()) == 14
+
+    assert len(dcq_calls) == 6
+    stats = client.poll_request_stats()
+    assert stats["snapshots"] == 6
+    assert stats["config_reads"] == 4
+    assert stats["config_cache_hits"] == 2
+
+
+def test_poll_request_stats_report_hourly_rate_before_and_after_cache(monkeypatch):
+    clock = [0.0]
+    client, _ = _config_cache_client(monkeypatch, clock)
+
+    for _ in range(1800):
+        asyncio.run(client.get_snapshot())
+        clock[0] += 2.0
+
+    stats = client.poll_request_stats()
+    assert stats["uncached_requests_per_hour"] == 3600
+    assert stats["requests_per_hour"] == 1800 + 60
+
+
+def test_failed_config_read_is_retried_on_next_poll(monkeypatch):
+    clock = [0.0]
+    client, _ = _config_cache_client(monkeypatch, clock)
+    transport = client._transport
+
+    async def _failing_read_config(din):
+        transport.config_reads += 1
+        return None
+
+    transport.read_config = _failing_read_config
+    snap = asyncio.run(client.get_snapshot())
+    asyncio.run(client.get_snapshot())
+
+    assert snap.operation_mode is None
+    assert transport.config_reads == 2
@@ -205,8 +205,9 @@ async def test_common_api_diagnostics_are_read_only_and_credential_free():
     transport = _transport_without_key()
     observed_requests: list[str] = []
 
-    async def post_v1r(envelope_bytes: bytes, din: str):
+    async def post_v1r(envelope_bytes: bytes, din: str, *, idempotent: bool = False):
         assert din == "DIN--1"
+        assert idempotent
         request = combined_pb2.MessageEnvelope()
         request.ParseFromString(envelope_bytes)
         assert request.deliveryChannel == combined_pb2.DELIVERY_CHANNEL_HERMES_COMMAND
@@ -297,8 +298,9 @@ async def test_local_island_mode_uses_app_wire_values_and_identity():
     transport = _transport_without_key()
     captured: dict[str, object] = {}
 
-    async def post_v1r(envelope_bytes: bytes, din: str):
+    async def post_v1r(envelope_bytes: bytes, din: str, *, idempotent: bool = False):
         captured["din"] = din
+        captured["idempotent"] = idempotent
         request = tesla_pb2.MessageEnvelope()
         request.ParseFromString(envelope_bytes)
         captured["request"] = request
@@ -310,6 +312,8 @@ async def test_local_island_mode_uses_app_wire_values_and_identity():
     transport.post_v1r = post_v1r
 
     assert await transport.set_island_mode("DIN--1", off_grid=True) is True
+    # A write is never retried on a dropped connection.
+    assert captured["idempotent"] is False
     request = captured["request"]
     assert isinstance(request, tesla_pb2.MessageEnvelope)
     assert request.deliveryChannel == 2
@@ -484,6 +488,7 @@ async def test_snapshot_preserves_signature_rejection_for_coordinator():
             side_effect=client_mod.PowerwallSignatureError("inactive key")
         ),
         read_config=AsyncMock(return_value={}),
+        config_generation=0,
     )
 
     with pytest.raises(client_mod.PowerwallSignatureError, match="inactive key"):
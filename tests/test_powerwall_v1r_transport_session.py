@@ -0,0 +1,306 @@
+"""Tests for the keep-alive session behind the TEDAPI v1r transport."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import threading
+import types
+from pathlib import Path
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+from aiohttp import web
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from conftest import pinned_sys_modules
+
+
+ROOT = Path(__file__).resolve().parent.parent / "custom_components" / "power_sync"
+PKG = "power_sync_v1r_session_test"
+LOCAL_PKG = f"{PKG}.powerwall_local"
+
+
+def _load_transport_module():
+    pkg = types.ModuleType(PKG)
+    pkg.__path__ = [str(ROOT)]
+    local = types.ModuleType(LOCAL_PKG)
+    local.__path__ = [str(ROOT / "powerwall_local")]
+    # Session handling never touches the protobuf messages.
+    pb2_stub = types.ModuleType(f"{LOCAL_PKG}.tedapi_combined_pb2")
+    name = f"{LOCAL_PKG}.transport"
+    spec = importlib.util.spec_from_file_location(
+        name, ROOT / "powerwall_local" / "transport.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    with pinned_sys_modules(
+        {
+            PKG: pkg,
+            LOCAL_PKG: local,
+            f"{LOCAL_PKG}.tedapi_combined_pb2": pb2_stub,
+            name: module,
+        }
+    ):
+        spec.loader.exec_module(module)
+    return module
+
+
+transport_mod = _load_transport_module()
+PRIVATE_KEY_PEM = rsa.generate_private_key(
+    public_exponent=65537, key_size=2048
+).private_bytes(
+    serialization.Encoding.PEM,
+    serialization.PrivateFormat.PKCS8,
+    serialization.NoEncryption(),
+)
+
+
+async def _with_gateway(callback):
+    async def handler(request):
+        await request.read()
+        return web.Response(body=b"ok")
+
+    app = web.Application()
+    app.router.add_post("/tedapi/v1r", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        return await callback(f"http://127.0.0.1:{port}/tedapi/v1r")
+    finally:
+        await runner.cleanup()
+
+
+def test_session_reuses_connection_and_reopens_after_close():
+    transport = transport_mod.TEDAPIv1rTransport("127.0.0.1", PRIVATE_KEY_PEM)
+
+    async def _run(url):
+        first = await transport._session()
+        for _ in range(3):
+            async with first.post(url, data=b"x") as resp:
+                assert await resp.read() == b"ok"
+        assert await transport._session() is first
+
+        await transport.async_close()
+        assert first.closed
+        second = await transport._session()
+        async with second.post(url, data=b"x") as resp:
+            await resp.read()
+        await transport.async_close()
+        return first, second
+
+    first, second = asyncio.run(_with_gateway(_run))
+
+    assert second is not first
+    stats = transport.stats.as_dict()
+    assert stats["sessions_opened"] == 2
+    assert stats["handshakes"] == 2
+    assert stats["reused_connections"] == 2
+
+
+def test_close_without_session_is_a_noop():
+    transport = transport_mod.TEDAPIv1rTransport("127.0.0.1", PRIVATE_KEY_PEM)
+
+    asyncio.run(transport.async_close())
+
+    assert transport.stats.sessions_opened == 0
+
+
+def test_latency_histogram_buckets_and_summary():
+    stats = transport_mod.TransportStats()
+    for latency_ms, ok in ((12.0, True), (50.0, True), (180.0, True), (9000.0, False)):
+        stats.record(latency_ms, ok)
+
+    payload = stats.as_dict()
+
+    assert payload["requests"] == 4
+    assert payload["failed_requests"] == 1
+    assert payload["last_latency_ms"] == 9000.0
+    assert payload["max_latency_ms"] == 9000.0
+    assert payload["avg_latency_ms"] == 2310.5
+    histogram = payload["latency_histogram"]
+    assert histogram["le_50ms"] == 2
+    assert histogram["le_250ms"] == 1
+    assert histogram["gt_5000ms"] == 1
+    assert sum(histogram.values()) == 4
+
+
+def test_gateway_writes_bump_config_generation_even_on_failure():
+    transport = transport_mod.TEDAPIv1rTransport("127.0.0.1", PRIVATE_KEY_PEM)
+    writes = (
+        "write_config",
+        "set_island_mode",
+        "trigger_islanding",
+        "schedule_manual_backup",
+        "cancel_manual_backup",
+    )
+    for name in writes:
+        assert hasattr(getattr(transport_mod.TEDAPIv1rTransport, name), "__wrapped__")
+    assert not hasattr(transport_mod.TEDAPIv1rTransport.read_config, "__wrapped__")
+
+    # The protobuf module is stubbed out, so the write fails while encoding.
+    try:
+        asyncio.run(transport.write_config("DIN123", {"site_info.x": 1}))
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("stubbed protobuf module should fail the write")
+
+    assert transport.config_generation == 1
+
+
+def test_offloaded_work_runs_off_loop_and_reports_to_profile_hook():
+    transport = transport_mod.TEDAPIv1rTransport("127.0.0.1", PRIVATE_KEY_PEM)
+    profiled = []
+    transport.profile_hook = lambda *args: profiled.append(args)
+
+    async def _run():
+        loop_thread = threading.get_ident()
+        worker_thread = await transport.async_offload("decode", threading.get_ident)
+        # Offloaded signing is not counted as loop time; signing on the loop is.
+        await transport.async_offload("sign", transport._sign, b"payload")
+        transport._sign(b"payload")
+        return loop_thread, worker_thread
+
+    loop_thread, worker_thread = asyncio.run(_run())
+
+    assert worker_thread != loop_thread
+    assert [(stage, on_loop) for stage, _ms, on_loop in profiled] == [
+        ("decode", False),
+        ("sign", False),
+        ("sign", True),
+    ]
+    stats = transport.stats
+    assert stats.cpu_on_loop_ms == profiled[2][1]
+    assert stats.cpu_offloaded_ms == pytest.approx(profiled[0][1] + profiled[1][1])
+
+
+def test_presigned_request_is_used_once_while_fresh(monkeypatch):
+    transport = transport_mod.TEDAPIv1rTransport("127.0.0.1", PRIVATE_KEY_PEM)
+    signed = []
+
+    def _build_signed_bytes(envelope_bytes, din):
+        signed.append(envelope_bytes)
+        return b"signed-%d" % len(signed)
+
+    transport.build_signed_bytes = _build_signed_bytes
+    clock = [1_700_000_000.0]
+    monkeypatch.setattr(transport_mod.time, "time", lambda: clock[0])
+
+    async def _presign():
+        transport.schedule_presign(b"dcq", "DIN123")
+        await transport._presign_task
+
+    asyncio.run(_presign())
+    assert transport._take_presigned(b"config", "DIN123") is None
+    assert transport._take_presigned(b"dcq", "DIN123") == b"signed-1"
+    assert transport._take_presigned(b"dcq", "DIN123") is None
+
+    asyncio.run(_presign())
+    clock[0] += 5
+    assert transport._take_presigned(b"dcq", "DIN123") is None
+    assert transport.stats.presigned_hits == 1
+    assert signed == [b"dcq", b"dcq"]
+
+
+def test_close_cancels_pending_presign():
+    transport = transport_mod.TEDAPIv1rTransport("127.0.0.1", PRIVATE_KEY_PEM)
+    release = threading.Event()
+
+    def _slow_build(envelope_bytes, din):
+        release.wait(5)
+        return b"late"
+
+    transport.build_signed_bytes = _slow_build
+
+    async def _run():
+        transport.schedule_presign(b"dcq", "DIN123")
+        task = transport._presign_task
+        await asyncio.sleep(0)
+        await transport.async_close()
+        release.set()
+        return task
+
+    task = asyncio.run(_run())
+
+    assert task.cancelled()
+    assert transport._presigned is None
+
+
+class _OkResponse:
+    status = 200
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return b"routable"
+
+
+class _DroppingSession:
+    """Session whose first POST finds the keep-alive connection dropped."""
+
+    def __init__(self):
+        self.payloads = []
+
+    def post(self, url, *, data, headers):
+        self.payloads.append(data)
+        if len(self.payloads) == 1:
+            raise aiohttp.ServerDisconnectedError()
+        return _OkResponse()
+
+
+def _dropping_transport(monkeypatch):
+    transport = transport_mod.TEDAPIv1rTransport("127.0.0.1", PRIVATE_KEY_PEM)
+    session = _DroppingSession()
+    signed = []
+
+    async def _session():
+        return session
+
+    def _build_signed_bytes(envelope_bytes, din):
+        signed.append(envelope_bytes)
+        return b"signed-%d" % len(signed)
+
+    transport._session = _session
+    transport.build_signed_bytes = _build_signed_bytes
+    monkeypatch.setattr(
+        transport_mod.combined_pb2, "MESSAGEFAULT_ERROR_NONE", 0, raising=False
+    )
+    monkeypatch.setattr(
+        transport_mod,
+        "_parse_routable_message",
+        lambda raw: SimpleNamespace(
+            signed_message_status=SimpleNamespace(message_fault=0),
+            protobuf_message_as_bytes=b"inner",
+        ),
+    )
+    return transport, session
+
+
+def test_dropped_connection_retries_reads_with_a_fresh_signature(monkeypatch):
+    transport, session = _dropping_transport(monkeypatch)
+
+    resp = asyncio.run(transport.post_v1r(b"dcq", "DIN123", idempotent=True))
+
+    assert resp.ok and resp.inner_bytes == b"inner"
+    assert session.payloads == [b"signed-1", b"signed-2"]
+    assert transport.stats.stale_retries == 1
+
+
+def test_dropped_connection_is_not_retried_for_writes(monkeypatch):
+    transport, session = _dropping_transport(monkeypatch)
+
+    with pytest.raises(transport_mod.PowerwallUnreachableError):
+        asyncio.run(transport.post_v1r(b"write", "DIN123"))
+
+    assert session.payloads == [b"signed-1"]
+    assert transport.stats.stale_retries == 0
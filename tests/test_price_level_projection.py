@@ -11,7 +11,7 @@ import pytest
 
 
 ROOT = Path(__file__).resolve().parent.parent
-INIT_PATH = ROOT / "custom_components" / "power_sync" / "__init__.py"
+EV_VIEWS_PATH = ROOT / "custom_components" / "power_sync" / "ev_views.py"
 MODULE_PATH = (
     ROOT
     / "custom_components"
@@ -326,7 +326,7 @@ def test_home_battery_below_minimum_is_conditional(projection_module):
 
 
 def test_price_level_settings_write_only_schedules_nonblocking_replan():
-    source = INIT_PATH.read_text()
+    source = EV_VIEWS_PATH.read_text()
     start = source.index("class PriceLevelChargingSettingsView")
     end = source.index("class PriceLevelChargingStatusView", start)
     view_source = source[start:end]
@@ -618,13 +618,13 @@ def test_deferred_enable_restore_syncs_sigenergy_restore_target(opt_module):
 def _sigenergy_settings_view_post_source():
     import ast
 
-    init_path = (
+    views_path = (
         Path(__file__).resolve().parent.parent
         / "custom_components"
         / "power_sync"
-        / "__init__.py"
+        / "vendor_views.py"
     )
-    source = init_path.read_text()
+    source = views_path.read_text()
     module = ast.parse(source)
     for node in module.body:
         if isinstance(node, ast.ClassDef) and node.name == "SigenergySettingsView":
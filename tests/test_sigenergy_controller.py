@@ -205,6 +205,65 @@ def test_solar_export_hold_rejects_unlimited_export_limit(sigenergy_module):
     assert asyncio.run(controller.get_grid_export_limit_kw()) is None
 
 
+def test_status_poll_reads_plant_registers_in_blocks(sigenergy_module):
+    controller = sigenergy_module.SigenergyController(host="127.0.0.1")
+    input_values = {
+        controller.REG_GRID_SENSOR_POWER: controller._from_signed32(-1500),
+        controller.REG_ESS_SOC: [655],
+        controller.REG_PV_POWER: controller._from_signed32(4200),
+        controller.REG_ESS_POWER: controller._from_signed32(2000),
+        controller.REG_ESS_RATED_CAPACITY: controller._from_unsigned32(1600),
+        controller.REG_ESS_SOH: [990],
+        controller.REG_THIRD_PARTY_PV_POWER: controller._from_signed32(0),
+    }
+    holding_values = {
+        controller.REG_GRID_EXPORT_LIMIT: controller._from_unsigned32(5000),
+        controller.REG_PCS_EXPORT_LIMIT: controller._from_unsigned32(controller.EXPORT_LIMIT_UNLIMITED),
+    }
+    reads: list[tuple[str, int, int]] = []
+
+    def bank_reader(kind, values):
+        bank = {
+            address + offset: word
+            for address, words in values.items()
+            for offset, word in enumerate(words)
+        }
+
+        async def read(address, count, slave_id=None):
+            reads.append((kind, address, count))
+            return [bank.get(address + offset, 0) for offset in range(count)]
+
+        return read
+
+    async def connect():
+        return True
+
+    controller.connect = connect
+    controller._read_input_registers = bank_reader("input", input_values)
+    controller._read_holding_registers = bank_reader("holding", holding_values)
+
+    state = asyncio.run(controller.get_status())
+
+    # Nine single-value reads collapse into one read per register section.
+    assert reads == [
+        ("input", controller.REG_GRID_SENSOR_POWER, 34),
+        ("input", controller.REG_ESS_RATED_CAPACITY, 5),
+        ("input", controller.REG_THIRD_PARTY_PV_POWER, 2),
+        ("holding", controller.REG_GRID_EXPORT_LIMIT, 6),
+    ]
+    attrs = state.attributes
+    assert attrs["register_level"] == "plant"
+    assert attrs["grid_power_kw"] == -1.5
+    assert attrs["battery_soc"] == 65.5
+    assert attrs["pv_power_kw"] == 4.2
+    assert attrs["battery_power_kw"] == 2.0
+    assert attrs["battery_capacity_kwh"] == 16.0
+    assert attrs["battery_soh"] == 99.0
+    assert attrs["export_limit_kw"] == 5.0
+    assert "pcs_export_limit_kw" not in attrs
+    assert attrs["modbus_round_trips"] == 4
+
+
 def test_force_discharge_uses_pv_first_mode_when_solar_can_cover_target(sigenergy_module):
     controller = sigenergy_module.SigenergyController(host="127.0.0.1")
     _stub_force_discharge_reads(controller)
@@ -1288,7 +1347,7 @@ def test_apply_configured_export_cap_rolls_back_after_failed_write(
 
 def test_sigenergy_settings_post_persists_and_reoptimizes_export_cap():
     """The Controls API must update durable restore and planning state."""
-    source = (COMPONENT_ROOT / "__init__.py").read_text()
+    source = (COMPONENT_ROOT / "vendor_views.py").read_text()
     tree = ast.parse(source)
     view = next(
         node
@@ -1566,7 +1625,7 @@ def test_setup_clears_token_refresh_skip_before_registering_listener():
 
 def test_sigenergy_settings_get_prefers_configured_rate_caps_including_zero():
     """Controls shows durable caps while retaining live register diagnostics."""
-    source = (COMPONENT_ROOT / "__init__.py").read_text()
+    source = (COMPONENT_ROOT / "vendor_views.py").read_text()
     tree = ast.parse(source)
     resolver = next(
         node
@@ -1577,7 +1636,7 @@ def test_sigenergy_settings_get_prefers_configured_rate_caps_including_zero():
     resolver_module = ast.Module(body=[resolver], type_ignores=[])
     ast.fix_missing_locations(resolver_module)
     namespace: dict[str, object] = {}
-    exec(compile(resolver_module, str(COMPONENT_ROOT / "__init__.py"), "exec"), namespace)
+    exec(compile(resolver_module, str(COMPONENT_ROOT / "vendor_views.py"), "exec"), namespace)
     resolve = namespace["_sigenergy_controls_rate_limit_kw"]
 
     assert callable(resolve)
@@ -1677,7 +1736,7 @@ def test_optimizer_settings_persist_raw_sigenergy_limit_but_apply_cap():
 
 
 def test_sigenergy_settings_validate_complete_payload_before_hardware_writes():
-    source_path = COMPONENT_ROOT / "__init__.py"
+    source_path = COMPONENT_ROOT / "vendor_views.py"
     source = source_path.read_text()
     tree = ast.parse(source)
     validator = next(
@@ -1854,7 +1913,7 @@ def test_sigenergy_settings_get_keeps_configured_cap_visible_during_curtailment(
     value, so that field must prefer the configured site cap while exposing
     the live register separately for diagnostics.
     """
-    source = (COMPONENT_ROOT / "__init__.py").read_text()
+    source = (COMPONENT_ROOT / "vendor_views.py").read_text()
     tree = ast.parse(source)
     resolver = next(
         node
@@ -1865,7 +1924,7 @@ def test_sigenergy_settings_get_keeps_configured_cap_visible_during_curtailment(
     resolver_module = ast.Module(body=[resolver], type_ignores=[])
     ast.fix_missing_locations(resolver_module)
     namespace: dict[str, object] = {}
-    exec(compile(resolver_module, str(COMPONENT_ROOT / "__init__.py"), "exec"), namespace)
+    exec(compile(resolver_module, str(COMPONENT_ROOT / "vendor_views.py"), "exec"), namespace)
     resolve = namespace["_sigenergy_controls_export_limit_kw"]
 
     assert callable(resolve)
@@ -7,7 +7,10 @@ from pathlib import Path
 
 
 ROOT = Path(__file__).resolve().parent.parent
-INIT_PATH = ROOT / "custom_components" / "power_sync" / "__init__.py"
+COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
+INIT_PATH = COMPONENT_ROOT / "__init__.py"
+EV_VIEWS_PATH = COMPONENT_ROOT / "ev_views.py"
+VIEW_MODULE_PATHS = (INIT_PATH, EV_VIEWS_PATH, COMPONENT_ROOT / "vendor_views.py")
 
 # Views that reach Sigenergy helpers while serving a request.  These run
 # outside any scope that binds a request-local ``hass``, so they must use the
@@ -56,7 +59,7 @@ def test_sigenergy_ev_api_views_use_stored_hass_reference():
     Scans the whole class rather than only ``get`` — the calls have moved
     between methods before, which silently retired this guard.
     """
-    tree = ast.parse(INIT_PATH.read_text())
+    tree = ast.parse(EV_VIEWS_PATH.read_text())
 
     for class_name in SIGENERGY_VIEWS:
         hass_args = _sigenergy_helper_hass_args(_view_class(tree, class_name))
@@ -73,7 +76,14 @@ def test_no_api_view_method_reads_an_unbound_hass():
     The Sigenergy branch of ``EVVehiclesView.get`` regressed exactly this way
     and 500'd the whole vehicle list for anyone with a charger configured.
     """
-    tree = ast.parse(INIT_PATH.read_text())
+    tree = ast.Module(
+        body=[
+            node
+            for path in VIEW_MODULE_PATHS
+            for node in ast.parse(path.read_text()).body
+        ],
+        type_ignores=[],
+    )
 
     assert not [
         node
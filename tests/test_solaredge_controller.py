@@ -57,6 +57,44 @@ def test_solaredge_zero_curtail_and_restore_write_percent_limits():
     assert writes == [0, 100]
 
 
+def test_solaredge_modbus_status_reads_telemetry_and_limit_blocks():
+    controller = SolarEdgeController(
+        host="192.0.2.30",
+        rated_power_w=5000,
+    )
+    controller._connected = True
+    inverter_data = [0] * 38
+    inverter_data[12] = 3100  # AC power
+    inverter_data[13] = 0
+    inverter_data[29] = 32500  # DC power
+    inverter_data[30] = 0xFFFF  # scale factor -1
+    inverter_data[36] = 5  # throttled
+    reads: list[tuple[int, int]] = []
+
+    async def fake_read(address: int, count: int):
+        reads.append((address, count))
+        if address == controller.REG_INVERTER_DATA:
+            return inverter_data[:count]
+        if address == controller.REG_ACTIVE_POWER_LIMIT:
+            return [60]
+        return None
+
+    controller._read_holding_registers = fake_read
+
+    state = asyncio.run(controller.get_status())
+
+    assert reads == [
+        (controller.REG_INVERTER_DATA, 38),
+        (controller.REG_ACTIVE_POWER_LIMIT, 1),
+    ]
+    assert state.is_curtailed is True
+    assert state.power_output_w == 3100
+    assert state.power_limit_percent == 60
+    assert state.attributes["dc_power_w"] == 3250.0
+    assert state.attributes["status"] == "throttled"
+    assert state.attributes["modbus_round_trips"] == 2
+
+
 @pytest.mark.parametrize("entity_prefix", ["custom", "custom_*"])
 def test_solaredge_entity_fallback_prefers_configured_prefix(entity_prefix: str):
     class State:
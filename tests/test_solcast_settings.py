@@ -9,6 +9,7 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parent.parent
 COMPONENT_ROOT = ROOT / "custom_components" / "power_sync"
 INIT_PATH = COMPONENT_ROOT / "__init__.py"
+EV_VIEWS_PATH = COMPONENT_ROOT / "ev_views.py"
 CONFIG_FLOW_PATH = COMPONENT_ROOT / "config_flow.py"
 COORDINATOR_PATH = COMPONENT_ROOT / "coordinator.py"
 OPTIMIZATION_COORDINATOR_PATH = COMPONENT_ROOT / "optimization" / "coordinator.py"
@@ -213,7 +214,7 @@ def test_ev_surplus_forecaster_uses_configured_solar_provider():
         "__init__",
     )
     endpoint_source = _class_method_source(
-        INIT_PATH,
+        EV_VIEWS_PATH,
         "SurplusForecastView",
         "get",
     )
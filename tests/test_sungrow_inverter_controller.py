@@ -125,3 +125,79 @@ def test_sungrow_sg_and_sh_requests_share_endpoint_lock():
         assert tracker.max_active == 1
 
     asyncio.run(_run())
+
+
+class _RegisterBlockResult:
+    def __init__(self, registers: list[int]) -> None:
+        self.registers = registers
+
+    def isError(self) -> bool:
+        return False
+
+
+class _MappedRegisterClient:
+    connected = True
+
+    def __init__(self, input_values: dict[int, int], holding_values: dict[int, int]) -> None:
+        self.input_values = input_values
+        self.holding_values = holding_values
+        self.calls: list[tuple[str, int, int]] = []
+
+    def _read(self, kind: str, values: dict[int, int], kwargs) -> _RegisterBlockResult:
+        address = kwargs["address"]
+        count = kwargs["count"]
+        self.calls.append((kind, address, count))
+        return _RegisterBlockResult(
+            [values.get(address + offset, 0) for offset in range(count)]
+        )
+
+    async def read_input_registers(self, **kwargs) -> _RegisterBlockResult:
+        return self._read("input", self.input_values, kwargs)
+
+    async def read_holding_registers(self, **kwargs) -> _RegisterBlockResult:
+        return self._read("holding", self.holding_values, kwargs)
+
+
+def test_sungrow_status_reads_telemetry_in_blocks():
+    async def _connected() -> bool:
+        return True
+
+    controller = SungrowController("192.0.2.30", model="SG10RS")
+    controller.connect = _connected
+    client = _MappedRegisterClient(
+        {
+            5002: 123,
+            5003: 0x5678,
+            5004: 0x0001,
+            5007: 0xFFEC,
+            5010: 3801,
+            5011: 52,
+            5012: 3702,
+            5013: 41,
+            5016: 4200,
+            5017: 0,
+            5018: 2401,
+            5035: 500,
+            5037: SungrowController.STATE_RUNNING,
+        },
+        {5006: SungrowController.POWER_LIMIT_ENABLED, 5007: 1000},
+    )
+    controller._client = client
+
+    state = asyncio.run(controller.get_status())
+
+    # 13 single-value reads collapse into one input and one holding block.
+    assert client.calls == [("holding", 5006, 2), ("input", 5002, 36)]
+    attrs = state.attributes
+    assert attrs["dc_power"] == 4200
+    assert attrs["daily_pv_generation"] == 12.3
+    assert attrs["total_pv_generation"] == round(0x15678 * 0.1, 1)
+    assert attrs["mppt1_power"] == round(380.1 * 5.2, 0)
+    assert attrs["inverter_temperature"] == -2.0
+    assert attrs["grid_frequency"] == 50.0
+    assert attrs["power_limit_enabled"] is True
+    assert attrs["power_limit_percent"] == 100
+    assert attrs["running_state"] == "running"
+    assert attrs["modbus_round_trips"] == 2
+    assert "_running_state" not in attrs
+    assert state.power_output_w == 4200.0
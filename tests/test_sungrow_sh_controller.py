@@ -577,6 +577,50 @@ def test_battery_data_marks_zero_bms_discharge_capability():
     assert data["discharge_rate_limit_source"] == "bms_current"
 
 
+def test_status_poll_coalesces_register_reads_into_blocks():
+    async def run_read():
+        controller = SungrowSHController("192.0.2.10")
+        input_reads: list[tuple[int, int]] = []
+        holding_reads: list[tuple[int, int]] = []
+        bank = {
+            controller.REG_BATTERY_VOLTAGE: 5751,
+            controller.REG_BATTERY_LEVEL: 297,
+            controller.REG_DAILY_PV: 123,
+            controller.REG_INVERTER_TEMP: 312,
+            controller.REG_TOTAL_DC_POWER: 4200,
+            controller.REG_EXPORT_LIMIT_SETTING: 5000,
+            controller.REG_EXPORT_LIMIT_ENABLED: controller.EXPORT_LIMIT_ENABLE,
+        }
+
+        async def read_input_register(address: int, count: int = 1):
+            input_reads.append((address, count))
+            return [bank.get(register, 0) for register in range(address, address + count)]
+
+        async def read_register(address: int, count: int = 1):
+            holding_reads.append((address, count))
+            return [bank.get(register, 0) for register in range(address, address + count)]
+
+        controller._read_input_register = read_input_register
+        controller._read_register = read_register
+        attrs = await controller._read_all_registers()
+        return attrs, input_reads, holding_reads
+
+    attrs, input_reads, holding_reads = asyncio.run(run_read())
+
+    assert attrs["battery_voltage"] == 575.1
+    assert attrs["battery_level"] == 29.7
+    assert attrs["daily_pv_generation"] == 12.3
+    assert attrs["inverter_temperature"] == 31.2
+    assert attrs["pv_power"] == 4200
+    assert attrs["export_limit_w"] == 5000
+    assert attrs["export_limit_enabled"] is True
+    # 20 values used to cost 20 paced requests
+    assert holding_reads == [(13073, 14)]
+    assert len(input_reads) == 6
+    assert attrs["modbus_round_trips"] == 7
+    assert "modbus_poll_ms" in attrs
+
+
 def test_sungrow_rate_limits_use_mkaiser_power_registers():
     async def run_limits():
         controller = SungrowSHController("192.0.2.10")
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import sys
 import types
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -15,6 +15,8 @@ _ps.__path__ = [str(ROOT)]
 sys.modules["power_sync"] = _ps
 
 from power_sync.tariff_time import (  # noqa: E402
+    compile_tariff_timeline,
+    compile_tou_week,
     find_matching_tou_period,
     season_rate_maps,
     tariff_components_for_datetime,
@@ -290,3 +292,79 @@ def test_rate_aware_agl_reward_matching_keeps_weekday_peak_rate():
             "OFF_PEAK_AUTO_AGL_REWARD": 0.28,
         },
     ) == "PEAK_AGL_REWARD"
+
+
+def _layered_weekday_periods():
+    return {
+        "OFF_PEAK": [{"fromDayOfWeek": 0, "toDayOfWeek": 6, "fromHour": 0, "toHour": 0}],
+        "PEAK": {"periods": [{
+            "fromDayOfWeek": 1,
+            "toDayOfWeek": 5,
+            "fromHour": 15,
+            "fromMinute": 30,
+            "toHour": 21,
+        }]},
+        "SUPER_OFF_PEAK": [{
+            "fromDayOfWeek": 5,
+            "toDayOfWeek": 1,
+            "fromHour": 23,
+            "toHour": 6,
+            "toMinute": 30,
+        }],
+        "FREE": [{"fromDayOfWeek": 0, "toDayOfWeek": 6, "fromHour": 11, "toHour": 14}],
+    }
+
+
+def test_compiled_week_matches_reference_matcher_every_minute():
+    periods = _layered_weekday_periods()
+    buy_rates = {"OFF_PEAK": 0.22, "PEAK": 0.48, "SUPER_OFF_PEAK": 0.1, "FREE": 0.0}
+    sell_rates = {"OFF_PEAK": 0.05, "PEAK": 0.12}
+    week = compile_tou_week(periods, buy_rates, sell_rates)
+
+    start = datetime(2026, 5, 3)
+    for minute in range(7 * 24 * 60):
+        when = start + timedelta(minutes=minute)
+        assert week.period_at(when, default="ALL") == find_matching_tou_period(
+            periods,
+            when,
+            default="ALL",
+            buy_rates=buy_rates,
+            sell_rates=sell_rates,
+        ), when
+
+
+def test_tariff_timeline_switches_season_and_components_with_the_month():
+    periods = _layered_weekday_periods()
+    tariff = {
+        "tou_periods": {"OFF_PEAK": periods["OFF_PEAK"]},
+        "buy_rates": {"OFF_PEAK": 0.21},
+        "seasons": {
+            "Winter": {"fromMonth": 4, "toMonth": 10},
+            "Summer": {"fromMonth": 11, "toMonth": 3, "tou_periods": periods},
+        },
+        "season_buy_rates": {"Summer": {"OFF_PEAK": 0.21, "PEAK": 0.54}},
+    }
+    timeline = compile_tariff_timeline(tariff)
+
+    october = datetime(2026, 10, 30, 16, 0)
+    november = datetime(2026, 11, 2, 16, 0)
+    assert timeline.season_at(october) == "Winter"
+    assert timeline.period_at(october) == "OFF_PEAK"
+    assert timeline.season_at(november) == "Summer"
+    assert timeline.period_at(november) == "PEAK"
+    for when in (october, november):
+        assert timeline.components(when) == tariff_components_for_datetime(tariff, when)
+
+
+def test_compiled_tables_are_shared_by_content_and_rebuilt_after_edits():
+    periods = _layered_weekday_periods()
+    rates = {"PEAK": 0.48}
+
+    week = compile_tou_week(periods, rates)
+    assert compile_tou_week(_layered_weekday_periods(), dict(rates)) is week
+
+    periods["PEAK"]["periods"][0]["toHour"] = 22
+    edited = compile_tou_week(periods, rates)
+    assert edited is not week
+    assert edited.period_at(datetime(2026, 5, 4, 21, 30)) == "PEAK"
+    assert week.period_at(datetime(2026, 5, 4, 21, 30)) == "OFF_PEAK"
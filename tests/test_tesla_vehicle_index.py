@@ -0,0 +1,188 @@
+"""Tests for the registry index behind Tesla vehicle lookups."""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent / "custom_components" / "power_sync"
+package = sys.modules.setdefault("power_sync", types.ModuleType("power_sync"))
+package.__path__ = [str(ROOT)]
+
+from power_sync.tesla_vehicle_index import (  # noqa: E402
+    async_shutdown_tesla_vehicle_index,
+    tesla_vehicle_index,
+)
+
+
+VIN_A = "5YJ3E1EA7NF0000A1"
+VIN_B = "5YJ3E1EA7NF0000B2"
+
+
+class _Bus:
+    def __init__(self) -> None:
+        self.listeners: dict[str, list] = {}
+
+    def async_listen(self, event_type, listener):
+        self.listeners.setdefault(event_type, []).append(listener)
+
+        def _unsub():
+            self.listeners[event_type].remove(listener)
+
+        return _unsub
+
+    def fire(self, event_type: str) -> None:
+        for listener in list(self.listeners.get(event_type, ())):
+            listener(SimpleNamespace(event_type=event_type, data={}))
+
+
+def _entity(entity_id: str, device_id: str | None) -> SimpleNamespace:
+    return SimpleNamespace(entity_id=entity_id, device_id=device_id)
+
+
+def _hass(bus: _Bus | None = None) -> SimpleNamespace:
+    devices = {
+        "powerwall": SimpleNamespace(
+            id="powerwall", identifiers={("tesla_fleet", "1234567")}
+        ),
+        "car-a": SimpleNamespace(id="car-a", identifiers={("tesla_fleet", VIN_A)}),
+        "car-a-teslemetry": SimpleNamespace(
+            id="car-a-teslemetry", identifiers={("teslemetry", VIN_A)}
+        ),
+        "car-b": SimpleNamespace(id="car-b", identifiers={("tessie", VIN_B)}),
+        "heat-pump": SimpleNamespace(id="heat-pump", identifiers={("daikin", "x")}),
+    }
+    entities = {
+        entity.entity_id: entity
+        for entity in (
+            _entity("sensor.powerwall_charge", "powerwall"),
+            _entity("sensor.car_a_battery_level", "car-a"),
+            _entity("sensor.car_b_battery_level", "car-b"),
+            _entity("binary_sensor.car_a_charge_cable", "car-a-teslemetry"),
+            _entity("device_tracker.car_a_location", "car-a"),
+            _entity("sensor.heat_pump_power", "heat-pump"),
+            _entity("sun.sun", None),
+        )
+    }
+    hass = SimpleNamespace(
+        data={},
+        device_registry=SimpleNamespace(devices=devices),
+        entity_registry=SimpleNamespace(entities=entities),
+    )
+    if bus is not None:
+        hass.bus = bus
+    return hass
+
+
+@pytest.fixture(autouse=True)
+def _registry_stubs(monkeypatch):
+    core = types.ModuleType("homeassistant.core")
+    core.callback = lambda func: func
+    helpers = types.ModuleType("homeassistant.helpers")
+    device_registry = types.ModuleType("homeassistant.helpers.device_registry")
+    device_registry.EVENT_DEVICE_REGISTRY_UPDATED = "device_registry_updated"
+    device_registry.async_get = lambda hass: hass.device_registry
+    entity_registry = types.ModuleType("homeassistant.helpers.entity_registry")
+    entity_registry.EVENT_ENTITY_REGISTRY_UPDATED = "entity_registry_updated"
+    entity_registry.async_get = lambda hass: hass.entity_registry
+    helpers.device_registry = device_registry
+    helpers.entity_registry = entity_registry
+    monkeypatch.setitem(sys.modules, "homeassistant.core", core)
+    monkeypatch.setitem(sys.modules, "homeassistant.helpers", helpers)
+    monkeypatch.setitem(
+        sys.modules, "homeassistant.helpers.device_registry", device_registry
+    )
+    monkeypatch.setitem(
+        sys.modules, "homeassistant.helpers.entity_registry", entity_registry
+    )
+
+
+def test_index_groups_vehicle_devices_and_entities_in_registry_order():
+    index = tesla_vehicle_index(_hass(_Bus()))
+
+    assert [device.id for device, _vin in index.vehicle_devices()] == [
+        "car-a",
+        "car-a-teslemetry",
+        "car-b",
+    ]
+    assert [device.id for device, _vin in index.vehicle_devices(VIN_A)] == [
+        "car-a",
+        "car-a-teslemetry",
+    ]
+    assert index.vins() == (VIN_A, VIN_B)
+    assert [entity.entity_id for entity in index.device_entities("car-a")] == [
+        "sensor.car_a_battery_level",
+        "device_tracker.car_a_location",
+    ]
+    assert [
+        (entity.entity_id, vin) for entity, vin in index.vehicle_entities()
+    ] == [
+        ("sensor.car_a_battery_level", VIN_A),
+        ("sensor.car_b_battery_level", VIN_B),
+        ("binary_sensor.car_a_charge_cable", VIN_A),
+        ("device_tracker.car_a_location", VIN_A),
+    ]
+    assert index.device_vin("car-b") == VIN_B
+    assert index.device_vin("powerwall") is None
+    assert index.vehicle_devices("5YJ3E1EA7NF00UNKN") == ()
+
+
+def test_index_is_shared_and_rebuilt_only_after_registry_events():
+    bus = _Bus()
+    hass = _hass(bus)
+    index = tesla_vehicle_index(hass)
+
+    index.vehicle_devices(VIN_A)
+    tesla_vehicle_index(hass).device_entities("car-a")
+    assert tesla_vehicle_index(hass) is index
+    assert index.stats() == {
+        "watching": True,
+        "hits": 1,
+        "rebuilds": 1,
+        "devices": 3,
+        "entities": 4,
+    }
+
+    hass.entity_registry.entities["device_tracker.car_b_location"] = _entity(
+        "device_tracker.car_b_location", "car-b"
+    )
+    assert len(index.device_entities("car-b")) == 1
+    bus.fire("entity_registry_updated")
+    assert len(index.device_entities("car-b")) == 2
+    assert index.rebuilds == 2
+
+    del hass.device_registry.devices["car-b"]
+    bus.fire("device_registry_updated")
+    assert index.vins() == (VIN_A,)
+    assert index.rebuilds == 3
+
+
+def test_index_without_event_bus_rebuilds_on_every_lookup():
+    hass = _hass()
+    index = tesla_vehicle_index(hass)
+
+    assert index.vins() == (VIN_A, VIN_B)
+    del hass.device_registry.devices["car-a"]
+    del hass.device_registry.devices["car-a-teslemetry"]
+
+    assert index.vins() == (VIN_B,)
+    assert index.stats()["watching"] is False
+    assert index.hits == 0
+    assert index.rebuilds == 2
+
+
+def test_shutdown_drops_the_index_and_its_listeners():
+    bus = _Bus()
+    hass = _hass(bus)
+    index = tesla_vehicle_index(hass)
+
+    async_shutdown_tesla_vehicle_index(hass)
+
+    assert not any(bus.listeners.values())
+    assert index.watching is False
+    assert tesla_vehicle_index(hass) is not index
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
 import importlib.util
 import logging
@@ -34,24 +35,24 @@ def _coordinator(fixed_now: datetime):
         for node in tree.body
         if isinstance(node, ast.ClassDef) and node.name == "OptimizationCoordinator"
     )
-    method = next(
+    methods = [
         node
         for node in coordinator.body
         if isinstance(node, ast.FunctionDef)
-        and node.name == "_generate_tou_price_forecast"
-    )
+        and node.name in {"_generate_tou_price_forecast", "_resolve_tou_slot_rates"}
+    ]
     extracted = ast.ClassDef(
         name="_ExtractedCoordinator",
         bases=[],
         keywords=[],
-        body=[method],
+        body=methods,
         decorator_list=[],
     )
     namespace = {
         "dt_util": SimpleNamespace(now=lambda: fixed_now),
         "period_entries": tariff_time.period_entries,
-        "find_matching_tou_period": tariff_time.find_matching_tou_period,
-        "tariff_components_for_datetime": tariff_time.tariff_components_for_datetime,
+        "compile_tariff_timeline": tariff_time.compile_tariff_timeline,
+        "Mapping": Mapping,
         "_LOGGER": logging.getLogger(__name__),
     }
     module = ast.fix_missing_locations(ast.Module(body=[extracted], type_ignores=[]))